@@ -36,8 +36,10 @@ Installation (OpenCode):
 import argparse
 import json
 import os
+import socket
 import sys
 import subprocess
+import time
 from pathlib import Path
 
 
@@ -92,21 +94,136 @@ def load_kn_recent():
         return None
 
 
-def load_active_agents():
-    """Load active agents via orch status."""
+def _stat_signature(path):
+    """
+    [mtime_ns, size, ...] of a file and its sidecars, or of each file in a
+    directory, None if missing. Mirrors orch.status_daemon.registry_signature
+    and orch.beads_cache.db_signature (this hook doesn't import orch).
+    """
+    path = Path(path)
     try:
-        result = subprocess.run(
-            ['orch', 'status', '--format', 'json'],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=5
+        if path.is_dir():
+            return sorted(
+                [entry.name, entry.stat().st_mtime_ns, entry.stat().st_size]
+                for entry in os.scandir(path)
+                if entry.is_file()
+            )
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _sidecar_signature(path, sidecars, missing):
+    signature = _stat_signature(path)
+    if signature is None:
+        return None
+    for sidecar in sidecars:
+        side = _stat_signature(sidecar)
+        signature.extend(side if side is not None else missing)
+    return signature
+
+
+def _snapshot_is_current(snapshot):
+    """
+    Whether the registry and beads databases are unchanged since the daemon
+    computed the snapshot (the same check `orch status` makes).
+    """
+    # Same staleness limit as `orch status` uses for daemon snapshots
+    if time.time() - snapshot['computed_at'] > 120:
+        return False
+
+    registry_path = Path(snapshot['registry_path'])
+    if registry_path.is_dir():
+        registry = _stat_signature(registry_path)
+    else:
+        registry = _sidecar_signature(
+            registry_path, [registry_path.with_name(registry_path.name + '-wal')], []
         )
-        if result.returncode != 0:
+    if registry != snapshot['registry_signature']:
+        return False
+
+    for db_path, expected in snapshot.get('beads_signatures', {}).items():
+        db = Path(db_path)
+        sidecars = [db.with_name(db.name + '-wal'), db.parent / 'issues.jsonl']
+        if _sidecar_signature(db, sidecars, [None, None]) != expected:
+            return False
+    return True
+
+
+def _agents_from_status_daemon():
+    """
+    Active agents of the current git repo from a running `orch statusd`.
+
+    Returns items shaped like `orch status --json` agents, or None if no
+    daemon answers (the caller then runs `orch status`).
+    """
+    socket_path = Path.home() / '.orch' / 'statusd.sock'
+    if not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(str(socket_path))
+            sock.sendall(b'{"op": "snapshot"}\n')
+            data = b''
+            while not data.endswith(b'\n'):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        snapshot = json.loads(data)
+        entries = snapshot['active']
+        # Never trust a snapshot blindly: fall back to `orch status` if the
+        # registry or a beads database changed since it was computed
+        if not _snapshot_is_current(snapshot):
             return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    git_root = None
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'],
+            capture_output=True, text=True, check=False, timeout=2
+        )
+        if result.returncode == 0:
+            git_root = str(Path(result.stdout.strip()).resolve())
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+
+    agents = []
+    for entry in entries:
+        agent, status = entry.get('agent', {}), entry.get('status', {})
+        if git_root and str(Path(str(agent.get('project_dir', ''))).resolve()) != git_root:
+            continue
+        agents.append({
+            'agent_id': agent.get('id'),
+            'phase': status.get('phase'),
+            'window': agent.get('window'),
+            'alerts': status.get('alerts', []),
+        })
+    return agents
+
 
-        data = json.loads(result.stdout)
-        agents = data.get('agents', [])
+def load_active_agents():
+    """Load active agents from `orch statusd` if it is running, else via orch status."""
+    try:
+        agents = _agents_from_status_daemon()
+        if agents is None:
+            result = subprocess.run(
+                ['orch', 'status', '--format', 'json'],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=5
+            )
+            if result.returncode != 0:
+                return None
+
+            data = json.loads(result.stdout)
+            agents = data.get('agents', [])
 
         if not agents:
             return "**Active Agents:** None\n"
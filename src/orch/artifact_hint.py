@@ -18,6 +18,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional
 
+from orch.artifact_index import ORCH_ARTIFACT_ROOTS, ArtifactIndex
+
 
 # Stop words to filter from keyword extraction
 STOP_WORDS = {
@@ -241,27 +243,14 @@ def check_for_related_artifacts(
             found=False, artifacts=[], keywords=keywords, scored_artifacts=[]
         )
 
-    # Directories to search
-    search_dirs = [
-        orch_dir / "investigations",
-        orch_dir / "decisions",
-        orch_dir / "knowledge",
+    # Collect all .md files in investigations, decisions and knowledge within age limit
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+    files_to_search = [
+        entry.path
+        for entry in ArtifactIndex.for_project(project_dir).entries(ORCH_ARTIFACT_ROOTS)
+        if entry.mtime > cutoff
     ]
 
-    # Collect all .md files within age limit
-    cutoff = datetime.now() - timedelta(days=max_age_days)
-    files_to_search = []
-
-    for search_dir in search_dirs:
-        if search_dir.exists():
-            for md_file in search_dir.rglob("*.md"):
-                try:
-                    mtime = datetime.fromtimestamp(md_file.stat().st_mtime)
-                    if mtime > cutoff:
-                        files_to_search.append(md_file)
-                except OSError:
-                    pass
-
     if not files_to_search:
         return ArtifactSearchResult(
             found=False, artifacts=[], keywords=keywords, scored_artifacts=[]
@@ -0,0 +1,284 @@
+"""
+Per-project index of knowledge artifacts (investigations, decisions, knowledge).
+
+Status checks, verification and the spawn-time artifact hint all look for
+artifacts by workspace name. Walking .kb/investigations and
+.orch/investigations with rglob for every agent and every lookup is the
+slowest part of `orch status` on projects with a long history.
+
+ArtifactIndex keeps the listing of each artifact directory together with the
+directory's mtime. A refresh only stats the directories and re-lists the
+ones whose mtime changed (a file was added, removed or renamed), so lookups
+are dict hits on the file-name tokens instead of tree walks. The index is
+shared by every caller in the process and persisted in
+~/.orch/cache/artifacts/ so the next command starts warm.
+
+File contents are not indexed: an entry's mtime is read when it is looked
+up, and its phase is re-extracted only when the file's mtime or size
+changed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set
+
+INDEX_VERSION = 1
+
+# Where investigation files live: .kb/ first, .orch/ for legacy projects
+INVESTIGATION_ROOTS = ('.kb/investigations', '.orch/investigations')
+
+# Artifact directories searched by the pre-spawn artifact hint
+ORCH_ARTIFACT_ROOTS = ('.orch/investigations', '.orch/decisions', '.orch/knowledge')
+
+INDEXED_ROOTS = tuple(dict.fromkeys(INVESTIGATION_ROOTS + ORCH_ARTIFACT_ROOTS))
+
+# A directory modified this recently is re-listed on the next refresh: a
+# file added within the filesystem's timestamp granularity might not
+# change its mtime
+_RACY_WINDOW_NS = 50_000_000
+
+_LOADED: Dict[str, 'ArtifactIndex'] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def cache_dir() -> Path:
+    """Directory holding the per-project index files."""
+    return Path.home() / '.orch' / 'cache' / 'artifacts'
+
+
+def name_tokens(name: str) -> FrozenSet[str]:
+    """Lowercase hyphen-separated tokens of a file stem or workspace name."""
+    return frozenset(token for token in name.lower().split('-') if token)
+
+
+@dataclass
+class ArtifactEntry:
+    """One indexed .md artifact."""
+    name: str  # file stem
+    path: Path
+    root: str  # index root it was found under, e.g. '.kb/investigations'
+    depth: int  # directories between the root and the file (0 = directly in it)
+    tokens: FrozenSet[str] = field(default_factory=frozenset)
+    mtime: float = 0.0  # filled in when the entry is looked up
+
+
+class ArtifactIndex:
+    """Index of one project's artifact directories."""
+
+    def __init__(self, project_dir: Path, path: Optional[Path] = None):
+        self.project_dir = project_dir
+        self.path = path
+        self._lock = threading.Lock()
+        # relative dir -> {'mtime_ns': int|None, 'files': [names], 'dirs': [names]}
+        self._dirs: Dict[str, Dict[str, Any]] = {}
+        # relative file path -> [mtime_ns, size, phase]
+        self._phases: Dict[str, List[Any]] = {}
+        self._entries: Dict[str, ArtifactEntry] = {}
+        self._by_name: Dict[str, List[ArtifactEntry]] = {}
+        self._by_token: Dict[str, Set[str]] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> 'ArtifactIndex':
+        """Up-to-date index of a project (shared within the process)."""
+        project_dir = Path(project_dir).expanduser().absolute()
+        digest = hashlib.sha1(str(project_dir).encode()).hexdigest()[:16]
+        key = str(project_dir)
+        with _LOADED_LOCK:
+            index = _LOADED.get(key)
+            if index is None:
+                index = cls(project_dir, cache_dir() / f'{digest}.json')
+                _LOADED[key] = index
+        index.refresh()
+        return index
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            return
+        if data.get('project_dir') != str(self.project_dir):
+            return
+        if isinstance(data.get('dirs'), dict):
+            self._dirs = data['dirs']
+        if isinstance(data.get('phases'), dict):
+            self._phases = data['phases']
+
+    def save(self) -> None:
+        """Persist the index if it changed since it was loaded."""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            payload = {
+                'version': INDEX_VERSION,
+                'project_dir': str(self.project_dir),
+                'dirs': self._dirs,
+                'phases': self._phases,
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + '.')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(payload, f)
+                os.replace(tmp_name, self.path)
+            except OSError:
+                return
+            self._dirty = False
+
+    def refresh(self) -> None:
+        """Re-list directories whose mtime changed since they were indexed."""
+        with self._lock:
+            changed = False
+            seen: Set[str] = set()
+            now = time.time_ns()
+            pending = list(INDEXED_ROOTS)
+            while pending:
+                rel_dir = pending.pop()
+                seen.add(rel_dir)
+                try:
+                    mtime_ns = os.stat(self.project_dir / rel_dir).st_mtime_ns
+                except OSError:
+                    continue
+                listing = self._dirs.get(rel_dir)
+                if listing is None or listing.get('mtime_ns') != mtime_ns:
+                    listing = self._list_dir(rel_dir)
+                    # Don't trust a listing taken while the directory may still be changing
+                    listing['mtime_ns'] = None if now - mtime_ns < _RACY_WINDOW_NS else mtime_ns
+                    self._dirs[rel_dir] = listing
+                    changed = True
+                pending.extend(f'{rel_dir}/{name}' for name in listing['dirs'])
+
+            for rel_dir in [d for d in self._dirs if d not in seen]:
+                del self._dirs[rel_dir]
+                changed = True
+
+            if changed or not self._entries and self._dirs:
+                self._rebuild_entries()
+            if changed:
+                self._dirty = True
+        if changed:
+            self.save()
+
+    def _list_dir(self, rel_dir: str) -> Dict[str, Any]:
+        files, dirs = [], []
+        try:
+            with os.scandir(self.project_dir / rel_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        files.append(entry.name)
+        except OSError:
+            pass
+        return {'files': sorted(files), 'dirs': sorted(dirs)}
+
+    def _rebuild_entries(self) -> None:
+        """Recompute the lookup tables from the directory listings (lock held)."""
+        self._entries = {}
+        self._by_name = {}
+        self._by_token = {}
+        for rel_dir, listing in self._dirs.items():
+            root = next((r for r in INDEXED_ROOTS if rel_dir == r or rel_dir.startswith(r + '/')), None)
+            if root is None:
+                continue
+            depth = rel_dir.count('/') - root.count('/')
+            for file_name in listing['files']:
+                rel_path = f'{rel_dir}/{file_name}'
+                stem = file_name[:-len('.md')]
+                entry = ArtifactEntry(
+                    name=stem,
+                    path=self.project_dir / rel_path,
+                    root=root,
+                    depth=depth,
+                    tokens=name_tokens(stem),
+                )
+                self._entries[rel_path] = entry
+                self._by_name.setdefault(stem, []).append(entry)
+                for token in entry.tokens:
+                    self._by_token.setdefault(token, set()).add(rel_path)
+        self._phases = {k: v for k, v in self._phases.items() if k in self._entries}
+
+    @staticmethod
+    def _ordered(entries: Iterable[ArtifactEntry], roots: Optional[Sequence[str]]) -> List[ArtifactEntry]:
+        """Entries under roots (in roots order, then by path), with fresh mtimes."""
+        rank = {root: i for i, root in enumerate(roots or INDEXED_ROOTS)}
+        result = []
+        for entry in sorted((e for e in entries if e.root in rank), key=lambda e: (rank[e.root], str(e.path))):
+            try:
+                entry.mtime = entry.path.stat().st_mtime
+            except OSError:
+                continue  # Removed since the last refresh
+            result.append(entry)
+        return result
+
+    def find(self, name: str, roots: Optional[Sequence[str]] = None) -> List[ArtifactEntry]:
+        """Artifacts whose file stem is exactly name."""
+        with self._lock:
+            entries = list(self._by_name.get(name, []))
+        return self._ordered(entries, roots)
+
+    def find_containing(self, text: str, roots: Optional[Sequence[str]] = None) -> List[ArtifactEntry]:
+        """Artifacts whose file stem contains text (like a `*{text}*.md` glob)."""
+        # Tokens strictly inside text must appear whole in the stem; the
+        # first and last may be cut off (text can start or end mid-token)
+        inner_tokens = text.lower().split('-')[1:-1]
+        with self._lock:
+            if inner_tokens and all(inner_tokens):
+                candidates = set.intersection(*(self._by_token.get(t, set()) for t in inner_tokens))
+                entries = [self._entries[p] for p in candidates]
+            else:
+                entries = list(self._entries.values())
+        return self._ordered((e for e in entries if text in e.name), roots)
+
+    def entries(self, roots: Optional[Sequence[str]] = None) -> List[ArtifactEntry]:
+        """Every indexed artifact under roots."""
+        with self._lock:
+            entries = list(self._entries.values())
+        return self._ordered(entries, roots)
+
+    def phase(self, entry: ArtifactEntry) -> Optional[str]:
+        """Phase of an artifact, re-extracted only when the file changed."""
+        from orch.monitor import extract_phase_from_file
+
+        rel_path = entry.path.relative_to(self.project_dir).as_posix()
+        try:
+            st = entry.path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._phases.get(rel_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        phase = extract_phase_from_file(entry.path)
+        if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+            # Persisted by the next save() (see save_loaded_indexes)
+            with self._lock:
+                self._phases[rel_path] = [st.st_mtime_ns, st.st_size, phase]
+                self._dirty = True
+        return phase
+
+
+def save_loaded_indexes() -> None:
+    """Persist every in-process index with unsaved changes (e.g. new phases)."""
+    with _LOADED_LOCK:
+        indexes = list(_LOADED.values())
+    for index in indexes:
+        index.save()
+
+
+def clear_loaded_indexes() -> None:
+    """Drop the in-process indexes (the files on disk are kept)."""
+    with _LOADED_LOCK:
+        _LOADED.clear()
@@ -0,0 +1,202 @@
+"""
+On-disk cache of `bd` query results, keyed by the beads database's state.
+
+Beads state only changes when its database changes, so parsed `bd show`,
+`bd comments` and `bd list` replies are kept in
+~/.orch/cache/beads/<hash of db path>.json together with the stat signature
+(mtime, size) of the database, its SQLite WAL and the issues.jsonl export.
+A cache whose signature no longer matches is discarded on the next read, so
+repeated `orch status` / `orch wait` runs against an unchanged database do no
+subprocess work. Writes made through orch drop the cache explicitly.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_VERSION = 1
+
+# A database modified this recently is not cached: a second write within the
+# filesystem's timestamp granularity could keep the same mtime and size
+_RACY_WINDOW_NS = 50_000_000
+
+# Cache state shared by BeadsIntegration instances in this process, by cache file
+_LOADED: Dict[str, 'BeadsQueryCache'] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def cache_dir() -> Path:
+    """Directory holding the per-database cache files."""
+    return Path.home() / '.orch' / 'cache' / 'beads'
+
+
+def find_beads_db(start: Optional[Path] = None) -> Optional[Path]:
+    """
+    Locate the database `bd` would use when no --db flag is given.
+
+    Honours $BEADS_DB, then walks up from start (default: cwd) looking for
+    .beads/*.db, preferring beads.db.
+    """
+    env_db = os.environ.get('BEADS_DB')
+    if env_db:
+        return Path(env_db)
+
+    current = (start or Path.cwd()).resolve()
+    for directory in (current, *current.parents):
+        beads_dir = directory / '.beads'
+        if not beads_dir.is_dir():
+            continue
+        default_db = beads_dir / 'beads.db'
+        if default_db.exists():
+            return default_db
+        dbs = sorted(beads_dir.glob('*.db'))
+        if dbs:
+            return dbs[0]
+    return None
+
+
+def db_signature(db_path: Path) -> Optional[Tuple[Any, ...]]:
+    """(mtime_ns, size) of the database and its sidecar files, None if the db is missing."""
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    signature = [st.st_mtime_ns, st.st_size]
+    for sidecar in (db_path.with_name(db_path.name + '-wal'), db_path.parent / 'issues.jsonl'):
+        try:
+            side_st = os.stat(sidecar)
+            signature.extend([side_st.st_mtime_ns, side_st.st_size])
+        except OSError:
+            signature.extend([None, None])
+    return tuple(signature)
+
+
+def signature_is_racy(signature: Tuple[Any, ...]) -> bool:
+    """True if a file in the signature changed too recently to trust its mtime."""
+    now = time.time_ns()
+    return any(
+        mtime is not None and now - mtime < _RACY_WINDOW_NS
+        for mtime in signature[0::2]
+    )
+
+
+class BeadsQueryCache:
+    """Parsed `bd` replies for one beads database, invalidated by its stat signature."""
+
+    def __init__(self, db_path: Path, path: Path):
+        self.db_path = db_path
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._entries: Dict[str, Dict[str, Any]] = {'issues': {}, 'comments': {}, 'lists': {}}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_db(cls, db_path: Optional[str] = None) -> Optional['BeadsQueryCache']:
+        """
+        Cache for an explicit --db path, or for the database bd would discover.
+
+        Returns None when no database file can be found (nothing to key on).
+        """
+        db = Path(db_path).expanduser() if db_path else find_beads_db()
+        if db is None or not db.exists():
+            return None
+        db = db.resolve()
+        digest = hashlib.sha1(str(db).encode()).hexdigest()[:16]
+        path = cache_dir() / f'{digest}.json'
+        key = str(path)
+        with _LOADED_LOCK:
+            cache = _LOADED.get(key)
+            if cache is None:
+                cache = cls(db, path)
+                _LOADED[key] = cache
+            return cache
+
+    def _empty(self) -> None:
+        self._entries = {'issues': {}, 'comments': {}, 'lists': {}}
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return
+        signature = data.get('signature')
+        entries = data.get('entries')
+        if isinstance(signature, list) and isinstance(entries, dict):
+            self._signature = tuple(signature)
+            for section in self._entries:
+                if isinstance(entries.get(section), dict):
+                    self._entries[section] = entries[section]
+
+    def _validate(self) -> None:
+        """Drop entries if the database changed since they were stored (lock held)."""
+        current = db_signature(self.db_path)
+        if current != self._signature:
+            self._empty()
+            self._signature = current
+            self._dirty = False
+
+    def get(self, section: str, key: str) -> Optional[Any]:
+        """Cached value, or None if missing or the database has changed."""
+        with self._lock:
+            self._validate()
+            return self._entries[section].get(key)
+
+    def put(self, section: str, key: str, value: Any) -> None:
+        """
+        Remember a value fetched after a get() miss; persisted by save().
+
+        Ignored if the database changed since that get(), as the value may
+        predate the change.
+        """
+        with self._lock:
+            if self._signature is None or db_signature(self.db_path) != self._signature:
+                return
+            self._entries[section][key] = value
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write pending entries to disk (skipped while the database is mid-write)."""
+        with self._lock:
+            if not self._dirty or self._signature is None or signature_is_racy(self._signature):
+                return
+            payload = {
+                'version': CACHE_VERSION,
+                'db_path': str(self.db_path),
+                'signature': list(self._signature),
+                'entries': self._entries,
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + '.')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(payload, f)
+                os.replace(tmp_name, self.path)
+            except OSError:
+                return
+            self._dirty = False
+
+    def invalidate(self) -> None:
+        """Forget everything (called after orch writes to the database)."""
+        with self._lock:
+            self._empty()
+            self._signature = None
+            self._dirty = False
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+
+def clear_loaded_caches() -> None:
+    """Drop the in-process cache objects (the files on disk are kept)."""
+    with _LOADED_LOCK:
+        _LOADED.clear()
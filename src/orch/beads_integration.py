@@ -4,9 +4,43 @@ Provides a wrapper around the `bd` CLI for fetching and updating beads issues.
 """
 
 import json
+import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from orch.beads_cache import BeadsQueryCache, db_signature, find_beads_db, signature_is_racy
+from orch.beads_reader import BeadsDirectReader, BeadsReaderError, open_reader
+
+# Concurrent `bd comments` calls when comments don't come with `bd show`
+COMMENTS_MAX_WORKERS = 8
+
+# Seconds a single `bd comments` call may take in bulk fetches before its
+# issue is skipped (so one hung call can't stall a whole listing)
+BULK_CALL_TIMEOUT = 15
+
+# Parsed comments per (db_path, issue_id), shared by every BeadsIntegration
+# in the process so one command parses an issue's comments once. Each entry
+# keeps the signature of the database it was read from, so a long-running
+# process (orch statusd) refetches once the database changes. Timelines of a
+# store without a usable signature (no .db file, or one that just changed)
+# are only kept per instance.
+_TIMELINES: Dict[Tuple[Optional[str], str], Tuple[Any, 'IssueTimeline']] = {}
+_TIMELINES_LOCK = threading.Lock()
+
+# Structured comments agents post (each matched at the start of a comment)
+_PHASE_RE = re.compile(r"Phase:\s*(\w+)")
+_INVESTIGATION_PATH_RE = re.compile(r"investigation_path:\s*(.+)")
+_AGENT_METADATA_RE = re.compile(r"agent_metadata:\s*(\{.+\})")
+
+
+def clear_timelines() -> None:
+    """Forget every memoized issue timeline."""
+    with _TIMELINES_LOCK:
+        _TIMELINES.clear()
 
 
 class BeadsCLINotFoundError(Exception):
@@ -50,19 +84,211 @@ class BeadsIssue:
     dependents: Optional[list] = None  # List of BeadsDependency (child issues of this parent)
 
 
+def _parse_dependencies(deps_data: Optional[list]) -> Optional[list]:
+    """Parse a `bd show --json` dependency list into BeadsDependency objects."""
+    if deps_data is None:
+        return None
+    return [
+        BeadsDependency(
+            id=dep.get("id", ""),
+            title=dep.get("title", ""),
+            status=dep.get("status", ""),
+            dependency_type=dep.get("dependency_type", "")
+        )
+        for dep in deps_data
+    ]
+
+
+def _parse_issue(issue_data: dict, issue_id: str) -> BeadsIssue:
+    """Build a BeadsIssue from one `bd show --json` entry."""
+    return BeadsIssue(
+        id=issue_data.get("id", issue_id),
+        title=issue_data.get("title", ""),
+        description=issue_data.get("description", ""),
+        status=issue_data.get("status", ""),
+        priority=issue_data.get("priority", 0),
+        notes=issue_data.get("notes"),
+        dependencies=_parse_dependencies(issue_data.get("dependencies")),
+        issue_type=issue_data.get("issue_type"),
+        labels=issue_data.get("labels"),  # None if key missing, [] if empty array
+        dependents=_parse_dependencies(issue_data.get("dependents")),
+    )
+
+
+@dataclass
+class PhaseReport:
+    """One "Phase: ..." comment on a beads issue."""
+
+    phase: str  # e.g. "Implementing", "Complete"
+    text: str  # Full comment text, including any summary after the phase
+    created_at: Optional[str] = None
+
+
+@dataclass
+class IssueTimeline:
+    """Everything orch reads from an issue's comments, parsed in one pass.
+
+    Agents report progress through structured comments:
+      Phase: <phase> - <summary>
+      investigation_path: <path>
+      agent_metadata: {...}
+    The latest of each kind wins (comments are chronologically ordered).
+    """
+
+    issue_id: str
+    phases: List[PhaseReport]
+    investigation_path: Optional[str] = None
+    metadata: Optional[dict] = None
+
+    @property
+    def phase(self) -> Optional[str]:
+        """Latest reported phase, or None if the agent hasn't reported one."""
+        return self.phases[-1].phase if self.phases else None
+
+    @classmethod
+    def from_comments(cls, issue_id: str, comments: Optional[list]) -> 'IssueTimeline':
+        """Build the timeline from a `bd comments --json` list."""
+        timeline = cls(issue_id=issue_id, phases=[])
+        for comment in comments or []:
+            if not isinstance(comment, dict):
+                continue
+            text = comment.get("text") or ""
+            match = _PHASE_RE.match(text)
+            if match:
+                timeline.phases.append(PhaseReport(match.group(1), text, comment.get("created_at")))
+                continue
+            match = _INVESTIGATION_PATH_RE.match(text)
+            if match:
+                timeline.investigation_path = match.group(1).strip()
+                continue
+            match = _AGENT_METADATA_RE.match(text)
+            if match:
+                try:
+                    timeline.metadata = json.loads(match.group(1))
+                except json.JSONDecodeError:
+                    continue
+        return timeline
+
+
+def phase_from_comments(comments: Optional[list]) -> Optional[str]:
+    """Latest "Phase: ..." value in a chronologically ordered comment list."""
+    return IssueTimeline.from_comments("", comments).phase
+
+
+def child_convergence(issue: BeadsIssue) -> Optional[dict]:
+    """Child issue completion stats of a parent issue (None if no children)."""
+    if issue.dependents is None or len(issue.dependents) == 0:
+        return None
+
+    stats = {
+        "total": len(issue.dependents),
+        "closed": 0,
+        "in_progress": 0,
+        "open": 0,
+    }
+
+    for child in issue.dependents:
+        if child.status == "closed":
+            stats["closed"] += 1
+        elif child.status == "in_progress":
+            stats["in_progress"] += 1
+        else:
+            stats["open"] += 1
+
+    return stats
+
+
 class BeadsIntegration:
     """Wrapper around the beads (bd) CLI."""
 
-    def __init__(self, cli_path: str = "bd", db_path: Optional[str] = None):
+    def __init__(
+        self,
+        cli_path: str = "bd",
+        db_path: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        direct_read: Optional[bool] = None,
+    ):
         """Initialize BeadsIntegration.
 
         Args:
             cli_path: Path to the bd CLI executable. Defaults to "bd".
             db_path: Optional absolute path to beads database. If provided,
                      all bd commands will include --db flag for cross-repo access.
+            use_cache: Reuse bd query results from ~/.orch/cache/beads/ while
+                       the database is unchanged. Defaults to the
+                       beads_query_cache config setting.
+            direct_read: Read issues and comments straight from the beads
+                         store (read-only) instead of running bd, when its
+                         schema is recognized. Defaults to the
+                         beads_direct_read config setting.
         """
         self.cli_path = cli_path
         self.db_path = db_path
+        # Comments that came with `bd show --json` output (see get_many)
+        self._show_comments: Dict[str, list] = {}
+        # Timelines that couldn't go into the shared memo (see _remember_timeline)
+        self._timelines: Dict[str, IssueTimeline] = {}
+        if use_cache is None:
+            from orch.config import get_beads_query_cache_enabled
+            use_cache = get_beads_query_cache_enabled()
+        self._use_cache = use_cache
+        self._query_cache: Optional[BeadsQueryCache] = None
+        self._query_cache_resolved = False
+        if direct_read is None:
+            from orch.config import get_beads_direct_read_enabled
+            direct_read = get_beads_direct_read_enabled()
+        self._direct_read = direct_read
+        self._direct_reader: Optional[BeadsDirectReader] = None
+        self._direct_reader_resolved = False
+
+    @property
+    def query_cache(self) -> Optional[BeadsQueryCache]:
+        """On-disk query cache for this database (None if disabled or no db file)."""
+        if not self._query_cache_resolved:
+            self._query_cache_resolved = True
+            if self._use_cache:
+                self._query_cache = BeadsQueryCache.for_db(self.db_path)
+        return self._query_cache
+
+    @property
+    def direct_reader(self) -> Optional[BeadsDirectReader]:
+        """Read-only store reader (None if disabled, no store, or unrecognized schema)."""
+        if not self._direct_reader_resolved:
+            self._direct_reader_resolved = True
+            if self._direct_read:
+                self._direct_reader = open_reader(self.db_path)
+        return self._direct_reader
+
+    def _read_direct(self, read: Callable[[BeadsDirectReader], Any]) -> Tuple[bool, Any]:
+        """Run a direct read; (False, None) means the caller should use bd instead."""
+        reader = self.direct_reader
+        if reader is None:
+            return False, None
+        try:
+            return True, read(reader)
+        except BeadsReaderError:
+            # Don't retry a store that failed to read; bd handles the rest
+            self._direct_reader = None
+            return False, None
+
+    def _invalidate_cache(self) -> None:
+        """Forget cached query results after a write through bd."""
+        self._show_comments.clear()
+        self._timelines.clear()
+        with _TIMELINES_LOCK:
+            for key in [k for k in _TIMELINES if k[0] == self.db_path]:
+                del _TIMELINES[key]
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
+
+    def _remember_issue(self, issue_id: str, issue_data: dict) -> None:
+        """Keep a `bd show` entry (and any comments it carries) for reuse."""
+        if "comments" in issue_data:
+            self._show_comments[issue_id] = issue_data.get("comments") or []
+        if self.query_cache is not None:
+            self.query_cache.put("issues", issue_id, issue_data)
+            if "comments" in issue_data:
+                self.query_cache.put("comments", issue_id, issue_data.get("comments") or [])
 
     def _build_command(self, *args) -> list:
         """Build command with optional --db flag.
@@ -92,6 +318,23 @@ class BeadsIntegration:
             BeadsCLINotFoundError: If bd CLI is not installed
             BeadsIssueNotFoundError: If the issue doesn't exist
         """
+        cache = self.query_cache
+        if cache is not None:
+            cached = cache.get("issues", issue_id)
+            if cached is not None:
+                if "comments" in cached:
+                    self._show_comments[issue_id] = cached.get("comments") or []
+                return _parse_issue(cached, issue_id)
+
+        ok, direct = self._read_direct(lambda reader: reader.show([issue_id]))
+        if ok:
+            if issue_id not in direct:
+                raise BeadsIssueNotFoundError(issue_id)
+            self._remember_issue(issue_id, direct[issue_id])
+            if cache is not None:
+                cache.save()
+            return _parse_issue(direct[issue_id], issue_id)
+
         try:
             result = subprocess.run(
                 self._build_command("show", issue_id, "--json"),
@@ -113,50 +356,232 @@ class BeadsIntegration:
             raise BeadsIssueNotFoundError(issue_id)
 
         issue_data = issues[0]
+        self._remember_issue(issue_id, issue_data)
+        if cache is not None:
+            cache.save()
+        return _parse_issue(issue_data, issue_id)
 
-        # Parse dependencies if present
-        dependencies = None
-        deps_data = issue_data.get("dependencies")
-        if deps_data is not None:
-            dependencies = [
-                BeadsDependency(
-                    id=dep.get("id", ""),
-                    title=dep.get("title", ""),
-                    status=dep.get("status", ""),
-                    dependency_type=dep.get("dependency_type", "")
-                )
-                for dep in deps_data
-            ]
-
-        # Parse labels if present
-        labels = issue_data.get("labels")  # None if key missing, [] if empty array
-
-        # Parse dependents (child issues) if present
-        dependents = None
-        dependents_data = issue_data.get("dependents")
-        if dependents_data is not None:
-            dependents = [
-                BeadsDependency(
-                    id=dep.get("id", ""),
-                    title=dep.get("title", ""),
-                    status=dep.get("status", ""),
-                    dependency_type=dep.get("dependency_type", "")
+    def get_many(self, issue_ids: Iterable[str]) -> Dict[str, BeadsIssue]:
+        """Get several beads issues with one `bd show id1 id2 ... --json` call.
+
+        If bd rejects the batch (e.g. one of the IDs doesn't exist), falls
+        back to fetching the issues one by one.
+
+        Args:
+            issue_ids: Beads issue IDs
+
+        Returns:
+            Dict of issue ID -> BeadsIssue; IDs that don't exist are left out
+
+        Raises:
+            BeadsCLINotFoundError: If bd CLI is not installed
+        """
+        ids = list(dict.fromkeys(i for i in issue_ids if i))
+        found: Dict[str, BeadsIssue] = {}
+        cache = self.query_cache
+        if cache is not None:
+            for issue_id in ids:
+                cached = cache.get("issues", issue_id)
+                if cached is not None:
+                    found[issue_id] = _parse_issue(cached, issue_id)
+                    if "comments" in cached:
+                        self._show_comments[issue_id] = cached.get("comments") or []
+            ids = [i for i in ids if i not in found]
+        if not ids:
+            return found
+
+        ok, direct = self._read_direct(lambda reader: reader.show(ids))
+        if ok:
+            for issue_id, issue_data in direct.items():
+                found[issue_id] = _parse_issue(issue_data, issue_id)
+                self._remember_issue(issue_id, issue_data)
+            if cache is not None:
+                cache.save()
+            return found
+
+        try:
+            result = subprocess.run(
+                self._build_command("show", *ids, "--json"),
+                capture_output=True,
+                text=True,
+            )
+        except FileNotFoundError:
+            raise BeadsCLINotFoundError()
+
+        issues = None
+        if result.returncode == 0:
+            try:
+                issues = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                issues = None
+
+        if not isinstance(issues, list):
+            if len(ids) == 1:
+                return found
+            for issue_id in ids:
+                try:
+                    found[issue_id] = self.get_issue(issue_id)
+                except BeadsIssueNotFoundError:
+                    continue
+            return found
+
+        for issue_data in issues:
+            if not isinstance(issue_data, dict) or not issue_data.get("id"):
+                continue
+            issue_id = issue_data["id"]
+            found[issue_id] = _parse_issue(issue_data, issue_id)
+            self._remember_issue(issue_id, issue_data)
+        if cache is not None:
+            cache.save()
+        return found
+
+    def get_comments(self, issue_id: str) -> list:
+        """Get the comments of a beads issue (chronologically ordered).
+
+        Raises:
+            BeadsCLINotFoundError: If bd CLI is not installed
+            BeadsIssueNotFoundError: If the issue doesn't exist
+        """
+        cache = self.query_cache
+        if cache is not None:
+            cached = cache.get("comments", issue_id)
+            if cached is not None:
+                return cached
+        comments = self._fetch_comments(issue_id)
+        if cache is not None:
+            cache.put("comments", issue_id, comments)
+            cache.save()
+        return comments
+
+    def _fetch_comments(self, issue_id: str, timeout: Optional[float] = None) -> list:
+        """Read comments from the store or `bd comments <id> --json` (uncached).
+
+        Raises:
+            subprocess.TimeoutExpired: If bd runs longer than timeout seconds
+        """
+        ok, direct = self._read_direct(lambda reader: reader.comments(issue_id))
+        if ok:
+            if direct is None:
+                raise BeadsIssueNotFoundError(issue_id)
+            return direct
+
+        try:
+            result = subprocess.run(
+                self._build_command("comments", issue_id, "--json"),
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except FileNotFoundError:
+            raise BeadsCLINotFoundError()
+
+        if result.returncode != 0:
+            raise BeadsIssueNotFoundError(issue_id)
+
+        try:
+            comments = json.loads(result.stdout)
+        except json.JSONDecodeError:
+            return []
+        return comments if isinstance(comments, list) else []
+
+    def comments_many(
+        self,
+        issue_ids: Iterable[str],
+        timeout: Optional[float] = None,
+        max_workers: int = COMMENTS_MAX_WORKERS,
+    ) -> Dict[str, list]:
+        """Get the comments of several beads issues.
+
+        Comments included in an earlier get_many()/get_issue() `bd show`
+        reply are reused; the rest are fetched with `bd comments`, several at
+        a time.
+
+        Args:
+            issue_ids: Beads issue IDs
+            timeout: Optional limit in seconds for each `bd comments` call;
+                     issues whose call times out are left out
+            max_workers: Maximum concurrent `bd comments` calls
+
+        Returns:
+            Dict of issue ID -> comment list; IDs that don't exist are left out
+
+        Raises:
+            BeadsCLINotFoundError: If bd CLI is not installed
+        """
+        ids = list(dict.fromkeys(i for i in issue_ids if i))
+        found = {i: self._show_comments[i] for i in ids if i in self._show_comments}
+        cache = self.query_cache
+        if cache is not None:
+            for issue_id in ids:
+                if issue_id not in found:
+                    cached = cache.get("comments", issue_id)
+                    if cached is not None:
+                        found[issue_id] = cached
+        missing = [i for i in ids if i not in found]
+        if not missing:
+            return found
+
+        def fetch(issue_id: str) -> Optional[list]:
+            try:
+                return self._fetch_comments(issue_id, timeout=timeout)
+            except (BeadsIssueNotFoundError, subprocess.TimeoutExpired):
+                return None
+
+        workers = max(1, min(max_workers, len(missing)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for issue_id, comments in zip(missing, pool.map(fetch, missing)):
+                if comments is not None:
+                    found[issue_id] = comments
+                    if cache is not None:
+                        cache.put("comments", issue_id, comments)
+        if cache is not None:
+            cache.save()
+        return found
+
+    def list_issues(self, status: Optional[str] = None) -> list:
+        """List issues with one `bd list --json` call.
+
+        Args:
+            status: Optional status filter (e.g. "open", "in_progress")
+
+        Returns:
+            List of raw issue dicts (empty on failure)
+
+        Raises:
+            BeadsCLINotFoundError: If bd CLI is not installed
+        """
+        cache = self.query_cache
+        if cache is not None:
+            cached = cache.get("lists", status or "")
+            if cached is not None:
+                return cached
+
+        ok, issues = self._read_direct(lambda reader: reader.list_issues(status))
+        if not ok:
+            args = ["list"]
+            if status:
+                args.append(f"--status={status}")
+            try:
+                result = subprocess.run(
+                    self._build_command(*args, "--json"),
+                    capture_output=True,
+                    text=True,
                 )
-                for dep in dependents_data
-            ]
-
-        return BeadsIssue(
-            id=issue_data.get("id", issue_id),
-            title=issue_data.get("title", ""),
-            description=issue_data.get("description", ""),
-            status=issue_data.get("status", ""),
-            priority=issue_data.get("priority", 0),
-            notes=issue_data.get("notes"),
-            dependencies=dependencies,
-            issue_type=issue_data.get("issue_type"),
-            labels=labels,
-            dependents=dependents,
-        )
+            except FileNotFoundError:
+                raise BeadsCLINotFoundError()
+
+            if result.returncode != 0:
+                return []
+            try:
+                issues = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                return []
+            if not isinstance(issues, list):
+                return []
+        if cache is not None:
+            cache.put("lists", status or "", issues)
+            cache.save()
+        return issues
 
     def get_open_blockers(self, issue_id: str) -> list:
         """Get list of open blockers for an issue.
@@ -201,26 +626,7 @@ class BeadsIntegration:
             BeadsCLINotFoundError: If bd CLI is not installed
             BeadsIssueNotFoundError: If the issue doesn't exist
         """
-        issue = self.get_issue(issue_id)
-        if issue.dependents is None or len(issue.dependents) == 0:
-            return None
-
-        stats = {
-            "total": len(issue.dependents),
-            "closed": 0,
-            "in_progress": 0,
-            "open": 0,
-        }
-
-        for child in issue.dependents:
-            if child.status == "closed":
-                stats["closed"] += 1
-            elif child.status == "in_progress":
-                stats["in_progress"] += 1
-            else:
-                stats["open"] += 1
-
-        return stats
+        return child_convergence(self.get_issue(issue_id))
 
     def update_issue_notes(self, issue_id: str, notes: str) -> None:
         """Update the notes field of a beads issue.
@@ -241,6 +647,7 @@ class BeadsIntegration:
             )
         except FileNotFoundError:
             raise BeadsCLINotFoundError()
+        self._invalidate_cache()
 
         if result.returncode != 0:
             raise BeadsIssueNotFoundError(issue_id)
@@ -278,6 +685,7 @@ class BeadsIntegration:
             )
         except FileNotFoundError:
             raise BeadsCLINotFoundError()
+        self._invalidate_cache()
 
         if result.returncode != 0:
             raise BeadsIssueNotFoundError(issue_id)
@@ -304,6 +712,7 @@ class BeadsIntegration:
             )
         except FileNotFoundError:
             raise BeadsCLINotFoundError()
+        self._invalidate_cache()
 
         if result.returncode != 0:
             raise BeadsIssueNotFoundError(issue_id)
@@ -326,37 +735,48 @@ class BeadsIntegration:
             BeadsCLINotFoundError: If bd CLI is not installed
             BeadsIssueNotFoundError: If the issue doesn't exist
         """
-        try:
-            result = subprocess.run(
-                self._build_command("comments", issue_id, "--json"),
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            raise BeadsCLINotFoundError()
+        return self.get_timeline(issue_id).phase
 
-        if result.returncode != 0:
-            raise BeadsIssueNotFoundError(issue_id)
+    def get_timeline(self, issue_id: str) -> IssueTimeline:
+        """Phase history, investigation path and agent metadata of an issue.
 
-        try:
-            comments = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return None
-
-        if not comments:
-            return None
+        Built from a single comments fetch and shared by every instance for
+        the same database while the database is unchanged (and until orch
+        writes to beads).
 
-        # Find the latest "Phase: ..." comment (comments are chronologically ordered)
-        import re
-        latest_phase = None
-        for comment in comments:
-            text = comment.get("text", "")
-            # Match "Phase: <phase>" at start of comment
-            match = re.match(r"Phase:\s*(\w+)", text)
-            if match:
-                latest_phase = match.group(1)
-
-        return latest_phase
+        Raises:
+            BeadsCLINotFoundError: If bd CLI is not installed
+            BeadsIssueNotFoundError: If the issue doesn't exist
+        """
+        if issue_id in self._timelines:
+            return self._timelines[issue_id]
+        signature = self._db_signature()
+        if signature is not None:
+            with _TIMELINES_LOCK:
+                cached = _TIMELINES.get((self.db_path, issue_id))
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        comments = self._show_comments.get(issue_id)
+        if comments is None:
+            comments = self.get_comments(issue_id)
+        timeline = IssueTimeline.from_comments(issue_id, comments)
+        self._remember_timeline(issue_id, timeline, signature)
+        return timeline
+
+    def _db_signature(self) -> Any:
+        """Stat signature of the database, None if there's no database file."""
+        db = Path(self.db_path).expanduser() if self.db_path else find_beads_db()
+        return db_signature(db) if db is not None else None
+
+    def _remember_timeline(self, issue_id: str, timeline: 'IssueTimeline', signature: Any) -> None:
+        # Without a trustworthy signature a later change to the store can't
+        # be detected, so the timeline must not outlive this instance
+        if signature is None or signature_is_racy(signature):
+            self._timelines[issue_id] = timeline
+            return
+        with _TIMELINES_LOCK:
+            _TIMELINES[(self.db_path, issue_id)] = (signature, timeline)
 
     def has_phase_complete(self, issue_id: str) -> bool:
         """Check if issue has a "Phase: Complete" comment.
@@ -390,37 +810,7 @@ class BeadsIntegration:
             BeadsCLINotFoundError: If bd CLI is not installed
             BeadsIssueNotFoundError: If the issue doesn't exist
         """
-        try:
-            result = subprocess.run(
-                self._build_command("comments", issue_id, "--json"),
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            raise BeadsCLINotFoundError()
-
-        if result.returncode != 0:
-            raise BeadsIssueNotFoundError(issue_id)
-
-        try:
-            comments = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return None
-
-        if not comments:
-            return None
-
-        # Find the latest "investigation_path: ..." comment (comments are chronologically ordered)
-        import re
-        latest_path = None
-        for comment in comments:
-            text = comment.get("text", "")
-            # Match "investigation_path: <path>" at start of comment
-            match = re.match(r"investigation_path:\s*(.+)", text)
-            if match:
-                latest_path = match.group(1).strip()
-
-        return latest_path
+        return self.get_timeline(issue_id).investigation_path
 
     def add_comment(self, issue_id: str, comment: str) -> None:
         """Add a comment to a beads issue.
@@ -441,6 +831,7 @@ class BeadsIntegration:
             )
         except FileNotFoundError:
             raise BeadsCLINotFoundError()
+        self._invalidate_cache()
 
         if result.returncode != 0:
             raise BeadsIssueNotFoundError(issue_id)
@@ -500,47 +891,21 @@ class BeadsIntegration:
             BeadsCLINotFoundError: If bd CLI is not installed
             BeadsIssueNotFoundError: If the issue doesn't exist
         """
-        try:
-            result = subprocess.run(
-                self._build_command("comments", issue_id, "--json"),
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            raise BeadsCLINotFoundError()
-
-        if result.returncode != 0:
-            raise BeadsIssueNotFoundError(issue_id)
+        return self.get_timeline(issue_id).metadata
 
-        try:
-            comments = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return None
-
-        if not comments:
-            return None
-
-        # Find the latest "agent_metadata: {...}" comment
-        import re
-        latest_metadata = None
-        for comment in comments:
-            text = comment.get("text", "")
-            # Match "agent_metadata: {...}" at start of comment
-            match = re.match(r"agent_metadata:\s*(\{.+\})", text)
-            if match:
-                try:
-                    latest_metadata = json.loads(match.group(1))
-                except json.JSONDecodeError:
-                    continue
-
-        return latest_metadata
-
-    def list_active_agents(self) -> list:
+    def list_active_agents(self, timeout: float = BULK_CALL_TIMEOUT) -> list:
         """List active agents by querying beads issues with in_progress status.
 
         This is part of Phase 2 of registry removal: use beads to find
         active agents instead of reading from agent-registry.json.
 
+        Agent metadata comes from each issue's comments, fetched concurrently
+        (see comments_many) rather than one `bd comments` call after another.
+
+        Args:
+            timeout: Limit in seconds for each issue's comments fetch; an
+                     issue that times out is listed without metadata
+
         Returns:
             List of dicts with agent metadata for active issues.
             Each dict has keys: beads_id, title, agent_id, window_id, skill, project_dir
@@ -548,43 +913,24 @@ class BeadsIntegration:
         Raises:
             BeadsCLINotFoundError: If bd CLI is not installed
         """
-        try:
-            result = subprocess.run(
-                self._build_command("list", "--status=in_progress", "--json"),
-                capture_output=True,
-                text=True,
-            )
-        except FileNotFoundError:
-            raise BeadsCLINotFoundError()
-
-        if result.returncode != 0:
-            return []
-
-        try:
-            issues = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return []
+        signature = self._db_signature()
+        issues = [issue for issue in self.list_issues("in_progress") if issue.get("id")]
+        comments = self.comments_many((issue["id"] for issue in issues), timeout=timeout)
 
         agents = []
         for issue in issues:
-            issue_id = issue.get("id")
-            if not issue_id:
-                continue
-
-            # Get agent metadata from comments
-            try:
-                metadata = self.get_agent_metadata(issue_id)
-            except (BeadsCLINotFoundError, BeadsIssueNotFoundError):
-                metadata = None
-
+            issue_id = issue["id"]
             agent_info = {
                 "beads_id": issue_id,
                 "title": issue.get("title", ""),
                 "status": issue.get("status", ""),
             }
 
-            if metadata:
-                agent_info.update(metadata)
+            if issue_id in comments:
+                timeline = IssueTimeline.from_comments(issue_id, comments[issue_id])
+                self._remember_timeline(issue_id, timeline, signature)
+                if timeline.metadata:
+                    agent_info.update(timeline.metadata)
 
             agents.append(agent_info)
 
@@ -751,6 +1097,7 @@ class BeadsIntegration:
             )
         except FileNotFoundError:
             raise BeadsCLINotFoundError()
+        self._invalidate_cache()
 
         if result.returncode != 0:
             raise RuntimeError(f"Failed to create beads issue: {result.stderr.strip()}")
@@ -814,3 +1161,74 @@ class BeadsIntegration:
             return issues if issues else []
         except json.JSONDecodeError:
             return []
+
+
+class BeadsBatch:
+    """Issues and comments of many beads IDs, fetched in bulk per database.
+
+    Built once per command (e.g. `orch status`), so the phase, title and child
+    convergence of every agent come from one `bd show` call per database
+    (plus `bd comments` where show doesn't include comments) instead of
+    separate bd calls per agent and field.
+    """
+
+    def __init__(self):
+        self.issues: Dict[Tuple[Optional[str], str], BeadsIssue] = {}
+        self.comments: Dict[Tuple[Optional[str], str], list] = {}
+        self._timelines: Dict[Tuple[Optional[str], str], IssueTimeline] = {}
+
+    @classmethod
+    def fetch(cls, refs: Iterable[Tuple[str, Optional[str]]], cli_path: str = "bd") -> 'BeadsBatch':
+        """Fetch issues and comments.
+
+        Args:
+            refs: (beads_id, db_path) pairs; db_path None means the default database
+            cli_path: Path to the bd CLI executable
+
+        Returns:
+            BeadsBatch (empty if the bd CLI is not installed)
+        """
+        batch = cls()
+        by_db: Dict[Optional[str], List[str]] = {}
+        for beads_id, db_path in refs:
+            if beads_id:
+                by_db.setdefault(db_path or None, []).append(beads_id)
+
+        for db_path, ids in by_db.items():
+            beads = BeadsIntegration(cli_path=cli_path, db_path=db_path)
+            try:
+                issues = beads.get_many(ids)
+                comments = beads.comments_many(ids)
+            except BeadsCLINotFoundError:
+                return batch
+            for issue_id, issue in issues.items():
+                batch.issues[(db_path, issue_id)] = issue
+            for issue_id, issue_comments in comments.items():
+                batch.comments[(db_path, issue_id)] = issue_comments
+        return batch
+
+    def issue(self, beads_id: str, db_path: Optional[str] = None) -> Optional[BeadsIssue]:
+        """The issue, or None if it wasn't found."""
+        return self.issues.get((db_path or None, beads_id))
+
+    def has_comments(self, beads_id: str, db_path: Optional[str] = None) -> bool:
+        """Whether comments were fetched for the issue."""
+        return (db_path or None, beads_id) in self.comments
+
+    def timeline(self, beads_id: str, db_path: Optional[str] = None) -> IssueTimeline:
+        """Parsed comments of the issue (empty if none were fetched)."""
+        key = (db_path or None, beads_id)
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            timeline = IssueTimeline.from_comments(beads_id, self.comments.get(key))
+            self._timelines[key] = timeline
+        return timeline
+
+    def phase(self, beads_id: str, db_path: Optional[str] = None) -> Optional[str]:
+        """Latest "Phase: ..." reported in the issue's comments."""
+        return self.timeline(beads_id, db_path).phase
+
+    def convergence(self, beads_id: str, db_path: Optional[str] = None) -> Optional[dict]:
+        """Child convergence stats (None if no children or issue not found)."""
+        issue = self.issue(beads_id, db_path)
+        return child_convergence(issue) if issue else None
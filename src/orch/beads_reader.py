@@ -0,0 +1,270 @@
+"""
+Read-only access to a beads store without going through the `bd` CLI.
+
+Hot read paths (phase from comments, issue title and status, child
+convergence) otherwise pay for a Go process start and JSON encoding per
+call. BeadsDirectReader opens the beads SQLite database read-only, or the
+issues.jsonl export when a project has no database, and returns data shaped
+like `bd show --json` / `bd comments --json` / `bd list --json`, so callers
+parse it exactly as they would CLI output.
+
+The reader only accepts stores it understands: a SQLite database must have
+the tables and columns listed in REQUIRED_COLUMNS. Anything else makes
+open_reader() return None and callers fall back to the CLI. Writes always
+go through `bd`.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from orch.beads_cache import find_beads_db
+
+JSONL_NAME = 'issues.jsonl'
+
+# Beads SQLite schema this reader understands (table -> required columns)
+REQUIRED_COLUMNS = {
+    'issues': {'id', 'title', 'description', 'status', 'priority', 'issue_type', 'notes'},
+    'dependencies': {'issue_id', 'depends_on_id', 'type'},
+    'labels': {'issue_id', 'label'},
+    'comments': {'id', 'issue_id', 'author', 'text', 'created_at'},
+}
+
+# Issue columns copied into `bd show --json`-shaped dicts when present
+_ISSUE_FIELDS = (
+    'id', 'title', 'description', 'design', 'acceptance_criteria', 'notes',
+    'status', 'priority', 'issue_type', 'assignee', 'created_at', 'updated_at',
+    'closed_at',
+)
+
+
+class BeadsReaderError(Exception):
+    """Raised when a beads store can't be read (callers fall back to the CLI)."""
+
+
+def find_beads_jsonl(start: Optional[Path] = None) -> Optional[Path]:
+    """issues.jsonl of the nearest .beads directory (used when there is no database)."""
+    current = (start or Path.cwd()).resolve()
+    for directory in (current, *current.parents):
+        jsonl = directory / '.beads' / JSONL_NAME
+        if jsonl.is_file():
+            return jsonl
+    return None
+
+
+def open_reader(db_path: Optional[str] = None) -> Optional['BeadsDirectReader']:
+    """
+    Reader for an explicit --db path, or for the store bd would discover.
+
+    Returns None if there is no store, or its schema isn't recognized.
+    """
+    if db_path:
+        db = Path(db_path).expanduser()
+        if not db.exists():
+            return None
+        return SqliteBeadsReader.open(db) if db.suffix != '.jsonl' else JsonlBeadsReader(db)
+
+    db = find_beads_db()
+    if db is not None:
+        return SqliteBeadsReader.open(db) if db.exists() else None
+    jsonl = find_beads_jsonl()
+    return JsonlBeadsReader(jsonl) if jsonl else None
+
+
+def _dependency_entry(issue: Dict[str, Any], dependency_type: str) -> Dict[str, Any]:
+    """A related issue as it appears in `bd show --json` dependencies/dependents."""
+    return {
+        'id': issue.get('id', ''),
+        'title': issue.get('title', ''),
+        'status': issue.get('status', ''),
+        'dependency_type': dependency_type,
+    }
+
+
+class BeadsDirectReader:
+    """Base class for read-only beads stores."""
+
+    def show(self, issue_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """`bd show --json` entries (with comments) by issue ID; missing IDs left out."""
+        raise NotImplementedError
+
+    def comments(self, issue_id: str) -> Optional[List[Dict[str, Any]]]:
+        """`bd comments --json` list, or None if the issue doesn't exist."""
+        raise NotImplementedError
+
+    def list_issues(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """`bd list --json` entries, optionally filtered by status."""
+        raise NotImplementedError
+
+
+class SqliteBeadsReader(BeadsDirectReader):
+    """Reads a beads SQLite database opened in read-only mode."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @classmethod
+    def open(cls, path: Path) -> Optional['SqliteBeadsReader']:
+        """Reader for the database, or None if its schema isn't recognized."""
+        reader = cls(path)
+        try:
+            with reader._connect() as conn:
+                for table, required in REQUIRED_COLUMNS.items():
+                    columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+                    if not required <= columns:
+                        return None
+        except sqlite3.Error:
+            return None
+        return reader
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, timeout=5)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        try:
+            conn = self._connect()
+            try:
+                return conn.execute(sql, tuple(params)).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            raise BeadsReaderError(str(e)) from e
+
+    @staticmethod
+    def _issue_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        keys = row.keys()
+        return {field: row[field] for field in _ISSUE_FIELDS if field in keys}
+
+    def show(self, issue_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        ids = list(dict.fromkeys(i for i in issue_ids if i))
+        if not ids:
+            return {}
+        marks = ','.join('?' * len(ids))
+        issues = {
+            row['id']: self._issue_dict(row)
+            for row in self._query(f'SELECT * FROM issues WHERE id IN ({marks})', ids)
+        }
+        if not issues:
+            return {}
+        found = list(issues)
+        marks = ','.join('?' * len(found))
+
+        for issue in issues.values():
+            issue['labels'] = []
+            issue['dependencies'] = []
+            issue['dependents'] = []
+            issue['comments'] = []
+
+        for row in self._query(
+            f'SELECT issue_id, label FROM labels WHERE issue_id IN ({marks}) ORDER BY label', found
+        ):
+            issues[row['issue_id']]['labels'].append(row['label'])
+
+        for row in self._query(
+            'SELECT d.issue_id, d.depends_on_id, d.type, i.title, i.status '
+            'FROM dependencies d JOIN issues i ON i.id = d.depends_on_id '
+            f'WHERE d.issue_id IN ({marks}) ORDER BY d.depends_on_id', found
+        ):
+            issues[row['issue_id']]['dependencies'].append(_dependency_entry(
+                {'id': row['depends_on_id'], 'title': row['title'], 'status': row['status']}, row['type']
+            ))
+
+        for row in self._query(
+            'SELECT d.issue_id, d.depends_on_id, d.type, i.title, i.status '
+            'FROM dependencies d JOIN issues i ON i.id = d.issue_id '
+            f'WHERE d.depends_on_id IN ({marks}) ORDER BY d.issue_id', found
+        ):
+            issues[row['depends_on_id']]['dependents'].append(_dependency_entry(
+                {'id': row['issue_id'], 'title': row['title'], 'status': row['status']}, row['type']
+            ))
+
+        for row in self._query(
+            'SELECT id, issue_id, author, text, created_at FROM comments '
+            f'WHERE issue_id IN ({marks}) ORDER BY created_at, id', found
+        ):
+            issues[row['issue_id']]['comments'].append(dict(row))
+
+        return issues
+
+    def comments(self, issue_id: str) -> Optional[List[Dict[str, Any]]]:
+        if not self._query('SELECT 1 FROM issues WHERE id = ?', [issue_id]):
+            return None
+        return [
+            dict(row) for row in self._query(
+                'SELECT id, issue_id, author, text, created_at FROM comments '
+                'WHERE issue_id = ? ORDER BY created_at, id', [issue_id]
+            )
+        ]
+
+    def list_issues(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        if status:
+            rows = self._query(
+                'SELECT * FROM issues WHERE status = ? ORDER BY priority, created_at', [status]
+            )
+        else:
+            rows = self._query('SELECT * FROM issues ORDER BY priority, created_at')
+        return [self._issue_dict(row) for row in rows]
+
+
+class JsonlBeadsReader(BeadsDirectReader):
+    """Reads the issues.jsonl export (for projects without a beads database)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        issues: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if not isinstance(record, dict) or not record.get('id'):
+                        raise BeadsReaderError(f'Unrecognized record in {self.path}')
+                    issues[record['id']] = record
+        except (OSError, ValueError) as e:
+            raise BeadsReaderError(str(e)) from e
+        return issues
+
+    @staticmethod
+    def _show_entry(issue: Dict[str, Any], issues: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        entry = {field: issue[field] for field in _ISSUE_FIELDS if field in issue}
+        entry['labels'] = list(issue.get('labels') or [])
+        entry['dependencies'] = [
+            _dependency_entry(issues.get(dep.get('depends_on_id'), {'id': dep.get('depends_on_id')}),
+                              dep.get('type', ''))
+            for dep in issue.get('dependencies') or []
+        ]
+        entry['dependents'] = [
+            _dependency_entry(other, dep.get('type', ''))
+            for other in issues.values()
+            for dep in other.get('dependencies') or []
+            if dep.get('depends_on_id') == issue['id']
+        ]
+        entry['comments'] = list(issue.get('comments') or [])
+        return entry
+
+    def show(self, issue_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        issues = self._load()
+        return {
+            issue_id: self._show_entry(issues[issue_id], issues)
+            for issue_id in dict.fromkeys(issue_ids)
+            if issue_id in issues
+        }
+
+    def comments(self, issue_id: str) -> Optional[List[Dict[str, Any]]]:
+        issue = self._load().get(issue_id)
+        if issue is None:
+            return None
+        return list(issue.get('comments') or [])
+
+    def list_issues(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [
+            {field: issue[field] for field in _ISSUE_FIELDS if field in issue}
+            for issue in self._load().values()
+            if not status or issue.get('status') == status
+        ]
@@ -15,12 +15,15 @@ Polling optimization: Instead of fixed 30s sleeps, polls process status
 every 0.5s and returns immediately when processes exit. Typical completion
 drops from 30-60s to 2-5s.
 
+Several agents can be cleaned in one run; their cascades then run
+concurrently (see cleanup_agents_async) and the registry is written once.
+
 Usage:
-    cleanup_daemon.py <agent_id> <registry_path>
+    cleanup_daemon.py <agent_id> [<agent_id>...] <registry_path>
 
 Exit codes:
     0 - Cleanup successful
-    1 - Cleanup failed (agent marked as failed in registry)
+    1 - Cleanup failed (agent(s) marked as failed in registry)
 """
 
 import sys
@@ -28,49 +31,11 @@ import time
 import subprocess
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List
 
+from orch.tmux_utils import has_active_processes, shutdown_windows
 
-def has_active_processes(window_id: str) -> bool:
-    """
-    Check if a tmux window has active child processes.
-
-    Args:
-        window_id: Tmux window ID (e.g., '@123')
-
-    Returns:
-        True if window has running child processes, False otherwise
-    """
-    try:
-        # Get the PID of the tmux pane/window
-        result = subprocess.run(
-            ['tmux', 'list-panes', '-t', window_id, '-F', '#{pane_pid}'],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode != 0:
-            # Window doesn't exist or error getting PID
-            return False
-
-        pid = result.stdout.strip()
-        if not pid:
-            return False
-
-        # Check for child processes using pgrep
-        children = subprocess.run(
-            ['pgrep', '-P', pid],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        # pgrep returns 0 if processes found, 1 if none found
-        return children.returncode == 0
-
-    except Exception:
-        # If any error occurs, assume no active processes (fail safe)
-        return False
+CLEANUP_FAILED_ERROR = 'Cleanup failed after all strategies (graceful, /exit, force kill)'
 
 
 def graceful_shutdown_window(window_id: str, wait_seconds: int = 30) -> bool:
@@ -267,6 +232,17 @@ def mark_agent_completed(agent: dict, registry) -> None:
     registry.save()
 
 
+def mark_agent_failed(agent: dict, error: str) -> None:
+    """Mark agent as failed (caller saves the registry)."""
+    now = datetime.now().isoformat()
+    agent['status'] = 'failed'
+    agent['updated_at'] = now  # For timestamp-based merge conflict resolution
+    if 'completion' not in agent:
+        agent['completion'] = {}
+    agent['completion']['completed_at'] = now
+    agent['completion']['error'] = error
+
+
 def cleanup_agent_async(agent_id: str, registry_path: Path) -> bool:
     """
     Attempt async cleanup of agent with timeout cascade and polling optimization.
@@ -318,28 +294,78 @@ def cleanup_agent_async(agent_id: str, registry_path: Path) -> bool:
         return True
 
     # All strategies failed - mark as failed
-    now = datetime.now().isoformat()
-    agent['status'] = 'failed'
-    agent['updated_at'] = now  # For timestamp-based merge conflict resolution
-    if 'completion' not in agent:
-        agent['completion'] = {}
-    agent['completion']['completed_at'] = now
-    agent['completion']['error'] = 'Cleanup failed after all strategies (graceful, /exit, force kill)'
+    mark_agent_failed(agent, CLEANUP_FAILED_ERROR)
     registry.save()
     return False
 
 
+def cleanup_agents_async(agent_ids: List[str], registry_path: Path,
+                         max_workers: int = 8) -> Dict[str, str]:
+    """
+    Clean up many agents at once with the same timeout cascade.
+
+    Instead of running cleanup_agent_async per agent (up to a minute each),
+    every stage of the cascade is applied to all agent windows together via
+    tmux_utils.shutdown_windows(): tmux commands go out on a bounded thread
+    pool and one batched liveness probe per tick covers every window. Agent
+    windows are killed at the end. All results are saved in one registry
+    write.
+
+    Args:
+        agent_ids: Agent identifiers
+        registry_path: Path to agent registry file
+        max_workers: Concurrent tmux commands
+
+    Returns:
+        Outcome per agent: 'not-found', 'no-window', or the shutdown_windows()
+        outcome of its window ('failed' if its window could not be killed)
+    """
+    from orch.registry import AgentRegistry
+
+    registry = AgentRegistry(registry_path)
+    results: Dict[str, str] = {}
+    agents = {}
+    for agent_id in agent_ids:
+        agent = registry.find(agent_id)
+        if agent:
+            agents[agent_id] = agent
+        else:
+            results[agent_id] = 'not-found'
+
+    outcomes = shutdown_windows(
+        [agent['window_id'] for agent in agents.values() if agent.get('window_id')],
+        graceful_wait=30, exit_wait=30, max_workers=max_workers
+    )
+
+    # One registry write for every agent
+    with registry.transaction():
+        for agent_id, agent in agents.items():
+            window_id = agent.get('window_id')
+            outcome = outcomes.get(window_id, 'no-window') if window_id else 'no-window'
+            results[agent_id] = outcome
+            if outcome == 'failed':
+                mark_agent_failed(agent, CLEANUP_FAILED_ERROR)
+                registry.save()
+            else:
+                mark_agent_completed(agent, registry)
+    return results
+
+
 def main():
     """Main entry point for cleanup daemon."""
-    if len(sys.argv) != 3:
-        print("Usage: cleanup_daemon.py <agent_id> <registry_path>", file=sys.stderr)
+    if len(sys.argv) < 3:
+        print("Usage: cleanup_daemon.py <agent_id> [<agent_id>...] <registry_path>", file=sys.stderr)
         sys.exit(2)
 
-    agent_id = sys.argv[1]
-    registry_path = Path(sys.argv[2])
+    agent_ids = sys.argv[1:-1]
+    registry_path = Path(sys.argv[-1])
 
     # Perform cleanup
-    success = cleanup_agent_async(agent_id, registry_path)
+    if len(agent_ids) == 1:
+        success = cleanup_agent_async(agent_ids[0], registry_path)
+    else:
+        results = cleanup_agents_async(agent_ids, registry_path)
+        success = all(outcome not in ('failed', 'not-found') for outcome in results.values())
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)
@@ -46,12 +46,16 @@ def _init_agentlog():
 
 _init_agentlog()
 from orch.registry import AgentRegistry
-from orch.tmux_utils import list_windows, find_session, is_tmux_available, get_window_by_target
+from orch.tmux_utils import (
+    list_windows, find_session, is_tmux_available, get_window_by_target, snapshot_windows,
+    shutdown_windows, SHUTDOWN_OUTCOMES,
+)
 from orch.monitor import check_agent_status, get_status_emoji
 from orch.logging import OrchLogger
 from orch.complete import verify_agent_work, clean_up_agent
 from orch.help import show_help_overview, show_help_topic, show_unknown_topic, HELP_TOPICS
 from orch.markdown_utils import extract_tldr
+from orch.frontmatter import memoize_by_stat
 # Import from path_utils to break circular dependencies
 # (cli -> complete -> spawn -> cli and cli -> complete -> spawn -> investigations -> cli)
 # Re-export for backward compatibility
@@ -164,6 +168,20 @@ def _is_stale_agent(agent: dict, check_status_func) -> tuple[bool, str | None]:
     return (False, None)
 
 
+def _needs_status_check(agent: dict, clean_all: bool, pattern_violations: bool, stale: bool) -> bool:
+    """Whether _should_clean_agent will look at the agent's workspace status in this mode."""
+    if 'project_dir' not in agent or 'workspace' not in agent:
+        return False
+    status_val = agent.get('status', 'unknown')
+    if stale:
+        return status_val == 'active' and bool(agent.get('spawned_at'))
+    if pattern_violations:
+        return status_val not in ('terminated', 'abandoned')
+    if clean_all:
+        return status_val not in ('abandoned', 'terminated', 'completed', 'completing')
+    return status_val not in ('abandoned', 'terminated')
+
+
 def _should_clean_agent(agent: dict, clean_all: bool, pattern_violations: bool, stale: bool, check_status_func) -> tuple[bool, str | None]:
     """
     Determine whether an agent should be cleaned based on mode.
@@ -241,7 +259,7 @@ def _should_clean_agent(agent: dict, clean_all: bool, pattern_violations: bool,
 @click.option('--dry-run', is_flag=True, help='Show what would be cleaned without executing')
 def clean(all, pattern_violations, stale, dry_run):
     """Remove completed agents and close their tmux windows."""
-    from orch.monitor import check_agent_status
+    from orch.monitor import check_agent_status, evaluate_agent_statuses
 
     # Initialize logger
     orch_logger = OrchLogger()
@@ -255,11 +273,25 @@ def clean(all, pattern_violations, stale, dry_run):
     # Get all agents
     all_agents = registry.list_agents()
 
+    # Evaluate the workspace status of every agent that needs it concurrently
+    to_check = [a for a in all_agents if _needs_status_check(a, all, pattern_violations, stale)]
+    checked = dict(zip(
+        (a['id'] for a in to_check),
+        evaluate_agent_statuses(to_check, check_func=check_agent_status, check_git=stale)
+    ))
+    timed_out = {agent_id for agent_id, status in checked.items() if status.timed_out is True}
+
+    def checked_status(agent, **kwargs):
+        return checked[agent['id']] if agent['id'] in checked else check_agent_status(agent, **kwargs)
+
     # Filter agents based on flags and collect stale reasons
     agents_to_clean = []
     stale_reasons = {}  # agent_id -> reason
     for agent in all_agents:
-        should_clean, stale_reason = _should_clean_agent(agent, all, pattern_violations, stale, check_agent_status)
+        # An agent whose check timed out has an unknown status: never clean it on that basis
+        if agent['id'] in timed_out:
+            continue
+        should_clean, stale_reason = _should_clean_agent(agent, all, pattern_violations, stale, checked_status)
         if should_clean:
             agents_to_clean.append(agent)
             if stale_reason:
@@ -276,6 +308,9 @@ def clean(all, pattern_violations, stale, dry_run):
         orch_logger.log_event("clean", "No completed agents to clean", {
             "total_agents": len(all_agents)
         }, level="INFO")
+        if not dry_run:
+            # Still move old terminal agents out of the hot registry
+            registry.archive_terminal_agents()
         click.echo("No completed agents to clean.")
         return
 
@@ -295,53 +330,80 @@ def clean(all, pattern_violations, stale, dry_run):
         click.echo(f"Run without --dry-run to execute cleanup.")
         return
 
-    # Close tmux windows and remove from registry
-    cleaned_count = 0
-    for agent in agents_to_clean:
-        # For stale mode: auto-abandon the agent first
-        stale_reason = stale_reasons.get(agent['id'])
-        if stale and stale_reason:
-            registry.abandon_agent(agent['id'], reason=stale_reason)
-            orch_logger.log_event("clean", f"Auto-abandoned stale agent: {agent['id']}", {
-                "agent_id": agent['id'],
-                "reason": stale_reason
-            }, level="INFO")
+    # One tmux call tells us which windows still exist
+    snapshot = snapshot_windows()
 
-        # Try to close tmux window using stable window ID
+    # Resolve each agent's window (legacy entries without window_id by target)
+    window_ids = {}
+    for agent in agents_to_clean:
         window_id = agent.get('window_id')
-        if window_id:
-            # Use window ID (stable, never changes)
-            try:
-                subprocess.run(['tmux', 'kill-window', '-t', window_id],
-                             check=False,  # Don't raise if window already closed
-                             stderr=subprocess.DEVNULL)
-            except Exception:
-                # Window might already be closed, continue anyway
-                pass
-        else:
-            # Fallback for old registry entries without window_id
-            window = get_window_by_target(agent['window'])
-            if window:
+        if not window_id and agent.get('window') in snapshot.by_target:
+            window_id = snapshot.by_target[agent['window']]['id']
+        window_ids[agent['id']] = window_id
+
+    # Shut every window down concurrently: Ctrl+C, /exit, then kill-window,
+    # with one batched liveness probe per tick for all of them
+    outcomes = {}
+    if snapshot.available:
+        outcomes = shutdown_windows(window_ids.values(), graceful_wait=5, exit_wait=5,
+                                    snapshot=snapshot)
+
+    # Remove from registry (one registry write for all agents)
+    cleaned_count = 0
+    with registry.transaction(skip_merge=True):
+        for agent in agents_to_clean:
+            # For stale mode: auto-abandon the agent first
+            stale_reason = stale_reasons.get(agent['id'])
+            if stale and stale_reason:
+                registry.abandon_agent(agent['id'], reason=stale_reason)
+                orch_logger.log_event("clean", f"Auto-abandoned stale agent: {agent['id']}", {
+                    "agent_id": agent['id'],
+                    "reason": stale_reason
+                }, level="INFO")
+
+            window_id = window_ids[agent['id']]
+            outcome = outcomes.get(window_id)
+            if window_id and snapshot.available:
+                # Already shut down above
+                if outcome in ('interrupted', 'exited', 'killed', 'failed'):
+                    click.echo(f"  • {agent['id']}: {SHUTDOWN_OUTCOMES[outcome]}")
+            elif window_id:
+                # Use window ID (stable, never changes)
                 try:
-                    window.kill()
+                    subprocess.run(['tmux', 'kill-window', '-t', window_id],
+                                 check=False,  # Don't raise if window already closed
+                                 stderr=subprocess.DEVNULL)
                 except Exception:
+                    # Window might already be closed, continue anyway
                     pass
+            else:
+                # Fallback for old registry entries without window_id
+                window = get_window_by_target(agent['window'])
+                if window:
+                    try:
+                        window.kill()
+                    except Exception:
+                        pass
 
-        # Remove from registry via public API
-        registry.remove(agent['id'])
-        cleaned_count += 1
+            # Remove from registry via public API
+            registry.remove(agent['id'])
+            cleaned_count += 1
 
-        # Log agent removal
-        orch_logger.log_event("clean", f"Removed agent: {agent['id']}", {
-            "agent_id": agent['id'],
-            "window": agent.get('window', 'unknown'),
-            "reason": stale_reason if stale_reason else "completed"
-        }, level="INFO")
+            # Log agent removal
+            orch_logger.log_event("clean", f"Removed agent: {agent['id']}", {
+                "agent_id": agent['id'],
+                "window": agent.get('window', 'unknown'),
+                "reason": stale_reason if stale_reason else "completed",
+                "shutdown": outcome
+            }, level="INFO")
 
-    # Save registry (skip merge to prevent re-adding removed agents)
-    # Bug fix: Merge logic would re-add deleted agents from disk
-    # Investigation: .orch/investigations/2025-11-17-investigate-from-roadmap-resume-failure.md
-    registry.save(skip_merge=True)
+        # Save registry (skip merge to prevent re-adding removed agents)
+        # Bug fix: Merge logic would re-add deleted agents from disk
+        # Investigation: .orch/investigations/2025-11-17-investigate-from-roadmap-resume-failure.md
+        registry.save(skip_merge=True)
+
+    # Move terminal agents past registry_archive_days to the archive tier
+    registry.archive_terminal_agents()
 
     # Calculate duration
     duration_ms = int((time.time() - start_time) * 1000)
@@ -431,43 +493,44 @@ def abandon(agent_ids, reason, yes, force):
         "reason": reason or "no_reason_provided"
     })
 
-    # Abandon each agent
+    # Abandon each agent (one registry write for all agents)
     abandoned_count = 0
-    for agent in agents_to_abandon:
-        agent_id = agent['id']
+    with registry.transaction():
+        for agent in agents_to_abandon:
+            agent_id = agent['id']
 
-        # Try to close tmux window using stable window ID
-        window_id = agent.get('window_id')
-        if window_id:
-            try:
-                subprocess.run(['tmux', 'kill-window', '-t', window_id],
-                             check=False,  # Don't raise if window already closed
-                             stderr=subprocess.DEVNULL)
-            except Exception:
-                # Window might already be closed, continue anyway
-                pass
-        else:
-            # Fallback for old registry entries without window_id
-            window = get_window_by_target(agent['window'])
-            if window:
+            # Try to close tmux window using stable window ID
+            window_id = agent.get('window_id')
+            if window_id:
                 try:
-                    window.kill()
+                    subprocess.run(['tmux', 'kill-window', '-t', window_id],
+                                 check=False,  # Don't raise if window already closed
+                                 stderr=subprocess.DEVNULL)
                 except Exception:
+                    # Window might already be closed, continue anyway
                     pass
+            else:
+                # Fallback for old registry entries without window_id
+                window = get_window_by_target(agent['window'])
+                if window:
+                    try:
+                        window.kill()
+                    except Exception:
+                        pass
 
-        # Mark as abandoned in registry
-        registry.abandon_agent(agent_id, reason=reason)
-        abandoned_count += 1
+            # Mark as abandoned in registry
+            registry.abandon_agent(agent_id, reason=reason)
+            abandoned_count += 1
 
-        # Log agent abandonment
-        orch_logger.log_event("abandon", f"Abandoned agent: {agent_id}", {
-            "agent_id": agent_id,
-            "window": agent.get('window', 'unknown'),
-            "reason": reason or "no_reason_provided"
-        }, level="INFO")
+            # Log agent abandonment
+            orch_logger.log_event("abandon", f"Abandoned agent: {agent_id}", {
+                "agent_id": agent_id,
+                "window": agent.get('window', 'unknown'),
+                "reason": reason or "no_reason_provided"
+            }, level="INFO")
 
-    # Save registry
-    registry.save()
+        # Save registry
+        registry.save()
 
     # Calculate duration
     duration_ms = int((time.time() - start_time) * 1000)
@@ -508,7 +571,7 @@ def complete(agent_id, beads_issue, dry_run, complete_all, project, skip_test_ch
         orch complete --issue orch-cli-xyz
     """
     from orch.complete import complete_agent_work
-    from orch.monitor import check_agent_status, Scenario
+    from orch.monitor import check_agent_status, evaluate_agent_statuses, Scenario
 
     # Handle --issue flag: close beads issue directly (bypass registry)
     if beads_issue:
@@ -569,10 +632,9 @@ def complete(agent_id, beads_issue, dry_run, complete_all, project, skip_test_ch
         if project:
             agents = [a for a in agents if Path(a['project_dir']).name == project or str(a['project_dir']) == project]
 
-        # Filter by scenario (only ready agents)
+        # Filter by scenario (only ready agents), checking agents concurrently
         ready_agents = []
-        for agent_info in agents:
-            status = check_agent_status(agent_info)
+        for agent_info, status in zip(agents, evaluate_agent_statuses(agents, check_func=check_agent_status)):
             if status.scenario in [Scenario.READY_COMPLETE, Scenario.READY_CLEAN]:
                 ready_agents.append((agent_info, status))
 
@@ -595,32 +657,58 @@ def complete(agent_id, beads_issue, dry_run, complete_all, project, skip_test_ch
         successes = []
         failures = []
 
-        for agent_info, status in ready_agents:
-            agent_id_batch = agent_info['id']
-            click.echo(f"Completing: {agent_id_batch}")
+        # Verify, close beads issues and mark each agent completed first (one
+        # registry write for the whole batch); windows are left running so an
+        # agent that fails verification keeps its session
+        completed_windows = {}
+        with registry.transaction():
+            for agent_info, status in ready_agents:
+                agent_id_batch = agent_info['id']
+                click.echo(f"Completing: {agent_id_batch}")
 
-            try:
-                project_dir = Path(agent_info['project_dir'])
-
-                result = complete_agent_work(
-                    agent_id=agent_id_batch,
-                    project_dir=project_dir,
-                    dry_run=False,
-                    skip_test_check=skip_test_check,
-                    reviewed=reviewed
-                )
+                try:
+                    project_dir = Path(agent_info['project_dir'])
+
+                    result = complete_agent_work(
+                        agent_id=agent_id_batch,
+                        project_dir=project_dir,
+                        dry_run=False,
+                        skip_test_check=skip_test_check,
+                        reviewed=reviewed,
+                        registry=registry,
+                        close_window=False
+                    )
 
-                if result['success']:
-                    successes.append(agent_id_batch)
-                    click.echo(f"  ✓ {agent_id_batch} completed")
-                else:
-                    failures.append((agent_id_batch, result['errors']))
-                    click.echo(f"  ✗ {agent_id_batch} failed: {result['errors'][0] if result['errors'] else 'Unknown error'}")
-            except Exception as e:
-                failures.append((agent_id_batch, [str(e)]))
-                click.echo(f"  ✗ {agent_id_batch} error: {str(e)}")
+                    if result['success']:
+                        successes.append(agent_id_batch)
+                        completed_windows[agent_id_batch] = agent_info.get('window_id')
+                        click.echo(f"  ✓ {agent_id_batch} completed")
+                    else:
+                        failures.append((agent_id_batch, result['errors']))
+                        click.echo(f"  ✗ {agent_id_batch} failed: {result['errors'][0] if result['errors'] else 'Unknown error'}")
+                except Exception as e:
+                    failures.append((agent_id_batch, [str(e)]))
+                    click.echo(f"  ✗ {agent_id_batch} error: {str(e)}")
 
-            click.echo()
+                click.echo()
+
+        # Stop the completed agents' processes concurrently (Ctrl+C, then
+        # /exit), then kill the windows that went idle. Windows still running
+        # processes are left open, as a single `orch complete` would.
+        outcomes = shutdown_windows(completed_windows.values(), graceful_wait=5, exit_wait=5, kill=False)
+        idle_windows = [w for w, outcome in outcomes.items() if outcome in ('idle', 'interrupted', 'exited')]
+        shutdown_windows(idle_windows, graceful_wait=0, exit_wait=0)
+        for agent_id_batch, window_id in completed_windows.items():
+            outcome = outcomes.get(window_id)
+            if outcome in ('interrupted', 'exited'):
+                click.echo(f"  • {agent_id_batch}: {SHUTDOWN_OUTCOMES[outcome]}")
+            elif outcome == 'busy':
+                successes.remove(agent_id_batch)
+                failures.append((agent_id_batch, [
+                    f"Agent {agent_id_batch} has active processes that did not terminate. "
+                    f"Cannot safely kill window {window_id}. "
+                    f"Tried /exit but processes still running."
+                ]))
 
         # Show summary
         click.echo(f"Completed: {len(successes)}/{len(ready_agents)} successful")
@@ -1116,24 +1204,12 @@ def _lint_issues():
         click.echo(f"❌ Failed to initialize beads integration: {e}", err=True)
         return
 
-    # Get all open issues
+    # Get all open issues (one `bd list` call; issue fields come from it)
     try:
-        result = subprocess.run(
-            ["bd", "list", "--status=open", "--json"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            click.echo("❌ Failed to list beads issues", err=True)
-            return
-
-        issues = json.loads(result.stdout)
-    except FileNotFoundError:
+        issues = beads.list_issues(status="open")
+    except BeadsCLINotFoundError:
         click.echo("❌ bd CLI not found. Install beads or check PATH.", err=True)
         return
-    except json.JSONDecodeError:
-        click.echo("❌ Failed to parse beads output", err=True)
-        return
 
     if not issues:
         click.echo("✅ No open issues to validate")
@@ -1558,6 +1634,27 @@ def extract_investigation_category(path):
         return None
 
 
+@memoize_by_stat
+def _parse_artifact_fields(file_path):
+    """Extract **Field:** value pairs from markdown frontmatter (memoized on mtime and size)."""
+    import re
+
+    metadata = {}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+            # Match **Field:** value patterns in first ~50 lines
+            lines = content.split('\n')[:50]
+            for line in lines:
+                match = re.match(r'^\*\*([^*]+):\*\*\s*(.+)$', line)
+                if match:
+                    field, value = match.groups()
+                    metadata[field] = value.strip()
+    except Exception:
+        pass  # Skip files that can't be read
+    return metadata
+
+
 @cli.command(name='build-readme', hidden=True)
 @click.option('--dry-run', is_flag=True, help='Preview README without writing')
 @click.option('--project', help='Project directory (defaults to current dir)')
@@ -1579,7 +1676,6 @@ def build_readme(dry_run, project):
       orch build-readme --dry-run         # Preview without writing
       orch build-readme --project ~/foo   # Generate for specific project
     """
-    import re
     from datetime import datetime, timedelta
     from pathlib import Path
 
@@ -1596,24 +1692,6 @@ def build_readme(dry_run, project):
         click.echo(f"❌ .orch directory not found at {orch_dir}", err=True)
         raise click.Abort()
 
-    # Parse frontmatter from markdown file
-    def parse_frontmatter(file_path):
-        """Extract **Field:** value pairs from markdown frontmatter."""
-        metadata = {}
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Match **Field:** value patterns in first ~50 lines
-                lines = content.split('\n')[:50]
-                for line in lines:
-                    match = re.match(r'^\*\*([^*]+):\*\*\s*(.+)$', line)
-                    if match:
-                        field, value = match.groups()
-                        metadata[field] = value.strip()
-        except Exception:
-            pass  # Skip files that can't be read
-        return metadata
-
     # Discover artifacts
     def discover_artifacts(artifact_dir, extension='.md'):
         """Find all markdown files in directory with metadata."""
@@ -1628,7 +1706,7 @@ def build_readme(dry_run, project):
                 if filename.startswith('_') or 'template' in filename:
                     continue
 
-                metadata = parse_frontmatter(file_path)
+                metadata = _parse_artifact_fields(file_path)
                 artifacts.append({
                     'path': file_path,
                     'name': file_path.stem,
@@ -1680,7 +1758,7 @@ def build_readme(dry_run, project):
             if ws_path.is_dir():
                 workspace_file = ws_path / 'WORKSPACE.md'
                 if workspace_file.exists():
-                    metadata = parse_frontmatter(workspace_file)
+                    metadata = _parse_artifact_fields(workspace_file)
                     # Infer status for old formats
                     metadata['Status'] = infer_workspace_status(workspace_file, metadata)
                     workspaces.append({
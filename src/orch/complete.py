@@ -10,7 +10,7 @@ Handles:
 """
 
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Set
 from datetime import datetime
 
 import click
@@ -126,40 +126,56 @@ def close_beads_issue(beads_id: str, verify_phase: bool = True, db_path: Optiona
         raise
 
 
-def get_agent_by_id(agent_id: str) -> dict[str, Any] | None:
-    """Get agent from registry by ID."""
-    from orch.registry import AgentRegistry
-    registry = AgentRegistry()
+def get_agent_by_id(agent_id: str, registry=None) -> dict[str, Any] | None:
+    """Get agent from registry by ID (loads the registry unless one is given)."""
+    if registry is None:
+        from orch.registry import AgentRegistry
+        registry = AgentRegistry()
     return registry.find(agent_id)
 
 
-def clean_up_agent(agent_id: str, force: bool = False) -> None:
+def clean_up_agent(agent_id: str, force: bool = False, registry=None,
+                   busy_windows: Optional[Set[str]] = None, close_window: bool = True) -> None:
     """
     Clean up agent: mark as completed and close tmux window.
 
     Args:
         agent_id: Agent identifier
         force: Bypass safety checks (active processes)
+        registry: Registry to update (e.g. one inside a batch transaction);
+                  loaded fresh if not given
+        busy_windows: Windows known to have live processes, from one batched
+                      windows_with_active_processes() probe; probed per window
+                      if not given
+        close_window: Shut down and kill the agent's tmux window; callers
+                      that shut many windows down at once pass False
     """
-    from orch.registry import AgentRegistry
     import subprocess
 
-    registry = AgentRegistry()
+    if registry is None:
+        from orch.registry import AgentRegistry
+        registry = AgentRegistry()
     agent = registry.find(agent_id)
 
     if not agent:
         return
 
     # Mark as completed
+    now = datetime.now().isoformat()
     agent['status'] = 'completed'
-    agent['completed_at'] = datetime.now().isoformat()
+    agent['completed_at'] = now
+    agent['updated_at'] = now  # For timestamp-based merge conflict resolution
     registry.save()
 
     # Close tmux window if exists
     window_id = agent.get('window_id')
-    if window_id:
+    if window_id and close_window:
         # Check for active processes and attempt graceful shutdown
-        if has_active_processes(window_id):
+        if busy_windows is not None:
+            busy = window_id in busy_windows
+        else:
+            busy = has_active_processes(window_id)
+        if busy:
             if not graceful_shutdown_window(window_id):
                 # Graceful shutdown (Ctrl+C) didn't work, try /exit command
                 click.echo(f"⏳ Sending /exit to agent {agent_id}...")
@@ -205,7 +221,10 @@ def complete_agent_work(
     dry_run: bool = False,
     skip_test_check: bool = False,
     force: bool = False,
-    reviewed: bool = False
+    reviewed: bool = False,
+    registry=None,
+    busy_windows: Optional[Set[str]] = None,
+    close_window: bool = True
 ) -> dict[str, Any]:
     """
     Complete agent work: verify, close beads issue, cleanup.
@@ -224,6 +243,10 @@ def complete_agent_work(
         skip_test_check: Skip test verification (unused, kept for API compat)
         force: Bypass safety checks
         reviewed: Confirm work has been reviewed (required for skills with review: required)
+        registry: Shared AgentRegistry (lets `complete --all` batch all updates
+                  into one registry transaction); loaded fresh if not given
+        busy_windows: Batched live-process probe result (see clean_up_agent)
+        close_window: Close the agent's tmux window (see clean_up_agent)
 
     Returns:
         Dictionary with success, verified, errors, warnings
@@ -247,7 +270,7 @@ def complete_agent_work(
     })
 
     # Get agent from registry
-    agent = get_agent_by_id(agent_id)
+    agent = get_agent_by_id(agent_id, registry=registry)
     if not agent:
         result['errors'].append(f"Agent '{agent_id}' not found in registry")
         return result
@@ -360,7 +383,8 @@ def complete_agent_work(
                 click.echo(f"🎯 Closed {closed_count} beads issues: {', '.join(beads_ids_to_close)}")
 
     # Clean up agent
-    clean_up_agent(agent_id, force=force)
+    clean_up_agent(agent_id, force=force, registry=registry, busy_windows=busy_windows,
+                   close_window=close_window)
     logger.log_event("complete", "Agent cleaned up", {"agent_id": agent_id})
 
     result['success'] = True
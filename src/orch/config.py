@@ -9,6 +9,14 @@ Supported keys:
 - roadmap_format: preferred ROADMAP format - 'org' or 'markdown' (default: 'org')
 - cdd_docs_path: path to CDD docs (used in prompts only)
 - backend: default AI backend - 'claude' or 'codex' (default: 'claude')
+- registry_backend: agent registry storage - 'json', 'sqlite', 'journal' or 'sharded' (default: 'json')
+- registry_archive_days: days before terminal agents move to the registry archive (default: 7)
+- pane_log_max_kb: size cap of each agent's pipe-pane output log, 0 disables it (default: 1024)
+- beads_query_cache: cache bd query results on disk until the beads db changes (default: true)
+- beads_direct_read: read beads issues/comments from the db directly, not via bd (default: false)
+- status_workers: agents whose status is evaluated concurrently (default: 8)
+- status_agent_timeout: seconds before an agent's status check is reported as unknown (default: 30)
+- status_cache: reuse agent statuses whose inputs haven't changed since the last run (default: true)
 """
 
 from __future__ import annotations
@@ -29,6 +37,14 @@ def _defaults() -> Dict[str, Any]:
         'cdd_docs_path': str(home / 'orch-config' / 'docs' / 'cdd-essentials.md'),
         'roadmap_format': 'org',
         'backend': 'claude',
+        'registry_backend': 'json',
+        'registry_archive_days': 7,
+        'pane_log_max_kb': 1024,
+        'beads_query_cache': True,
+        'beads_direct_read': False,
+        'status_workers': 8,
+        'status_agent_timeout': 30,
+        'status_cache': True,
     }
 
 
@@ -110,3 +126,90 @@ def get_backend(cli_backend: Optional[str] = None) -> str:
     # Priority 3: Default (handled by get_config() merging with _defaults())
     return str(get_config().get('backend', _defaults()['backend']))
 
+
+def get_registry_backend() -> str:
+    """
+    Get agent registry storage backend from config.
+
+    Returns:
+        'json' (single agent-registry.json file), 'sqlite' (agent-registry.db
+        in WAL mode), 'journal' (append-only agent-registry.jsonl over the
+        JSON snapshot) or 'sharded' (per-project shards in agent-registry.d/)
+        - defaults to 'json' if not specified or unrecognized
+    """
+    backend = str(get_config().get('registry_backend', _defaults()['registry_backend']))
+    return backend if backend in ('json', 'sqlite', 'journal', 'sharded') else 'json'
+
+
+def get_registry_archive_days() -> int:
+    """
+    Get the age (in days) after which terminal agents are archived.
+
+    Agents that are deleted, completed, abandoned or failed for longer than
+    this are moved from the hot registry to ~/.orch/registry-archive/.
+    """
+    try:
+        return int(get_config().get('registry_archive_days', _defaults()['registry_archive_days']))
+    except (TypeError, ValueError):
+        return int(_defaults()['registry_archive_days'])
+
+
+def get_pane_log_max_bytes() -> int:
+    """
+    Get the size cap for per-agent pane output logs (pipe-pane capture).
+
+    Returns:
+        Maximum bytes kept per agent (0 disables pane logging)
+    """
+    try:
+        return max(0, int(get_config().get('pane_log_max_kb', _defaults()['pane_log_max_kb']))) * 1024
+    except (TypeError, ValueError):
+        return int(_defaults()['pane_log_max_kb']) * 1024
+
+
+def get_beads_query_cache_enabled() -> bool:
+    """
+    Whether bd query results are cached in ~/.orch/cache/beads/.
+
+    Cached results are reused until the beads database file changes.
+    """
+    return bool(get_config().get('beads_query_cache', _defaults()['beads_query_cache']))
+
+
+def get_beads_direct_read_enabled() -> bool:
+    """
+    Whether beads reads bypass the bd CLI and open the beads store read-only.
+
+    Stores with an unrecognized schema are still read through bd.
+    """
+    return bool(get_config().get('beads_direct_read', _defaults()['beads_direct_read']))
+
+
+def get_status_workers() -> int:
+    """Get the number of agent status checks run concurrently (at least 1)."""
+    try:
+        return max(1, int(get_config().get('status_workers', _defaults()['status_workers'])))
+    except (TypeError, ValueError):
+        return int(_defaults()['status_workers'])
+
+
+def get_status_agent_timeout() -> float:
+    """
+    Get the per-agent status check timeout in seconds.
+
+    An agent whose check takes longer is shown with an unknown status
+    instead of holding up the rest of the output.
+    """
+    try:
+        return float(get_config().get('status_agent_timeout', _defaults()['status_agent_timeout']))
+    except (TypeError, ValueError):
+        return float(_defaults()['status_agent_timeout'])
+
+
+def get_status_cache_enabled() -> bool:
+    """
+    Whether agent statuses are cached in ~/.orch/cache/status.json.
+
+    A cached status is reused until one of the agent's inputs changes.
+    """
+    return bool(get_config().get('status_cache', _defaults()['status_cache']))
@@ -1,14 +1,48 @@
 """
 Context monitoring for spawned agents.
 
-Sends /context command to agents and parses token usage.
+Context usage is read from the agent's Claude Code session transcript
+(~/.claude/projects/<project>/<session>.jsonl): every assistant turn records
+the token usage of the request, so the latest turn's usage is the current
+size of the context window. Transcripts are tailed incrementally - the byte
+offset reached is persisted in ~/.orch/cache/transcripts.json, so each check
+only parses lines appended since the previous one. Offsets are kept in memory
+during a status pass and written once at its end (save_transcript_state).
+
+Agents without a transcript fall back to sending /context to their tmux
+window and parsing the output.
 """
 
+import fcntl
+import json
+import os
+import re
 import subprocess
+import tempfile
+import threading
 import time
-import re
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from orch.pane_log import PaneLogFollower, pane_log_path
+
+# Context window of Claude models; sessions that have grown past it must be
+# running with the extended window
+DEFAULT_CONTEXT_WINDOW = 200_000
+EXTENDED_CONTEXT_WINDOW = 1_000_000
+
+# First read of a transcript only parses its tail (the latest usage is all we need)
+_INITIAL_TAIL_BYTES = 1024 * 1024
+
+# Bytes at the start of a transcript searched for the agent's workspace
+_TRANSCRIPT_HEAD_BYTES = 256 * 1024
+
+_STATE_LOCK = threading.Lock()
+
+# Entries read or updated by this process since the last save, by agent ID
+_PENDING: Dict[str, Dict[str, Any]] = {}
 
 
 @dataclass
@@ -60,7 +94,264 @@ def parse_context_output(text: str) -> Optional[ContextInfo]:
     )
 
 
+def claude_projects_dir() -> Path:
+    """Directory where Claude Code keeps per-project session transcripts."""
+    return Path.home() / '.claude' / 'projects'
+
+
+def transcript_state_path() -> Path:
+    """File holding each agent's transcript path and read offset."""
+    return Path.home() / '.orch' / 'cache' / 'transcripts.json'
+
+
+def _project_transcript_dir(project_dir: str) -> Path:
+    # Claude Code names the directory after the cwd with every
+    # non-alphanumeric character replaced by '-'
+    return claude_projects_dir() / re.sub(r'[^A-Za-z0-9]', '-', str(project_dir))
+
+
+def find_transcript(agent: Dict[str, Any]) -> Optional[Path]:
+    """
+    Locate the Claude Code transcript of an agent's session.
+
+    Uses the agent's session_id when the registry has one. Otherwise looks
+    in the project's transcript directory for a session started after the
+    agent was spawned whose opening prompt names the agent's workspace
+    (every spawn prompt points at .orch/workspace/<name>/SPAWN_CONTEXT.md).
+
+    Returns:
+        Transcript path, or None if no matching session exists
+    """
+    session_id = agent.get('session_id')
+    project_dir = agent.get('project_dir')
+    if session_id:
+        if project_dir:
+            candidate = _project_transcript_dir(project_dir) / f'{session_id}.jsonl'
+            if candidate.is_file():
+                return candidate
+        matches = list(claude_projects_dir().glob(f'*/{session_id}.jsonl'))
+        return matches[0] if matches else None
+
+    workspace = agent.get('workspace')
+    if not project_dir or not workspace:
+        return None
+    marker = f'.orch/workspace/{Path(workspace).name}/'.encode()
+
+    spawned_ts = 0.0
+    if agent.get('spawned_at'):
+        try:
+            spawned_ts = datetime.fromisoformat(agent['spawned_at']).timestamp()
+        except (ValueError, TypeError):
+            pass
+
+    candidates: List[Tuple[float, Path]] = []
+    try:
+        for entry in os.scandir(_project_transcript_dir(project_dir)):
+            if entry.name.endswith('.jsonl') and entry.is_file():
+                mtime = entry.stat().st_mtime
+                # Transcripts are written on every turn, so one last modified
+                # before the spawn belongs to an earlier session
+                if mtime >= spawned_ts:
+                    candidates.append((mtime, Path(entry.path)))
+    except OSError:
+        return None
+
+    for _, path in sorted(candidates, reverse=True):
+        try:
+            with open(path, 'rb') as f:
+                if marker in f.read(_TRANSCRIPT_HEAD_BYTES):
+                    return path
+        except OSError:
+            continue
+    return None
+
+
+def _usage_tokens(line: bytes) -> Optional[int]:
+    """Context size recorded by a transcript line, None if it isn't a main-thread assistant turn."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or record.get('type') != 'assistant' or record.get('isSidechain'):
+        return None
+    message = record.get('message')
+    usage = message.get('usage') if isinstance(message, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    return sum(
+        int(usage.get(key) or 0)
+        for key in ('input_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens', 'output_tokens')
+    )
+
+
+def _last_usage(data: bytes) -> Optional[int]:
+    tokens = None
+    for line in data.splitlines():
+        if b'"usage"' in line:
+            line_tokens = _usage_tokens(line)
+            if line_tokens is not None:
+                tokens = line_tokens
+    return tokens
+
+
+def _load_state() -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads(transcript_state_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _is_newer(entry: Dict[str, Any], other: Optional[Dict[str, Any]]) -> bool:
+    """Whether entry has read further than other (a different transcript always counts as newer)."""
+    if not isinstance(other, dict):
+        return True
+    if entry.get('path') != other.get('path') or entry.get('inode') != other.get('inode'):
+        return True
+    return entry.get('offset', 0) >= other.get('offset', 0)
+
+
+def save_transcript_state() -> None:
+    """
+    Write the offsets reached since the last save to the state file.
+
+    Runs under an exclusive lock on a sidecar lock file and merges with the
+    file as it is now, so concurrent orch processes (status, statusd, wait)
+    keep each other's entries; for the same transcript the entry that read
+    furthest wins. Entries whose transcript is gone are dropped.
+    """
+    with _STATE_LOCK:
+        if not _PENDING:
+            return
+        path = transcript_state_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path.with_name(path.name + '.lock'), 'a') as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    state = _load_state()
+                    for agent_id, entry in _PENDING.items():
+                        if _is_newer(entry, state.get(agent_id)):
+                            state[agent_id] = entry
+                    state = {
+                        key: value for key, value in state.items()
+                        if isinstance(value, dict) and value.get('path') and os.path.exists(value['path'])
+                    }
+                    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.')
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(state, f)
+                    os.replace(tmp_name, path)
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        except OSError:
+            return
+        _PENDING.clear()
+
+
+def clear_transcript_state() -> None:
+    """Forget offsets not yet saved (the state file is kept)."""
+    with _STATE_LOCK:
+        _PENDING.clear()
+
+
+def read_transcript_context(agent: Dict[str, Any]) -> Optional[ContextInfo]:
+    """
+    Context usage from the agent's session transcript, without touching its window.
+
+    Only the part of the transcript appended since the previous call is
+    parsed; the offset and last usage seen are kept in memory until
+    save_transcript_state() writes them to the state file.
+
+    Returns:
+        ContextInfo, or None if there is no transcript or it has no usage yet
+    """
+    with _STATE_LOCK:
+        entry = _PENDING.get(agent['id']) or _load_state().get(agent['id']) or {}
+
+    path = Path(entry['path']) if entry.get('path') else None
+    if path is None or not path.is_file():
+        path = find_transcript(agent)
+        if path is None:
+            return None
+        entry = {}
+
+    try:
+        st = os.stat(path)
+        offset = entry.get('offset', 0)
+        tokens = entry.get('tokens')
+        if entry.get('inode') != st.st_ino or st.st_size < offset:
+            # Replaced or truncated: start over
+            offset, tokens = 0, None
+
+        with open(path, 'rb') as f:
+            if offset == 0 and st.st_size > _INITIAL_TAIL_BYTES:
+                f.seek(st.st_size - _INITIAL_TAIL_BYTES)
+                tail = f.read()
+                # Drop the line cut in half by the seek
+                first_newline = tail.find(b'\n') + 1
+                end = tail.rfind(b'\n') + 1
+                tokens = _last_usage(tail[first_newline:end])
+                if tokens is None:
+                    # No assistant turn near the end: parse the whole file
+                    f.seek(0)
+                    data = f.read()
+                    end = data.rfind(b'\n') + 1
+                    tokens = _last_usage(data[:end])
+                    offset = end
+                else:
+                    offset = st.st_size - _INITIAL_TAIL_BYTES + end
+            else:
+                f.seek(offset)
+                data = f.read()
+                # Only whole lines; an unterminated last line is read next time
+                end = data.rfind(b'\n') + 1
+                new_tokens = _last_usage(data[:end])
+                if new_tokens is not None:
+                    tokens = new_tokens
+                offset += end
+    except OSError:
+        return None
+
+    with _STATE_LOCK:
+        _PENDING[agent['id']] = {
+            'path': str(path),
+            'inode': st.st_ino,
+            'offset': offset,
+            'tokens': tokens,
+        }
+
+    if tokens is None:
+        return None
+    tokens_total = DEFAULT_CONTEXT_WINDOW if tokens <= DEFAULT_CONTEXT_WINDOW else EXTENDED_CONTEXT_WINDOW
+    return ContextInfo(
+        tokens_used=tokens,
+        tokens_total=tokens_total,
+        percentage=tokens / tokens_total * 100
+    )
+
+
 def get_context_info(agent: Dict[str, Any], timeout: float = 3.0) -> Optional[ContextInfo]:
+    """
+    Get context usage info for an agent.
+
+    Reads the agent's session transcript (read_transcript_context), which is
+    instant and works while the agent is busy. Only agents without a
+    transcript get the /context command sent to their window.
+
+    Args:
+        agent: Agent dict from registry
+        timeout: Seconds to wait for /context output (default: 3.0)
+
+    Returns:
+        ContextInfo if successful, None if failed (or agent is busy)
+    """
+    info = read_transcript_context(agent)
+    if info is not None:
+        return info
+    return request_context_command(agent, timeout)
+
+
+def request_context_command(agent: Dict[str, Any], timeout: float = 3.0) -> Optional[ContextInfo]:
     """
     Get context usage info for an agent by sending /context command.
 
@@ -83,6 +374,10 @@ def get_context_info(agent: Dict[str, Any], timeout: float = 3.0) -> Optional[Co
     # Prefer stable window_id over window target (window indices change when tmux renumbers)
     window_target = agent.get('window_id', agent['window'])
 
+    # With a pane log, read only the output produced by /context
+    log_path = pane_log_path(agent)
+    follower = PaneLogFollower(log_path) if log_path and log_path.exists() else None
+
     try:
         # Clear the pane first to get clean output
         subprocess.run(
@@ -111,6 +406,11 @@ def get_context_info(agent: Dict[str, Any], timeout: float = 3.0) -> Optional[Co
         # Wait for output to appear
         time.sleep(timeout)
 
+        if follower is not None:
+            info = parse_context_output(follower.read_new())
+            if info:
+                return info
+
         # Capture pane output
         result = subprocess.run(
             ['tmux', 'capture-pane', '-t', window_target, '-p'],
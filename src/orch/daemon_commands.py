@@ -71,7 +71,8 @@ def register_daemon_commands(cli):
     @click.option("--dry-run", is_flag=True, help="Preview spawns without executing")
     @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
     @click.option("--no-focus", is_flag=True, help="Disable focus-based prioritization")
-    def run(poll_interval, max_agents, label, dry_run, verbose, no_focus):
+    @click.option("--tmux-control", is_flag=True, help="Track agent windows over a tmux control-mode connection")
+    def run(poll_interval, max_agents, label, dry_run, verbose, no_focus, tmux_control):
         """Run the work daemon in foreground.
 
         Polls `bd ready` across all projects registered with kb and spawns
@@ -87,6 +88,7 @@ def register_daemon_commands(cli):
             orch daemon run --poll-interval 30  # Poll every 30 seconds
             orch daemon run --max-agents 5      # Allow 5 concurrent agents
             orch daemon run --no-focus          # Disable focus prioritization
+            orch daemon run --tmux-control      # Complete agents as their windows close
         """
         config = DaemonConfig(
             poll_interval_seconds=poll_interval,
@@ -95,6 +97,7 @@ def register_daemon_commands(cli):
             dry_run=dry_run,
             verbose=verbose,
             use_focus=not no_focus,
+            tmux_control=tmux_control,
         )
 
         run_daemon(config)
@@ -15,9 +15,14 @@ Inline markdown format (fallback):
 **Phase:** Implementation
 **Status:** Active
 """
+import copy
+import functools
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Callable, Tuple, TypeVar
 from pathlib import Path
 
 try:
@@ -26,6 +31,66 @@ except ImportError:
     frontmatter = None  # Graceful degradation if python-frontmatter not installed
 
 
+T = TypeVar('T')
+
+# Files remembered per memoized function (least recently used are dropped)
+FILE_CACHE_SIZE = 512
+
+# Files modified this recently aren't memoized: a second write within the
+# filesystem's timestamp granularity could keep the same mtime and size
+_RACY_WINDOW_NS = 50_000_000
+
+_file_caches: List[Tuple['OrderedDict[str, Tuple[int, int, Any]]', threading.Lock]] = []
+
+
+def memoize_by_stat(func: Callable[[Path], T]) -> Callable[[Path], T]:
+    """
+    Memoize a function of a file path on the file's (path, st_mtime_ns, st_size).
+
+    Status, verification, history and build-readme parse the same artifacts
+    over and over (several times per `orch status` run, again on every
+    watch tick). A memoized parser re-reads a file only when its mtime or
+    size changed. Callers get a copy of the result, so mutating it doesn't
+    affect the cache. Paths that can't be stat'ed are passed through.
+    """
+    cache: 'OrderedDict[str, Tuple[int, int, Any]]' = OrderedDict()
+    lock = threading.Lock()
+    _file_caches.append((cache, lock))
+
+    @functools.wraps(func)
+    def wrapper(path: Path) -> T:
+        try:
+            resolved = Path(path).expanduser().absolute()
+            st = resolved.stat()
+        except (OSError, TypeError, ValueError):
+            return func(path)
+
+        key = str(resolved)
+        with lock:
+            cached = cache.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                cache.move_to_end(key)
+                return copy.deepcopy(cached[2])
+
+        value = func(path)
+        if time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS:
+            with lock:
+                cache[key] = (st.st_mtime_ns, st.st_size, value)
+                cache.move_to_end(key)
+                while len(cache) > FILE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return copy.deepcopy(value)
+
+    return wrapper
+
+
+def clear_file_caches() -> None:
+    """Forget every memoized file parse."""
+    for cache, lock in _file_caches:
+        with lock:
+            cache.clear()
+
+
 @dataclass
 class MetadataResult:
     """
@@ -307,23 +372,13 @@ def extract_phase_from_file(path: Path) -> Optional[str]:
     Returns:
         Phase value if found, None otherwise
     """
-    if not path:
-        return None
-
-    path = Path(path).expanduser()
-    if not path.exists():
-        return None
-
-    try:
-        content = path.read_text(encoding='utf-8')
-        return extract_phase(content)
-    except Exception:
-        return None
+    return extract_metadata_from_file(path).phase
 
 
+@memoize_by_stat
 def extract_metadata_from_file(path: Path) -> MetadataResult:
     """
-    Extract all metadata from a file.
+    Extract all metadata from a file (re-read only when the file changes).
 
     Args:
         path: Path to markdown file
@@ -53,6 +53,63 @@ def is_git_repo(directory: Path) -> bool:
         return False
 
 
+def read_git_head(directory: Path) -> Optional[str]:
+    """
+    Commit hash HEAD points to, read from .git without running git.
+
+    Cheap enough to call per agent (used to notice new commits). Follows a
+    `.git` file to a worktree's git dir, and looks branch refs up in
+    packed-refs when there is no loose ref file.
+
+    Args:
+        directory: Any directory inside the repository
+
+    Returns:
+        Commit hash, or None if directory isn't in a git repository or HEAD
+        can't be resolved (e.g. a branch with no commits yet)
+    """
+    directory = Path(directory).resolve()
+    for candidate in (directory, *directory.parents):
+        dot_git = candidate / '.git'
+        if dot_git.exists():
+            break
+    else:
+        return None
+
+    try:
+        git_dir = dot_git
+        if dot_git.is_file():
+            pointer = dot_git.read_text().strip()
+            if not pointer.startswith('gitdir:'):
+                return None
+            git_dir = (candidate / pointer[len('gitdir:'):].strip()).resolve()
+
+        head = (git_dir / 'HEAD').read_text().strip()
+        if not head.startswith('ref:'):
+            return head or None
+        ref = head[len('ref:'):].strip()
+
+        # Worktrees keep HEAD locally but share refs with the main repository
+        common_dir = git_dir
+        if (git_dir / 'commondir').is_file():
+            common_dir = (git_dir / (git_dir / 'commondir').read_text().strip()).resolve()
+
+        for refs_dir in dict.fromkeys((git_dir, common_dir)):
+            ref_file = refs_dir / ref
+            if ref_file.is_file():
+                return ref_file.read_text().strip() or None
+
+        packed_refs = common_dir / 'packed-refs'
+        if packed_refs.is_file():
+            for line in packed_refs.read_text().splitlines():
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        return None
+    return None
+
+
 def get_last_commit(directory: Path) -> Optional[CommitInfo]:
     """
     Get information about the last commit in a git repository.
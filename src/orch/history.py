@@ -7,11 +7,13 @@ and identify gaps where skills could be applied but weren't.
 
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 import re
 
+from orch.frontmatter import memoize_by_stat
+
 
 @dataclass
 class SkillUsage:
@@ -59,27 +61,13 @@ class SkillAnalytics:
         return (self.workspaces_with_skills / self.total_workspaces) * 100
 
 
-def extract_skill_from_workspace(workspace_path: Path) -> Optional[SkillUsage]:
+@memoize_by_stat
+def _read_workspace_skill(workspace_file: Path) -> Optional[Tuple[str, Optional[str], Optional[datetime], Optional[datetime], bool]]:
     """
-    Extract skill usage information from a workspace file.
-
-    Args:
-        workspace_path: Path to workspace directory or WORKSPACE.md file
+    Parse skill name, phase, started, completed and success from a WORKSPACE.md.
 
-    Returns:
-        SkillUsage object if skill found, None otherwise
+    Memoized on the file's mtime and size: history rescans every workspace.
     """
-    # Handle both directory and file paths
-    if workspace_path.is_dir():
-        workspace_file = workspace_path / 'WORKSPACE.md'
-        workspace_name = workspace_path.name
-    else:
-        workspace_file = workspace_path
-        workspace_name = workspace_path.parent.name
-
-    if not workspace_file.exists():
-        return None
-
     try:
         content = workspace_file.read_text()
     except Exception:
@@ -137,6 +125,35 @@ def extract_skill_from_workspace(workspace_path: Path) -> Optional[SkillUsage]:
             except ValueError:
                 pass
 
+    return skill_name, phase, started, completed, success
+
+
+def extract_skill_from_workspace(workspace_path: Path) -> Optional[SkillUsage]:
+    """
+    Extract skill usage information from a workspace file.
+
+    Args:
+        workspace_path: Path to workspace directory or WORKSPACE.md file
+
+    Returns:
+        SkillUsage object if skill found, None otherwise
+    """
+    # Handle both directory and file paths
+    if workspace_path.is_dir():
+        workspace_file = workspace_path / 'WORKSPACE.md'
+        workspace_name = workspace_path.name
+    else:
+        workspace_file = workspace_path
+        workspace_name = workspace_path.parent.name
+
+    if not workspace_file.exists():
+        return None
+
+    parsed = _read_workspace_skill(workspace_file)
+    if not parsed:
+        return None
+    skill_name, phase, started, completed, success = parsed
+
     return SkillUsage(
         skill_name=skill_name,
         workspace_name=workspace_name,
@@ -5,6 +5,7 @@ Provides utilities for serializing orch dataclasses to JSON with schema versioni
 """
 
 import json
+from collections.abc import Mapping
 from typing import Dict, Any, Optional
 from dataclasses import asdict
 from orch.monitor import AgentStatus
@@ -89,6 +90,13 @@ def serialize_commit_info(commit: CommitInfo) -> Dict[str, Any]:
     }
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize dict-like objects (e.g. registry AgentRecords) as plain dicts."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def output_json(data: Dict[str, Any], pretty: bool = False) -> str:
     """
     Format data as JSON string with schema version.
@@ -106,6 +114,6 @@ def output_json(data: Dict[str, Any], pretty: bool = False) -> str:
     output = {"schema_version": SCHEMA_VERSION, **data}
 
     if pretty:
-        return json.dumps(output, indent=2)
+        return json.dumps(output, indent=2, default=_json_default)
     else:
-        return json.dumps(output)
+        return json.dumps(output, default=_json_default)
@@ -1,14 +1,20 @@
+import threading
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
-from orch.frontmatter import extract_phase as fm_extract_phase, extract_metadata
+from orch.frontmatter import extract_phase as fm_extract_phase, extract_metadata, memoize_by_stat
 import re
 from orch.patterns import check_patterns
+from orch.artifact_index import INVESTIGATION_ROOTS, ArtifactIndex, save_loaded_indexes
 from orch.context import ContextInfo
 from orch.git_utils import CommitInfo
-from orch.beads_integration import BeadsIntegration, BeadsCLINotFoundError, BeadsIssueNotFoundError
+from orch.beads_integration import BeadsBatch, BeadsIntegration, BeadsCLINotFoundError, BeadsIssueNotFoundError
+
+if TYPE_CHECKING:
+    from orch.status_cache import StatusCache
 
 
 class Scenario(Enum):
@@ -43,6 +49,50 @@ class AgentStatus:
     age_str: Optional[str] = None
     is_stale: bool = False
 
+    # Status check didn't finish within the per-agent timeout (see evaluate_agent_statuses)
+    timed_out: bool = False
+
+
+def status_to_dict(status: AgentStatus) -> Dict[str, Any]:
+    """
+    AgentStatus as a JSON-compatible dict that status_from_dict() restores.
+
+    context_info and last_commit are left out: they are only computed on
+    request (--context, git checks) and never stored.
+    """
+    return {
+        'agent_id': status.agent_id,
+        'needs_attention': status.needs_attention,
+        'priority': status.priority,
+        'alerts': status.alerts,
+        'phase': status.phase,
+        'commits_since_spawn': status.commits_since_spawn,
+        'scenario': status.scenario.value if status.scenario else None,
+        'recommendation': status.recommendation,
+        'completed_at': status.completed_at.isoformat() if status.completed_at else None,
+        'age_str': status.age_str,
+        'is_stale': status.is_stale,
+        'timed_out': status.timed_out,
+    }
+
+
+def status_from_dict(data: Dict[str, Any]) -> AgentStatus:
+    """Rebuild an AgentStatus serialized by status_to_dict()."""
+    return AgentStatus(
+        agent_id=data['agent_id'],
+        needs_attention=data.get('needs_attention', False),
+        priority=data.get('priority', 'ok'),
+        alerts=list(data.get('alerts') or []),
+        phase=data.get('phase', 'Unknown'),
+        commits_since_spawn=data.get('commits_since_spawn', 0),
+        scenario=Scenario(data['scenario']) if data.get('scenario') else None,
+        recommendation=data.get('recommendation'),
+        completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else None,
+        age_str=data.get('age_str'),
+        is_stale=data.get('is_stale', False),
+        timed_out=data.get('timed_out', False),
+    )
+
 
 def _is_template_placeholder(value: str) -> bool:
     """
@@ -63,11 +113,13 @@ def _is_template_placeholder(value: str) -> bool:
     return False
 
 
+@memoize_by_stat
 def extract_phase_from_file(path: Path) -> Optional[str]:
     """
     Extract Phase value from a coordination artifact (workspace or investigation file).
 
     Uses YAML frontmatter if present, falls back to inline markdown extraction.
+    Memoized on the file's mtime and size.
 
     Args:
         path: Path to file containing '**Phase:**' style metadata or YAML frontmatter
@@ -107,7 +159,8 @@ def extract_phase_from_file(path: Path) -> Optional[str]:
 
     return None
 
-def check_agent_status(agent_info: Dict[str, Any], check_context: bool = False, check_git: bool = False) -> AgentStatus:
+def check_agent_status(agent_info: Dict[str, Any], check_context: bool = False, check_git: bool = False,
+                       beads_batch: Optional[BeadsBatch] = None) -> AgentStatus:
     """
     Check status of an agent.
 
@@ -116,8 +169,10 @@ def check_agent_status(agent_info: Dict[str, Any], check_context: bool = False,
 
     Args:
         agent_info: Agent dict from registry (id, project_dir, workspace, window)
-        check_context: If True, check context usage via /context command
+        check_context: If True, check context usage (see orch.context.get_context_info)
         check_git: If True, check git commit history
+        beads_batch: Prefetched beads comments (see BeadsBatch); agents
+                     missing from it fall back to a `bd comments` call
 
     Returns:
         AgentStatus with alerts and priority
@@ -129,7 +184,10 @@ def check_agent_status(agent_info: Dict[str, Any], check_context: bool = False,
     # Primary: beads-based phase detection
     beads_id = agent_info.get('beads_id')
     beads_phase = None
-    if beads_id:
+    beads_db_path = agent_info.get('beads_db_path')
+    if beads_id and beads_batch is not None and beads_batch.has_comments(beads_id, beads_db_path):
+        beads_phase = beads_batch.phase(beads_id, beads_db_path)
+    elif beads_id:
         try:
             beads = BeadsIntegration()
             beads_phase = beads.get_phase_from_comments(beads_id)
@@ -164,18 +222,9 @@ def check_agent_status(agent_info: Dict[str, Any], check_context: bool = False,
     if not primary_artifact_path and skill_name in ("investigation", "systematic-debugging", "codebase-audit"):
         # Check .kb/ first (new location), then .orch/ (legacy fallback)
         workspace_name = Path(workspace_path).name
-        matches = []
-        for base_dir in [".kb", ".orch"]:
-            investigations_dir = project_dir / base_dir / "investigations"
-            if investigations_dir.exists():
-                try:
-                    matches = list(investigations_dir.rglob(f"{workspace_name}.md"))
-                except Exception:
-                    matches = []
-                if matches:
-                    break
+        matches = ArtifactIndex.for_project(project_dir).find(workspace_name, INVESTIGATION_ROOTS)
         if matches:
-            inv_file = matches[0]
+            inv_file = matches[0].path
             try:
                 content = inv_file.read_text(encoding="utf-8")
             except Exception:
@@ -268,6 +317,179 @@ def check_agent_status(agent_info: Dict[str, Any], check_context: bool = False,
     return status
 
 
+def _timed_out_status(agent_id: str, timeout: float) -> AgentStatus:
+    """Placeholder status for an agent whose check exceeded the timeout."""
+    return AgentStatus(
+        agent_id=agent_id,
+        needs_attention=True,
+        priority='warning',
+        alerts=[{
+            'type': 'status_timeout',
+            'message': f'Status check timed out after {timeout:g}s (status unknown)',
+            'level': 'warning'
+        }],
+        timed_out=True,
+    )
+
+
+def evaluate_agent_statuses(
+    agents: Sequence[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    check_func: Optional[Callable[..., AgentStatus]] = None,
+    status_cache: Optional['StatusCache'] = None,
+    **check_kwargs: Any
+) -> List[AgentStatus]:
+    """
+    Run check_agent_status for many agents concurrently.
+
+    Each check may call beads, scan the filesystem and run git, so up to
+    max_workers checks run at once in worker threads. A check still running
+    `timeout` seconds after it started is reported as unknown
+    (AgentStatus.timed_out) instead of blocking the others; its thread is
+    left to finish in the background.
+
+    With a status_cache, agents whose inputs are unchanged since an earlier
+    run reuse that run's status and aren't checked at all. Checks that read
+    context usage or git history always run.
+
+    Args:
+        agents: Agent dicts from the registry
+        max_workers: Concurrent checks (default: status_workers config)
+        timeout: Per-agent limit in seconds (default: status_agent_timeout config)
+        check_func: Status check to run (default: check_agent_status)
+        status_cache: Earlier results to reuse (see orch.status_cache); new
+                      results are added to it, the caller saves it
+        **check_kwargs: Passed through to check_func
+
+    Returns:
+        One AgentStatus per agent, in the same order as agents
+    """
+    from orch.config import get_status_agent_timeout, get_status_workers
+
+    if not agents:
+        return []
+    max_workers = max(1, max_workers if max_workers is not None else get_status_workers())
+    if timeout is None:
+        timeout = get_status_agent_timeout()
+    if check_func is None:
+        check_func = check_agent_status
+
+    results: List[Optional[AgentStatus]] = [None] * len(agents)
+    queued = list(range(len(agents)))
+
+    # Fingerprints are taken before checking, so an input that changes
+    # mid-check leaves a stale fingerprint that won't match next time
+    fingerprints: Dict[int, str] = {}
+    if status_cache is not None and not (check_kwargs.get('check_context') or check_kwargs.get('check_git')):
+        for index in list(queued):
+            fingerprint, storable = status_cache.fingerprint(agents[index])
+            cached = status_cache.get(agents[index]['id'], fingerprint)
+            if cached is not None:
+                results[index] = cached
+                queued.remove(index)
+            elif storable:
+                fingerprints[index] = fingerprint
+
+    finished: Dict[int, AgentStatus] = {}
+    errors: Dict[int, BaseException] = {}
+    done = threading.Condition()
+
+    def run(index: int) -> None:
+        try:
+            status = check_func(agents[index], **check_kwargs)
+        except BaseException as e:  # re-raised in the calling thread
+            with done:
+                errors[index] = e
+                done.notify()
+            return
+        with done:
+            finished[index] = status
+            done.notify()
+
+    running: Dict[int, float] = {}  # index -> start time
+    with done:
+        while queued or running:
+            # Timed-out checks give up their slot, so a hung check can't
+            # starve the agents still queued behind it
+            while queued and len(running) < max_workers:
+                index = queued.pop(0)
+                running[index] = time.monotonic()
+                # Daemon threads: a hung check doesn't keep the process alive
+                threading.Thread(target=run, args=(index,), daemon=True).start()
+
+            for index in [i for i in running if i in finished or i in errors]:
+                del running[index]
+                if index in errors:
+                    raise errors[index]
+                results[index] = finished[index]
+                if index in fingerprints:
+                    status_cache.put(agents[index]['id'], fingerprints[index], finished[index])
+
+            now = time.monotonic()
+            for index, started in list(running.items()):
+                if now - started >= timeout:
+                    del running[index]
+                    results[index] = _timed_out_status(agents[index]['id'], timeout)
+
+            if running and not (queued and len(running) < max_workers):
+                next_expiry = min(running.values()) + timeout
+                done.wait(max(0.0, next_expiry - time.monotonic()))
+
+    # Phases and transcript offsets the checks read are written once for the whole pass
+    save_loaded_indexes()
+    if check_kwargs.get('check_context'):
+        from orch.context import save_transcript_state
+        save_transcript_state()
+    return [status for status in results if status is not None]
+
+
+class AgentStatusPoller:
+    """
+    Repeated status checks of one agent, at most one running at a time.
+
+    Used by `orch wait`. A check still running after `timeout` seconds is
+    reported as unknown (AgentStatus.timed_out), as in
+    evaluate_agent_statuses, but the next poll waits for that same check
+    instead of starting another: a hung check (e.g. a stuck bd) holds one
+    thread for the whole wait rather than one per poll.
+    """
+
+    def __init__(self, timeout: Optional[float] = None,
+                 check_func: Optional[Callable[..., AgentStatus]] = None):
+        from orch.config import get_status_agent_timeout
+
+        self.timeout = timeout if timeout is not None else get_status_agent_timeout()
+        self.check_func = check_func or check_agent_status
+        self._thread: Optional[threading.Thread] = None
+        self._status: Optional[AgentStatus] = None
+        self._error: Optional[BaseException] = None
+
+    def _run(self, agent: Dict[str, Any], check_kwargs: Dict[str, Any]) -> None:
+        try:
+            self._status = self.check_func(agent, **check_kwargs)
+        except BaseException as e:  # re-raised in the polling thread
+            self._error = e
+
+    def poll(self, agent: Dict[str, Any], **check_kwargs: Any) -> AgentStatus:
+        """Status of the agent, from a new check or the one still running."""
+        if self._thread is None:
+            self._status = None
+            self._error = None
+            # Daemon thread: a hung check doesn't keep the process alive
+            self._thread = threading.Thread(target=self._run, args=(agent, check_kwargs), daemon=True)
+            self._thread.start()
+        self._thread.join(self.timeout)
+        if self._thread.is_alive():
+            return _timed_out_status(agent['id'], self.timeout)
+
+        self._thread = None
+        if self._error is not None:
+            raise self._error
+        save_loaded_indexes()
+        return self._status
+
+
 def detect_completion_scenario(
     agent_info: Dict[str, Any],
     coordination_file: Optional[Path],
@@ -332,18 +554,9 @@ def detect_completion_scenario(
     workspace_path = agent_info['workspace']
     workspace_name = Path(workspace_path).name
 
-    # Look for investigation files (check .kb/ first, then .orch/)
-    has_investigation = False
-    for base_dir in [".kb", ".orch"]:
-        investigations_dir = project_dir / base_dir / "investigations"
-        if investigations_dir.exists():
-            try:
-                matches = list(investigations_dir.rglob(f"*{workspace_name}*.md"))
-                if matches:
-                    has_investigation = True
-                    break
-            except Exception:
-                pass
+    # Look for investigation files (in .kb/ or .orch/)
+    index = ArtifactIndex.for_project(project_dir)
+    has_investigation = bool(index.find_containing(workspace_name, INVESTIGATION_ROOTS))
 
     # Scenario: Investigation complete, ready to clean
     if has_investigation:
@@ -387,23 +600,17 @@ def _detect_completion_fallback(agent_info: Dict[str, Any], project_dir: Path) -
     if skill_name == 'investigation':
         # Look for investigation file (check .kb/ first, then .orch/)
         workspace_name = Path(workspace_path).name if workspace_path else ''
-        for base_dir in [".kb", ".orch"]:
-            investigations_dir = project_dir / base_dir / "investigations"
-            if investigations_dir.exists():
-                # Try to find investigation files that match workspace pattern
-                # Workspace names often follow: YYYY-MM-DD-inv-topic or inv-topic
-                try:
-                    for inv_type_dir in investigations_dir.iterdir():
-                        if inv_type_dir.is_dir():
-                            for inv_file in inv_type_dir.glob("*.md"):
-                                # Check if investigation file matches workspace name
-                                if workspace_name and workspace_name in inv_file.stem:
-                                    # Found matching investigation - check its phase
-                                    phase = extract_phase_from_file(inv_file)
-                                    if phase and phase.lower() == 'complete':
-                                        return "Complete (inferred)"
-                except (OSError, PermissionError):
-                    pass  # Ignore file system errors
+        if workspace_name:
+            # Investigation files live in type subdirectories (investigations/simple/...)
+            # and are named after the workspace: YYYY-MM-DD-inv-topic or inv-topic
+            index = ArtifactIndex.for_project(project_dir)
+            for inv_file in index.find_containing(workspace_name, INVESTIGATION_ROOTS):
+                if inv_file.depth != 1:
+                    continue
+                # Found matching investigation - check its phase
+                phase = index.phase(inv_file)
+                if phase and phase.lower() == 'complete':
+                    return "Complete (inferred)"
 
     # Signal 3: Check for commits since spawn (indicates work was done)
     spawn_time_str = agent_info.get('spawned_at')
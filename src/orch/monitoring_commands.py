@@ -8,10 +8,14 @@ import json
 import time
 from pathlib import Path
 
+from orch.beads_integration import BeadsBatch
 from orch.registry import AgentRegistry
-from orch.tmux_utils import list_windows, find_session, is_tmux_available
-from orch.monitor import check_agent_status, get_status_emoji
+from orch.tmux_utils import find_session, snapshot_windows
+from orch.monitor import AgentStatusPoller, check_agent_status, evaluate_agent_statuses, get_status_emoji
+from orch.status_cache import StatusCache
+from orch.status_daemon import reconcile_registry, request_snapshot
 from orch.logging import OrchLogger
+from orch.pane_log import read_agent_output
 from orch.path_utils import get_git_root, detect_and_display_context
 from orch.spawn_context_quality import (
     validate_spawn_context_quality,
@@ -25,63 +29,20 @@ from orch.agent_filters import (
 )
 
 
+# Lines of pane log scanned for a pending question (about one screen)
+QUESTION_SCAN_LINES = 60
+
+
 def _display_context_info(context_info):
     """Helper to display context info."""
     click.echo(f"    Context: {context_info.tokens_used:,}/{context_info.tokens_total:,} ({context_info.percentage:.1f}%)")
 
 
-def _get_issue_title(beads_id: str, db_path: str = None) -> str | None:
-    """Fetch beads issue title for display.
-
-    Args:
-        beads_id: Beads issue ID
-        db_path: Optional path to beads database
-
-    Returns:
-        Issue title or None if issue not found or beads CLI unavailable
-    """
-    from orch.beads_integration import (
-        BeadsIntegration,
-        BeadsCLINotFoundError,
-        BeadsIssueNotFoundError,
-    )
-
-    try:
-        beads = BeadsIntegration(db_path=db_path) if db_path else BeadsIntegration()
-        issue = beads.get_issue(beads_id)
-        return issue.title
-    except (BeadsCLINotFoundError, BeadsIssueNotFoundError):
-        return None
-
-
-def _get_issue_convergence(beads_id: str, db_path: str = None) -> dict | None:
-    """Fetch child issue convergence stats for a parent issue.
-
-    Args:
-        beads_id: Beads issue ID
-        db_path: Optional path to beads database
-
-    Returns:
-        Convergence dict {total, closed, in_progress, open} or None if no children
-    """
-    from orch.beads_integration import (
-        BeadsIntegration,
-        BeadsCLINotFoundError,
-        BeadsIssueNotFoundError,
-    )
-
-    try:
-        beads = BeadsIntegration(db_path=db_path) if db_path else BeadsIntegration()
-        return beads.get_child_convergence(beads_id)
-    except (BeadsCLINotFoundError, BeadsIssueNotFoundError):
-        return None
-
-
 def _format_convergence(convergence: dict | None) -> str:
     """Format convergence stats for display.
 
     Args:
-        convergence: Convergence dict from _get_issue_convergence
+        convergence: Convergence dict from BeadsBatch.convergence
 
     Returns:
         Formatted string like "3/5 children complete" or empty string
@@ -118,6 +79,108 @@ def _format_agent_not_found_error(agent_id: str, registry: AgentRegistry) -> str
         return f"Agent '{agent_id}' not found (no active agents)."
 
 
+def _load_reconciled_agents(registry_path, include_completed: bool, output_format: str):
+    """Active (and optionally completed) agents after reconciling the registry with tmux."""
+    # Load registry (use custom path for testing)
+    if registry_path:
+        registry = AgentRegistry(registry_path=Path(registry_path))
+    else:
+        registry = AgentRegistry()
+
+    # One tmux call lists every window on the server (also tells us tmux is up)
+    snapshot = snapshot_windows()
+    if not snapshot.available:
+        # Only show warnings in human format
+        if output_format == 'human':
+            click.echo("⚠️  Tmux not available or not running.")
+            click.echo("   Cannot reconcile agent state with tmux windows.")
+            click.echo("   Showing registry state only (may be stale).\n")
+        # Skip reconciliation, continue with registry state
+    else:
+        reconcile_registry(registry, snapshot)
+
+    # Note: reconcile_opencode() removed in lifecycle simplification
+    # OpenCode agents tracked via beads, not separate reconciliation
+
+    # Get active agents
+    agents = registry.list_active_agents()
+
+    # Get completed agents only when --include-completed flag is set
+    # This makes the default output cleaner (active only)
+    if include_completed:
+        # Older completions live in the archive tier; only read it when asked
+        completed_agents = [
+            a for a in registry.list_agents(include_archived=True)
+            if a.get('status') == 'completed'
+        ]
+    else:
+        completed_agents = []
+
+    return agents, completed_agents
+
+
+def _load_archived_completed_agents():
+    """Completed agents in the registry's archive tier (not covered by `orch statusd`)."""
+    return AgentRegistry().list_archived_agents(statuses=['completed'])
+
+
+def _evaluate_statuses(agents, completed_agents, check_context: bool, output_format: str,
+                       use_cache: bool = True):
+    """
+    Check every agent's status.
+
+    With use_cache, agents whose inputs haven't changed since an earlier run
+    reuse that run's status (see orch.status_cache).
+
+    Returns (agent_statuses, completed_statuses, issue_titles, issue_convergence).
+    """
+    # Show progress if checking context (slow operation) - only in human format
+    total_agents_to_check = len(agents) + len(completed_agents)
+    if check_context and output_format == 'human' and total_agents_to_check > 0:
+        click.echo(f"\n⏳ Checking context usage for {total_agents_to_check} agent(s)...\n")
+
+    # Fetch every agent's beads issue and comments in bulk (one `bd show`
+    # per beads database); phase, title and convergence all read from it
+    beads_batch = BeadsBatch.fetch(
+        (agent.get('beads_id'), agent.get('beads_db_path'))
+        for agent in agents + completed_agents
+    )
+
+    status_cache = None
+    if use_cache:
+        from orch.config import get_status_cache_enabled
+        if get_status_cache_enabled():
+            status_cache = StatusCache()
+
+    # Check status of active agents and (Phase 2.5) completed agents
+    # concurrently; results keep the registry order
+    statuses = evaluate_agent_statuses(
+        agents + completed_agents, check_func=check_agent_status,
+        status_cache=status_cache, check_context=check_context, beads_batch=beads_batch
+    )
+    if status_cache is not None:
+        status_cache.save()
+    agent_statuses = list(zip(agents, statuses[:len(agents)]))
+    completed_statuses = list(zip(completed_agents, statuses[len(agents):]))
+
+    # Build cache of issue titles and convergence for agents spawned from beads issues
+    issue_titles = {}
+    issue_convergence = {}
+    for agent in agents + completed_agents:
+        beads_id = agent.get('beads_id')
+        if beads_id and beads_id not in issue_titles:
+            db_path = agent.get('beads_db_path')
+            issue = beads_batch.issue(beads_id, db_path)
+            if issue and issue.title:
+                issue_titles[beads_id] = issue.title
+            # Also record convergence (None if no children)
+            convergence = beads_batch.convergence(beads_id, db_path)
+            if convergence:
+                issue_convergence[beads_id] = convergence
+
+    return agent_statuses, completed_statuses, issue_titles, issue_convergence
+
+
 def register_monitoring_commands(cli):
     """Register monitoring-related commands with the CLI."""
 
@@ -132,8 +195,10 @@ def register_monitoring_commands(cli):
     @click.option('--filter', 'workspace_filter', help='Filter by workspace name pattern (e.g., "investigate-*")')
     @click.option('--status', 'status_filter', help='Filter by phase/status (e.g., "Planning", "Complete", "blocked")')
     @click.option('--include-completed', 'include_completed', is_flag=True, help='Include completed agents (default: active only)')
+    @click.option('--no-daemon', 'no_daemon', is_flag=True, help="Compute status directly even if 'orch statusd' is running")
+    @click.option('--no-cache', 'no_cache', is_flag=True, help='Recheck every agent instead of reusing unchanged cached statuses')
     @click.option('--registry', 'registry_path', type=click.Path(exists=True), hidden=True, help='Registry path (for testing)')
-    def status(compact, session, check_context, output_format, json_flag, global_flag, project, workspace_filter, status_filter, include_completed, registry_path):
+    def status(compact, session, check_context, output_format, json_flag, global_flag, project, workspace_filter, status_filter, include_completed, no_daemon, no_cache, registry_path):
         """Quick-glance agent monitoring.
 
         \b
@@ -174,12 +239,6 @@ def register_monitoring_commands(cli):
             "include_completed": include_completed
         })
 
-        # Load registry (use custom path for testing)
-        if registry_path:
-            registry = AgentRegistry(registry_path=Path(registry_path))
-        else:
-            registry = AgentRegistry()
-
         # Resolve session default from config if not provided
         if not session:
             try:
@@ -188,71 +247,22 @@ def register_monitoring_commands(cli):
             except Exception:
                 session = 'orchestrator'
 
-        # Check tmux availability
-        if not is_tmux_available():
-            # Only show warnings in human format
-            if output_format == 'human':
-                click.echo("⚠️  Tmux not available or not running.")
-                click.echo("   Cannot reconcile agent state with tmux windows.")
-                click.echo("   Showing registry state only (may be stale).\n")
-            # Skip reconciliation, continue with registry state
+        # A running status daemon (`orch statusd`) has these statuses precomputed.
+        # --context, --no-cache and test registries need the direct path.
+        daemon_snapshot = None
+        if not check_context and not registry_path and not no_daemon and not no_cache:
+            daemon_snapshot = request_snapshot()
+
+        archived_agents = []
+        if daemon_snapshot is not None:
+            agents = [a for a, s in daemon_snapshot.active]
+            completed_agents = [a for a, s in daemon_snapshot.completed] if include_completed else []
+            if include_completed:
+                # The daemon only tracks the hot registry; older completions
+                # are read from the archive tier here, when asked for
+                archived_agents = _load_archived_completed_agents()
         else:
-            # Collect active window IDs from ALL sessions where agents are registered
-            # This fixes the bug where agents in workers-* sessions were incorrectly
-            # marked as completed when status only checked the orchestrator session
-
-            # Find all unique sessions from registered agents
-            agent_sessions = set()
-            for agent in registry.list_active_agents():
-                # Extract session name from window target (e.g., "workers-price-watch:5" -> "workers-price-watch")
-                window_target = agent.get('window') or ''
-                if window_target and ':' in window_target:
-                    session_name = window_target.split(':')[0]
-                    agent_sessions.add(session_name)
-
-            # Also include the default session (for backward compatibility)
-            agent_sessions.add(session)
-
-            # Build combined active_window_ids from all relevant sessions
-            all_active_window_ids = []
-            target_to_id = {}  # For legacy migration
-
-            for sess in agent_sessions:
-                session_obj = find_session(sess)
-                if session_obj:
-                    windows = list_windows(sess)
-                    # Add to combined list
-                    all_active_window_ids.extend([w['id'] for w in windows])
-                    # Build legacy migration map
-                    for w in windows:
-                        target_to_id[f"{sess}:{w['index']}"] = w['id']
-
-            # Legacy migration: upgrade agents missing window_id (one-time migration)
-            migrated_count = 0
-            for agent in registry.list_active_agents():
-                if not agent.get('window_id') and agent['window'] in target_to_id:
-                    agent['window_id'] = target_to_id[agent['window']]
-                    migrated_count += 1
-
-            # Save if any migrations occurred
-            if migrated_count > 0:
-                registry.save()
-
-            # Always reconcile - even if no windows found, this detects agents whose windows closed
-            registry.reconcile(all_active_window_ids)
-
-        # Note: reconcile_opencode() removed in lifecycle simplification
-        # OpenCode agents tracked via beads, not separate reconciliation
-
-        # Get active agents
-        agents = registry.list_active_agents()
-
-        # Get completed agents only when --include-completed flag is set
-        # This makes the default output cleaner (active only)
-        if include_completed:
-            completed_agents = [a for a in registry.list_agents() if a.get('status') == 'completed']
-        else:
-            completed_agents = []
+            agents, completed_agents = _load_reconciled_agents(registry_path, include_completed, output_format)
 
         # Automatic project scoping: filter to git root if no filters specified
         # This allows running 'orch status' from subdirectories and seeing project agents
@@ -266,6 +276,7 @@ def register_monitoring_commands(cli):
         if project or workspace_filter:
             agents = filter_agents(agents, project=project, workspace_pattern=workspace_filter)
             completed_agents = filter_agents(completed_agents, project=project, workspace_pattern=workspace_filter)
+            archived_agents = filter_agents(archived_agents, project=project, workspace_pattern=workspace_filter)
 
         if not agents:
             # Calculate duration
@@ -299,43 +310,32 @@ def register_monitoring_commands(cli):
                     click.echo("No active agents found.")
             return
 
-        # Show progress if checking context (slow operation) - only in human format
-        total_agents_to_check = len(agents) + len(completed_agents)
-        if check_context and output_format == 'human' and total_agents_to_check > 0:
-            click.echo(f"\n⏳ Checking context usage for {total_agents_to_check} agent(s)...\n")
-
-        # Check status of each active agent
-        agent_statuses = []
-        for agent in agents:
-            status_obj = check_agent_status(agent, check_context=check_context)
-            agent_statuses.append((agent, status_obj))
-
-        # Phase 2.5: Check status of completed agents too
-        completed_statuses = []
-        for agent in completed_agents:
-            status_obj = check_agent_status(agent, check_context=check_context)
-            completed_statuses.append((agent, status_obj))
+        if daemon_snapshot is not None:
+            # Filtering keeps the snapshot's agent dicts, so look statuses up by identity
+            snapshot_statuses = {
+                id(agent): status_obj
+                for agent, status_obj in daemon_snapshot.active + daemon_snapshot.completed
+            }
+            agent_statuses = [(a, snapshot_statuses[id(a)]) for a in agents]
+            completed_statuses = [(a, snapshot_statuses[id(a)]) for a in completed_agents]
+            issue_titles = dict(daemon_snapshot.issue_titles)
+            issue_convergence = dict(daemon_snapshot.issue_convergence)
+            if archived_agents:
+                _, archived_statuses, archived_titles, archived_convergence = _evaluate_statuses(
+                    [], archived_agents, check_context, output_format
+                )
+                completed_statuses += archived_statuses
+                issue_titles.update(archived_titles)
+                issue_convergence.update(archived_convergence)
+        else:
+            agent_statuses, completed_statuses, issue_titles, issue_convergence = _evaluate_statuses(
+                agents, completed_agents, check_context, output_format, use_cache=not no_cache
+            )
 
         # Filter by status/phase if requested
         if status_filter:
             agent_statuses = filter_agents_by_status(agent_statuses, status_filter)
 
-        # Build cache of issue titles and convergence for agents spawned from beads issues
-        issue_titles = {}
-        issue_convergence = {}
-        all_agents_to_display = [a for a, s in agent_statuses] + [a for a, s in completed_statuses]
-        for agent in all_agents_to_display:
-            beads_id = agent.get('beads_id')
-            if beads_id and beads_id not in issue_titles:
-                db_path = agent.get('beads_db_path')
-                title = _get_issue_title(beads_id, db_path)
-                if title:
-                    issue_titles[beads_id] = title
-                # Also fetch convergence (may be None if no children)
-                convergence = _get_issue_convergence(beads_id, db_path)
-                if convergence:
-                    issue_convergence[beads_id] = convergence
-
         # Group by priority
         critical = [(a, s) for a, s in agent_statuses if s.priority == 'critical']
         warnings = [(a, s) for a, s in agent_statuses if s.priority == 'warning']
@@ -530,6 +530,34 @@ def register_monitoring_commands(cli):
             "completed": len(completed_statuses)
         })
 
+    @cli.command()
+    @click.option('--poll-interval', default=2.0, type=float, help='Seconds between checks for registry/tmux/beads changes (default: 2)')
+    @click.option('--refresh-interval', default=30.0, type=float, help='Recompute at least this often, in seconds (default: 30)')
+    def statusd(poll_interval, refresh_interval):
+        """Serve precomputed agent status to 'orch status' (runs in foreground).
+
+        \b
+        Keeps every agent's status up to date in the background and serves it
+        over ~/.orch/statusd.sock. While it runs, 'orch status' and the
+        SessionStart hook read the snapshot instead of recomputing it; without
+        it they compute status directly as usual.
+
+        \b
+        Examples:
+          orch statusd &
+          orch status --no-daemon    # bypass the daemon for one run
+        """
+        from orch.status_daemon import StatusDaemon, StatusDaemonError
+
+        status_daemon = StatusDaemon(poll_interval=poll_interval, max_refresh_interval=refresh_interval)
+        click.echo(f"📡 orch statusd listening on {status_daemon.path} (Ctrl+C to stop)")
+        try:
+            status_daemon.serve_forever()
+        except StatusDaemonError as e:
+            raise click.ClickException(str(e))
+        except KeyboardInterrupt:
+            click.echo("\nStopped.")
+
     @cli.command()
     @click.argument('agent_id', required=False)
     @click.option('--issue', 'beads_issue', help='Inspect beads issue directly (bypass registry)')
@@ -562,9 +590,12 @@ def register_monitoring_commands(cli):
             orch_logger.log_command_start("check", {"beads_issue": beads_issue, "format": output_format})
 
             try:
+                # One `bd show` serves both the issue and (when included) its comments
                 beads = BeadsIntegration()
-                issue = beads.get_issue(beads_issue)
-                phase = beads.get_phase_from_comments(beads_issue)
+                issue = beads.get_many([beads_issue]).get(beads_issue)
+                if issue is None:
+                    raise BeadsIssueNotFoundError(beads_issue)
+                phase = beads.get_timeline(beads_issue).phase
             except BeadsCLINotFoundError:
                 click.echo("bd CLI not found. Install beads or check PATH.", err=True)
                 raise click.Abort()
@@ -741,10 +772,26 @@ def register_monitoring_commands(cli):
         click.echo()
 
     @cli.command()
-    @click.argument('agent_id')
+    @click.argument('agent_ids', nargs=-1)
     @click.option('--lines', default=20, help='Number of lines to capture (default: 20)')
-    def tail(agent_id, lines):
-        """Capture recent output from agent's tmux window."""
+    @click.option('--follow', '-f', is_flag=True, help='Keep streaming new output (Ctrl+C to stop)')
+    @click.option('--project', help='Follow all active agents in a project')
+    @click.option('--all', 'all_agents', is_flag=True, help='Follow all active agents')
+    @click.option('--interval', default=0.5, type=float, help='Poll interval in seconds for --follow (default: 0.5)')
+    def tail(agent_ids, lines, follow, project, all_agents, interval):
+        """Capture recent output from agent's tmux window.
+
+        With several agents, --project or --all, output is interleaved with
+        an [agent-id] prefix per line.
+
+        \b
+        Examples:
+          orch tail my-agent
+          orch tail my-agent --follow
+          orch tail agent-a agent-b -f
+          orch tail --project price-watch -f
+          orch tail --all -f --lines 0
+        """
         from orch.tail import tail_agent_output
 
         # Initialize logger
@@ -752,6 +799,12 @@ def register_monitoring_commands(cli):
 
         # Load registry
         registry = AgentRegistry()
+
+        if len(agent_ids) != 1 or follow or project or all_agents:
+            _tail_many(registry, orch_logger, agent_ids, lines, follow, project, all_agents, interval)
+            return
+
+        agent_id = agent_ids[0]
         agent = registry.find(agent_id)
 
         if not agent:
@@ -782,6 +835,58 @@ def register_monitoring_commands(cli):
             click.echo(f"❌ {e}", err=True)
             raise click.Abort()
 
+    def _tail_many(registry, orch_logger, agent_ids, lines, follow, project, all_agents, interval):
+        """Tail (and optionally follow) several agents with per-agent prefixes."""
+        from orch.tail import follow_agents, tail_agent_output
+
+        if all_agents or project:
+            agents = registry.list_active_agents()
+            if project:
+                agents = filter_agents(agents, project=resolve_project_path(project))
+        else:
+            agents = []
+            for agent_id in agent_ids:
+                agent = registry.find(agent_id)
+                if not agent:
+                    click.echo(f"❌ {_format_agent_not_found_error(agent_id, registry)}", err=True)
+                    raise click.Abort()
+                agents.append(agent)
+
+        if not agents:
+            click.echo("No agents to tail.", err=True)
+            raise click.Abort()
+
+        width = max(len(a['id']) for a in agents)
+        prefixed = len(agents) > 1
+
+        def emit(agent_id, line):
+            if line is None:
+                click.echo(f"⚠️  [{agent_id}] output stream unavailable", err=True)
+                return
+            click.echo(f"[{agent_id.ljust(width)}] {line}" if prefixed else line)
+
+        orch_logger.log_event("tail", f"Tailing {len(agents)} agent(s)", {
+            "agent_ids": [a['id'] for a in agents],
+            "follow": follow,
+            "lines_requested": lines
+        }, level="INFO")
+
+        if not follow:
+            for agent in agents:
+                try:
+                    output = tail_agent_output(agent, lines=lines)
+                except RuntimeError as e:
+                    click.echo(f"❌ {e}", err=True)
+                    continue
+                for line in output.rstrip('\n').split('\n'):
+                    emit(agent['id'], line)
+            return
+
+        try:
+            follow_agents(agents, emit, lines=lines, interval=interval)
+        except KeyboardInterrupt:
+            pass
+
     @cli.command()
     @click.option('--limit', default=50, help='Number of log entries to show (default: 50)')
     @click.option('--command', 'command_filter', help='Filter by command name (spawn, clean, status, etc.)')
@@ -877,8 +982,11 @@ def register_monitoring_commands(cli):
             click.echo("Analytics tracking moved to beads. Use 'bd stats' instead.")
             return
 
-        # Show history view - list completed agents from registry
-        completed_agents = [a for a in reg.list_agents() if a.get('status') == 'completed']
+        # Show history view - list completed agents from registry and its archive
+        completed_agents = [
+            a for a in reg.list_agents(include_archived=True)
+            if a.get('status') == 'completed'
+        ]
 
         if not completed_agents:
             if output_format == 'json':
@@ -906,15 +1014,24 @@ def register_monitoring_commands(cli):
             click.echo()
 
     @cli.command()
-    @click.argument('agent_id')
-    @click.argument('message')
-    def send(agent_id, message):
+    @click.argument('agent_id', required=False)
+    @click.argument('message', required=False)
+    @click.option('--all', 'all_agents', is_flag=True, help='Send MESSAGE to every active agent')
+    @click.option('--project', help='Send MESSAGE to every active agent in this project')
+    def send(agent_id, message, all_agents, project):
         """Send a message to a spawned agent.
 
         AGENT_ID is the agent's unique identifier (e.g., 'fix-tmux-registry-tracking'),
         not the window number. Use 'orch status' to see active agent IDs.
 
-        Example: orch send fix-tmux-registry-tracking "Please provide a status update"
+        With --all or --project, the only argument is the message, and it is
+        delivered to all matching agents in parallel.
+
+        \b
+        Examples:
+          orch send fix-tmux-registry-tracking "Please provide a status update"
+          orch send --all "Wrap up and report Phase: Complete"
+          orch send --project . "Rebase on main before committing"
         """
         from orch.send import send_message_to_agent
 
@@ -923,6 +1040,18 @@ def register_monitoring_commands(cli):
 
         # Load registry
         registry = AgentRegistry()
+
+        if all_agents or project:
+            if message is not None or agent_id is None:
+                click.echo("❌ With --all/--project, pass only the message: orch send --all \"MESSAGE\"", err=True)
+                raise click.Abort()
+            _broadcast(registry, orch_logger, agent_id, project)
+            return
+
+        if agent_id is None or message is None:
+            click.echo("❌ Usage: orch send AGENT_ID MESSAGE (or orch send --all MESSAGE)", err=True)
+            raise click.Abort()
+
         agent = registry.find(agent_id)
 
         if not agent:
@@ -978,6 +1107,40 @@ def register_monitoring_commands(cli):
             click.echo(f"❌ {e}", err=True)
             raise click.Abort()
 
+    def _broadcast(registry, orch_logger, message, project):
+        """Deliver one message to all active agents (optionally of one project)."""
+        from orch.send import broadcast_message
+
+        agents = registry.list_active_agents()
+        if project:
+            agents = filter_agents(agents, project=project)
+        if not agents:
+            click.echo("No active agents to send to.", err=True)
+            raise click.Abort()
+
+        results = broadcast_message(agents, message)
+        failed = 0
+        for agent, error in results:
+            if error:
+                failed += 1
+                orch_logger.log_error("send", f"Failed to send message to {agent['id']}", {
+                    "agent_id": agent['id'],
+                    "reason": error
+                })
+                click.echo(f"❌ {agent['id']}: {error}", err=True)
+            else:
+                click.echo(f"✅ Message sent to {agent['id']}")
+
+        orch_logger.log_event("send", f"Message broadcast to {len(results) - failed} agent(s)", {
+            "agent_ids": [agent['id'] for agent, _ in results],
+            "failed": failed,
+            "message_length": len(message),
+            "project": project
+        }, level="INFO")
+
+        if failed:
+            raise click.Abort()
+
     @cli.command()
     @click.argument('agent_id')
     @click.option('--message', '-m', help='Custom continuation message (overrides auto-generated message)')
@@ -1123,17 +1286,19 @@ def register_monitoring_commands(cli):
             click.echo(_format_agent_not_found_error(agent_id, registry))
             return
 
-        # Get tmux window content
+        # Get recent output: the agent's pane log on disk, else the tmux window
         # Prefer stable window_id over window target (window indices change when tmux renumbers)
         window = agent.get('window_id', agent['window'])
         try:
-            result = subprocess.run(
-                ['tmux', 'capture-pane', '-t', window, '-p'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            output = result.stdout
+            output = read_agent_output(agent, lines=QUESTION_SCAN_LINES)
+            if output is None:
+                result = subprocess.run(
+                    ['tmux', 'capture-pane', '-t', window, '-p'],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                output = result.stdout
         except subprocess.CalledProcessError:
             orch_logger.log_error("question", f"Failed to capture tmux output: {agent_id}", {
                 "agent_id": agent_id,
@@ -1233,9 +1398,10 @@ def register_monitoring_commands(cli):
 
         # Polling loop
         last_phase = None
+        poller = AgentStatusPoller(check_func=check_agent_status)
         while True:
-            # Check agent status
-            status_obj = check_agent_status(agent)
+            # Check agent status (a hung check reads as Unknown and is waited on again next poll)
+            status_obj = poller.poll(agent)
             current_phase = status_obj.phase
 
             # Log phase changes
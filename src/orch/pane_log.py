@@ -0,0 +1,286 @@
+"""
+Per-agent pane output logs captured with `tmux pipe-pane`.
+
+Spawn attaches `tmux pipe-pane` to each agent window. The pane's output
+stream goes into a small writer process (`python -m orch.pane_log`), which
+appends it, ANSI-stripped, to <workspace>/pane.log. The log is a two-segment
+ring buffer: once pane.log reaches half the size cap it is rotated to
+pane.log.1, so an agent never uses more than the cap on disk.
+
+Readers (`orch tail`, `orch question`, context checks) read the most recent
+lines from disk by seeking from the end, instead of forking
+`tmux capture-pane`. The log also outlives the window, so a closed agent's
+final output stays available.
+"""
+
+import os
+import re
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PANE_LOG_NAME = 'pane.log'
+
+# CSI/OSC/charset escape sequences (bytes)
+_ANSI_RE = re.compile(
+    rb'\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[()][0-9A-Za-z]|[=>78DEHMc])'
+)
+# Sequences that move the cursor to another line or erase (part of) the
+# screen: a full-screen TUI redraws with these instead of newlines
+_LINE_BREAK_CSI = frozenset(b'ABEFHJKdf')
+_LINE_BREAK_ESC = frozenset(b'DEM')
+# Placeholder for a line break made by an escape sequence (collapsed below)
+_BREAK = b'\x00'
+_BREAKS_RE = re.compile(rb'\n*(?:\x00\n*)+')
+# Leftover control bytes other than tab/newline
+_CTRL_RE = re.compile(rb'[\x00-\x08\x0b\x0c\x0e-\x1a\x1c-\x1f\x7f]')
+# An escape sequence cut off at the end of a chunk
+_PARTIAL_ESCAPE_RE = re.compile(rb'\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*|[()])?$')
+
+
+def _replace_escape(match: 're.Match[bytes]') -> bytes:
+    sequence = match.group()
+    final = sequence[-1]
+    if sequence[1:2] == b'[':
+        if final in _LINE_BREAK_CSI:
+            return _BREAK
+        if final == ord('C'):  # cursor forward: TUIs use it for spacing
+            return b' '
+    elif len(sequence) == 2 and final in _LINE_BREAK_ESC:
+        return _BREAK
+    return b''
+
+
+def strip_ansi(data: bytes) -> bytes:
+    """
+    Remove terminal escape sequences and normalize line endings.
+
+    Cursor moves to another line and line/screen erases become a line break
+    (several in a row collapse into one), so a TUI's redraws come out as
+    separate lines rather than run together.
+    """
+    data = _ANSI_RE.sub(_replace_escape, data)
+    data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    data = _BREAKS_RE.sub(b'\n', data)
+    return _CTRL_RE.sub(b'', data)
+
+
+def pane_log_path(agent: Dict[str, Any]) -> Optional[Path]:
+    """Location of an agent's pane log (None if the agent has no workspace)."""
+    workspace = agent.get('workspace')
+    project_dir = agent.get('project_dir')
+    if not workspace or not project_dir:
+        return None
+    return Path(project_dir) / workspace / PANE_LOG_NAME
+
+
+def _rotated(path: Path) -> Path:
+    return path.with_name(path.name + '.1')
+
+
+def attach_pane_log(window_id: str, log_path: Path, max_bytes: int) -> bool:
+    """
+    Start capturing a window's output into a ring-buffer log.
+
+    Args:
+        window_id: Tmux window ID (e.g., '@123')
+        log_path: Log file to write (normally <workspace>/pane.log)
+        max_bytes: Size cap across both log segments
+
+    Returns:
+        True if pipe-pane was attached
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    writer = ' '.join(shlex.quote(arg) for arg in (
+        sys.executable, '-m', 'orch.pane_log', str(log_path), str(max_bytes)
+    ))
+    result = subprocess.run(
+        # -o: only open a pipe if none is attached yet
+        ['tmux', 'pipe-pane', '-o', '-t', window_id, f'exec {writer}'],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    return result.returncode == 0
+
+
+def start_pane_log(window_id: str, workspace_path: Path) -> Optional[Path]:
+    """
+    Attach a pane log for a newly spawned agent window (if enabled in config).
+
+    Never fails the spawn: any problem just leaves the agent without a log,
+    and readers fall back to `tmux capture-pane`.
+
+    Returns:
+        Log path, or None if pane logging is disabled or couldn't be attached
+    """
+    from orch.config import get_pane_log_max_bytes
+
+    max_bytes = get_pane_log_max_bytes()
+    if not max_bytes:
+        return None
+    log_path = Path(workspace_path) / PANE_LOG_NAME
+    try:
+        return log_path if attach_pane_log(window_id, log_path, max_bytes) else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_stream(stream, log_path: Path, max_bytes: int) -> None:
+    """
+    Copy a pane output stream into the ring-buffer log until EOF.
+
+    Runs inside the pipe-pane writer process.
+    """
+    segment_bytes = max(max_bytes // 2, 4096)
+    fd = stream.fileno()
+    carry = b''
+    f = open(log_path, 'ab')
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            data = carry + chunk
+            # Hold back an escape sequence (or \r of a \r\n) split across reads
+            tail = data[-64:]
+            partial = _PARTIAL_ESCAPE_RE.search(tail)
+            cut = len(data) - len(tail) + partial.start() if partial else len(data)
+            if data[:cut].endswith(b'\r'):
+                cut -= 1
+            data, carry = data[:cut], data[cut:]
+
+            f.write(strip_ansi(data))
+            f.flush()
+
+            if f.tell() >= segment_bytes:
+                f.close()
+                os.replace(log_path, _rotated(log_path))
+                f = open(log_path, 'ab')
+        if carry:
+            f.write(strip_ansi(carry))
+    finally:
+        f.close()
+
+
+def read_tail(log_path: Path, lines: int = 20, block_size: int = 8192) -> Optional[str]:
+    """
+    Read the last `lines` lines of a pane log by seeking from the end.
+
+    Falls back to the rotated segment when the current one is short.
+
+    Returns:
+        The lines (joined with newlines), or None if there is no log
+    """
+    segments = [p for p in (_rotated(log_path), log_path) if p.exists()]
+    if not segments:
+        return None
+
+    collected: List[bytes] = []
+    needed = lines + 1  # +1: the last line may be unterminated
+    for segment in reversed(segments):
+        with open(segment, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            data = b''
+            while pos > 0 and data.count(b'\n') < needed:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        collected.insert(0, data)
+        if b''.join(collected).count(b'\n') >= needed:
+            break
+
+    text = b''.join(collected).decode('utf-8', errors='replace')
+    return '\n'.join(text.rstrip('\n').split('\n')[-lines:])
+
+
+def read_agent_output(agent: Dict[str, Any], lines: int = 20) -> Optional[str]:
+    """
+    Recent output of an agent from its pane log.
+
+    Returns:
+        The last `lines` lines, or None if the agent has no (non-empty) log
+    """
+    log_path = pane_log_path(agent)
+    if log_path is None:
+        return None
+    output = read_tail(log_path, lines)
+    return output or None
+
+
+class PaneLogFollower:
+    """
+    Incremental reader for a pane log (follows rotation).
+
+    Tracks the inode and offset of the last read, so each read_new() returns
+    only output appended since the previous call. When the writer has rotated
+    pane.log to pane.log.1 in between, the rest of the rotated segment is
+    read first.
+    """
+
+    def __init__(self, log_path: Path, from_end: bool = True):
+        self.log_path = Path(log_path)
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._partial = b''
+        if from_end:
+            try:
+                st = os.stat(self.log_path)
+                self._inode, self._offset = st.st_ino, st.st_size
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _read_from(path: Path, offset: int) -> bytes:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read()
+
+    def read_new(self) -> str:
+        """Complete lines appended since the last call ('' if none)."""
+        try:
+            st = os.stat(self.log_path)
+        except FileNotFoundError:
+            return ''
+
+        data = b''
+        if self._inode is not None and st.st_ino != self._inode:
+            # Rotated: finish the old segment, then start the new one from 0
+            rotated = _rotated(self.log_path)
+            try:
+                if os.stat(rotated).st_ino == self._inode:
+                    data += self._read_from(rotated, self._offset)
+            except FileNotFoundError:
+                pass
+            self._offset = 0
+        elif st.st_size < self._offset:
+            # Truncated/replaced in place
+            self._offset = 0
+
+        self._inode = st.st_ino
+        new = self._read_from(self.log_path, self._offset)
+        self._offset += len(new)
+        data = self._partial + data + new
+
+        # Only hand out whole lines; keep the unterminated tail for next time
+        end = data.rfind(b'\n') + 1
+        self._partial = data[end:]
+        return data[:end].decode('utf-8', errors='replace')
+
+
+def main(argv: List[str] = None) -> int:
+    """pipe-pane writer entry point: python -m orch.pane_log <log_path> <max_bytes>"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Usage: python -m orch.pane_log <log_path> <max_bytes>", file=sys.stderr)
+        return 2
+    write_stream(sys.stdin, Path(argv[0]), int(argv[1]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
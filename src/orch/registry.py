@@ -5,13 +5,99 @@ Simplified version: tracks agent_id ↔ window_id mapping for tmux operations.
 Beads is the source of truth for agent state and lifecycle.
 """
 
-import json
-import fcntl
-import time
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, Iterator, Generator
+from datetime import datetime, timedelta
 from orch.logging import OrchLogger
+from orch.registry_archive import RegistryArchive, TERMINAL_STATUSES, terminal_timestamp
+from orch.registry_storage import (
+    RegistryStorage,
+    create_storage,
+    default_registry_path,
+    merge_agents,
+)
+
+
+_MISSING = object()
+
+# Keys AgentRegistry maintains hash indexes for
+_INDEXED_KEYS = ('id', 'beads_id', 'window_id', 'status')
+
+
+class AgentRecord(MutableMapping):
+    """
+    Compact agent record with dict-compatible access.
+
+    Fields every registered agent carries live in __slots__; optional and
+    legacy fields go to a small overflow dict. Supports agent['key'],
+    agent.get(), `in`, iteration and dict(agent), so existing callers keep
+    treating agents as dicts. Writes to indexed keys (id, beads_id,
+    window_id, status) notify the owning registry so its indexes stay
+    consistent however the agent is mutated (and any write marks an open
+    transaction as needing a save).
+    """
+
+    _FIELDS = (
+        'id', 'task', 'window', 'window_id', 'project_dir', 'workspace',
+        'spawned_at', 'updated_at', 'status', 'is_interactive', 'beads_id',
+    )
+    __slots__ = _FIELDS + ('_extra', '_owner', '_seq')
+
+    def __init__(self, data: Dict[str, Any] = None):
+        for field in self._FIELDS:
+            object.__setattr__(self, field, _MISSING)
+        self._extra: Dict[str, Any] = {}
+        self._owner = None
+        self._seq = 0
+        for key, value in (data or {}).items():
+            self._set(key, value)
+
+    def _set(self, key: str, value: Any) -> None:
+        if key in self._FIELDS:
+            object.__setattr__(self, key, value)
+        else:
+            self._extra[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        old = self.get(key, _MISSING)
+        self._set(key, value)
+        if self._owner is not None:
+            self._owner._record_changed(self, key, old, value)
+
+    def __delitem__(self, key: str) -> None:
+        old = self[key]
+        if key in self._FIELDS:
+            object.__setattr__(self, key, _MISSING)
+        else:
+            del self._extra[key]
+        if self._owner is not None:
+            self._owner._record_changed(self, key, old, _MISSING)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in self._FIELDS:
+            if getattr(self, field) is not _MISSING:
+                yield field
+        yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"AgentRecord({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy (for JSON serialization)."""
+        return dict(self)
 
 
 class AgentRegistry:
@@ -23,124 +109,175 @@ class AgentRegistry:
     - Basic agent metadata (project_dir, beads_id)
     - Status tracking (active, completed, abandoned, deleted)
 
-    Uses fcntl file locking to prevent race conditions.
-    Note: File locking requires Unix-like systems.
+    Persistence is delegated to a RegistryStorage backend (see
+    orch.registry_storage): the JSON file by default, or SQLite/WAL when the
+    registry path ends in .db or `registry_backend: sqlite` is configured.
+
+    Terminal agents older than `registry_archive_days` are moved to a
+    RegistryArchive (registry-archive/ next to the registry file) by
+    archive_terminal_agents(), and only read back via list_archived_agents().
     """
 
-    def __init__(self, registry_path: Path = None):
-        if registry_path is None:
-            registry_path = Path.home() / '.orch' / 'agent-registry.json'
-        self.registry_path = Path(registry_path)
-        self._agents = []
-        self._logger = OrchLogger()
+    def __init__(self, registry_path: Path = None, storage: RegistryStorage = None):
         self._lock_timeout = 10  # seconds
+        if storage is None:
+            if registry_path is None:
+                registry_path = default_registry_path()
+            storage = create_storage(Path(registry_path), self._lock_timeout)
+        self._storage = storage
+        self.registry_path = storage.path
+        self._agents: List[AgentRecord] = []
+        self._indexes: Dict[str, Dict[Any, Dict[int, AgentRecord]]] = {}
+        self._indexed_count = 0
+        self._next_seq = 0
+        self._archive = None
+        self._txn_depth = 0
+        self._txn_pending = False
+        self._txn_skip_merge = False
+        self._logger = OrchLogger()
         self._load()
 
     def _load(self):
-        """Load registry from disk with shared lock (allows concurrent reads)."""
-        if self.registry_path.exists():
-            with open(self.registry_path, 'r') as f:
-                try:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                    data = json.load(f)
-                    self._agents = data.get('agents', [])
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        """Load registry from storage."""
+        self._agents = self._storage.load()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """Wrap agents as AgentRecords and rebuild id/beads_id/window_id/status indexes."""
+        self._indexes = {key: {} for key in _INDEXED_KEYS}
+        self._next_seq = 0
+        records = []
+        for agent in self._agents:
+            if not isinstance(agent, AgentRecord):
+                agent = AgentRecord(agent)
+            records.append(agent)
+            self._track(agent)
+        self._agents = records
+        self._indexed_count = len(records)
+
+    def _ensure_indexes(self):
+        # Agents appended to _agents directly (bypassing register) are picked
+        # up here so lookups never miss them
+        if self._indexed_count != len(self._agents):
+            self._rebuild_indexes()
+
+    def _track(self, record: AgentRecord):
+        record._owner = self
+        record._seq = self._next_seq
+        self._next_seq += 1
+        for key in _INDEXED_KEYS:
+            value = record.get(key, _MISSING)
+            if value is not _MISSING:
+                self._indexes[key].setdefault(value, {})[record._seq] = record
+
+    def _record_changed(self, record: AgentRecord, key: str, old: Any, new: Any):
+        """Called by AgentRecord on every write."""
+        if self._txn_depth:
+            self._txn_pending = True
+        if key in _INDEXED_KEYS and old != new:
+            self._reindex(record, key, old, new)
+
+    def _reindex(self, record: AgentRecord, key: str, old: Any, new: Any):
+        """Move record between index buckets after an indexed key changed."""
+        index = self._indexes[key]
+        if old is not _MISSING:
+            bucket = index.get(old)
+            if bucket is not None:
+                bucket.pop(record._seq, None)
+                if not bucket:
+                    del index[old]
+        if new is not _MISSING:
+            index.setdefault(new, {})[record._seq] = record
+
+    def _lookup(self, key: str, value: Any) -> List[AgentRecord]:
+        """Agents whose indexed key equals value, in registry order."""
+        self._ensure_indexes()
+        bucket = self._indexes[key].get(value)
+        if not bucket:
+            return []
+        return [bucket[seq] for seq in sorted(bucket)]
 
     def save(self, skip_merge: bool = False):
-        """Persist registry to disk with exclusive lock and merge logic.
+        """Persist registry via the storage backend (merging concurrent changes).
+
+        Inside transaction() the write is deferred to the end of the block.
 
         Args:
             skip_merge: If True, skip merge logic and overwrite with in-memory state.
                        Used by clean command to prevent re-adding deleted agents.
         """
-        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._txn_depth:
+            self._txn_pending = True
+            self._txn_skip_merge = self._txn_skip_merge or skip_merge
+            return
+        self._storage.save(self._agents, skip_merge=skip_merge)
+
+    @contextmanager
+    def transaction(self, skip_merge: bool = False) -> Generator['AgentRegistry', None, None]:
+        """
+        Batch mutations into a single save.
 
-        start_time = time.time()
-        while True:
+        save() calls made inside the block (directly or by register(),
+        reconcile(), etc.) are deferred, and the registry is written once on
+        exit if anything changed - one lock acquisition and one write no
+        matter how many agents changed. Mutations that don't save on their
+        own (remove(), abandon_agent(), direct agent['key'] writes) are
+        included too. Nested transactions join the outermost one.
+
+        Mutations made before an exception are still written, so windows that
+        were already closed stay recorded.
+
+        Usage:
+            with registry.transaction():
+                for agent_id in agent_ids:
+                    registry.abandon_agent(agent_id)
+
+        Args:
+            skip_merge: Write with skip_merge=True (see save())
+        """
+        if self._txn_depth:
+            self._txn_skip_merge = self._txn_skip_merge or skip_merge
+            self._txn_depth += 1
             try:
-                mode = 'r+' if self.registry_path.exists() else 'w+'
-                with open(self.registry_path, mode) as f:
-                    try:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    except BlockingIOError:
-                        if time.time() - start_time > self._lock_timeout:
-                            raise TimeoutError(
-                                f"Could not acquire registry lock after {self._lock_timeout}s"
-                            )
-                        time.sleep(0.01)
-                        continue
-
-                    try:
-                        if skip_merge:
-                            # Skip merge - used when deleting agents to prevent re-adding
-                            agents_to_write = self._agents
-                        else:
-                            # Re-read and merge to prevent concurrent overwrites
-                            f.seek(0)
-                            content = f.read()
-                            if content.strip():
-                                current_data = json.loads(content)
-                                current_agents = current_data.get('agents', [])
-                            else:
-                                current_agents = []
-
-                            agents_to_write = self._merge_agents(current_agents, self._agents)
-
-                        f.seek(0)
-                        f.truncate()
-                        json.dump({'agents': agents_to_write}, f, indent=2)
-                    finally:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                    break
-
-            except FileNotFoundError:
-                continue
+                yield self
+            finally:
+                self._txn_depth -= 1
+            return
+
+        self._txn_depth = 1
+        self._txn_pending = False
+        self._txn_skip_merge = skip_merge
+        try:
+            yield self
+        finally:
+            self._txn_depth = 0
+            if self._txn_pending:
+                self._storage.save(self._agents, skip_merge=self._txn_skip_merge)
+            self._txn_pending = False
+            self._txn_skip_merge = False
 
     def _merge_agents(self, current: List[Dict[str, Any]], ours: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge concurrent registry changes (newer updated_at wins)."""
+        return merge_agents(current, ours)
+
+    def list_agents(self, include_archived: bool = False) -> List[Dict[str, Any]]:
+        """Return all non-deleted agents.
+
+        Args:
+            include_archived: Also read agents from the archive tier (slow
+                              with long histories; use only for history views)
         """
-        Merge concurrent registry changes using ID-based deduplication.
-        Newer entries (by updated_at) win in conflicts.
-        Falls back to spawned_at for backwards compatibility with older entries.
-        """
-        merged = {}
-
-        # Index our agents
-        ours_by_id = {a['id']: a for a in ours}
-
-        # Process current agents from disk
-        for current_agent in current:
-            agent_id = current_agent['id']
-            our_agent = ours_by_id.get(agent_id)
-
-            if our_agent:
-                # Compare timestamps, newer wins
-                # Use updated_at if available, fallback to spawned_at for backwards compatibility
-                current_ts = current_agent.get('updated_at') or current_agent.get('spawned_at', '')
-                our_ts = our_agent.get('updated_at') or our_agent.get('spawned_at', '')
-                if current_ts > our_ts:
-                    merged[agent_id] = current_agent
-                else:
-                    # When timestamps are equal or ours is newer, prefer our version
-                    # This ensures in-memory changes are preserved
-                    merged[agent_id] = our_agent
-            else:
-                merged[agent_id] = current_agent
-
-        # Add agents only we have
-        for our_agent in ours:
-            if our_agent['id'] not in merged:
-                merged[our_agent['id']] = our_agent
-
-        return list(merged.values())
-
-    def list_agents(self) -> List[Dict[str, Any]]:
-        """Return all non-deleted agents."""
-        return [a for a in self._agents if a.get('status') != 'deleted']
+        agents = [a for a in self._agents if a.get('status') != 'deleted']
+        if include_archived:
+            agents += [
+                AgentRecord(a) for a in self.list_archived_agents()
+                if a.get('status') != 'deleted'
+            ]
+        return agents
 
     def list_active_agents(self) -> List[Dict[str, Any]]:
         """Return only active agents."""
-        return [a for a in self._agents if a['status'] == 'active']
+        return self._lookup('status', 'active')
 
     def find(self, agent_id: str) -> Dict[str, Any] | None:
         """
@@ -153,33 +290,94 @@ class AgentRegistry:
             Agent dict if found, None otherwise
         """
         # First, try exact match on agent ID (workspace name)
-        for agent in self._agents:
-            if agent['id'] == agent_id:
-                return agent
+        agent = self._find_by_id(agent_id)
+        if agent:
+            return agent
 
         # Second, try match on beads_id
-        for agent in self._agents:
-            if agent.get('beads_id') == agent_id:
-                return agent
-
-        return None
+        matches = self._lookup('beads_id', agent_id)
+        return matches[0] if matches else None
 
     def _find_by_id(self, agent_id: str) -> Dict[str, Any] | None:
         """Find agent by exact agent ID only (not beads_id)."""
-        for agent in self._agents:
-            if agent['id'] == agent_id:
-                return agent
-        return None
+        matches = self._lookup('id', agent_id)
+        return matches[0] if matches else None
 
     def _find_by_window_id(self, window_id: str) -> Dict[str, Any] | None:
         """Find active agent by window_id."""
         if not window_id:
             return None
-        for agent in self._agents:
-            if agent['status'] == 'active' and agent.get('window_id') == window_id:
+        for agent in self._lookup('window_id', window_id):
+            if agent['status'] == 'active':
                 return agent
         return None
 
+    @property
+    def archive(self) -> RegistryArchive:
+        """Archive tier for this registry (created lazily, never loaded eagerly)."""
+        if self._archive is None:
+            self._archive = RegistryArchive(self.registry_path.parent / 'registry-archive')
+        return self._archive
+
+    def archive_terminal_agents(self, max_age_days: int = None) -> int:
+        """
+        Move terminal agents older than max_age_days out of the hot registry.
+
+        Agents are appended to the archive first and then purged from storage,
+        so an interruption can at worst leave a copy in both places.
+
+        Args:
+            max_age_days: Minimum age since reaching a terminal status
+                          (defaults to `registry_archive_days` config)
+
+        Returns:
+            Number of agents archived
+        """
+        if max_age_days is None:
+            from orch.config import get_registry_archive_days
+            max_age_days = get_registry_archive_days()
+
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        to_archive = [
+            a for a in self._agents
+            if a.get('status') in TERMINAL_STATUSES and terminal_timestamp(a) < cutoff
+        ]
+        if not to_archive:
+            return 0
+
+        self.archive.append(to_archive)
+        archived_ids = {a['id'] for a in to_archive}
+        self._storage.purge(archived_ids)
+        self._agents = [a for a in self._agents if a['id'] not in archived_ids]
+        self._rebuild_indexes()
+
+        self._logger.log_event("registry", f"Archived {len(to_archive)} terminal agent(s)", {
+            "archived_count": len(to_archive),
+            "max_age_days": max_age_days
+        }, level="INFO")
+
+        return len(to_archive)
+
+    def list_archived_agents(self, statuses: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return archived agents not present in the hot registry.
+
+        Reads the archive segments on demand; only call this when history is
+        explicitly requested.
+
+        Args:
+            statuses: Only include agents with these statuses (default: all)
+        """
+        self._ensure_indexes()
+        archived: Dict[str, Dict[str, Any]] = {}
+        for agent in self.archive.iter_agents(statuses):
+            if agent['id'] in self._indexes['id']:
+                continue
+            current = archived.get(agent['id'])
+            if current is None or terminal_timestamp(agent) >= terminal_timestamp(current):
+                archived[agent['id']] = agent
+        return list(archived.values())
+
     def register(
         self,
         agent_id: str,
@@ -216,7 +414,7 @@ class AgentRegistry:
         if existing:
             raise ValueError(f"Agent '{agent_id}' already registered.")
 
-        # Check for window_id reuse
+        # Check for window_id reuse (saved together with the new agent below)
         if window_id:
             existing_window = self._find_by_window_id(window_id)
             if existing_window:
@@ -224,7 +422,6 @@ class AgentRegistry:
                 existing_window['status'] = 'abandoned'
                 existing_window['abandoned_at'] = now
                 existing_window['updated_at'] = now
-                self.save()
 
         now = datetime.now().isoformat()
         agent = {
@@ -262,7 +459,11 @@ class AgentRegistry:
         if origin_dir:
             agent['origin_dir'] = str(Path(origin_dir).expanduser())
 
+        agent = AgentRecord(agent)
+        self._ensure_indexes()
         self._agents.append(agent)
+        self._track(agent)
+        self._indexed_count += 1
         self.save()
 
         self._logger.log_event("registry", f"Agent registered: {agent_id}", {
@@ -276,14 +477,15 @@ class AgentRegistry:
 
     def remove(self, agent_id: str) -> bool:
         """Mark agent as deleted (tombstone pattern)."""
-        for agent in self._agents:
-            if agent.get('id') == agent_id:
-                now = datetime.now().isoformat()
-                agent['status'] = 'deleted'
-                agent['deleted_at'] = now
-                agent['updated_at'] = now
-                return True
-        return False
+        agent = self._find_by_id(agent_id)
+        if not agent:
+            return False
+
+        now = datetime.now().isoformat()
+        agent['status'] = 'deleted'
+        agent['deleted_at'] = now
+        agent['updated_at'] = now
+        return True
 
     def abandon_agent(self, agent_id: str, reason: str = None) -> bool:
         """Mark agent as abandoned."""
@@ -313,27 +515,50 @@ class AgentRegistry:
         Beads tracks the actual completion state.
         """
         active_window_set = set(active_windows)
+        closed = [
+            agent for agent in self.list_active_agents()
+            if agent.get('window_id') not in active_window_set
+        ]
+        self._complete_closed_windows(closed)
+
+    def reconcile_closed_windows(self, closed_window_ids: List[str]) -> int:
+        """
+        Complete the active agents whose windows are known to have closed.
 
+        Event-driven counterpart of reconcile(): a tmux control-mode client
+        reports %window-close notifications, so only those windows are looked
+        up (via the window_id index) instead of scanning every agent.
+
+        Returns:
+            Number of agents marked completed
+        """
+        closed = [
+            agent
+            for window_id in dict.fromkeys(closed_window_ids)
+            for agent in self._lookup('window_id', window_id)
+            if agent.get('status') == 'active'
+        ]
+        return self._complete_closed_windows(closed)
+
+    def _complete_closed_windows(self, agents: List[Dict[str, Any]]) -> int:
         completed_count = 0
-        for agent in self._agents:
-            if agent['status'] == 'active':
-                # Skip non-tmux backends
-                if agent.get('backend') == 'opencode':
-                    continue
+        for agent in agents:
+            # Skip non-tmux backends
+            if agent.get('backend') == 'opencode':
+                continue
 
-                if agent.get('window_id') not in active_window_set:
-                    now = datetime.now().isoformat()
-                    agent['status'] = 'completed'
-                    agent['completed_at'] = now
-                    agent['updated_at'] = now
+            now = datetime.now().isoformat()
+            agent['status'] = 'completed'
+            agent['completed_at'] = now
+            agent['updated_at'] = now
 
-                    self._logger.log_event("registry",
-                        f"Agent completed (window closed): {agent['id']}", {
-                        "agent_id": agent['id'],
-                        "window_id": agent.get('window_id')
-                    }, level="INFO")
+            self._logger.log_event("registry",
+                f"Agent completed (window closed): {agent['id']}", {
+                "agent_id": agent['id'],
+                "window_id": agent.get('window_id')
+            }, level="INFO")
 
-                    completed_count += 1
+            completed_count += 1
 
         if completed_count > 0:
             self._logger.log_event("registry",
@@ -341,3 +566,4 @@ class AgentRegistry:
                 "completed_count": completed_count
             }, level="INFO")
             self.save()
+        return completed_count
@@ -0,0 +1,101 @@
+"""
+Registry archive tier for terminal agents.
+
+Agents that reached a terminal status (deleted, completed, abandoned, failed)
+are moved out of the hot registry into monthly gzip-compressed JSONL
+segments under ~/.orch/registry-archive/ (e.g. 2025-12.jsonl.gz, keyed by
+the month the agent reached its terminal status). The hot registry then
+holds only live and recently finished agents, so its load time stays flat
+as history grows.
+
+The archive is only read when a command explicitly asks for history
+(`orch history`, `orch status --include-completed`).
+"""
+
+import fcntl
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+TERMINAL_STATUSES = ('deleted', 'completed', 'abandoned', 'failed')
+
+
+def terminal_timestamp(agent: Dict[str, Any]) -> str:
+    """ISO timestamp of when the agent reached its terminal status."""
+    status_field = {
+        'deleted': 'deleted_at',
+        'completed': 'completed_at',
+        'abandoned': 'abandoned_at',
+    }.get(agent.get('status'))
+    return (
+        (agent.get(status_field) if status_field else None)
+        or agent.get('updated_at')
+        or agent.get('spawned_at', '')
+    )
+
+
+class RegistryArchive:
+    """Append-only monthly segments of archived agents."""
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+
+    def _segment_path(self, month: str) -> Path:
+        return self.archive_dir / f"{month}.jsonl.gz"
+
+    def append(self, agents: Iterable[Dict[str, Any]]) -> int:
+        """Append agents to the segment for the month they finished in.
+
+        Returns:
+            Number of agents written
+        """
+        by_month: Dict[str, List[Dict[str, Any]]] = {}
+        for agent in agents:
+            month = terminal_timestamp(agent)[:7] or 'unknown'
+            by_month.setdefault(month, []).append(dict(agent))
+        if not by_month:
+            return 0
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.archive_dir / '.lock', 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                for month, month_agents in by_month.items():
+                    # Each append adds a gzip member; gzip readers concatenate them
+                    with gzip.open(self._segment_path(month), 'at') as f:
+                        f.write(''.join(json.dumps(a) + '\n' for a in month_agents))
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+        return sum(len(a) for a in by_month.values())
+
+    def segments(self) -> List[Path]:
+        """Segment files, oldest month first."""
+        if not self.archive_dir.exists():
+            return []
+        return sorted(self.archive_dir.glob('*.jsonl.gz'))
+
+    def iter_agents(self, statuses: Iterable[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield archived agents lazily, one segment at a time.
+
+        An agent archived more than once (e.g. re-added by a stale registry
+        writer) is yielded once per copy; callers dedupe by id if needed.
+        """
+        wanted = set(statuses) if statuses else None
+        for segment in self.segments():
+            try:
+                with gzip.open(segment, 'rt') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            agent = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if wanted is None or agent.get('status') in wanted:
+                            yield agent
+            except (OSError, EOFError):
+                # Truncated segment from an interrupted append; skip the rest
+                continue
@@ -0,0 +1,792 @@
+"""
+Storage backends for the agent registry.
+
+AgentRegistry keeps agents in memory as dict-compatible AgentRecords and
+delegates persistence to a storage backend, which exchanges plain dicts:
+
+- JsonRegistryStorage: the original single-file ~/.orch/agent-registry.json
+  (default, read-merge-rewrite under an exclusive fcntl lock)
+- SqliteRegistryStorage: ~/.orch/agent-registry.db in WAL mode with one row
+  per agent, indexed on id, beads_id, window_id, status and project_dir.
+  Saves are row-level upserts of changed agents instead of full rewrites.
+- JournalRegistryStorage: ~/.orch/agent-registry.jsonl, an append-only
+  mutation journal on top of the agent-registry.json snapshot, compacted
+  back into the snapshot once the journal grows past a threshold.
+- ShardedRegistryStorage: ~/.orch/agent-registry.d/, one JSON shard per
+  project (each with its own lock) plus a thin index of shards, so
+  operations on different projects never contend.
+
+The backend is chosen from the registry path suffix (.db/.sqlite → SQLite,
+.jsonl → journal, .d → sharded), and the default path from the
+`registry_backend` config key.
+
+The file-based backends share a process-level read cache keyed on the
+files' (st_ino, st_mtime_ns, st_size), so constructing AgentRegistry()
+repeatedly in one process (status, work daemon loops, complete) only
+re-parses the registry when it actually changed on disk - in this process
+or any other.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+# Parsed registries by path: (stat signature, agents)
+_READ_CACHE: Dict[str, Tuple[tuple, List[Dict[str, Any]]]] = {}
+
+# Files modified this recently are not cached: a second write within the
+# filesystem's timestamp granularity could keep the same mtime and size
+_RACY_WINDOW_NS = 50_000_000
+
+
+def _stat_signature(st: os.stat_result) -> tuple:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _is_racy(st: os.stat_result) -> bool:
+    return time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+
+
+def _copy_agents(agents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy agents (and their nested dicts/lists) so callers can't mutate the cache."""
+    return [
+        {k: (v.copy() if isinstance(v, (dict, list)) else v) for k, v in agent.items()}
+        for agent in agents
+    ]
+
+
+def clear_read_cache() -> None:
+    """Drop all cached registry parses."""
+    _READ_CACHE.clear()
+
+
+def merge_agents(current: List[Dict[str, Any]], ours: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge concurrent registry changes using ID-based deduplication.
+    Newer entries (by updated_at) win in conflicts.
+    Falls back to spawned_at for backwards compatibility with older entries.
+    """
+    merged = {}
+
+    # Index our agents
+    ours_by_id = {a['id']: a for a in ours}
+
+    # Process current agents from disk
+    for current_agent in current:
+        agent_id = current_agent['id']
+        our_agent = ours_by_id.get(agent_id)
+
+        if our_agent:
+            # Compare timestamps, newer wins
+            # Use updated_at if available, fallback to spawned_at for backwards compatibility
+            current_ts = current_agent.get('updated_at') or current_agent.get('spawned_at', '')
+            our_ts = our_agent.get('updated_at') or our_agent.get('spawned_at', '')
+            if current_ts > our_ts:
+                merged[agent_id] = current_agent
+            else:
+                # When timestamps are equal or ours is newer, prefer our version
+                # This ensures in-memory changes are preserved
+                merged[agent_id] = our_agent
+        else:
+            merged[agent_id] = current_agent
+
+    # Add agents only we have
+    for our_agent in ours:
+        if our_agent['id'] not in merged:
+            merged[our_agent['id']] = our_agent
+
+    return list(merged.values())
+
+
+class RegistryStorage:
+    """Base class for registry persistence backends."""
+
+    def __init__(self, path: Path, lock_timeout: float = 10):
+        self.path = Path(path)
+        self.lock_timeout = lock_timeout
+        # updated_at of each agent as last seen on disk (for incremental saves)
+        self._persisted: Dict[str, str] = {}
+
+    @staticmethod
+    def _version(agent: Dict[str, Any]) -> str:
+        return agent.get('updated_at') or agent.get('spawned_at', '')
+
+    def _remember(self, agents: List[Dict[str, Any]]) -> None:
+        """Record the on-disk version of agents after a load or save."""
+        for agent in agents:
+            self._persisted[agent['id']] = self._version(agent)
+
+    def _changed(self, agents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Agents whose updated_at differs from what was last loaded/saved."""
+        return [a for a in agents if self._persisted.get(a['id']) != self._version(a)]
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Return all agents currently persisted."""
+        raise NotImplementedError
+
+    def save(self, agents: List[Dict[str, Any]], skip_merge: bool = False) -> None:
+        """Persist agents, merging with concurrent changes unless skip_merge."""
+        raise NotImplementedError
+
+    def purge(self, agent_ids: Iterable[str]) -> None:
+        """Drop agents from storage entirely (used when archiving)."""
+        raise NotImplementedError
+
+
+class JsonRegistryStorage(RegistryStorage):
+    """
+    Single JSON file storage (the original registry format).
+
+    Uses fcntl file locking to prevent race conditions.
+    Note: File locking requires Unix-like systems.
+    """
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load registry from disk with shared lock (allows concurrent reads).
+
+        Returns the cached parse when the file's stat signature is unchanged.
+        """
+        key = str(self.path)
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            _READ_CACHE.pop(key, None)
+            return []
+        cached = _READ_CACHE.get(key)
+        if cached and cached[0] == _stat_signature(st):
+            return _copy_agents(cached[1])
+
+        with open(self.path, 'r') as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                # Stat under the lock so the signature matches the content read
+                st = os.fstat(f.fileno())
+                content = f.read()
+                # A registry created by a concurrent first save may still be empty
+                if not content.strip():
+                    return []
+                agents = json.loads(content).get('agents', [])
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        if not _is_racy(st):
+            _READ_CACHE[key] = (_stat_signature(st), agents)
+            return _copy_agents(agents)
+        return agents
+
+    def save(self, agents: List[Dict[str, Any]], skip_merge: bool = False) -> None:
+        """Persist registry to disk with exclusive lock and merge logic.
+
+        Args:
+            agents: In-memory agents to persist
+            skip_merge: If True, skip merge logic and overwrite with in-memory state.
+                       Used by clean command to prevent re-adding deleted agents.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        agents = [dict(a) for a in agents]
+        _READ_CACHE.pop(str(self.path), None)
+
+        start_time = time.time()
+        while True:
+            try:
+                # a+ creates the file without truncating a concurrent writer's content
+                with open(self.path, 'a+') as f:
+                    try:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        if time.time() - start_time > self.lock_timeout:
+                            raise TimeoutError(
+                                f"Could not acquire registry lock after {self.lock_timeout}s"
+                            )
+                        time.sleep(0.01)
+                        continue
+
+                    try:
+                        if skip_merge:
+                            # Skip merge - used when deleting agents to prevent re-adding
+                            agents_to_write = agents
+                        else:
+                            # Re-read and merge to prevent concurrent overwrites
+                            f.seek(0)
+                            content = f.read()
+                            if content.strip():
+                                current_data = json.loads(content)
+                                current_agents = current_data.get('agents', [])
+                            else:
+                                current_agents = []
+
+                            agents_to_write = merge_agents(current_agents, agents)
+
+                        f.seek(0)
+                        f.truncate()
+                        json.dump({'agents': agents_to_write}, f, indent=2)
+                        # Flush while still holding the lock (close happens after unlock)
+                        f.flush()
+                    finally:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                    break
+
+            except FileNotFoundError:
+                continue
+
+    def purge(self, agent_ids: Iterable[str]) -> None:
+        """Rewrite the registry without the given agents."""
+        ids = set(agent_ids)
+        if not ids or not self.path.exists():
+            return
+        _READ_CACHE.pop(str(self.path), None)
+        with open(self.path, 'r+') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                content = f.read()
+                agents = json.loads(content).get('agents', []) if content.strip() else []
+                f.seek(0)
+                f.truncate()
+                json.dump({'agents': [a for a in agents if a['id'] not in ids]}, f, indent=2)
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        for agent_id in ids:
+            self._persisted.pop(agent_id, None)
+
+
+class SqliteRegistryStorage(RegistryStorage):
+    """
+    SQLite storage in WAL mode (one row per agent).
+
+    Indexed columns are extracted for lookups; the full agent dict is kept
+    as JSON in `data` so optional fields need no schema changes. Readers never
+    block the writer under WAL, and saves only touch agents whose updated_at
+    changed since load.
+
+    On first open, agents are imported once from the sibling JSON registry
+    (agent-registry.json next to agent-registry.db) if it exists.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS agents (
+            id TEXT PRIMARY KEY,
+            beads_id TEXT,
+            window_id TEXT,
+            status TEXT,
+            project_dir TEXT,
+            updated_at TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_agents_beads_id ON agents(beads_id);
+        CREATE INDEX IF NOT EXISTS idx_agents_window_id ON agents(window_id);
+        CREATE INDEX IF NOT EXISTS idx_agents_status ON agents(status);
+        CREATE INDEX IF NOT EXISTS idx_agents_project_dir ON agents(project_dir);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, path: Path, lock_timeout: float = 10, json_path: Path = None):
+        super().__init__(path, lock_timeout)
+        self.json_path = Path(json_path) if json_path else self.path.with_suffix('.json')
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=self.lock_timeout)
+        if not self._initialized:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self._SCHEMA)
+            self._migrate_from_json(conn)
+            self._initialized = True
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _migrate_from_json(self, conn: sqlite3.Connection) -> None:
+        """Import agents from the JSON registry once (idempotent via meta row)."""
+        row = conn.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+        if row is not None:
+            return
+
+        agents = []
+        if self.json_path.exists():
+            agents = JsonRegistryStorage(self.json_path, self.lock_timeout).load()
+
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            # Re-check under the write lock: another process may have migrated
+            row = conn.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+            if row is not None:
+                return
+            conn.executemany(
+                'INSERT OR IGNORE INTO agents VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [self._row(a) for a in agents]
+            )
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                (str(self.json_path) if agents else '',)
+            )
+
+    @staticmethod
+    def _row(agent: Dict[str, Any]) -> tuple:
+        return (
+            agent['id'],
+            agent.get('beads_id'),
+            agent.get('window_id'),
+            agent.get('status'),
+            agent.get('project_dir'),
+            SqliteRegistryStorage._version(agent),
+            json.dumps(dict(agent)),
+        )
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load all agents (WAL readers don't block concurrent writers)."""
+        conn = self._connect()
+        try:
+            rows = conn.execute('SELECT updated_at, data FROM agents ORDER BY rowid').fetchall()
+        finally:
+            conn.close()
+        agents = [json.loads(data) for _, data in rows]
+        self._remember(agents)
+        return agents
+
+    def save(self, agents: List[Dict[str, Any]], skip_merge: bool = False) -> None:
+        """Upsert changed agents.
+
+        Without skip_merge, a row is only overwritten when ours has an
+        updated_at >= the row on disk (newer wins, same as the JSON merge).
+        With skip_merge, our version is written unconditionally. Rows for
+        agents not held in memory are left untouched either way.
+        """
+        changed = self._changed(agents)
+        if not changed:
+            return
+
+        if skip_merge:
+            sql = 'INSERT OR REPLACE INTO agents VALUES (?, ?, ?, ?, ?, ?, ?)'
+        else:
+            sql = (
+                'INSERT INTO agents VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET '
+                'beads_id = excluded.beads_id, window_id = excluded.window_id, '
+                'status = excluded.status, project_dir = excluded.project_dir, '
+                'updated_at = excluded.updated_at, data = excluded.data '
+                'WHERE excluded.updated_at >= agents.updated_at'
+            )
+
+        rows = [self._row(a) for a in changed]
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(sql, rows)
+        except sqlite3.OperationalError as e:
+            if 'locked' in str(e):
+                raise TimeoutError(
+                    f"Could not acquire registry lock after {self.lock_timeout}s"
+                ) from e
+            raise
+        finally:
+            conn.close()
+
+        self._remember(changed)
+
+    def purge(self, agent_ids: Iterable[str]) -> None:
+        """Delete agent rows."""
+        ids = list(agent_ids)
+        if not ids:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany('DELETE FROM agents WHERE id = ?', [(i,) for i in ids])
+        finally:
+            conn.close()
+        for agent_id in ids:
+            self._persisted.pop(agent_id, None)
+
+
+class JournalRegistryStorage(RegistryStorage):
+    """
+    Append-only mutation journal over a JSON snapshot.
+
+    save() appends one JSON line per changed agent (the full agent after the
+    mutation, keyed by its updated_at) instead of re-reading and rewriting the
+    whole registry. load() replays the journal over the snapshot with the same
+    newer-wins rule as merge_agents(). Once the journal exceeds
+    compact_bytes, the next save folds it into a fresh snapshot (written to a
+    temp file and renamed into place) and truncates the journal.
+
+    The snapshot is the sibling agent-registry.json, so an existing JSON
+    registry is picked up as the initial snapshot. The journal file doubles as
+    the lock: appends and compaction take it exclusively, loads shared.
+    """
+
+    def __init__(self, path: Path, lock_timeout: float = 10, compact_bytes: int = 512 * 1024):
+        super().__init__(path, lock_timeout)
+        self.snapshot_path = self.path.with_suffix('.json')
+        self.compact_bytes = compact_bytes
+
+    def _lock(self, f, mode: int) -> None:
+        start_time = time.time()
+        while True:
+            try:
+                fcntl.flock(f.fileno(), mode | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if time.time() - start_time > self.lock_timeout:
+                    raise TimeoutError(
+                        f"Could not acquire registry lock after {self.lock_timeout}s"
+                    )
+                time.sleep(0.01)
+
+    def _read_snapshot(self) -> List[Dict[str, Any]]:
+        if not self.snapshot_path.exists():
+            return []
+        content = self.snapshot_path.read_text()
+        if not content.strip():
+            return []
+        return json.loads(content).get('agents', [])
+
+    @classmethod
+    def _replay(cls, agents: List[Dict[str, Any]], journal: str) -> List[Dict[str, Any]]:
+        """Apply journal lines to snapshot agents (newer updated_at wins)."""
+        by_id = {a['id']: a for a in agents}
+        for line in journal.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn trailing write from a crashed process; skip it
+                continue
+            if 'purge' in entry:
+                by_id.pop(entry['purge'], None)
+                continue
+            agent = entry['agent']
+            current = by_id.get(agent['id'])
+            if (current is None or entry.get('force')
+                    or cls._version(agent) >= cls._version(current)):
+                by_id[agent['id']] = agent
+        return list(by_id.values())
+
+    def _signature(self, journal_st: os.stat_result) -> Tuple[tuple, bool]:
+        """Combined (journal, snapshot) stat signature and whether it's racy."""
+        try:
+            snapshot_st = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            return (_stat_signature(journal_st), None), _is_racy(journal_st)
+        signature = (_stat_signature(journal_st), _stat_signature(snapshot_st))
+        return signature, _is_racy(journal_st) or _is_racy(snapshot_st)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load snapshot + journal tail under a shared journal lock.
+
+        Returns the cached replay when neither file changed since.
+        """
+        key = str(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+') as f:
+            self._lock(f, fcntl.LOCK_SH)
+            try:
+                signature, racy = self._signature(os.fstat(f.fileno()))
+                cached = _READ_CACHE.get(key)
+                if cached and cached[0] == signature:
+                    agents = cached[1]
+                else:
+                    f.seek(0)
+                    agents = self._replay(self._read_snapshot(), f.read())
+                    if racy:
+                        _READ_CACHE.pop(key, None)
+                    else:
+                        _READ_CACHE[key] = (signature, agents)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        self._remember(agents)
+        return _copy_agents(agents)
+
+    def save(self, agents: List[Dict[str, Any]], skip_merge: bool = False) -> None:
+        """Append changed agents to the journal.
+
+        Args:
+            agents: In-memory agents to persist
+            skip_merge: If True, entries are marked `force` so replay applies
+                       them regardless of updated_at.
+        """
+        changed = self._changed(agents)
+        if not changed:
+            return
+
+        lines = []
+        for agent in changed:
+            entry = {'updated_at': self._version(agent), 'agent': dict(agent)}
+            if skip_merge:
+                entry['force'] = True
+            lines.append(json.dumps(entry) + '\n')
+
+        self._append(lines)
+        self._remember(changed)
+
+    def purge(self, agent_ids: Iterable[str]) -> None:
+        """Append purge entries so replay drops the agents."""
+        ids = list(agent_ids)
+        if not ids:
+            return
+        self._append([json.dumps({'purge': agent_id}) + '\n' for agent_id in ids])
+        for agent_id in ids:
+            self._persisted.pop(agent_id, None)
+
+    def _append(self, lines: List[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _READ_CACHE.pop(str(self.path), None)
+        with open(self.path, 'a+') as f:
+            self._lock(f, fcntl.LOCK_EX)
+            try:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != '\n':
+                        # Terminate a torn line left by a crashed writer
+                        lines.insert(0, '\n')
+                # Single write per save keeps entries whole for concurrent readers
+                f.write(''.join(lines))
+                f.flush()
+                if f.tell() > self.compact_bytes:
+                    self._compact_locked(f)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot and truncate the journal."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+') as f:
+            self._lock(f, fcntl.LOCK_EX)
+            try:
+                self._compact_locked(f)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _compact_locked(self, f) -> None:
+        _READ_CACHE.pop(str(self.path), None)
+        f.seek(0)
+        agents = self._replay(self._read_snapshot(), f.read())
+
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=f'.{self.snapshot_path.name}.', dir=str(self.snapshot_path.parent)
+        )
+        try:
+            with os.fdopen(fd, 'w') as tmp:
+                json.dump({'agents': agents}, tmp, indent=2)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_name, self.snapshot_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        # A crash before this truncate only means the journal is replayed
+        # again over a snapshot that already contains it (idempotent)
+        f.truncate(0)
+
+
+class ShardedRegistryStorage(RegistryStorage):
+    """
+    Per-project registry shards.
+
+    Each project's agents live in their own JSON shard
+    (agent-registry.d/shards/<project>-<hash>.json) handled by a
+    JsonRegistryStorage with its own lock, so spawns, reconciles and cleanups
+    in different projects never wait on each other. save() only touches the
+    shards that contain changed agents.
+
+    index.json maps shard file names to project directories. It is written
+    only when a shard is first created, keeping it off the hot path. load()
+    reads all shards in parallel (each through the stat-validated read
+    cache) and merges them.
+
+    On first use, agents are imported once from the sibling
+    agent-registry.json if it exists.
+    """
+
+    UNSCOPED = '_unscoped'
+
+    def __init__(self, path: Path, lock_timeout: float = 10, max_workers: int = 8):
+        super().__init__(path, lock_timeout)
+        self.shards_dir = self.path / 'shards'
+        self.index_path = self.path / 'index.json'
+        self.max_workers = max_workers
+        self._shards: Dict[str, JsonRegistryStorage] = {}
+        # Shard each agent was last loaded from / saved to
+        self._shard_of: Dict[str, str] = {}
+
+    @classmethod
+    def shard_name(cls, project_dir: str = None) -> str:
+        """Stable shard file name for a project directory."""
+        if not project_dir:
+            return f'{cls.UNSCOPED}.json'
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '-', Path(project_dir).name).strip('-') or 'project'
+        digest = hashlib.sha1(str(project_dir).encode()).hexdigest()[:8]
+        return f'{slug}-{digest}.json'
+
+    def _shard(self, name: str) -> JsonRegistryStorage:
+        if name not in self._shards:
+            self._shards[name] = JsonRegistryStorage(self.shards_dir / name, self.lock_timeout)
+        return self._shards[name]
+
+    def _locked_index(self, update) -> Dict[str, Any]:
+        """Read-modify-write index.json under its lock; update(index) -> bool (changed)."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, 'a+') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read()
+                index = json.loads(content) if content.strip() else {}
+                index.setdefault('shards', {})
+                if update(index):
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(index, f, indent=2)
+                    f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return index
+
+    def read_index(self) -> Dict[str, Any]:
+        """Return the shard index ({'shards': {file_name: project_dir}})."""
+        if not self.index_path.exists():
+            return {'shards': {}}
+        content = self.index_path.read_text()
+        index = json.loads(content) if content.strip() else {}
+        index.setdefault('shards', {})
+        return index
+
+    def _migrate_from_json(self) -> None:
+        legacy_path = self.path.with_suffix('.json')
+
+        def migrate(index):
+            if 'migrated_from_json' in index:
+                return False
+            agents = JsonRegistryStorage(legacy_path, self.lock_timeout).load() if legacy_path.exists() else []
+            for name, shard_agents in self._group(agents).items():
+                self._shard(name).save(shard_agents)
+                index['shards'][name] = shard_agents[0].get('project_dir')
+            index['migrated_from_json'] = str(legacy_path) if agents else ''
+            return True
+
+        self._locked_index(migrate)
+
+    def _group(self, agents: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for agent in agents:
+            grouped.setdefault(self.shard_name(agent.get('project_dir')), []).append(agent)
+        return grouped
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load and merge all shards in parallel."""
+        if not self.index_path.exists():
+            self._migrate_from_json()
+
+        names = sorted(p.name for p in self.shards_dir.glob('*.json')) if self.shards_dir.exists() else []
+        if not names:
+            return []
+
+        shards = [self._shard(name) for name in names]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as pool:
+            results = list(pool.map(lambda shard: shard.load(), shards))
+
+        agents = []
+        for name, shard_agents in zip(names, results):
+            for agent in shard_agents:
+                self._shard_of[agent['id']] = name
+            agents.extend(shard_agents)
+        self._remember(agents)
+        return agents
+
+    def save(self, agents: List[Dict[str, Any]], skip_merge: bool = False) -> None:
+        """Save each shard that contains changed agents (under that shard's lock only)."""
+        changed = self._changed(agents)
+        if not changed:
+            return
+
+        # Shards are written whole, so pass every in-memory agent of a touched shard
+        grouped = self._group(agents)
+        touched = {self.shard_name(a.get('project_dir')) for a in changed}
+
+        new_shards = {name for name in touched if not (self.shards_dir / name).exists()}
+        if new_shards:
+            def register_shards(index):
+                missing = new_shards - set(index['shards'])
+                for name in missing:
+                    index['shards'][name] = grouped[name][0].get('project_dir')
+                return bool(missing)
+
+            self._locked_index(register_shards)
+
+        for name in sorted(touched):
+            self._shard(name).save(grouped[name], skip_merge=skip_merge)
+
+        # An agent whose project_dir changed must leave its old shard
+        moved: Dict[str, List[str]] = {}
+        for agent in changed:
+            old = self._shard_of.get(agent['id'])
+            new = self.shard_name(agent.get('project_dir'))
+            if old and old != new:
+                moved.setdefault(old, []).append(agent['id'])
+            self._shard_of[agent['id']] = new
+        for name, ids in moved.items():
+            self._shard(name).purge(ids)
+
+        self._remember(changed)
+
+    def purge(self, agent_ids: Iterable[str]) -> None:
+        """Drop agents from whichever shards hold them."""
+        by_shard: Dict[str, List[str]] = {}
+        unknown: List[str] = []
+        for agent_id in agent_ids:
+            name = self._shard_of.pop(agent_id, None)
+            if name:
+                by_shard.setdefault(name, []).append(agent_id)
+            else:
+                unknown.append(agent_id)
+            self._persisted.pop(agent_id, None)
+        if unknown and self.shards_dir.exists():
+            # Not seen by this instance; try every shard
+            for shard_path in self.shards_dir.glob('*.json'):
+                by_shard.setdefault(shard_path.name, []).extend(unknown)
+        for name, ids in by_shard.items():
+            self._shard(name).purge(ids)
+
+
+def create_storage(path: Path, lock_timeout: float = 10) -> RegistryStorage:
+    """Pick a storage backend from the registry path suffix."""
+    path = Path(path)
+    if path.suffix in SQLITE_SUFFIXES:
+        return SqliteRegistryStorage(path, lock_timeout)
+    if path.suffix == '.jsonl':
+        return JournalRegistryStorage(path, lock_timeout)
+    if path.suffix == '.d':
+        return ShardedRegistryStorage(path, lock_timeout)
+    return JsonRegistryStorage(path, lock_timeout)
+
+
+def default_registry_path() -> Path:
+    """Default registry location for the configured `registry_backend`."""
+    from orch.config import get_registry_backend
+
+    orch_dir = Path.home() / '.orch'
+    backend = get_registry_backend()
+    if backend == 'sqlite':
+        return orch_dir / 'agent-registry.db'
+    if backend == 'journal':
+        return orch_dir / 'agent-registry.jsonl'
+    if backend == 'sharded':
+        return orch_dir / 'agent-registry.d'
+    return orch_dir / 'agent-registry.json'
@@ -1,14 +1,27 @@
 """
 Send messages to spawned agents via tmux or OpenCode API.
+
+Tmux delivery loads the message into a buffer with load-buffer (from stdin,
+so no part of it is parsed as tmux syntax) and pastes it with paste-buffer
+(bracketed paste, so newlines stay inside the message instead of submitting
+it early), waits until the pasted text shows up in the pane, then presses
+Enter.
 """
 
 import subprocess
 import time
-from typing import Dict, Any
-from orch.tmux_utils import get_window_by_target, get_window_by_id
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from orch.tmux_utils import WindowSnapshot, get_window_by_target, get_window_by_id, snapshot_windows
+
+# How long to wait for pasted text to appear before pressing Enter anyway
+ECHO_TIMEOUT = 1.0
+ECHO_POLL_INTERVAL = 0.02
 
 
-def send_message_to_agent(agent: Dict[str, Any], message: str):
+def send_message_to_agent(agent: Dict[str, Any], message: str,
+                          snapshot: Optional[WindowSnapshot] = None):
     """
     Send a message to an agent via tmux or OpenCode API.
 
@@ -19,6 +32,7 @@ def send_message_to_agent(agent: Dict[str, Any], message: str):
         agent: Agent dict from registry (must have 'window' or 'window_id' key,
                or 'backend'='opencode' with 'session_id')
         message: Message to send
+        snapshot: Window snapshot to resolve the window from (taken if not given)
 
     Raises:
         RuntimeError: If tmux window not found or OpenCode API call fails
@@ -29,7 +43,32 @@ def send_message_to_agent(agent: Dict[str, Any], message: str):
         return
 
     # Tmux-based backends (claude, codex)
-    _send_message_tmux(agent, message)
+    _send_message_tmux(agent, message, snapshot=snapshot)
+
+
+def broadcast_message(agents: List[Dict[str, Any]], message: str,
+                      max_workers: int = 8) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+    """
+    Send the same message to many agents in parallel.
+
+    Windows are resolved from one shared `tmux list-windows -a` snapshot.
+
+    Returns:
+        (agent, error) per agent in input order; error is None on success
+    """
+    if not agents:
+        return []
+    snapshot = snapshot_windows()
+
+    def deliver(agent: Dict[str, Any]) -> Optional[str]:
+        try:
+            send_message_to_agent(agent, message, snapshot=snapshot)
+            return None
+        except (RuntimeError, subprocess.CalledProcessError) as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(agents)))) as pool:
+        return list(zip(agents, pool.map(deliver, agents)))
 
 
 def _send_message_opencode(agent: Dict[str, Any], message: str):
@@ -68,8 +107,73 @@ def _send_message_opencode(agent: Dict[str, Any], message: str):
         raise RuntimeError(f"Failed to send message to OpenCode session {session_id}: {e}")
 
 
-def _send_message_tmux(agent: Dict[str, Any], message: str):
-    """Send message to a tmux-based agent via send-keys."""
+def _echo_marker(message: str) -> str:
+    """Tail of the message's last line, to spot the paste in the pane."""
+    lines = [line.strip() for line in message.splitlines() if line.strip()]
+    return lines[-1][-40:] if lines else ''
+
+
+def _capture_pane(target: str) -> str:
+    """Visible text of the pane (wrapped lines joined), '' if it can't be read."""
+    result = subprocess.run(
+        ['tmux', 'capture-pane', '-p', '-J', '-t', target],
+        capture_output=True, text=True, check=False
+    )
+    return result.stdout if isinstance(result.stdout, str) else ''
+
+
+def _pane_tail(output: str, lines: int = 5) -> List[str]:
+    """Last few non-blank lines of a pane capture."""
+    return [line for line in output.splitlines() if line.strip()][-lines:]
+
+
+def _paste_seen(before: str, after: str, marker: str) -> bool:
+    """
+    Whether a new copy of the paste showed up between two pane captures.
+
+    Claude Code collapses long pastes into a "[Pasted text ...]" placeholder,
+    which counts as the paste too. Earlier turns may already show the same
+    text, so it has to appear more often than before, or in a bottom of the
+    pane that changed (older copies may have scrolled out of view).
+    """
+    signs = [marker, '[Pasted text']
+    if any(after.count(sign) > before.count(sign) for sign in signs):
+        return True
+    tail = _pane_tail(after)
+    if tail == _pane_tail(before):
+        return False
+    return any(sign in '\n'.join(tail) for sign in signs)
+
+
+def _wait_for_echo(target: str, message: str, before: str = '',
+                   timeout: float = ECHO_TIMEOUT) -> bool:
+    """
+    Poll the pane until the pasted message is visible.
+
+    Args:
+        target: Tmux target the message was pasted into
+        message: The pasted message
+        before: Pane capture taken just before pasting
+        timeout: Maximum wait in seconds
+
+    Returns:
+        True if the paste was seen, False if the timeout ran out
+    """
+    marker = _echo_marker(message)
+    if not marker:
+        return True
+    deadline = time.monotonic() + timeout
+    while True:
+        if _paste_seen(before, _capture_pane(target), marker):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(ECHO_POLL_INTERVAL)
+
+
+def _send_message_tmux(agent: Dict[str, Any], message: str,
+                       snapshot: Optional[WindowSnapshot] = None):
+    """Send message to a tmux-based agent via a bracketed paste."""
     # Prefer stable window_id over window target
     window_id = agent.get('window_id')
     if window_id:
@@ -77,8 +181,12 @@ def _send_message_tmux(agent: Dict[str, Any], message: str):
         window_target = agent.get('window', '')
         session_name = window_target.split(':')[0] if ':' in window_target else 'orchestrator'
 
-        # Use stable window ID (doesn't change with tmux renumbering)
-        window = get_window_by_id(window_id, session_name)
+        # Use stable window ID (doesn't change with tmux renumbering);
+        # looked up in a single `tmux list-windows -a` snapshot
+        if snapshot is not None:
+            window = get_window_by_id(window_id, session_name, snapshot=snapshot)
+        else:
+            window = get_window_by_id(window_id, session_name)
         if not window:
             raise RuntimeError(f"Window with ID '{window_id}' not found")
         # Tmux accepts window_id directly as target
@@ -91,16 +199,27 @@ def _send_message_tmux(agent: Dict[str, Any], message: str):
             raise RuntimeError(f"Window '{window_target}' not found")
         target = window_target
 
-    # Send message via tmux send-keys
-    subprocess.run([
-        "tmux", "send-keys",
-        "-t", target,
-        message
-    ], check=True)
-
-    # Wait for message to be pasted into terminal buffer
-    # Without this sleep, Enter gets processed before message is fully pasted
-    time.sleep(1)
+    # What the pane shows before the paste, so the echo check only counts
+    # a new copy of the message
+    before = _capture_pane(target) if _echo_marker(message) else ''
+
+    # Load the message into a private buffer from stdin (passing it as an
+    # argument would let tmux treat a trailing ';' as a command separator),
+    # then paste it. -p: bracketed paste (if the app asked for it), -d:
+    # delete the buffer
+    buffer_name = f"orch-send-{uuid.uuid4().hex[:8]}"
+    subprocess.run(
+        ["tmux", "load-buffer", "-b", buffer_name, "-"],
+        input=message, text=True, check=True
+    )
+    subprocess.run(
+        ["tmux", "paste-buffer", "-p", "-d", "-b", buffer_name, "-t", target],
+        check=True
+    )
+
+    # Without this check, Enter can arrive while the app is still taking in
+    # the paste and be swallowed as part of it
+    _wait_for_echo(target, message, before)
 
     # Auto-append Enter
     subprocess.run([
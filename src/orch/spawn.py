@@ -38,6 +38,7 @@ from orch.backends.opencode import (
     resolve_opencode_model,
 )
 from orch.config import get_backend
+from orch.pane_log import start_pane_log
 from orch.skill_discovery import (
     SkillDeliverable,
     SkillVerification,
@@ -616,6 +617,9 @@ def spawn_in_tmux(config: SpawnConfig, session_name: str = None) -> Dict[str, st
         window_index, window_id = output.split(':', 1)
         actual_window_target = f"{session_name}:{window_index}"
 
+        # Capture the window's output into <workspace>/pane.log from the start
+        start_pane_log(window_id, workspace_path)
+
         # Send backend command with minimal prompt (full context in file)
         # Using CLI's built-in initial prompt support avoids paste mode timing issues
         # Reference: ~/.claude/docs/official/claude-code/cli-reference.md - `claude "query"`
@@ -1337,6 +1341,9 @@ def spawn_interactive(
     window_index, window_id = output.split(':', 1)
     actual_window_target = f"{session_name}:{window_index}"
 
+    # Capture the window's output into <workspace>/pane.log from the start
+    start_pane_log(window_id, workspace_path)
+
     # Send claude command with minimal prompt (full context in file)
     # Using CLI's built-in initial prompt support avoids paste mode timing issues
     # Reference: ~/.claude/docs/official/claude-code/cli-reference.md - `claude "query"`
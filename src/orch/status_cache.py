@@ -0,0 +1,258 @@
+"""
+Persistent cache of agent statuses, keyed by a fingerprint of their inputs.
+
+Most agents' status doesn't change between two `orch status` runs, yet
+check_agent_status re-reads beads, scans investigation directories and may
+run git for each of them. StatusCache stores each agent's last AgentStatus
+in ~/.orch/cache/status.json with a fingerprint of everything the check
+reads:
+
+- the agent's registry entry (status, skill, workspace, primary_artifact...;
+  closed tmux windows show up here once reconcile marks the agent completed)
+- the stat signature of the agent's beads store (its database, or
+  .beads/issues.jsonl in projects without one)
+- the stat signature of its primary_artifact
+- the names and stat signatures of everything under the project's
+  .kb/investigations and .orch/investigations
+- the project's git HEAD
+- for completed agents, the relative age shown ("3h ago") and staleness
+
+An unchanged fingerprint means check_agent_status would return the same
+result, so the stored status is reused. Checks that also read context usage
+or git history are never cached (see evaluate_agent_statuses).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from orch.beads_cache import db_signature, find_beads_db
+from orch.beads_reader import find_beads_jsonl
+from orch.git_utils import read_git_head
+from orch.monitor import AgentStatus, status_from_dict, status_to_dict
+
+CACHE_VERSION = 2
+
+# Entries not recomputed for this long are dropped when the cache is saved
+_MAX_ENTRY_AGE_SECONDS = 7 * 24 * 3600
+
+# Inputs modified this recently aren't cached: a second write within the
+# filesystem's timestamp granularity could keep the same mtime and size
+_RACY_WINDOW_NS = 50_000_000
+
+
+def cache_path() -> Path:
+    """Location of the status cache file."""
+    return Path.home() / '.orch' / 'cache' / 'status.json'
+
+
+def _stat_signature(path: Path) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _newest_mtime(signature: Optional[List[Any]]) -> int:
+    """Latest mtime_ns in a stat signature ([mtime_ns, size, mtime_ns, size, ...])."""
+    if not signature:
+        return 0
+    return max((m for m in signature[0::2] if m is not None), default=0)
+
+
+def _tree_signature(root: Path) -> Optional[List[Any]]:
+    """(relative path, mtime_ns, size) of every entry under root, None if root is missing."""
+    if not root.is_dir():
+        return None
+    entries = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append([os.path.relpath(entry.path, root), st.st_mtime_ns, st.st_size])
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+        except OSError:
+            continue
+    return sorted(entries)
+
+
+class StatusCache:
+    """
+    Agent statuses from earlier runs, reused while their inputs are unchanged.
+
+    One instance serves one command run: per-project inputs (investigation
+    trees, git HEAD) and beads database signatures are read once and shared
+    by every agent of that project.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else cache_path()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._updated: Dict[str, Dict[str, Any]] = {}
+        self._project_inputs: Dict[str, Any] = {}
+        self._db_signatures: Dict[str, Any] = {}
+        self._entries = self._read_entries()
+
+    def _read_entries(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def _project(self, project_dir: Path) -> Any:
+        key = str(project_dir)
+        if key not in self._project_inputs:
+            trees = [
+                _tree_signature(project_dir / '.kb' / 'investigations'),
+                _tree_signature(project_dir / '.orch' / 'investigations'),
+            ]
+            newest = max((e[1] for tree in trees if tree for e in tree), default=0)
+            head = read_git_head(project_dir) if project_dir.is_dir() else None
+            self._project_inputs[key] = ([*trees, head], newest)
+        return self._project_inputs[key]
+
+    def _beads_store(self, agent: Dict[str, Any]) -> Optional[Path]:
+        """The beads database or issues.jsonl the agent's comments are read from."""
+        if agent.get('beads_db_path'):
+            return Path(agent['beads_db_path']).expanduser()
+        # Without a recorded database, look where the project's .beads lives
+        # first, then where bd finds one from the current directory
+        project_dir = agent.get('project_dir')
+        starts = [Path(project_dir), None] if project_dir else [None]
+        for start in starts:
+            store = find_beads_db(start) or find_beads_jsonl(start)
+            if store is not None:
+                return store
+        return None
+
+    def _beads_signature(self, agent: Dict[str, Any]) -> Any:
+        """Stat signature of the agent's beads store, None if there is none."""
+        store = self._beads_store(agent)
+        if store is None:
+            return None
+        key = str(store)
+        if key not in self._db_signatures:
+            if store.suffix == '.jsonl':
+                signature = _stat_signature(store)
+            else:
+                signature = db_signature(store)
+            self._db_signatures[key] = list(signature) if signature is not None else None
+        return self._db_signatures[key]
+
+    def fingerprint(self, agent: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Digest of the agent's status inputs, and whether it is safe to store.
+
+        Not safe when an input was modified within the last few milliseconds
+        (a further write might not change its mtime), or when the agent's
+        beads comments come from a store that can't be found (a change to
+        it wouldn't show up in the fingerprint).
+        """
+        from orch.session import format_relative_time, is_stale
+
+        project_dir = Path(agent.get('project_dir', ''))
+        project_inputs, newest = self._project(project_dir)
+        inputs: Dict[str, Any] = {
+            # updated_at changes on any registry touch; status doesn't read it
+            'agent': {k: v for k, v in agent.items() if k != 'updated_at'},
+            'project': project_inputs,
+        }
+        storable = True
+        if agent.get('beads_id'):
+            inputs['beads'] = self._beads_signature(agent)
+            newest = max(newest, _newest_mtime(inputs['beads']))
+            storable = inputs['beads'] is not None
+
+        primary_artifact = agent.get('primary_artifact')
+        if primary_artifact:
+            artifact_path = Path(primary_artifact).expanduser()
+            if not artifact_path.is_absolute():
+                artifact_path = project_dir / artifact_path
+            inputs['primary_artifact'] = _stat_signature(artifact_path)
+            newest = max(newest, _newest_mtime(inputs['primary_artifact']))
+
+        # Relative age and staleness are derived from the clock
+        if agent.get('completed_at'):
+            try:
+                completed_dt = datetime.fromisoformat(agent['completed_at'])
+                inputs['age'] = [format_relative_time(completed_dt), is_stale(completed_dt)]
+            except (ValueError, TypeError):
+                pass
+
+        encoded = json.dumps(inputs, sort_keys=True, default=str)
+        racy = time.time_ns() - newest < _RACY_WINDOW_NS
+        return hashlib.sha1(encoded.encode()).hexdigest(), storable and not racy
+
+    def get(self, agent_id: str, fingerprint: str) -> Optional[AgentStatus]:
+        """Stored status for the agent if it was computed from the same inputs."""
+        with self._lock:
+            entry = self._updated.get(agent_id) or self._entries.get(agent_id)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return None
+        try:
+            return status_from_dict(entry['status'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, agent_id: str, fingerprint: str, status: AgentStatus) -> None:
+        """Remember a freshly computed status; persisted by save()."""
+        if status.timed_out:
+            return
+        try:
+            serialized = status_to_dict(status)
+            json.dumps(serialized)
+        except (AttributeError, TypeError, ValueError):
+            return
+        with self._lock:
+            self._updated[agent_id] = {
+                'fingerprint': fingerprint,
+                'status': serialized,
+                'stored_at': time.time(),
+            }
+
+    def save(self) -> None:
+        """
+        Write new entries to disk.
+
+        Merges with the file as it is now, so concurrent runs scoped to
+        different projects keep each other's entries.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            entries = self._read_entries()
+            entries.update(self._updated)
+            cutoff = time.time() - _MAX_ENTRY_AGE_SECONDS
+            entries = {
+                agent_id: entry for agent_id, entry in entries.items()
+                if isinstance(entry, dict) and entry.get('stored_at', 0) >= cutoff
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + '.')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'version': CACHE_VERSION, 'entries': entries}, f)
+                os.replace(tmp_name, self.path)
+            except OSError:
+                return
+            self._entries = entries
+            self._updated = {}
@@ -0,0 +1,435 @@
+"""
+Background status daemon (`orch statusd`).
+
+`orch status` normally reloads the registry, reconciles it with tmux, queries
+beads and checks every agent on each run. The status daemon does that work in
+the background and keeps the resulting AgentStatus snapshot in memory,
+serving it over a Unix socket (~/.orch/statusd.sock) so `orch status` and the
+SessionStart hook can answer in milliseconds.
+
+The daemon recomputes the snapshot when its inputs change - the registry
+file, the set of tmux windows, or an agent's beads database - polling them
+every POLL_INTERVAL seconds, and at least every MAX_REFRESH_INTERVAL seconds
+for inputs it doesn't watch (workspace files, git).
+
+Clients never trust a snapshot blindly: request_snapshot() returns None when
+no daemon is listening, the snapshot is too old, or the registry or a beads
+database changed after it was computed, and callers then compute status
+directly as before.
+
+Protocol: the client sends one JSON line ({"op": "snapshot"}) and reads one
+JSON line back.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from orch.beads_cache import db_signature, find_beads_db
+from orch.beads_integration import BeadsBatch
+from orch.monitor import AgentStatus, evaluate_agent_statuses, status_from_dict, status_to_dict
+from orch.registry import AgentRegistry
+from orch.registry_storage import default_registry_path
+from orch.tmux_utils import WindowSnapshot, snapshot_windows
+
+SNAPSHOT_VERSION = 1
+
+# Seconds between checks of the daemon's inputs
+POLL_INTERVAL = 2.0
+
+# Recompute at least this often (catches workspace and git changes)
+MAX_REFRESH_INTERVAL = 30.0
+
+# Client-side limits: how long to wait for the daemon, and the oldest
+# snapshot worth using (older means the daemon is stuck)
+CLIENT_TIMEOUT = 0.5
+MAX_SNAPSHOT_AGE = 120.0
+
+_MAX_REQUEST_BYTES = 64 * 1024
+
+
+class StatusDaemonError(Exception):
+    """Raised when the status daemon can't start."""
+
+
+def socket_path() -> Path:
+    """Unix socket the status daemon listens on."""
+    return Path.home() / '.orch' / 'statusd.sock'
+
+
+def reconcile_registry(registry: AgentRegistry, windows: WindowSnapshot) -> None:
+    """
+    Bring the registry in line with the tmux windows that exist.
+
+    Agents registered before window IDs were tracked get their window_id
+    filled in from their 'session:index' target, then agents whose window is
+    gone are marked completed - in a single registry write.
+    """
+    # Active window IDs across ALL sessions. Window IDs are unique
+    # server-wide, so agents in workers-* sessions are reconciled
+    # alongside the orchestrator session.
+    all_active_window_ids = windows.window_ids()
+
+    # Legacy migration map: "session:index" -> window ID
+    target_to_id = {target: w['id'] for target, w in windows.by_target.items()}
+
+    # Migration and reconciliation share one registry write
+    with registry.transaction():
+        # Legacy migration: upgrade agents missing window_id (one-time migration)
+        migrated_count = 0
+        for agent in registry.list_active_agents():
+            if not agent.get('window_id') and agent['window'] in target_to_id:
+                agent['window_id'] = target_to_id[agent['window']]
+                agent['updated_at'] = datetime.now().isoformat()
+                migrated_count += 1
+
+        # Save if any migrations occurred
+        if migrated_count > 0:
+            registry.save()
+
+        # Always reconcile - even if no windows found, this detects agents whose windows closed
+        registry.reconcile(all_active_window_ids)
+
+
+def registry_signature(path: Path) -> Optional[List[Any]]:
+    """
+    Stat signature of a registry of any backend, None if it doesn't exist.
+
+    Covers the file and its SQLite WAL, or each shard of a sharded registry.
+    """
+    path = Path(path)
+    try:
+        if path.is_dir():
+            return sorted(
+                [entry.name, entry.stat().st_mtime_ns, entry.stat().st_size]
+                for entry in os.scandir(path)
+                if entry.is_file()
+            )
+        st = os.stat(path)
+    except OSError:
+        return None
+    signature = [st.st_mtime_ns, st.st_size]
+    try:
+        wal_st = os.stat(path.with_name(path.name + '-wal'))
+        signature.extend([wal_st.st_mtime_ns, wal_st.st_size])
+    except OSError:
+        pass
+    return signature
+
+
+def _beads_signatures(db_paths: List[str]) -> Dict[str, Optional[List[Any]]]:
+    signatures = {}
+    for db_path in db_paths:
+        signature = db_signature(Path(db_path))
+        signatures[db_path] = list(signature) if signature is not None else None
+    return signatures
+
+
+def _with_beads_db(agent: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of agent whose beads_db_path is resolved from its project.
+
+    `orch status` finds an agent's beads database from the directory it runs
+    in; the daemon runs elsewhere, so it looks in the agent's project instead.
+    """
+    if not agent.get('beads_id') or agent.get('beads_db_path'):
+        return agent
+    try:
+        db = find_beads_db(Path(agent['project_dir']))
+    except (KeyError, OSError):
+        return agent
+    if db is None:
+        return agent
+    return {**agent, 'beads_db_path': str(db)}
+
+
+@dataclass
+class StatusSnapshot:
+    """Every agent's status at one point in time, plus the inputs it was computed from."""
+    computed_at: float
+    registry_path: str
+    registry_signature: Optional[List[Any]]
+    window_ids: Optional[List[str]] = None
+    beads_signatures: Dict[str, Optional[List[Any]]] = field(default_factory=dict)
+    active: List[Tuple[Dict[str, Any], AgentStatus]] = field(default_factory=list)
+    completed: List[Tuple[Dict[str, Any], AgentStatus]] = field(default_factory=list)
+    issue_titles: Dict[str, str] = field(default_factory=dict)
+    issue_convergence: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': SNAPSHOT_VERSION,
+            'computed_at': self.computed_at,
+            'registry_path': self.registry_path,
+            'registry_signature': self.registry_signature,
+            'window_ids': self.window_ids,
+            'beads_signatures': self.beads_signatures,
+            'active': [{'agent': a, 'status': status_to_dict(s)} for a, s in self.active],
+            'completed': [{'agent': a, 'status': status_to_dict(s)} for a, s in self.completed],
+            'issue_titles': self.issue_titles,
+            'issue_convergence': self.issue_convergence,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StatusSnapshot':
+        """Parse a snapshot; raises ValueError if it isn't one this version understands."""
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError('Unsupported status snapshot')
+        try:
+            return cls(
+                computed_at=float(data['computed_at']),
+                registry_path=data['registry_path'],
+                registry_signature=data['registry_signature'],
+                window_ids=data.get('window_ids'),
+                beads_signatures=dict(data.get('beads_signatures') or {}),
+                active=[(e['agent'], status_from_dict(e['status'])) for e in data['active']],
+                completed=[(e['agent'], status_from_dict(e['status'])) for e in data['completed']],
+                issue_titles=dict(data.get('issue_titles') or {}),
+                issue_convergence=dict(data.get('issue_convergence') or {}),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f'Malformed status snapshot: {e}') from e
+
+    def is_current(self, max_age: float = MAX_SNAPSHOT_AGE) -> bool:
+        """
+        Whether the snapshot still reflects the registry and beads on disk.
+
+        Only stats files, so it is cheap enough to run on every read.
+        """
+        if time.time() - self.computed_at > max_age:
+            return False
+        if _normalized(registry_signature(Path(self.registry_path))) != _normalized(self.registry_signature):
+            return False
+        return _normalized(_beads_signatures(list(self.beads_signatures))) == _normalized(self.beads_signatures)
+
+
+def _normalized(value: Any) -> Any:
+    """Value as it looks after a JSON round trip (tuples become lists)."""
+    return json.loads(json.dumps(value))
+
+
+def compute_snapshot(registry_path: Optional[Path] = None) -> StatusSnapshot:
+    """
+    Compute every agent's status the way `orch status --include-completed --global` does.
+
+    Only the hot registry is covered: completed agents in the archive tier
+    are read by `orch status` itself when asked for, so the cost of a
+    refresh doesn't grow with history. Reconciles the registry with tmux
+    first (this may write the registry).
+    """
+    registry_path = Path(registry_path) if registry_path else default_registry_path()
+
+    # Inputs are fingerprinted before they are read, so a change made while
+    # computing (including our own reconcile write) makes the snapshot look
+    # outdated rather than current
+    signature = registry_signature(registry_path)
+    computed_at = time.time()
+
+    registry = AgentRegistry(registry_path=registry_path)
+    windows = snapshot_windows()
+    if windows.available:
+        reconcile_registry(registry, windows)
+
+    agents = registry.list_active_agents()
+    completed_agents = [a for a in registry.list_agents() if a.get('status') == 'completed']
+    resolved = [_with_beads_db(a) for a in agents + completed_agents]
+    db_paths = sorted({a['beads_db_path'] for a in resolved if a.get('beads_db_path')})
+    beads_signatures = _beads_signatures(db_paths)
+
+    beads_batch = BeadsBatch.fetch((a['beads_id'], a.get('beads_db_path')) for a in resolved if a.get('beads_id'))
+    statuses = evaluate_agent_statuses(resolved, beads_batch=beads_batch)
+
+    issue_titles = {}
+    issue_convergence = {}
+    for agent in resolved:
+        beads_id = agent.get('beads_id')
+        if beads_id and beads_id not in issue_titles:
+            db_path = agent.get('beads_db_path')
+            issue = beads_batch.issue(beads_id, db_path)
+            if issue and issue.title:
+                issue_titles[beads_id] = issue.title
+            convergence = beads_batch.convergence(beads_id, db_path)
+            if convergence:
+                issue_convergence[beads_id] = convergence
+
+    return StatusSnapshot(
+        computed_at=computed_at,
+        registry_path=str(registry_path),
+        registry_signature=signature,
+        window_ids=sorted(windows.window_ids()) if windows.available else None,
+        beads_signatures=beads_signatures,
+        active=list(zip(agents, statuses[:len(agents)])),
+        completed=list(zip(completed_agents, statuses[len(agents):])),
+        issue_titles=issue_titles,
+        issue_convergence=issue_convergence,
+    )
+
+
+class _SnapshotRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline(_MAX_REQUEST_BYTES)
+        if not line:
+            # Connection probe (see StatusDaemon._bind)
+            return
+        try:
+            request = json.loads(line)
+            op = request.get('op') if isinstance(request, dict) else None
+        except ValueError:
+            op = None
+
+        snapshot = self.server.daemon.snapshot
+        if op != 'snapshot':
+            reply = {'error': f'Unknown request: {line[:100]!r}'}
+        elif snapshot is None:
+            reply = {'error': 'Snapshot not computed yet'}
+        else:
+            reply = snapshot.to_dict()
+        try:
+            self.wfile.write(json.dumps(reply, default=str).encode() + b'\n')
+        except OSError:
+            # Client gave up waiting
+            pass
+
+
+class _StatusServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: 'StatusDaemon'):
+        self.daemon = daemon
+        super().__init__(path, _SnapshotRequestHandler)
+
+
+class StatusDaemon:
+    """Keeps a StatusSnapshot fresh and serves it over a Unix socket."""
+
+    def __init__(self, path: Optional[Path] = None, registry_path: Optional[Path] = None,
+                 poll_interval: float = POLL_INTERVAL,
+                 max_refresh_interval: float = MAX_REFRESH_INTERVAL):
+        self.path = Path(path) if path else socket_path()
+        self.registry_path = Path(registry_path) if registry_path else default_registry_path()
+        self.poll_interval = poll_interval
+        self.max_refresh_interval = max_refresh_interval
+        self._lock = threading.Lock()
+        self._snapshot: Optional[StatusSnapshot] = None
+        self._stop = threading.Event()
+        self._server: Optional[_StatusServer] = None
+
+    @property
+    def snapshot(self) -> Optional[StatusSnapshot]:
+        with self._lock:
+            return self._snapshot
+
+    def inputs_changed(self, snapshot: StatusSnapshot) -> bool:
+        """Whether the registry, tmux windows or a beads database changed since snapshot."""
+        windows = snapshot_windows()
+        current = [
+            registry_signature(self.registry_path),
+            sorted(windows.window_ids()) if windows.available else None,
+            _beads_signatures(list(snapshot.beads_signatures)),
+        ]
+        seen = [snapshot.registry_signature, snapshot.window_ids, snapshot.beads_signatures]
+        return _normalized(current) != _normalized(seen)
+
+    def refresh(self) -> StatusSnapshot:
+        """Recompute the snapshot now."""
+        snapshot = compute_snapshot(self.registry_path)
+        with self._lock:
+            self._snapshot = snapshot
+        return snapshot
+
+    def refresh_if_changed(self) -> bool:
+        """Recompute if an input changed or the snapshot is due; True if it was recomputed."""
+        snapshot = self.snapshot
+        if (snapshot is None
+                or time.time() - snapshot.computed_at >= self.max_refresh_interval
+                or self.inputs_changed(snapshot)):
+            self.refresh()
+            return True
+        return False
+
+    def _bind(self) -> None:
+        """Listen on the socket, replacing one left behind by a dead daemon."""
+        if self.path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+            except OSError:
+                self.path.unlink()
+            else:
+                raise StatusDaemonError(f'Status daemon already running on {self.path}')
+            finally:
+                probe.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _StatusServer(str(self.path), self)
+        os.chmod(self.path, 0o600)
+
+    def serve_forever(self) -> None:
+        """Serve snapshots until stop() is called (or KeyboardInterrupt)."""
+        self._bind()
+        server_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.refresh_if_changed()
+                except Exception:
+                    # A failed refresh keeps serving the previous snapshot;
+                    # clients reject it once it is too old
+                    pass
+                self._stop.wait(self.poll_interval)
+        finally:
+            self._server.shutdown()
+            self._server.server_close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def request_snapshot(path: Optional[Path] = None, timeout: float = CLIENT_TIMEOUT,
+                     max_age: float = MAX_SNAPSHOT_AGE,
+                     registry_path: Optional[Path] = None) -> Optional[StatusSnapshot]:
+    """
+    Current snapshot from a running status daemon.
+
+    Returns None - meaning "compute status directly" - if no daemon answers
+    within timeout, or its snapshot is for another registry or no longer
+    current (see StatusSnapshot.is_current).
+    """
+    path = Path(path) if path else socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps({'op': 'snapshot'}).encode() + b'\n')
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b'\n'):
+                    break
+        snapshot = StatusSnapshot.from_dict(json.loads(b''.join(chunks)))
+    except (OSError, ValueError):
+        return None
+
+    expected_registry = Path(registry_path) if registry_path else default_registry_path()
+    if Path(snapshot.registry_path).resolve() != expected_registry.resolve():
+        return None
+    if not snapshot.is_current(max_age):
+        return None
+    return snapshot
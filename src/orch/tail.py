@@ -2,10 +2,14 @@
 Agent output capture for passive monitoring.
 """
 
+import queue
 import subprocess
+import threading
+import time
 from typing import Dict, Any, List
 
 from orch.backends.opencode import OpenCodeClient, discover_server
+from orch.pane_log import PaneLogFollower, pane_log_path, read_agent_output, strip_ansi
 
 
 def tail_agent_output(agent: Dict[str, Any], lines: int = 20) -> str:
@@ -111,7 +115,19 @@ def _format_opencode_messages(messages: List[Any], lines: int) -> str:
 
 
 def _tail_tmux(agent: Dict[str, Any], lines: int) -> str:
-    """Capture recent output from an agent's tmux window."""
+    """Capture recent output from an agent's tmux window.
+
+    Reads the agent's pipe-pane log from disk when one exists (also works
+    after the window has closed); otherwise captures the pane.
+    """
+    logged = read_agent_output(agent, lines)
+    if logged is not None:
+        return logged
+    return _tail_tmux_capture(agent, lines)
+
+
+def _tail_tmux_capture(agent: Dict[str, Any], lines: int) -> str:
+    """Capture recent output with `tmux capture-pane`."""
     # Prefer stable window_id over window target (window indices change when tmux renumbers)
     window_target = agent.get('window_id', agent['window'])
 
@@ -138,3 +154,219 @@ def _tail_tmux(agent: Dict[str, Any], lines: int) -> str:
         )
 
     return result.stdout
+
+
+# --- Follow mode -------------------------------------------------------------
+#
+# `orch tail --follow` streams new output for one or many agents. Each agent
+# gets the cheapest incremental source available:
+#   - its pipe-pane log (offset-tracked reads of appended bytes),
+#   - else a tmux control-mode connection (%output notifications for the
+#     agent's pane; one connection per session),
+#   - else, if control mode is unavailable, periodic capture-pane diffs;
+#   - OpenCode agents with a session_id use the server's SSE event stream.
+
+
+class _LogSource:
+    """New lines from an agent's pane log."""
+
+    def __init__(self, agent_id: str, log_path):
+        self.agent_id = agent_id
+        self.follower = PaneLogFollower(log_path)
+
+    def poll(self) -> List[str]:
+        return self.follower.read_new().splitlines()
+
+
+class _CaptureSource:
+    """New lines between successive capture-pane snapshots (last resort)."""
+
+    def __init__(self, agent: Dict[str, Any], lines: int):
+        self.agent = agent
+        self.agent_id = agent['id']
+        self.lines = lines
+        self.previous: List[str] = self._capture()
+
+    def _capture(self) -> List[str]:
+        try:
+            return _tail_tmux_capture(self.agent, self.lines).rstrip('\n').split('\n')
+        except RuntimeError:
+            return []
+
+    def poll(self) -> List[str]:
+        current = self._capture()
+        previous, self.previous = self.previous, current
+        # Lines after the longest overlap between the old tail and the new head
+        for k in range(min(len(previous), len(current)), 0, -1):
+            if previous[-k:] == current[:k]:
+                return current[k:]
+        return current if current != previous else []
+
+
+class _LineSplitter:
+    """Turns streamed chunks into complete lines."""
+
+    def __init__(self):
+        self.partial = ''
+
+    def feed(self, text: str) -> List[str]:
+        text = self.partial + text
+        lines = text.split('\n')
+        self.partial = lines.pop()
+        return lines
+
+
+def _start_control_sources(agents: List[Dict[str, Any]], out: queue.Queue) -> List[Any]:
+    """
+    Stream %output for tmux agents over control-mode connections.
+
+    Agents whose connection or pane can't be set up get a (agent_id, None)
+    entry on the queue so the caller can fall back to capture-pane diffs.
+
+    Returns:
+        Started TmuxControlClients (caller closes them)
+    """
+    from orch.tmux_control import TmuxControlClient, TmuxControlError
+
+    by_session: Dict[str, List[Dict[str, Any]]] = {}
+    for agent in agents:
+        session_name = (agent.get('window') or '').split(':')[0] or None
+        by_session.setdefault(session_name, []).append(agent)
+
+    clients = []
+    for session_name, session_agents in by_session.items():
+        client = TmuxControlClient(session_name)
+        try:
+            client.start()
+        except TmuxControlError:
+            for agent in session_agents:
+                out.put((agent['id'], None))
+            continue
+
+        pane_to_agent: Dict[str, str] = {}
+        for agent in session_agents:
+            target = agent.get('window_id', agent.get('window'))
+            try:
+                for pane_id in client.command('list-panes', '-t', target, '-F', '#{pane_id}'):
+                    pane_to_agent[pane_id] = agent['id']
+            except TmuxControlError:
+                out.put((agent['id'], None))
+
+        splitters = {agent_id: _LineSplitter() for agent_id in pane_to_agent.values()}
+
+        def on_output(pane_id, data, pane_to_agent=pane_to_agent, splitters=splitters):
+            agent_id = pane_to_agent.get(pane_id)
+            if agent_id:
+                text = strip_ansi(data).decode('utf-8', errors='replace')
+                for line in splitters[agent_id].feed(text):
+                    out.put((agent_id, line))
+
+        client.on('output', on_output)
+        clients.append(client)
+    return clients
+
+
+def _start_opencode_source(agents: List[Dict[str, Any]], out: queue.Queue):
+    """Stream text deltas for OpenCode sessions from the server's SSE endpoint."""
+    server_url = discover_server()
+    if not server_url:
+        raise RuntimeError("OpenCode server not found")
+
+    session_to_agent = {a['session_id']: a['id'] for a in agents}
+    splitters = {a['id']: _LineSplitter() for a in agents}
+    sse = OpenCodeClient(server_url).subscribe_events()
+
+    def run():
+        try:
+            for event in sse.events():
+                if event.get('type') != 'message.part.updated':
+                    continue
+                props = event.get('properties') or {}
+                part = props.get('part') or {}
+                agent_id = session_to_agent.get(part.get('sessionID'))
+                if agent_id and part.get('type') == 'text' and props.get('delta'):
+                    for line in splitters[agent_id].feed(props['delta']):
+                        out.put((agent_id, line))
+        except Exception:
+            for agent_id in splitters:
+                out.put((agent_id, None))
+
+    threading.Thread(target=run, name='opencode-sse', daemon=True).start()
+    return sse
+
+
+def follow_agents(agents: List[Dict[str, Any]], emit, lines: int = 20,
+                  interval: float = 0.5, stop=None) -> None:
+    """
+    Stream new output of several agents, interleaved, until stop is set.
+
+    Prints the last `lines` lines of each agent first, then only new output.
+
+    Args:
+        agents: Agents to follow
+        emit: Callable(agent_id, line); line is None when an agent's stream
+              could not be started or ended
+        lines: Lines of history to show per agent before following
+        interval: Poll interval for file/capture sources (seconds)
+        stop: threading.Event that ends the loop (runs until interrupted if None)
+    """
+    stop = stop or threading.Event()
+    out: queue.Queue = queue.Queue()
+    polled: List[Any] = []
+    control_agents, opencode_agents = [], []
+
+    for agent in agents:
+        log_path = pane_log_path(agent)
+        if agent.get('backend') == 'opencode' and agent.get('session_id'):
+            opencode_agents.append(agent)
+        elif log_path is not None and log_path.exists():
+            # Offset taken before reading history, so nothing falls in between
+            polled.append(_LogSource(agent['id'], log_path))
+        else:
+            control_agents.append(agent)
+
+        # Recent history first (from the pane log when there is one)
+        if lines > 0:
+            try:
+                history = tail_agent_output(agent, lines=lines)
+            except Exception:
+                history = ''
+            for line in history.rstrip('\n').split('\n') if history else []:
+                emit(agent['id'], line)
+
+    clients = _start_control_sources(control_agents, out) if control_agents else []
+    sse = None
+    if opencode_agents:
+        try:
+            sse = _start_opencode_source(opencode_agents, out)
+        except RuntimeError:
+            for agent in opencode_agents:
+                emit(agent['id'], None)
+
+    try:
+        while not stop.is_set():
+            for source in polled:
+                for line in source.poll():
+                    emit(source.agent_id, line)
+
+            deadline = time.monotonic() + interval
+            while not stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    agent_id, line = out.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if line is None:
+                    # Control mode unavailable for this agent: diff pane captures
+                    agent = next((a for a in control_agents if a['id'] == agent_id), None)
+                    if agent is not None:
+                        polled.append(_CaptureSource(agent, lines))
+                        continue
+                emit(agent_id, line)
+    finally:
+        for client in clients:
+            client.close()
+        if sse is not None:
+            sse.stop()
@@ -0,0 +1,300 @@
+"""
+Persistent tmux control-mode client.
+
+Every helper in tmux_utils forks a fresh `tmux` client per call. Long-running
+processes (the work daemon, watch modes) can instead keep one `tmux -C`
+control-mode connection open:
+
+- commands are written to the client's stdin and their replies matched up
+  from the %begin/%end (or %error) blocks, in order, so many commands share
+  one connection;
+- notifications (%window-add, %window-close, %unlinked-window-close,
+  %output, %exit) are dispatched to registered callbacks.
+
+WindowCloseReconciler uses the window-close notifications to drive
+AgentRegistry.reconcile_closed_windows(), so closed agent windows are
+completed as they close instead of by periodic full scans.
+
+Usage:
+    with TmuxControlClient() as client:
+        windows = client.command('list-windows', '-a', '-F', '#{window_id}')
+        client.on('window-close', lambda args: print('closed', args[0]))
+"""
+
+import subprocess
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+
+class TmuxControlError(RuntimeError):
+    """A control-mode command failed or the connection is gone."""
+
+
+def quote_arg(arg: str) -> str:
+    """Quote one argument for the tmux command parser."""
+    arg = str(arg)
+    if arg and all(c.isalnum() or c in '@%$:._-/=,+' for c in arg):
+        return arg
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+def decode_output(data: str) -> bytes:
+    """Decode a %output payload (tmux escapes bytes < 32 and '\\' as \\ooo)."""
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        c = data[i]
+        digits = data[i + 1:i + 4]
+        if c == '\\' and len(digits) == 3 and all(d in '01234567' for d in digits):
+            out.append(int(digits, 8))
+            i += 4
+            continue
+        out.extend(c.encode('utf-8', errors='surrogateescape'))
+        i += 1
+    return bytes(out)
+
+
+class _PendingCommand:
+    """Reply slot for one command written to the control client."""
+
+    __slots__ = ('done', 'lines', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.lines: List[str] = []
+        self.error = False
+
+
+class TmuxControlClient:
+    """
+    One long-lived `tmux -C attach-session` connection.
+
+    Event names are the notification names without the leading '%'
+    (e.g. 'window-close'); callbacks receive the notification's arguments
+    as a list of strings. 'output' callbacks receive (pane_id, bytes).
+    """
+
+    def __init__(self, session_name: str = None):
+        self.session_name = session_name
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+        self._pending: Deque[_PendingCommand] = deque()
+        self._current: Optional[_PendingCommand] = None
+        self._current_ours = False
+        self._callbacks: Dict[str, List[Callable]] = {}
+        self.connected = False
+
+    def __enter__(self) -> 'TmuxControlClient':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Attach the control client (to session_name, or the first session)."""
+        if self.session_name is None:
+            from orch.tmux_utils import snapshot_windows
+
+            snapshot = snapshot_windows()
+            if not snapshot.sessions:
+                raise TmuxControlError("No tmux session to attach a control client to")
+            self.session_name = snapshot.sessions[0]
+
+        try:
+            self._proc = subprocess.Popen(
+                ['tmux', '-C', 'attach-session', '-t', self.session_name],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors='surrogateescape',
+                bufsize=1,
+            )
+        except OSError as e:
+            raise TmuxControlError(f"Could not start tmux control client: {e}") from e
+
+        self.connected = True
+        self._reader = threading.Thread(target=self._read_loop, name='tmux-control', daemon=True)
+        self._reader.start()
+
+    def close(self) -> None:
+        """Detach and stop the reader thread."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            # An empty line detaches a control client
+            proc.stdin.write('\n')
+            proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        if self._reader:
+            self._reader.join(timeout=2)
+        self._disconnected()
+
+    def on(self, event: str, callback: Callable) -> None:
+        """Register a callback for a notification (e.g. 'window-close')."""
+        self._callbacks.setdefault(event, []).append(callback)
+
+    def command(self, *args: str, timeout: float = 5) -> List[str]:
+        """
+        Run one tmux command over the connection.
+
+        Returns:
+            Output lines of the command
+
+        Raises:
+            TmuxControlError: If tmux reports an error, the connection is
+                closed, or no reply arrives within timeout
+        """
+        pending = _PendingCommand()
+        line = ' '.join(quote_arg(a) for a in args) + '\n'
+        with self._write_lock:
+            if not self.connected or self._proc is None:
+                raise TmuxControlError("tmux control client is not connected")
+            self._pending.append(pending)
+            try:
+                self._proc.stdin.write(line)
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._pending.remove(pending)
+                raise TmuxControlError(f"tmux control client write failed: {e}") from e
+
+        if not pending.done.wait(timeout):
+            raise TmuxControlError(f"No reply from tmux for: {line.strip()}")
+        if pending.error:
+            raise TmuxControlError('\n'.join(pending.lines) or f"tmux command failed: {line.strip()}")
+        return pending.lines
+
+    def _read_loop(self) -> None:
+        proc = self._proc
+        try:
+            for line in proc.stdout:
+                self._handle_line(line.rstrip('\n'))
+        except (OSError, ValueError):
+            pass
+        self._disconnected()
+
+    def _handle_line(self, line: str) -> None:
+        """Route one line of control-mode output."""
+        if self._current is not None:
+            if line.startswith(('%end ', '%error ')):
+                current, self._current = self._current, None
+                if self._current_ours:
+                    current.error = line.startswith('%error ')
+                    current.done.set()
+            else:
+                self._current.lines.append(line)
+            return
+
+        if not line.startswith('%'):
+            return
+
+        name, _, rest = line[1:].partition(' ')
+        if name == 'begin':
+            # %begin <time> <command number> <flags>; flags is 1 for
+            # commands sent by this client, 0 for e.g. the initial attach
+            fields = rest.split()
+            self._current_ours = len(fields) >= 3 and fields[2] == '1'
+            if self._current_ours and self._pending:
+                self._current = self._pending.popleft()
+            else:
+                self._current_ours = False
+                self._current = _PendingCommand()
+            return
+
+        if name == 'output':
+            pane_id, _, data = rest.partition(' ')
+            self._emit('output', pane_id, decode_output(data))
+        elif name == 'exit':
+            self._emit('exit', rest.split())
+            self._disconnected()
+        else:
+            self._emit(name, rest.split())
+
+    def _emit(self, event: str, *args) -> None:
+        for callback in list(self._callbacks.get(event, [])):
+            try:
+                callback(*args)
+            except Exception:
+                # A failing subscriber must not kill the reader thread
+                pass
+
+    def _disconnected(self) -> None:
+        self.connected = False
+        while self._pending:
+            pending = self._pending.popleft()
+            pending.error = True
+            pending.lines.append("tmux control client disconnected")
+            pending.done.set()
+
+
+class WindowCloseReconciler:
+    """
+    Complete agents as soon as tmux reports their window closed.
+
+    Window-close notifications are batched for `debounce` seconds and then
+    applied with AgentRegistry.reconcile_closed_windows() on a freshly loaded
+    registry. A full snapshot-based reconcile runs once on start, covering
+    windows that closed while nothing was listening.
+    """
+
+    CLOSE_EVENTS = ('window-close', 'unlinked-window-close')
+
+    def __init__(self, client: TmuxControlClient, registry_path: Path = None,
+                 debounce: float = 0.2):
+        self.client = client
+        self.registry_path = registry_path
+        self.debounce = debounce
+        self._closed: List[str] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def _registry(self):
+        from orch.registry import AgentRegistry
+
+        return AgentRegistry(self.registry_path)
+
+    def start(self) -> None:
+        """Subscribe to close events and run the initial full reconcile."""
+        for event in self.CLOSE_EVENTS:
+            self.client.on(event, self._on_close)
+
+        from orch.tmux_utils import snapshot_windows
+
+        snapshot = snapshot_windows()
+        if snapshot.available:
+            self._registry().reconcile(snapshot.window_ids())
+
+    def _on_close(self, args: List[str]) -> None:
+        if not args:
+            return
+        with self._lock:
+            self._closed.append(args[0])
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> int:
+        """Apply pending window closes now.
+
+        Returns:
+            Number of agents marked completed
+        """
+        with self._lock:
+            closed, self._closed = self._closed, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not closed:
+            return 0
+        return self._registry().reconcile_closed_windows(closed)
@@ -1,5 +1,6 @@
+import os
 import libtmux
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Set
 
 def get_server():
     """Get libtmux server instance."""
@@ -77,29 +78,105 @@ def get_window_by_target(window_target: str) -> Optional[Any]:
 
     return None
 
-def get_window_by_id(window_id: str, session_name: str = "workers") -> Optional[Any]:
+
+SNAPSHOT_FORMAT = '#{session_name}\t#{window_id}\t#{window_index}\t#{window_name}\t#{pane_pid}'
+
+
+class WindowSnapshot:
+    """
+    Point-in-time view of every tmux window on the server.
+
+    Built from a single `tmux list-windows -a` call. Windows are dicts with
+    'session', 'id', 'index', 'name' and 'pane_pid' keys, indexed by window ID
+    and by 'session:index' target.
+    """
+
+    def __init__(self, windows: List[Dict[str, Any]] = None, available: bool = True):
+        self.windows = windows or []
+        self.available = available
+        self.by_id: Dict[str, Dict[str, Any]] = {w['id']: w for w in self.windows}
+        self.by_target: Dict[str, Dict[str, Any]] = {
+            f"{w['session']}:{w['index']}": w for w in self.windows
+        }
+
+    @property
+    def sessions(self) -> List[str]:
+        """Session names that have at least one window, in first-seen order."""
+        return list(dict.fromkeys(w['session'] for w in self.windows))
+
+    def window_ids(self) -> List[str]:
+        """All window IDs on the server."""
+        return list(self.by_id)
+
+    def windows_in(self, session_name: str) -> List[Dict[str, Any]]:
+        """Windows belonging to one session."""
+        return [w for w in self.windows if w['session'] == session_name]
+
+
+def snapshot_windows() -> WindowSnapshot:
+    """
+    Snapshot all tmux windows with one `tmux list-windows -a` call.
+
+    Returns:
+        WindowSnapshot; `available` is False if tmux isn't installed or no
+        server is running (the snapshot is then empty)
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['tmux', 'list-windows', '-a', '-F', SNAPSHOT_FORMAT],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except (OSError, subprocess.SubprocessError):
+        return WindowSnapshot(available=False)
+
+    if result.returncode != 0:
+        return WindowSnapshot(available=False)
+
+    windows = []
+    for line in result.stdout.splitlines():
+        parts = line.split('\t')
+        if len(parts) != 5:
+            continue
+        session_name, window_id, window_index, window_name, pane_pid = parts
+        windows.append({
+            'session': session_name,
+            'id': window_id,
+            'index': window_index,
+            'name': window_name,
+            'pane_pid': int(pane_pid) if pane_pid.isdigit() else None,
+        })
+    return WindowSnapshot(windows)
+
+
+def get_window_by_id(window_id: str, session_name: str = None,
+                     snapshot: WindowSnapshot = None) -> Optional[Dict[str, Any]]:
     """
     Get window by stable window ID (e.g., '@157').
 
     Window IDs are stable and don't change when tmux renumbers windows,
     making them more reliable than window indices for tracking agents.
+    They are also unique across the tmux server, so the session is only
+    used to reject a match in a different session.
 
     Args:
         window_id: Window ID in format '@NNN'
-        session_name: Tmux session name (default: 'workers')
+        session_name: Expected tmux session name (optional)
+        snapshot: Existing WindowSnapshot to look in (taken if not given)
 
     Returns:
-        Window object or None
+        Window dict (see WindowSnapshot) or None
     """
-    session = find_session(session_name)
-    if not session:
-        return None
-
-    for window in session.windows:
-        if window.window_id == window_id:
-            return window
+    if snapshot is None:
+        snapshot = snapshot_windows()
 
-    return None
+    window = snapshot.by_id.get(window_id)
+    if window and session_name and window['session'] != session_name:
+        return None
+    return window
 
 
 def has_active_processes(window_id: str) -> bool:
@@ -147,13 +224,124 @@ def has_active_processes(window_id: str) -> bool:
         return False
 
 
+def process_children() -> Dict[int, List[int]]:
+    """
+    Build a parent PID -> child PIDs map for every process on the system.
+
+    Reads /proc once on Linux; elsewhere (macOS) falls back to a single
+    `ps -A -o pid= -o ppid=` call.
+    """
+    import subprocess
+
+    children: Dict[int, List[int]] = {}
+    if os.path.isdir('/proc/self'):
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat', 'rb') as f:
+                    stat = f.read()
+            except OSError:
+                # Process exited while walking
+                continue
+            # Fields after "(comm)" start with state, then ppid
+            fields = stat[stat.rfind(b')') + 2:].split()
+            if len(fields) > 1:
+                children.setdefault(int(fields[1]), []).append(int(entry))
+        return children
+
+    try:
+        result = subprocess.run(
+            ['ps', '-A', '-o', 'pid=', '-o', 'ppid='],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except (OSError, subprocess.SubprocessError):
+        return children
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            children.setdefault(int(parts[1]), []).append(int(parts[0]))
+    return children
+
+
+def pane_pids_by_window() -> Dict[str, List[int]]:
+    """Map every tmux window ID to its pane PIDs (one `tmux list-panes -a` call)."""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['tmux', 'list-panes', '-a', '-F', '#{window_id}\t#{pane_pid}'],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    panes: Dict[str, List[int]] = {}
+    for line in result.stdout.splitlines():
+        window_id, _, pid = line.partition('\t')
+        if pid.isdigit():
+            panes.setdefault(window_id, []).append(int(pid))
+    return panes
+
+
+def windows_with_active_processes(window_ids: Iterable[str] = None) -> Set[str]:
+    """
+    Batched has_active_processes(): which windows still have live child processes.
+
+    Answers for all windows at once with one `tmux list-panes -a` and one
+    process-table walk, instead of a list-panes + pgrep pair per window.
+
+    Args:
+        window_ids: Windows to check (default: every tmux window)
+
+    Returns:
+        Set of window IDs whose panes have running child processes
+    """
+    panes = pane_pids_by_window()
+    if not panes:
+        return set()
+    wanted = set(window_ids) if window_ids is not None else set(panes)
+    children = process_children()
+    return {
+        window_id for window_id in wanted
+        if any(children.get(pid) for pid in panes.get(window_id, ()))
+    }
+
+
+def wait_for_idle_windows(window_ids: Iterable[str], wait_seconds: float = 5,
+                          poll_interval: float = 0.5) -> Set[str]:
+    """
+    Poll (one batched probe per tick) until the windows have no live processes.
+
+    Returns:
+        Window IDs that still have active processes when the wait ends
+    """
+    import time
+
+    busy = windows_with_active_processes(window_ids)
+    deadline = time.monotonic() + wait_seconds
+    while busy and time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        busy = windows_with_active_processes(busy)
+    return busy
+
+
 def graceful_shutdown_window(window_id: str, wait_seconds: int = 5) -> bool:
     """
     Attempt graceful shutdown of tmux window by sending Ctrl+C and waiting.
 
+    Polls every 0.5s and returns as soon as the processes are gone, instead
+    of always sleeping the full wait.
+
     Args:
         window_id: Tmux window ID (e.g., '@123')
-        wait_seconds: How long to wait for processes to terminate (default: 5)
+        wait_seconds: Maximum time to wait for processes to terminate (default: 5)
 
     Returns:
         True if shutdown successful (no processes remain), False if processes still active
@@ -173,8 +361,12 @@ def graceful_shutdown_window(window_id: str, wait_seconds: int = 5) -> bool:
             stderr=subprocess.DEVNULL
         )
 
-        # Wait for processes to terminate
-        time.sleep(wait_seconds)
+        # Poll for process termination instead of a fixed sleep
+        deadline = time.monotonic() + wait_seconds
+        while time.monotonic() < deadline:
+            time.sleep(0.5)
+            if not has_active_processes(window_id):
+                return True
 
         # Check if processes are gone
         return not has_active_processes(window_id)
@@ -182,3 +374,110 @@ def graceful_shutdown_window(window_id: str, wait_seconds: int = 5) -> bool:
     except Exception:
         # If error occurs, return False (processes may still be active)
         return False
+
+
+# Human-readable shutdown_windows() outcomes
+SHUTDOWN_OUTCOMES = {
+    'closed': 'window already closed',
+    'idle': 'no running processes',
+    'interrupted': 'stopped by Ctrl+C',
+    'exited': 'stopped by /exit',
+    'killed': 'force-killed',
+    'busy': 'still running',
+    'failed': 'could not kill window',
+}
+
+
+def _tmux_each(commands: Dict[str, List[str]], max_workers: int = 8) -> Dict[str, int]:
+    """Run one tmux command per window on a bounded thread pool.
+
+    Returns:
+        Return code per window ID (-1 if the command could not be run)
+    """
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    def run(args: List[str]) -> int:
+        try:
+            return subprocess.run(args, check=False, stderr=subprocess.DEVNULL).returncode
+        except Exception:
+            return -1
+
+    if not commands:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(commands)))) as pool:
+        codes = pool.map(run, commands.values())
+        return dict(zip(commands, codes))
+
+
+def shutdown_windows(window_ids: Iterable[str], graceful_wait: float = 30,
+                     exit_wait: float = 30, kill: bool = True,
+                     snapshot: WindowSnapshot = None, max_workers: int = 8,
+                     poll_interval: float = 0.5) -> Dict[str, str]:
+    """
+    Run the shutdown cascade for many windows at once.
+
+    Each stage is applied to every window still running processes, with the
+    tmux commands fanned out over a bounded thread pool and a single batched
+    liveness probe per poll tick shared by all windows:
+
+    1. Ctrl+C, then wait up to graceful_wait seconds
+    2. /exit, then wait up to exit_wait seconds
+    3. kill-window (if kill), for every window - idle ones included
+
+    A session is given a fresh 'main' window before its last windows are
+    killed, so it survives the cleanup.
+
+    Args:
+        window_ids: Tmux window IDs (e.g., '@123')
+        graceful_wait: Maximum wait after Ctrl+C
+        exit_wait: Maximum wait after /exit
+        kill: Kill the windows at the end of the cascade
+        snapshot: Window snapshot to resolve windows from (taken if not given)
+        max_workers: Concurrent tmux commands
+        poll_interval: Seconds between liveness probes
+
+    Returns:
+        Outcome per window ID: 'closed' (window already gone), 'idle' (no
+        processes were running), 'interrupted' (stopped by Ctrl+C), 'exited'
+        (stopped by /exit), 'killed' (force-killed while still running),
+        'busy' (still running, kill=False) or 'failed' (kill-window failed)
+    """
+    window_ids = list(dict.fromkeys(w for w in window_ids if w))
+    if snapshot is None:
+        snapshot = snapshot_windows()
+
+    outcomes = {w: 'closed' for w in window_ids if w not in snapshot.by_id}
+    open_windows = [w for w in window_ids if w in snapshot.by_id]
+    if not open_windows:
+        return outcomes
+
+    busy = windows_with_active_processes(open_windows)
+    outcomes.update({w: 'idle' for w in open_windows if w not in busy})
+
+    stages = (
+        ('interrupted', ['C-c'], graceful_wait),
+        ('exited', ['/exit', 'Enter'], exit_wait),
+    )
+    for outcome, keys, wait_seconds in stages:
+        if not busy:
+            break
+        _tmux_each({w: ['tmux', 'send-keys', '-t', w] + keys for w in busy}, max_workers)
+        still_busy = wait_for_idle_windows(busy, wait_seconds, poll_interval)
+        outcomes.update({w: outcome for w in busy - still_busy})
+        busy = still_busy
+
+    if not kill:
+        outcomes.update({w: 'busy' for w in busy})
+        return outcomes
+
+    # Keep sessions alive: add a placeholder window where we kill them all
+    killing = set(open_windows)
+    for session in {snapshot.by_id[w]['session'] for w in open_windows}:
+        if all(w['id'] in killing for w in snapshot.windows_in(session)):
+            _tmux_each({session: ['tmux', 'new-window', '-d', '-t', session, '-n', 'main']})
+
+    codes = _tmux_each({w: ['tmux', 'kill-window', '-t', w] for w in open_windows}, max_workers)
+    for window_id in busy:
+        outcomes[window_id] = 'killed' if codes.get(window_id) == 0 else 'failed'
+    return outcomes
@@ -17,6 +17,9 @@ from dataclasses import dataclass, field
 import re
 import subprocess
 
+from orch.artifact_index import INVESTIGATION_ROOTS, ArtifactEntry, ArtifactIndex
+from orch.frontmatter import memoize_by_stat
+
 
 @dataclass
 class VerificationResult:
@@ -83,17 +86,9 @@ def _check_deliverable_exists(
                 primary_path = (project_dir / primary_path).resolve()
             return primary_path.exists()
 
-        # Check .kb/ first (new location), then .orch/ (legacy fallback)
-        for base_dir in [".kb", ".orch"]:
-            investigations_dir = project_dir / base_dir / "investigations"
-            if investigations_dir.exists():
-                # Search recursively in investigation subdirectories
-                pattern = f"**/{workspace_name}.md"
-                matching_files = list(investigations_dir.glob(pattern))
-                if matching_files:
-                    return True
-
-        return False
+        # Search .kb/ (new location) and .orch/ (legacy fallback), including subdirectories
+        index = ArtifactIndex.for_project(project_dir)
+        return bool(index.find(workspace_name, INVESTIGATION_ROOTS))
 
     # Skip workspace deliverable check - beads is now source of truth
     # WORKSPACE.md is no longer created (see investigation 2025-12-05-investigate-where-workspace-files-still.md)
@@ -395,48 +390,35 @@ def _search_investigation_file(workspace_name: str, project_dir: Path) -> Option
     # Get today's date prefix
     today = date.today().strftime('%Y-%m-%d')
 
-    # Search patterns to try
-    search_dirs = [
-        project_dir / ".kb" / "investigations",
-        project_dir / ".orch" / "investigations",
-    ]
+    index = ArtifactIndex.for_project(project_dir)
 
-    for base_dir in search_dirs:
-        if not base_dir.exists():
-            continue
+    def most_recent(entries: List[ArtifactEntry]) -> Optional[Path]:
+        if not entries:
+            return None
+        return max(entries, key=lambda e: e.mtime).path
 
-        # Try exact workspace name match first
-        for pattern in [
-            f"**/*{workspace_name}*.md",
-            f"**/{today}-*{workspace_name}*.md",
-            f"*{workspace_name}*.md",
-            f"{today}-*{workspace_name}*.md",
-        ]:
-            matches = list(base_dir.glob(pattern))
-            if matches:
-                # Return most recently modified
-                return sorted(matches, key=lambda p: p.stat().st_mtime, reverse=True)[0]
+    # Check .kb/ first (new location), then .orch/ (legacy fallback)
+    for root in INVESTIGATION_ROOTS:
+        # Try exact workspace name match first (anywhere under the root)
+        found = most_recent(index.find_containing(workspace_name, [root]))
+        if found:
+            return found
 
         # Try without date suffix (e.g., "task-name-09dec" -> "task-name")
         if '-' in workspace_name:
             # Remove date suffix like "-09dec"
             parts = workspace_name.rsplit('-', 1)
             if len(parts[1]) <= 5:  # Likely a date suffix
-                base_name = parts[0]
-                for pattern in [
-                    f"**/*{base_name}*.md",
-                    f"*{base_name}*.md",
-                ]:
-                    matches = list(base_dir.glob(pattern))
-                    if matches:
-                        return sorted(matches, key=lambda p: p.stat().st_mtime, reverse=True)[0]
+                found = most_recent(index.find_containing(parts[0], [root]))
+                if found:
+                    return found
 
         # Try keyword-based search for prefix mismatches (e.g., debug- vs inv-)
         # Extract keywords, ignoring common prefixes and date suffixes
         keywords = _extract_keywords_from_workspace(workspace_name)
         if len(keywords) >= 2:
             # Try searching today's files with multiple keyword matches
-            result = _search_by_keywords(base_dir, today, keywords)
+            result = _search_by_keywords(index.entries([root]), today, keywords)
             if result:
                 return result
 
@@ -482,7 +464,7 @@ def _extract_keywords_from_workspace(workspace_name: str) -> List[str]:
 
 
 def _search_by_keywords(
-    base_dir: Path,
+    candidates: List[ArtifactEntry],
     date_prefix: str,
     keywords: List[str]
 ) -> Optional[Path]:
@@ -492,7 +474,7 @@ def _search_by_keywords(
     Finds files from today that contain at least 2 keywords.
 
     Args:
-        base_dir: Directory to search
+        candidates: Indexed investigation files to search
         date_prefix: Date prefix (YYYY-MM-DD)
         keywords: Keywords to match
 
@@ -500,18 +482,18 @@ def _search_by_keywords(
         Best matching file path, or None
     """
     # Get all today's files
-    all_today_files = list(base_dir.glob(f"**/{date_prefix}*.md"))
+    all_today_files = [entry for entry in candidates if entry.name.startswith(date_prefix)]
 
     if not all_today_files:
         return None
 
     # Score files by keyword matches
     scored_files = []
-    for file_path in all_today_files:
-        file_name_lower = file_path.stem.lower()
+    for entry in all_today_files:
+        file_name_lower = entry.name.lower()
         matches = sum(1 for kw in keywords if kw in file_name_lower)
         if matches >= 2:  # Require at least 2 keyword matches
-            scored_files.append((matches, file_path.stat().st_mtime, file_path))
+            scored_files.append((matches, entry.mtime, entry.path))
 
     if not scored_files:
         return None
@@ -521,8 +503,9 @@ def _search_by_keywords(
     return scored_files[0][2]
 
 
+@memoize_by_stat
 def _extract_investigation_phase(path: Path) -> Optional[str]:
-    """Extract Phase value from an investigation file.
+    """Extract Phase value from an investigation file (memoized on mtime and size).
 
     Supports multiple investigation file formats:
     - **Phase:** value (kb-cli template)
@@ -53,6 +53,7 @@ class DaemonConfig:
     dry_run: bool = False
     verbose: bool = False
     use_focus: bool = True  # Enable focus-based prioritization
+    tmux_control: bool = False  # Reconcile from a tmux control-mode connection
 
 
 @dataclass
@@ -368,6 +369,8 @@ def run_daemon(config: DaemonConfig) -> None:
     print(f"  Dry run: {config.dry_run}")
     print()
 
+    control = _start_tmux_control() if config.tmux_control else None
+
     try:
         while True:
             timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
@@ -386,6 +389,29 @@ def run_daemon(config: DaemonConfig) -> None:
 
     except KeyboardInterrupt:
         print("\nDaemon stopped")
+    finally:
+        if control:
+            control.close()
+
+
+def _start_tmux_control():
+    """Open a tmux control-mode client that completes agents as their windows close.
+
+    Keeps the active-agent count (and so spawn slots) current between polls
+    without rescanning tmux. Returns None if tmux isn't reachable.
+    """
+    from orch.tmux_control import TmuxControlClient, TmuxControlError, WindowCloseReconciler
+
+    client = TmuxControlClient()
+    try:
+        client.start()
+    except TmuxControlError as e:
+        print(f"  tmux control mode unavailable: {e}")
+        return None
+
+    WindowCloseReconciler(client).start()
+    print(f"  tmux control mode: attached to {client.session_name}")
+    return client
 
 
 def run_once(config: DaemonConfig) -> dict:
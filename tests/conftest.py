@@ -376,3 +376,62 @@ def reset_config_cache():
     config._CONFIG_CACHE = None
     yield
     config._CONFIG_CACHE = None
+
+
+# =============================================================================
+# BEADS FIXTURES
+# =============================================================================
+
+@pytest.fixture(autouse=True)
+def isolated_beads_query_cache(tmp_path, monkeypatch):
+    """Keep bd query caches in the test's tmp dir, never in ~/.orch/cache."""
+    from orch import beads_cache
+    from orch.beads_integration import clear_timelines
+    monkeypatch.setattr(beads_cache, 'cache_dir', lambda: tmp_path / 'beads-cache')
+    beads_cache.clear_loaded_caches()
+    clear_timelines()
+    yield
+    beads_cache.clear_loaded_caches()
+    clear_timelines()
+
+
+@pytest.fixture(autouse=True)
+def no_status_daemon(tmp_path, monkeypatch):
+    """Never read status from an `orch statusd` running on the developer's machine."""
+    from orch import status_daemon
+    monkeypatch.setattr(status_daemon, 'socket_path', lambda: tmp_path / 'statusd.sock')
+
+
+@pytest.fixture(autouse=True)
+def isolated_status_cache(tmp_path, monkeypatch):
+    """Keep the agent status cache in the test's tmp dir, never in ~/.orch/cache."""
+    from orch import status_cache
+    monkeypatch.setattr(status_cache, 'cache_path', lambda: tmp_path / 'status-cache.json')
+
+
+@pytest.fixture(autouse=True)
+def isolated_transcripts(tmp_path, monkeypatch):
+    """Read agent transcripts from the test's tmp dir, never from ~/.claude/projects."""
+    from orch import context
+    monkeypatch.setattr(context, 'claude_projects_dir', lambda: tmp_path / 'claude-projects')
+    monkeypatch.setattr(context, 'transcript_state_path', lambda: tmp_path / 'transcripts.json')
+    context.clear_transcript_state()
+
+
+@pytest.fixture(autouse=True)
+def isolated_artifact_index(tmp_path, monkeypatch):
+    """Keep artifact indexes in the test's tmp dir and never share them across tests."""
+    from orch import artifact_index
+    monkeypatch.setattr(artifact_index, 'cache_dir', lambda: tmp_path / 'artifact-index')
+    artifact_index.clear_loaded_indexes()
+    yield
+    artifact_index.clear_loaded_indexes()
+
+
+@pytest.fixture(autouse=True)
+def fresh_file_caches():
+    """Start every test without memoized artifact parses."""
+    from orch.frontmatter import clear_file_caches
+    clear_file_caches()
+    yield
+    clear_file_caches()
@@ -0,0 +1,58 @@
+-- Subset of the beads SQLite schema read by orch.beads_reader
+CREATE TABLE issues (
+    id TEXT PRIMARY KEY,
+    content_hash TEXT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    design TEXT NOT NULL DEFAULT '',
+    acceptance_criteria TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'open',
+    priority INTEGER NOT NULL DEFAULT 2,
+    issue_type TEXT NOT NULL DEFAULT 'task',
+    assignee TEXT,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    closed_at DATETIME
+);
+
+CREATE TABLE dependencies (
+    issue_id TEXT NOT NULL,
+    depends_on_id TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT 'blocks',
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_by TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (issue_id, depends_on_id)
+);
+
+CREATE TABLE labels (
+    issue_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (issue_id, label)
+);
+
+CREATE TABLE comments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    issue_id TEXT NOT NULL,
+    author TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO issues (id, title, description, status, priority, issue_type, created_at) VALUES
+    ('proj-1', 'Parent epic', 'Epic description', 'open', 1, 'epic', '2025-12-01T10:00:00Z'),
+    ('proj-2', 'First child', '', 'closed', 2, 'task', '2025-12-01T11:00:00Z'),
+    ('proj-3', 'Second child', '', 'in_progress', 2, 'task', '2025-12-01T12:00:00Z');
+
+INSERT INTO dependencies (issue_id, depends_on_id, type) VALUES
+    ('proj-2', 'proj-1', 'parent-child'),
+    ('proj-3', 'proj-1', 'parent-child');
+
+INSERT INTO labels (issue_id, label) VALUES
+    ('proj-1', 'P1'),
+    ('proj-1', 'target:orch-cli');
+
+INSERT INTO comments (issue_id, author, text, created_at) VALUES
+    ('proj-3', 'agent', 'Phase: Planning', '2025-12-01T12:05:00Z'),
+    ('proj-3', 'agent', 'investigation_path: /tmp/inv.md', '2025-12-01T12:06:00Z'),
+    ('proj-3', 'agent', 'Phase: Implementing - wiring it up', '2025-12-01T12:10:00Z');
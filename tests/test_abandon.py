@@ -1,7 +1,7 @@
 """Tests for orch abandon command."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 
 class TestAbandonCommand:
@@ -25,7 +25,7 @@ class TestAbandonCommand:
              patch('orch.cli.OrchLogger'), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.find.return_value = mock_agent
             mock_registry.abandon_agent.return_value = True
             MockRegistry.return_value = mock_registry
@@ -55,7 +55,7 @@ class TestAbandonCommand:
              patch('orch.cli.OrchLogger'), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.find.return_value = mock_agent
             mock_registry.abandon_agent.return_value = True
             MockRegistry.return_value = mock_registry
@@ -89,7 +89,7 @@ class TestAbandonCommand:
              patch('orch.cli.OrchLogger'), \
              patch('orch.cli.sys') as mock_sys:
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.find.return_value = mock_agent
             MockRegistry.return_value = mock_registry
             # Make sys.stdin.isatty() return True to simulate interactive terminal
@@ -124,7 +124,7 @@ class TestAbandonCommand:
              patch('subprocess.run'), \
              patch('orch.cli.sys') as mock_sys:
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.find.return_value = mock_agent
             mock_registry.abandon_agent.return_value = True
             MockRegistry.return_value = mock_registry
@@ -156,7 +156,7 @@ class TestAbandonCommand:
              patch('orch.cli.OrchLogger'), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.find.return_value = mock_agent
             mock_registry.abandon_agent.return_value = True
             MockRegistry.return_value = mock_registry
@@ -0,0 +1,147 @@
+"""Tests for the per-project artifact index."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from orch import artifact_index
+from orch.artifact_index import INVESTIGATION_ROOTS, ArtifactIndex
+
+
+def _age(path, seconds=60):
+    """Backdate path so it is outside the index's racy window."""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def _write(path, content="**Phase:** Investigating\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "project"
+    _write(project / ".kb" / "investigations" / "simple" / "2026-01-01-inv-cache-status.md")
+    _write(project / ".orch" / "investigations" / "2026-01-02-inv-cache-status-legacy.md")
+    _write(project / ".orch" / "decisions" / "2026-01-03-use-sqlite.md")
+    _write(project / ".orch" / "investigations" / "notes.txt")
+    for root, dirs, files in os.walk(project):
+        for name in dirs + files:
+            _age(os.path.join(root, name))
+    return project
+
+
+class TestLookups:
+    def test_find_exact_name(self, project):
+        index = ArtifactIndex.for_project(project)
+
+        [entry] = index.find("2026-01-01-inv-cache-status", INVESTIGATION_ROOTS)
+
+        assert entry.root == ".kb/investigations"
+        assert entry.depth == 1
+        assert entry.path == project / ".kb/investigations/simple/2026-01-01-inv-cache-status.md"
+
+    def test_find_containing_orders_by_root(self, project):
+        index = ArtifactIndex.for_project(project)
+
+        matches = index.find_containing("inv-cache-status", INVESTIGATION_ROOTS)
+
+        assert [m.name for m in matches] == [
+            "2026-01-01-inv-cache-status",
+            "2026-01-02-inv-cache-status-legacy",
+        ]
+
+    def test_find_containing_partial_tokens(self, project):
+        index = ArtifactIndex.for_project(project)
+
+        assert [m.name for m in index.find_containing("v-cache-sta")] == [
+            "2026-01-01-inv-cache-status",
+            "2026-01-02-inv-cache-status-legacy",
+        ]
+        assert index.find_containing("cache-sqlite") == []
+
+    def test_roots_filter(self, project):
+        index = ArtifactIndex.for_project(project)
+
+        assert [e.name for e in index.entries([".orch/decisions"])] == ["2026-01-03-use-sqlite"]
+        assert index.find("2026-01-03-use-sqlite", INVESTIGATION_ROOTS) == []
+
+    def test_only_markdown_indexed(self, project):
+        names = [e.name for e in ArtifactIndex.for_project(project).entries()]
+
+        assert "notes" not in names
+
+
+class TestRefresh:
+    def test_new_file_visible(self, project):
+        index = ArtifactIndex.for_project(project)
+        _write(project / ".kb" / "investigations" / "simple" / "2026-01-04-inv-new.md")
+
+        assert ArtifactIndex.for_project(project) is index
+        assert index.find("2026-01-04-inv-new")
+
+    def test_removed_file_dropped(self, project):
+        index = ArtifactIndex.for_project(project)
+        (project / ".orch" / "decisions" / "2026-01-03-use-sqlite.md").unlink()
+
+        assert index.find("2026-01-03-use-sqlite") == []
+
+    def test_unchanged_directories_not_listed(self, project):
+        ArtifactIndex.for_project(project)
+        artifact_index.clear_loaded_indexes()
+
+        with patch.object(ArtifactIndex, "_list_dir") as list_dir:
+            index = ArtifactIndex.for_project(project)
+
+        list_dir.assert_not_called()
+        assert index.find("2026-01-03-use-sqlite")
+
+    def test_recently_modified_directory_relisted(self, project):
+        index = ArtifactIndex.for_project(project)
+        os.utime(project / ".orch" / "decisions")
+
+        with patch.object(ArtifactIndex, "_list_dir", wraps=index._list_dir) as list_dir:
+            index.refresh()
+            index.refresh()
+
+        assert list_dir.call_count == 2
+        assert index.find("2026-01-03-use-sqlite")
+
+
+class TestPhase:
+    def test_phase_reextracted_only_when_file_changes(self, project):
+        index = ArtifactIndex.for_project(project)
+        [entry] = index.find("2026-01-01-inv-cache-status")
+
+        with patch("orch.monitor.extract_phase_from_file", return_value="Investigating") as extract:
+            assert index.phase(entry) == "Investigating"
+            assert index.phase(entry) == "Investigating"
+            assert extract.call_count == 1
+
+            _write(entry.path, "**Phase:** Complete\n")
+            _age(entry.path, seconds=30)
+            extract.return_value = "Complete"
+
+            assert index.phase(entry) == "Complete"
+            assert extract.call_count == 2
+
+    def test_phases_saved_once_per_pass(self, project):
+        index = ArtifactIndex.for_project(project)
+        entries = index.find_containing("inv-cache-status")
+
+        with patch.object(ArtifactIndex, "save", wraps=index.save) as save:
+            for entry in entries:
+                index.phase(entry)
+            save.assert_not_called()
+            artifact_index.save_loaded_indexes()
+
+        assert save.call_count == 1
+        artifact_index.clear_loaded_indexes()
+        reloaded = ArtifactIndex.for_project(project)
+        with patch("orch.monitor.extract_phase_from_file") as extract:
+            assert [reloaded.phase(e) for e in entries] == ["Investigating", "Investigating"]
+        extract.assert_not_called()
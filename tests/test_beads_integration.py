@@ -1,13 +1,19 @@
 """Tests for beads integration module."""
 
 import json
+import os
 import pytest
 from unittest.mock import patch, MagicMock
 import subprocess
+import time
 
+from orch.beads_cache import clear_loaded_caches
 from orch.beads_integration import (
+    COMMENTS_MAX_WORKERS,
+    BeadsBatch,
     BeadsIssue,
     BeadsIntegration,
+    IssueTimeline,
     BeadsCLINotFoundError,
     BeadsIssueNotFoundError,
 )
@@ -1095,12 +1101,17 @@ class TestBeadsIntegrationListActiveAgents:
             },
         ])
 
+        # Comments are fetched concurrently, so answer by issue ID
+        outputs = {
+            "--status=in_progress": mock_issues,
+            "orch-cli-abc": mock_comments_1,
+            "orch-cli-def": mock_comments_2,
+        }
+
         with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout=mock_issues, stderr=""),
-                MagicMock(returncode=0, stdout=mock_comments_1, stderr=""),
-                MagicMock(returncode=0, stdout=mock_comments_2, stderr=""),
-            ]
+            mock_run.side_effect = lambda cmd, **kwargs: MagicMock(
+                returncode=0, stdout=outputs[cmd[2]], stderr=""
+            )
 
             beads = BeadsIntegration()
             agents = beads.list_active_agents()
@@ -1135,6 +1146,39 @@ class TestBeadsIntegrationListActiveAgents:
 
             assert agents == []
 
+    def test_list_active_agents_fetches_comments_concurrently(self):
+        """Metadata fetches overlap, and a hung issue is listed without metadata."""
+        import threading
+        import time
+
+        issues = [{"id": f"i-{n}", "title": f"T{n}", "status": "in_progress"} for n in range(16)]
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def run(cmd, **kwargs):
+            if cmd[1] == "list":
+                return MagicMock(returncode=0, stdout=json.dumps(issues), stderr="")
+            assert kwargs["timeout"] == 5
+            if cmd[2] == "i-0":
+                raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+            with lock:
+                active.append(cmd[2])
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(cmd[2])
+            metadata = json.dumps({"agent_id": f"ws-{cmd[2]}"})
+            return MagicMock(returncode=0, stdout=json.dumps([{"text": f"agent_metadata: {metadata}"}]), stderr="")
+
+        with patch('subprocess.run', side_effect=run):
+            agents = BeadsIntegration().list_active_agents(timeout=5)
+
+        assert [a["beads_id"] for a in agents] == [i["id"] for i in issues]
+        assert "agent_id" not in agents[0]
+        assert agents[5]["agent_id"] == "ws-i-5"
+        assert 1 < max(peak) <= COMMENTS_MAX_WORKERS
+
     def test_list_active_agents_cli_not_found(self):
         """Test error when bd CLI is not installed."""
         with patch('subprocess.run') as mock_run:
@@ -2342,3 +2386,244 @@ class TestBeadsIntegrationGetStaleIssues:
             cmd = call_args[0][0]
             assert "--db" in cmd
             assert "/other/repo/.beads/beads.db" in cmd
+
+
+class TestBeadsIntegrationBatch:
+    """Tests for get_many()/comments_many() and BeadsBatch."""
+
+    def _run(self, show=None, comments=None, show_rc=0):
+        """subprocess.run stand-in answering `bd show` and `bd comments`."""
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            if "show" in cmd:
+                return MagicMock(returncode=show_rc, stdout=json.dumps(show or []), stderr="")
+            issue_id = cmd[cmd.index("comments") + 1]
+            if comments is None or issue_id not in comments:
+                return MagicMock(returncode=1, stdout="", stderr="not found")
+            return MagicMock(returncode=0, stdout=json.dumps(comments[issue_id]), stderr="")
+
+        return run, calls
+
+    def test_get_many_uses_one_show_call(self):
+        run, calls = self._run(show=[
+            {"id": "a", "title": "A", "status": "open", "priority": 1},
+            {"id": "b", "title": "B", "status": "open", "priority": 2,
+             "dependents": [{"id": "c", "status": "closed", "dependency_type": "parent-child"}]},
+        ])
+        with patch('subprocess.run', side_effect=run):
+            issues = BeadsIntegration(db_path="/x/beads.db").get_many(["a", "b", "a", None])
+
+        assert calls == [["bd", "--db", "/x/beads.db", "show", "a", "b", "--json"]]
+        assert issues["a"].title == "A"
+        assert issues["b"].dependents[0].status == "closed"
+
+    def test_get_many_falls_back_when_batch_fails(self):
+        def run(cmd, **kwargs):
+            if cmd[2:] == ["a", "missing", "--json"]:
+                return MagicMock(returncode=1, stdout="", stderr="missing not found")
+            if cmd[2] == "a":
+                return MagicMock(returncode=0, stdout=json.dumps([{"id": "a", "title": "A"}]), stderr="")
+            return MagicMock(returncode=1, stdout="", stderr="not found")
+
+        with patch('subprocess.run', side_effect=run):
+            issues = BeadsIntegration().get_many(["a", "missing"])
+
+        assert list(issues) == ["a"]
+
+    def test_comments_many_reuses_show_comments(self):
+        run, calls = self._run(
+            show=[{"id": "a", "title": "A", "comments": [{"text": "Phase: Complete"}]},
+                  {"id": "b", "title": "B"}],
+            comments={"b": [{"text": "Phase: Planning"}]},
+        )
+        with patch('subprocess.run', side_effect=run):
+            beads = BeadsIntegration()
+            beads.get_many(["a", "b"])
+            comments = beads.comments_many(["a", "b", "gone"])
+
+        assert comments == {"a": [{"text": "Phase: Complete"}], "b": [{"text": "Phase: Planning"}]}
+        comment_calls = sorted(c[2] for c in calls if "comments" in c)
+        assert comment_calls == ["b", "gone"]
+
+    def test_batch_groups_by_database(self):
+        run, calls = self._run(
+            show=[{"id": "a", "title": "A"}, {"id": "b", "title": "B"}],
+            comments={"a": [{"text": "Phase: Implementing"}], "b": []},
+        )
+        with patch('subprocess.run', side_effect=run):
+            batch = BeadsBatch.fetch([("a", None), ("b", "/other/beads.db"), (None, None)])
+
+        show_calls = [c for c in calls if "show" in c]
+        assert ["bd", "show", "a", "--json"] in show_calls
+        assert ["bd", "--db", "/other/beads.db", "show", "b", "--json"] in show_calls
+        assert batch.phase("a") == "Implementing"
+        assert batch.has_comments("b", "/other/beads.db")
+        assert not batch.has_comments("b")
+
+    def test_batch_empty_without_cli(self):
+        with patch('subprocess.run', side_effect=FileNotFoundError()):
+            batch = BeadsBatch.fetch([("a", None)])
+
+        assert batch.issue("a") is None
+        assert not batch.has_comments("a")
+
+
+class TestBeadsIntegrationQueryCache:
+    """Tests for the on-disk bd query cache keyed by the database's stat."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        db = tmp_path / ".beads" / "beads.db"
+        db.parent.mkdir()
+        db.write_text("sqlite")
+        # Outside the racy window, so results are persisted
+        os.utime(db, ns=(1_000_000_000, 1_000_000_000))
+        return db
+
+    @staticmethod
+    def _run(calls):
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            if "show" in cmd:
+                return MagicMock(returncode=0, stdout=json.dumps([{"id": "a", "title": "A"}]), stderr="")
+            if "comments" in cmd:
+                return MagicMock(returncode=0, stdout=json.dumps([{"text": "Phase: Complete"}]), stderr="")
+            return MagicMock(returncode=0, stdout="", stderr="")
+        return run
+
+    def test_unchanged_db_skips_subprocess(self, db):
+        calls = []
+        with patch('subprocess.run', side_effect=self._run(calls)):
+            BeadsIntegration(db_path=str(db), use_cache=True).get_issue("a")
+            BeadsIntegration(db_path=str(db), use_cache=True).get_phase_from_comments("a")
+            clear_loaded_caches()  # a later orch process reads the cache file
+            beads = BeadsIntegration(db_path=str(db), use_cache=True)
+            assert beads.get_issue("a").title == "A"
+            assert beads.get_phase_from_comments("a") == "Complete"
+
+        assert len(calls) == 2
+
+    def test_db_change_invalidates(self, db):
+        calls = []
+        with patch('subprocess.run', side_effect=self._run(calls)):
+            BeadsIntegration(db_path=str(db), use_cache=True).get_issue("a")
+            os.utime(db, ns=(2_000_000_000, 2_000_000_000))
+            BeadsIntegration(db_path=str(db), use_cache=True).get_issue("a")
+
+        assert len(calls) == 2
+
+    def test_orch_write_invalidates(self, db):
+        calls = []
+        with patch('subprocess.run', side_effect=self._run(calls)):
+            beads = BeadsIntegration(db_path=str(db), use_cache=True)
+            beads.get_many(["a"])
+            beads.add_comment("a", "Phase: Complete")
+            beads.get_many(["a"])
+
+        assert [c[3] for c in calls] == ["show", "comment", "show"]
+
+    def test_disabled_cache_always_runs_bd(self, db):
+        calls = []
+        with patch('subprocess.run', side_effect=self._run(calls)):
+            BeadsIntegration(db_path=str(db), use_cache=False).get_issue("a")
+            BeadsIntegration(db_path=str(db), use_cache=False).get_issue("a")
+
+        assert len(calls) == 2
+
+
+class TestIssueTimeline:
+    """Tests for IssueTimeline - phase, investigation path and metadata from one comments fetch."""
+
+    COMMENTS = [
+        {"id": 1, "text": "agent_metadata: {\"agent_id\": \"ws-1\", \"window_id\": \"@1\"}",
+         "created_at": "2025-12-02T09:00:00Z"},
+        {"id": 2, "text": "Phase: Planning - reading code", "created_at": "2025-12-02T10:00:00Z"},
+        {"id": 3, "text": "investigation_path: /p/.kb/investigations/a.md ", "created_at": "2025-12-02T11:00:00Z"},
+        {"id": 4, "text": "agent_metadata: {not json}", "created_at": "2025-12-02T11:30:00Z"},
+        {"id": 5, "text": "Phase: Complete - done", "created_at": "2025-12-02T12:00:00Z"},
+    ]
+
+    def test_from_comments_single_pass(self):
+        timeline = IssueTimeline.from_comments("test-id", self.COMMENTS)
+
+        assert timeline.phase == "Complete"
+        assert [(p.phase, p.created_at) for p in timeline.phases] == [
+            ("Planning", "2025-12-02T10:00:00Z"),
+            ("Complete", "2025-12-02T12:00:00Z"),
+        ]
+        assert timeline.phases[0].text == "Phase: Planning - reading code"
+        assert timeline.investigation_path == "/p/.kb/investigations/a.md"
+        assert timeline.metadata == {"agent_id": "ws-1", "window_id": "@1"}
+
+    def test_empty_timeline(self):
+        timeline = IssueTimeline.from_comments("test-id", None)
+
+        assert timeline.phase is None
+        assert timeline.investigation_path is None
+        assert timeline.metadata is None
+
+    def test_accessors_share_one_comments_fetch(self):
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(self.COMMENTS), stderr="")
+
+            beads = BeadsIntegration()
+            assert beads.get_phase_from_comments("test-id") == "Complete"
+            assert beads.get_investigation_path_from_comments("test-id") == "/p/.kb/investigations/a.md"
+            assert beads.get_agent_metadata("test-id")["agent_id"] == "ws-1"
+            assert beads.has_phase_complete("test-id")
+
+        assert mock_run.call_count == 1
+
+    def test_write_refreshes_timeline(self):
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(self.COMMENTS), stderr="")
+
+            beads = BeadsIntegration()
+            beads.get_timeline("test-id")
+            beads.add_comment("test-id", "Phase: Complete")
+            beads.get_timeline("test-id")
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["comments", "comment", "comments"]
+
+    def test_instances_share_timeline_for_same_database(self, tmp_path):
+        db = tmp_path / "beads.db"
+        db.write_bytes(b"one")
+        os.utime(db, (time.time() - 60, time.time() - 60))
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(self.COMMENTS), stderr="")
+
+            assert BeadsIntegration(db_path=str(db)).get_timeline("test-id").phase == "Complete"
+            assert BeadsIntegration(db_path=str(db)).get_timeline("test-id").phase == "Complete"
+
+        assert mock_run.call_count == 1
+
+    def test_database_change_refetches_timeline(self, tmp_path):
+        db = tmp_path / "beads.db"
+        db.write_bytes(b"one")
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(self.COMMENTS), stderr="")
+
+            BeadsIntegration(db_path=str(db)).get_timeline("test-id")
+            db.write_bytes(b"three")
+            BeadsIntegration(db_path=str(db)).get_timeline("test-id")
+
+        assert mock_run.call_count == 2
+
+    def test_no_database_timeline_not_shared(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("BEADS_DB", raising=False)
+        monkeypatch.chdir(tmp_path)
+        planning = json.dumps(self.COMMENTS[:2])
+        complete = json.dumps(self.COMMENTS)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=planning, stderr="")
+            beads = BeadsIntegration(use_cache=False, direct_read=False)
+            assert beads.get_phase_from_comments("x-1") == "Planning"
+            assert beads.get_phase_from_comments("x-1") == "Planning"
+
+            mock_run.return_value = MagicMock(returncode=0, stdout=complete, stderr="")
+            fresh = BeadsIntegration(use_cache=False, direct_read=False)
+            assert fresh.get_phase_from_comments("x-1") == "Complete"
+
+        assert mock_run.call_count == 2
@@ -0,0 +1,135 @@
+"""Tests for the read-only direct beads store reader."""
+
+import json
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from orch.beads_integration import BeadsIntegration, BeadsIssueNotFoundError
+from orch.beads_reader import JsonlBeadsReader, SqliteBeadsReader, open_reader
+
+SCHEMA = Path(__file__).parent / "fixtures" / "beads" / "schema.sql"
+
+
+@pytest.fixture
+def beads_db(tmp_path):
+    """A beads database built from the fixture schema (stands in for `bd`)."""
+    db = tmp_path / ".beads" / "beads.db"
+    db.parent.mkdir()
+    conn = sqlite3.connect(db)
+    conn.executescript(SCHEMA.read_text())
+    conn.close()
+    return db
+
+
+def _no_bd(*args, **kwargs):
+    raise AssertionError(f"bd should not run: {args}")
+
+
+class TestSqliteBeadsReader:
+    def test_show_matches_bd_shape(self, beads_db):
+        reader = open_reader(str(beads_db))
+        assert isinstance(reader, SqliteBeadsReader)
+
+        issues = reader.show(["proj-1", "proj-3", "missing"])
+
+        assert set(issues) == {"proj-1", "proj-3"}
+        epic = issues["proj-1"]
+        assert epic["title"] == "Parent epic"
+        assert epic["labels"] == ["P1", "target:orch-cli"]
+        assert [(d["id"], d["status"], d["dependency_type"]) for d in epic["dependents"]] == [
+            ("proj-2", "closed", "parent-child"),
+            ("proj-3", "in_progress", "parent-child"),
+        ]
+        assert issues["proj-3"]["dependencies"][0]["id"] == "proj-1"
+
+    def test_comments_are_chronological(self, beads_db):
+        comments = open_reader(str(beads_db)).comments("proj-3")
+
+        assert [c["text"] for c in comments][0] == "Phase: Planning"
+        assert comments[-1]["text"].startswith("Phase: Implementing")
+        assert open_reader(str(beads_db)).comments("missing") is None
+
+    def test_list_filters_by_status(self, beads_db):
+        issues = open_reader(str(beads_db)).list_issues("in_progress")
+
+        assert [i["id"] for i in issues] == ["proj-3"]
+
+    def test_unrecognized_schema_returns_none(self, tmp_path):
+        db = tmp_path / "beads.db"
+        conn = sqlite3.connect(db)
+        conn.execute("CREATE TABLE issues (id TEXT PRIMARY KEY, summary TEXT)")
+        conn.close()
+
+        assert open_reader(str(db)) is None
+
+    def test_database_is_not_modified(self, beads_db):
+        before = beads_db.read_bytes()
+        reader = open_reader(str(beads_db))
+        reader.show(["proj-1"])
+        reader.list_issues()
+
+        assert beads_db.read_bytes() == before
+
+
+class TestJsonlBeadsReader:
+    def test_reads_jsonl_without_database(self, tmp_path, monkeypatch):
+        beads_dir = tmp_path / ".beads"
+        beads_dir.mkdir()
+        records = [
+            {"id": "p-1", "title": "Parent", "status": "open", "priority": 1},
+            {"id": "p-2", "title": "Child", "status": "closed", "priority": 2,
+             "dependencies": [{"issue_id": "p-2", "depends_on_id": "p-1", "type": "parent-child"}],
+             "comments": [{"id": 1, "issue_id": "p-2", "text": "Phase: Complete"}]},
+        ]
+        (beads_dir / "issues.jsonl").write_text("\n".join(json.dumps(r) for r in records) + "\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("BEADS_DB", raising=False)
+
+        reader = open_reader()
+
+        assert isinstance(reader, JsonlBeadsReader)
+        parent = reader.show(["p-1"])["p-1"]
+        assert parent["dependents"] == [
+            {"id": "p-2", "title": "Child", "status": "closed", "dependency_type": "parent-child"}
+        ]
+        assert reader.comments("p-2")[0]["text"] == "Phase: Complete"
+
+
+class TestBeadsIntegrationDirectRead:
+    def test_hot_reads_bypass_bd(self, beads_db):
+        beads = BeadsIntegration(db_path=str(beads_db), use_cache=False, direct_read=True)
+
+        with patch("subprocess.run", side_effect=_no_bd):
+            assert beads.get_issue("proj-1").title == "Parent epic"
+            assert beads.get_child_convergence("proj-1") == {
+                "total": 2, "closed": 1, "in_progress": 1, "open": 0,
+            }
+            assert beads.get_phase_from_comments("proj-3") == "Implementing"
+            assert set(beads.get_many(["proj-2", "proj-3", "nope"])) == {"proj-2", "proj-3"}
+            assert [i["id"] for i in beads.list_issues("closed")] == ["proj-2"]
+            with pytest.raises(BeadsIssueNotFoundError):
+                beads.get_issue("nope")
+
+    def test_unrecognized_schema_falls_back_to_cli(self, tmp_path):
+        db = tmp_path / "beads.db"
+        sqlite3.connect(db).close()
+        beads = BeadsIntegration(db_path=str(db), use_cache=False, direct_read=True)
+
+        with patch("subprocess.run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = json.dumps([{"id": "x-1", "title": "From bd"}])
+            assert beads.get_issue("x-1").title == "From bd"
+
+        assert run.call_args[0][0][3] == "show"
+
+    def test_writes_still_use_bd(self, beads_db):
+        beads = BeadsIntegration(db_path=str(beads_db), use_cache=False, direct_read=True)
+
+        with patch("subprocess.run") as run:
+            run.return_value.returncode = 0
+            beads.add_comment("proj-3", "Phase: Complete")
+
+        assert run.call_args[0][0] == ["bd", "--db", str(beads_db), "comment", "proj-3", "Phase: Complete"]
@@ -3,7 +3,7 @@ Tests for orch clean functionality.
 """
 
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import MagicMock, Mock, patch, call
 from pathlib import Path
 
 
@@ -32,7 +32,7 @@ class TestCleanCommand:
         }
 
         with patch('orch.cli.AgentRegistry') as MockRegistry:
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed_agent1, mock_completed_agent2]
             mock_registry._agents = [mock_completed_agent1, mock_completed_agent2]
             MockRegistry.return_value = mock_registry
@@ -73,7 +73,7 @@ class TestCleanCommand:
         }
 
         with patch('orch.cli.AgentRegistry') as MockRegistry:
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_active_agent]
             MockRegistry.return_value = mock_registry
 
@@ -96,7 +96,7 @@ class TestCleanCommand:
         }
 
         with patch('orch.cli.AgentRegistry') as MockRegistry:
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed_agent]
             mock_registry._agents = [mock_completed_agent]
             MockRegistry.return_value = mock_registry
@@ -112,6 +112,34 @@ class TestCleanCommand:
         # Verify registry was saved
         mock_registry.save.assert_called_once()
 
+    def test_clean_skips_kill_for_windows_missing_from_snapshot(self, cli_runner):
+        """Test that clean only kills windows the tmux snapshot still lists."""
+        from orch.cli import cli
+        from orch.tmux_utils import WindowSnapshot
+
+        agents = [
+            {'id': 'open-agent', 'window': 'workers:1', 'window_id': '@1', 'status': 'completed'},
+            {'id': 'closed-agent', 'window': 'workers:2', 'window_id': '@2', 'status': 'completed'},
+        ]
+        snapshot = WindowSnapshot([
+            {'session': 'workers', 'id': '@1', 'index': '1', 'name': 'open-agent', 'pane_pid': 101},
+        ])
+
+        with patch('orch.cli.AgentRegistry') as MockRegistry:
+            mock_registry = MagicMock()
+            mock_registry.list_agents.return_value = agents
+            mock_registry._agents = list(agents)
+            MockRegistry.return_value = mock_registry
+
+            with patch('orch.cli.snapshot_windows', return_value=snapshot), \
+                 patch('orch.cli.subprocess.run') as mock_run:
+                result = cli_runner.invoke(cli, ['clean'])
+
+        assert result.exit_code == 0
+        killed = [c[0][0] for c in mock_run.call_args_list if c[0][0][:2] == ['tmux', 'kill-window']]
+        assert killed == [['tmux', 'kill-window', '-t', '@1']]
+        assert mock_registry.remove.call_count == 2
+
     def test_clean_mixed_active_and_completed(self, cli_runner):
         """Test that clean only removes completed agents, not active ones."""
         from orch.cli import cli
@@ -133,7 +161,7 @@ class TestCleanCommand:
         }
 
         with patch('orch.cli.AgentRegistry') as MockRegistry:
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             all_agents = [mock_active_agent, mock_completed_agent]
             mock_registry.list_agents.return_value = all_agents
             mock_registry._agents = all_agents.copy()  # Copy so we can track modifications
@@ -168,7 +196,7 @@ class TestCleanCommand:
         }
 
         with patch('orch.cli.AgentRegistry') as MockRegistry:
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed_agent]
             mock_registry._agents = [mock_completed_agent]
             MockRegistry.return_value = mock_registry
@@ -192,7 +220,7 @@ class TestCleanCommand:
         from orch.cli import cli
 
         with patch('orch.cli.AgentRegistry') as MockRegistry:
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = []
             MockRegistry.return_value = mock_registry
 
@@ -237,7 +265,7 @@ class TestCleanCommand:
         with patch('orch.cli.AgentRegistry') as MockRegistry, \
              patch('orch.monitor.check_agent_status', return_value=mock_status):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_incomplete_agent]
             mock_registry._agents = [mock_incomplete_agent]
             MockRegistry.return_value = mock_registry
@@ -280,7 +308,7 @@ class TestCleanCommand:
              patch('orch.monitor.check_agent_status', return_value=mock_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_complete_agent]
             mock_registry._agents = [mock_complete_agent]
             MockRegistry.return_value = mock_registry
@@ -319,7 +347,7 @@ class TestCleanCommand:
         with patch('orch.cli.AgentRegistry') as MockRegistry, \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_terminated_agent]
             mock_registry._agents = [mock_terminated_agent]
             MockRegistry.return_value = mock_registry
@@ -384,7 +412,7 @@ class TestCleanCommand:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             all_agents = [mock_active_agent, mock_completed_agent]
             mock_registry.list_agents.return_value = all_agents
             mock_registry._agents = all_agents.copy()
@@ -428,7 +456,7 @@ class TestCleanLogging:
         with patch('orch.cli.AgentRegistry') as MockRegistry, \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed1, mock_completed2]
             mock_registry._agents = [mock_completed1, mock_completed2]
             MockRegistry.return_value = mock_registry
@@ -454,7 +482,7 @@ class TestCleanLogging:
              patch('orch.cli.OrchLogger') as MockLogger, \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed]
             mock_registry._agents = [mock_completed]
             MockRegistry.return_value = mock_registry
@@ -486,7 +514,7 @@ class TestCleanLogging:
              patch('orch.cli.OrchLogger') as MockLogger, \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed]
             mock_registry._agents = [mock_completed]
             MockRegistry.return_value = mock_registry
@@ -524,7 +552,7 @@ class TestCleanLogging:
         with patch('orch.cli.AgentRegistry') as MockRegistry, \
              patch('orch.cli.check_agent_status', return_value=mock_status):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_active]
             MockRegistry.return_value = mock_registry
 
@@ -591,7 +619,7 @@ class TestCleanAllFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_active_agent, mock_completed_agent]
             mock_registry._agents = [mock_active_agent, mock_completed_agent]
             MockRegistry.return_value = mock_registry
@@ -632,7 +660,7 @@ class TestCleanAllFlag:
              patch('orch.monitor.check_agent_status', return_value=mock_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_completed_agent]
             mock_registry._agents = [mock_completed_agent]
             MockRegistry.return_value = mock_registry
@@ -663,7 +691,7 @@ class TestCleanAllFlag:
              patch('orch.monitor.check_agent_status', return_value=mock_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_abandoned_agent]
             mock_registry._agents = [mock_abandoned_agent]
             MockRegistry.return_value = mock_registry
@@ -690,7 +718,7 @@ class TestCleanAllFlag:
         with patch('orch.cli.AgentRegistry') as MockRegistry, \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_terminated_agent]
             mock_registry._agents = [mock_terminated_agent]
             MockRegistry.return_value = mock_registry
@@ -733,7 +761,7 @@ class TestCleanStaleFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_stale_agent]
             mock_registry._agents = [mock_stale_agent]
             MockRegistry.return_value = mock_registry
@@ -772,7 +800,7 @@ class TestCleanStaleFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_young_agent]
             mock_registry._agents = [mock_young_agent]
             MockRegistry.return_value = mock_registry
@@ -811,7 +839,7 @@ class TestCleanStaleFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_frozen_agent]
             mock_registry._agents = [mock_frozen_agent]
             MockRegistry.return_value = mock_registry
@@ -850,7 +878,7 @@ class TestCleanStaleFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_young_agent]
             mock_registry._agents = [mock_young_agent]
             MockRegistry.return_value = mock_registry
@@ -889,7 +917,7 @@ class TestCleanStaleFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_stale_agent]
             mock_registry._agents = [mock_stale_agent]
             MockRegistry.return_value = mock_registry
@@ -931,7 +959,7 @@ class TestCleanStaleFlag:
              patch('orch.cli.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_stale_agent]
             mock_registry._agents = [mock_stale_agent]
             MockRegistry.return_value = mock_registry
@@ -974,7 +1002,7 @@ class TestCleanStaleFlag:
              patch('orch.monitor.check_agent_status', side_effect=mock_check_status), \
              patch('subprocess.run'):
 
-            mock_registry = Mock()
+            mock_registry = MagicMock()
             mock_registry.list_agents.return_value = [mock_working_agent]
             mock_registry._agents = [mock_working_agent]
             MockRegistry.return_value = mock_registry
@@ -509,3 +509,63 @@ class TestMain:
                 with pytest.raises(SystemExit) as exc_info:
                     main()
                 assert exc_info.value.code == 1
+
+
+class TestCleanupAgentsAsync:
+    """Tests for the bulk cleanup cascade."""
+
+    def test_one_cascade_and_one_registry_write(self, tmp_path):
+        from orch.cleanup_daemon import cleanup_agents_async
+        from orch.registry import AgentRegistry
+
+        registry_path = tmp_path / "agent-registry.json"
+        registry = AgentRegistry(registry_path)
+        for i in (1, 2, 3):
+            registry.register(agent_id=f"agent-{i}", task="Task", window=f"workers:{i}",
+                              window_id=f"@{i}", project_dir=str(tmp_path), workspace=f".orch/workspace/agent-{i}")
+
+        from orch.registry_storage import JsonRegistryStorage
+
+        outcomes = {'@1': 'interrupted', '@2': 'killed', '@3': 'failed'}
+        with patch('orch.cleanup_daemon.shutdown_windows', return_value=outcomes) as mock_shutdown, \
+             patch.object(JsonRegistryStorage, 'save', autospec=True,
+                          side_effect=JsonRegistryStorage.save) as mock_save:
+            results = cleanup_agents_async(['agent-1', 'agent-2', 'agent-3', 'missing'], registry_path)
+
+        assert results == {'agent-1': 'interrupted', 'agent-2': 'killed',
+                           'agent-3': 'failed', 'missing': 'not-found'}
+        assert list(mock_shutdown.call_args[0][0]) == ['@1', '@2', '@3']
+        assert mock_save.call_count == 1
+
+        registry = AgentRegistry(registry_path)
+        assert registry.find('agent-1')['status'] == 'completed'
+        assert registry.find('agent-2')['status'] == 'completed'
+        assert registry.find('agent-3')['status'] == 'failed'
+
+    def test_agent_without_window_not_shut_down(self, tmp_path):
+        from orch.cleanup_daemon import cleanup_agents_async
+        from orch.registry import AgentRegistry
+
+        registry_path = tmp_path / "agent-registry.json"
+        registry = AgentRegistry(registry_path)
+        registry.register(agent_id="agent-1", task="Task", window="workers:1", window_id="@1",
+                          project_dir=str(tmp_path), workspace=".orch/workspace/agent-1")
+        registry.register(agent_id="headless", task="Task", window="workers:2",
+                          project_dir=str(tmp_path), workspace=".orch/workspace/headless")
+
+        with patch('orch.cleanup_daemon.shutdown_windows', return_value={'@1': 'idle'}) as mock_shutdown:
+            results = cleanup_agents_async(['agent-1', 'headless'], registry_path)
+
+        assert list(mock_shutdown.call_args[0][0]) == ['@1']
+        assert results == {'agent-1': 'idle', 'headless': 'no-window'}
+
+    def test_main_accepts_several_agents(self, tmp_path):
+        registry_path = tmp_path / "registry.json"
+        with patch('sys.argv', ['cleanup_daemon.py', 'a', 'b', str(registry_path)]), \
+             patch('orch.cleanup_daemon.cleanup_agents_async',
+                   return_value={'a': 'idle', 'b': 'failed'}) as mock_bulk:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        mock_bulk.assert_called_once_with(['a', 'b'], registry_path)
+        assert exc_info.value.code == 1
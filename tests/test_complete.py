@@ -458,6 +458,29 @@ class TestProcessChecking:
                     assert 'active processes' in str(exc_info.value).lower()
                     assert 'test-agent' in str(exc_info.value)
 
+    def test_clean_up_agent_uses_batched_probe_result(self):
+        """Test that clean_up_agent trusts busy_windows instead of probing per window."""
+        from orch.complete import clean_up_agent
+
+        mock_agent = {
+            'id': 'test-agent',
+            'window_id': '@123',
+            'status': 'active'
+        }
+        mock_registry = Mock()
+        mock_registry.find.return_value = mock_agent
+
+        with patch('orch.complete.has_active_processes') as mock_has_processes:
+            with patch('orch.complete.graceful_shutdown_window', return_value=False):
+                with patch('orch.complete.send_exit_command', return_value=False):
+                    with pytest.raises(RuntimeError):
+                        clean_up_agent('test-agent', registry=mock_registry, busy_windows={'@123'})
+
+            with patch('subprocess.run', return_value=Mock(returncode=1, stdout='')):
+                clean_up_agent('test-agent', registry=mock_registry, busy_windows=set())
+
+        mock_has_processes.assert_not_called()
+
     def test_clean_up_agent_proceeds_when_no_processes_running(self):
         """Test that clean_up_agent proceeds with cleanup when no active processes."""
         from orch.complete import clean_up_agent
@@ -1529,3 +1552,37 @@ class TestReviewGateEnforcement:
 
         # Should succeed - force bypasses review gate
         assert result['success'] is True
+
+
+class TestCompleteAllShutdown:
+    """`orch complete --all` only shuts down windows of agents that completed."""
+
+    def test_rejected_agent_keeps_its_session(self, cli_runner):
+        from contextlib import nullcontext
+        from orch.cli import cli
+        from orch.monitor import AgentStatus, Scenario
+
+        agents = [
+            {'id': 'agent-ok', 'project_dir': '/tmp/p', 'window_id': '@1'},
+            {'id': 'agent-bad', 'project_dir': '/tmp/p', 'window_id': '@2'},
+        ]
+        registry = Mock()
+        registry.list_agents.return_value = agents
+        registry.transaction.return_value = nullcontext()
+        ready = [AgentStatus(agent_id=a['id'], scenario=Scenario.READY_COMPLETE) for a in agents]
+
+        def complete(agent_id, **kwargs):
+            assert kwargs['close_window'] is False
+            if agent_id == 'agent-ok':
+                return {'success': True, 'errors': []}
+            return {'success': False, 'errors': ['Phase is not Complete']}
+
+        with patch('orch.cli.AgentRegistry', return_value=registry), \
+             patch('orch.monitor.evaluate_agent_statuses', return_value=ready), \
+             patch('orch.complete.complete_agent_work', side_effect=complete), \
+             patch('orch.cli.shutdown_windows', side_effect=[{'@1': 'exited'}, {'@1': 'closed'}]) as shutdown:
+            result = cli_runner.invoke(cli, ['complete', '--all'])
+
+        assert result.exit_code != 0
+        assert [list(c.args[0]) for c in shutdown.call_args_list] == [['@1'], ['@1']]
+        assert 'Completed: 1/2 successful' in result.output
@@ -292,3 +292,41 @@ def test_get_backend_priority_cli_over_config():
             config._CONFIG_CACHE = None
             with patch('pathlib.Path.exists', return_value=False):
                 assert config.get_backend() == 'claude'
+
+
+def test_get_registry_backend_default():
+    """Test get_registry_backend returns 'json' when not configured."""
+    with patch.object(config, 'get_config', return_value=config._defaults()):
+        assert config.get_registry_backend() == 'json'
+
+
+def test_get_registry_backend_sqlite():
+    """Test get_registry_backend honours 'sqlite' and rejects unknown values."""
+    with patch.object(config, 'get_config', return_value={'registry_backend': 'sqlite'}):
+        assert config.get_registry_backend() == 'sqlite'
+    with patch.object(config, 'get_config', return_value={'registry_backend': 'journal'}):
+        assert config.get_registry_backend() == 'journal'
+    with patch.object(config, 'get_config', return_value={'registry_backend': 'sharded'}):
+        assert config.get_registry_backend() == 'sharded'
+    with patch.object(config, 'get_config', return_value={'registry_backend': 'redis'}):
+        assert config.get_registry_backend() == 'json'
+
+
+def test_get_registry_archive_days():
+    """Test get_registry_archive_days default, override and invalid values."""
+    with patch.object(config, 'get_config', return_value=config._defaults()):
+        assert config.get_registry_archive_days() == 7
+    with patch.object(config, 'get_config', return_value={'registry_archive_days': 30}):
+        assert config.get_registry_archive_days() == 30
+    with patch.object(config, 'get_config', return_value={'registry_archive_days': 'soon'}):
+        assert config.get_registry_archive_days() == 7
+
+
+def test_get_pane_log_max_bytes():
+    """Test pane log cap is configured in KB and 0 disables it."""
+    with patch.object(config, 'get_config', return_value={}):
+        assert config.get_pane_log_max_bytes() == 1024 * 1024
+    with patch.object(config, 'get_config', return_value={'pane_log_max_kb': 0}):
+        assert config.get_pane_log_max_bytes() == 0
+    with patch.object(config, 'get_config', return_value={'pane_log_max_kb': 'lots'}):
+        assert config.get_pane_log_max_bytes() == 1024 * 1024
@@ -0,0 +1,216 @@
+"""Tests for context usage read from agent session transcripts."""
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from orch import context
+from orch.context import (
+    find_transcript,
+    get_context_info,
+    read_transcript_context,
+)
+
+
+def _assistant(input_tokens, cache_read=0, output=0, sidechain=False):
+    return {
+        'type': 'assistant',
+        'isSidechain': sidechain,
+        'message': {
+            'role': 'assistant',
+            'usage': {
+                'input_tokens': input_tokens,
+                'cache_creation_input_tokens': 0,
+                'cache_read_input_tokens': cache_read,
+                'output_tokens': output,
+            },
+        },
+    }
+
+
+def _user(text):
+    return {'type': 'user', 'message': {'role': 'user', 'content': text}}
+
+
+def _write(path, records, mode='w'):
+    with open(path, mode) as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+@pytest.fixture
+def agent(tmp_path):
+    project = tmp_path / 'my.project'
+    project.mkdir()
+    return {
+        'id': 'feat-x',
+        'project_dir': str(project),
+        'workspace': str(project / '.orch' / 'workspace' / 'feat-x'),
+        'window': 'workers:3',
+        'spawned_at': '2026-01-01T10:00:00',
+    }
+
+
+@pytest.fixture
+def transcript_dir(agent):
+    directory = context._project_transcript_dir(agent['project_dir'])
+    directory.mkdir(parents=True)
+    return directory
+
+
+@pytest.fixture
+def transcript(transcript_dir):
+    path = transcript_dir / 'session-1.jsonl'
+    _write(path, [
+        _user('Read your spawn context from .orch/workspace/feat-x/SPAWN_CONTEXT.md and begin.'),
+        _assistant(1000, cache_read=20000, output=500),
+    ])
+    return path
+
+
+class TestFindTranscript:
+    def test_directory_name_encodes_project_path(self, agent, transcript_dir):
+        assert '.' not in transcript_dir.name
+        assert transcript_dir.name.endswith('-my-project')
+
+    def test_matches_spawn_prompt_workspace(self, agent, transcript, transcript_dir):
+        _write(transcript_dir / 'other.jsonl', [
+            _user('Read your spawn context from .orch/workspace/feat-y/SPAWN_CONTEXT.md'),
+        ])
+
+        assert find_transcript(agent) == transcript
+
+    def test_ignores_sessions_last_written_before_spawn(self, agent, transcript):
+        old = time.time() - 3600
+        os.utime(transcript, (old, old))
+        agent['spawned_at'] = '2099-01-01T00:00:00'
+
+        assert find_transcript(agent) is None
+
+    def test_uses_session_id(self, agent, transcript_dir):
+        path = transcript_dir / 'abc-123.jsonl'
+        _write(path, [_assistant(10)])
+        agent['session_id'] = 'abc-123'
+
+        assert find_transcript(agent) == path
+
+
+class TestReadTranscriptContext:
+    def test_latest_main_thread_usage(self, agent, transcript):
+        _write(transcript, [_assistant(90000, sidechain=True)], mode='a')
+
+        info = read_transcript_context(agent)
+
+        assert info.tokens_used == 21500
+        assert info.tokens_total == 200000
+        assert info.percentage == pytest.approx(10.75)
+
+    def test_reads_only_appended_lines(self, agent, transcript):
+        read_transcript_context(agent)
+        _write(transcript, [_assistant(2000, cache_read=150000, output=800)], mode='a')
+
+        with patch.object(context, 'find_transcript') as find:
+            info = read_transcript_context(agent)
+
+        find.assert_not_called()
+        assert info.tokens_used == 152800
+        assert not context.transcript_state_path().exists()
+
+        context.save_transcript_state()
+        state = json.loads(context.transcript_state_path().read_text())
+        assert state['feat-x']['offset'] == transcript.stat().st_size
+
+    def test_partial_line_left_for_next_read(self, agent, transcript):
+        read_transcript_context(agent)
+        line = json.dumps(_assistant(5000, cache_read=100000))
+        with open(transcript, 'a') as f:
+            f.write(line[:20])
+
+        assert read_transcript_context(agent).tokens_used == 21500
+
+        with open(transcript, 'a') as f:
+            f.write(line[20:] + '\n')
+
+        assert read_transcript_context(agent).tokens_used == 105000
+
+    def test_large_transcript_reads_tail(self, agent, transcript, monkeypatch):
+        monkeypatch.setattr(context, '_INITIAL_TAIL_BYTES', 200)
+        _write(transcript, [_user('x' * 1000), _assistant(3000, cache_read=40000)], mode='a')
+
+        assert read_transcript_context(agent).tokens_used == 43000
+
+    def test_replaced_transcript_read_from_start(self, agent, transcript):
+        read_transcript_context(agent)
+        transcript.unlink()
+        _write(transcript, [
+            _user('Read your spawn context from .orch/workspace/feat-x/SPAWN_CONTEXT.md'),
+            _assistant(700),
+        ])
+
+        assert read_transcript_context(agent).tokens_used == 700
+
+    def test_no_transcript(self, agent):
+        assert read_transcript_context(agent) is None
+
+
+class TestSaveTranscriptState:
+    def test_keeps_entries_saved_by_other_processes(self, agent, transcript, tmp_path):
+        other = tmp_path / 'other.jsonl'
+        _write(other, [_assistant(10)])
+        read_transcript_context(agent)
+        # Written by another orch process after this one loaded the state
+        context.transcript_state_path().write_text(json.dumps({
+            'other-agent': {'path': str(other), 'inode': other.stat().st_ino, 'offset': 5, 'tokens': 10},
+        }))
+
+        context.save_transcript_state()
+
+        state = json.loads(context.transcript_state_path().read_text())
+        assert sorted(state) == ['feat-x', 'other-agent']
+
+    def test_further_offset_on_disk_wins(self, agent, transcript):
+        read_transcript_context(agent)
+        size = transcript.stat().st_size
+        ahead = {'path': str(transcript), 'inode': transcript.stat().st_ino, 'offset': size + 10, 'tokens': 1}
+        context.transcript_state_path().write_text(json.dumps({'feat-x': ahead}))
+
+        context.save_transcript_state()
+
+        assert json.loads(context.transcript_state_path().read_text())['feat-x'] == ahead
+
+    def test_written_once_per_status_pass(self, agent, transcript, transcript_dir):
+        from orch.monitor import AgentStatus, evaluate_agent_statuses
+
+        second = dict(agent, id='feat-y', workspace=agent['workspace'].replace('feat-x', 'feat-y'))
+        _write(transcript_dir / 'session-2.jsonl', [
+            _user('Read your spawn context from .orch/workspace/feat-y/SPAWN_CONTEXT.md'),
+            _assistant(50),
+        ])
+
+        def check(agent_info, **kwargs):
+            read_transcript_context(agent_info)
+            return AgentStatus(agent_id=agent_info['id'])
+
+        with patch('orch.context.os.replace', wraps=os.replace) as replace:
+            evaluate_agent_statuses([agent, second], check_func=check, check_context=True)
+
+        assert replace.call_count == 1
+        assert sorted(json.loads(context.transcript_state_path().read_text())) == ['feat-x', 'feat-y']
+
+
+class TestGetContextInfo:
+    def test_transcript_avoids_tmux(self, agent, transcript):
+        with patch('orch.context.subprocess.run') as run:
+            info = get_context_info(agent)
+
+        run.assert_not_called()
+        assert info.tokens_used == 21500
+
+    def test_falls_back_to_context_command(self, agent):
+        with patch('orch.context.request_context_command', return_value=None) as request:
+            assert get_context_info(agent) is None
+
+        request.assert_called_once_with(agent, 3.0)
@@ -4,14 +4,20 @@ Tests for frontmatter parsing module.
 TDD approach: These tests are written first, before the implementation.
 They define the expected behavior of the frontmatter parser.
 """
+import os
+import time
 import pytest
 from pathlib import Path
 from typing import Optional
+from unittest.mock import patch
 
 
 # This import will fail until we create the module (TDD RED phase)
+from orch import frontmatter
 from orch.frontmatter import (
     extract_metadata,
+    extract_metadata_from_file,
+    extract_phase_from_file,
     extract_phase,
     extract_status,
     has_frontmatter,
@@ -436,3 +442,64 @@ Previous files used `**Status:** Blocked` format.
         assert result.phase is None
         # Status at start of line should match
         assert result.status == "Active"
+
+
+class TestMemoizedFileExtraction:
+    """Test that file extraction is only repeated when the file changes."""
+
+    @staticmethod
+    def _age(path, seconds=60):
+        then = time.time() - seconds
+        os.utime(path, (then, then))
+
+    def test_unchanged_file_not_reparsed(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Phase:** Investigating\n")
+        self._age(test_file)
+
+        with patch.object(frontmatter, 'extract_metadata', wraps=frontmatter.extract_metadata) as parse:
+            assert frontmatter.extract_phase_from_file(test_file) == "Investigating"
+            assert frontmatter.extract_metadata_from_file(test_file).phase == "Investigating"
+
+        assert parse.call_count == 1
+
+    def test_changed_file_reparsed(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Phase:** Investigating\n")
+        self._age(test_file, seconds=60)
+        assert extract_phase_from_file(test_file) == "Investigating"
+
+        test_file.write_text("**Phase:** Complete\n")
+        self._age(test_file, seconds=30)
+
+        assert extract_phase_from_file(test_file) == "Complete"
+
+    def test_recently_written_file_not_memoized(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("**Phase:** Investigating\n")
+
+        with patch.object(frontmatter, 'extract_metadata', wraps=frontmatter.extract_metadata) as parse:
+            frontmatter.extract_metadata_from_file(test_file)
+            frontmatter.extract_metadata_from_file(test_file)
+
+        assert parse.call_count == 2
+
+    def test_result_copies_are_independent(self, tmp_path):
+        test_file = tmp_path / "test.md"
+        test_file.write_text("---\nphase: Active\ntags: [a]\n---\n")
+        self._age(test_file)
+
+        extract_metadata_from_file(test_file).tags.append("b")
+
+        assert extract_metadata_from_file(test_file).tags == ["a"]
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(frontmatter, 'FILE_CACHE_SIZE', 2)
+        for i in range(4):
+            test_file = tmp_path / f"test-{i}.md"
+            test_file.write_text("**Phase:** Active\n")
+            self._age(test_file)
+            frontmatter.extract_metadata_from_file(test_file)
+
+        cached = [cache for cache, _ in frontmatter._file_caches if cache]
+        assert [len(cache) for cache in cached] == [2]
@@ -10,7 +10,7 @@ Following TDD workflow:
 import pytest
 import subprocess
 from pathlib import Path
-from orch.git_utils import validate_work_committed
+from orch.git_utils import read_git_head, validate_work_committed
 
 
 class TestValidateWorkCommittedWithExclusions:
@@ -282,3 +282,36 @@ class TestValidateWorkCommittedWithExclusions:
         is_valid, message = validate_work_committed(repo_dir, exclude_files=excluded_files)
 
         assert is_valid, f"Nested files inside excluded directory should be excluded. Message: {message}"
+
+
+class TestReadGitHead:
+    """Tests for read_git_head (HEAD resolved without running git)."""
+
+    def _rev_parse(self, directory):
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=directory, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def test_matches_rev_parse_from_subdirectory(self, git_project_dir):
+        subdir = git_project_dir / ".orch" / "workspace"
+
+        assert read_git_head(subdir) == self._rev_parse(git_project_dir)
+
+    def test_follows_packed_refs(self, git_project_dir):
+        subprocess.run(['git', 'pack-refs', '--all'], cwd=git_project_dir, check=True, capture_output=True)
+
+        assert read_git_head(git_project_dir) == self._rev_parse(git_project_dir)
+
+    def test_worktree(self, git_project_dir, tmp_path):
+        worktree = tmp_path / "worktree"
+        subprocess.run(['git', 'worktree', 'add', '-q', '-b', 'feature', str(worktree)],
+                       cwd=git_project_dir, check=True, capture_output=True)
+        (worktree / "new.txt").write_text("x")
+        subprocess.run(['git', 'add', 'new.txt'], cwd=worktree, check=True, capture_output=True)
+        subprocess.run(['git', 'commit', '-m', 'Worktree commit'], cwd=worktree, check=True, capture_output=True)
+
+        assert read_git_head(worktree) == self._rev_parse(worktree)
+        assert read_git_head(worktree) != read_git_head(git_project_dir)
+
+    def test_not_a_repository(self, tmp_path):
+        assert read_git_head(tmp_path) is None
@@ -0,0 +1,144 @@
+"""
+Tests for pipe-pane ring-buffer logs.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+from orch.pane_log import (
+    PaneLogFollower,
+    attach_pane_log,
+    pane_log_path,
+    read_agent_output,
+    read_tail,
+    start_pane_log,
+    strip_ansi,
+    write_stream,
+)
+
+
+class _PipeStream:
+    """Readable stream fed from a pipe, like pipe-pane's stdin."""
+
+    def __init__(self, *chunks):
+        self.read_fd, write_fd = os.pipe()
+        for chunk in chunks:
+            os.write(write_fd, chunk)
+        os.close(write_fd)
+
+    def fileno(self):
+        return self.read_fd
+
+
+class TestWriteStream:
+    """Tests for the pipe-pane writer."""
+
+    def test_strips_ansi_across_chunk_boundaries(self, tmp_path):
+        log_path = tmp_path / "pane.log"
+        write_stream(_PipeStream(b"one\r\n\x1b[3", b"1mtwo\x1b[0m\r", b"\nthree\n"), log_path, 1 << 20)
+
+        assert log_path.read_bytes() == b"one\ntwo\nthree\n"
+
+    def test_rotates_to_stay_under_cap(self, tmp_path):
+        log_path = tmp_path / "pane.log"
+        payload = b"".join(b"line %05d\n" % i for i in range(5000))
+        write_stream(_PipeStream(payload), log_path, 16384)
+
+        rotated = tmp_path / "pane.log.1"
+        assert rotated.exists()
+        assert log_path.stat().st_size + rotated.stat().st_size <= 16384 + 65536
+        assert read_tail(log_path, 2) == "line 04998\nline 04999"
+
+    def test_strip_ansi(self):
+        assert strip_ansi(b"\x1b[1;32mok\x1b[0m\x1b]0;title\x07\x07") == b"ok"
+
+    def test_strip_ansi_breaks_lines_on_cursor_moves(self):
+        redraw = b"\x1b[H\x1b[2J> status\x1b[3;1H\x1b[2KThinking\x1b[1Cabout\x1b[K\x1b[4;1Hdone"
+
+        assert strip_ansi(redraw) == b"\n> status\nThinking about\ndone"
+
+
+class TestReadTail:
+    """Tests for reading recent lines from disk."""
+
+    def test_reads_last_lines_across_segments(self, tmp_path):
+        log_path = tmp_path / "pane.log"
+        (tmp_path / "pane.log.1").write_text("a\nb\nc\n")
+        log_path.write_text("d\ne")
+
+        assert read_tail(log_path, 3) == "c\nd\ne"
+        assert read_tail(log_path, 1) == "e"
+
+    def test_small_block_size(self, tmp_path):
+        log_path = tmp_path / "pane.log"
+        log_path.write_text("".join(f"{i}\n" for i in range(100)))
+
+        assert read_tail(log_path, 2, block_size=3) == "98\n99"
+
+    def test_missing_log(self, tmp_path):
+        assert read_tail(tmp_path / "pane.log") is None
+
+    def test_read_agent_output(self, tmp_path):
+        agent = {'project_dir': str(tmp_path), 'workspace': '.orch/workspace/a'}
+        assert pane_log_path(agent) == tmp_path / '.orch/workspace/a/pane.log'
+        assert read_agent_output(agent) is None
+
+        pane_log_path(agent).parent.mkdir(parents=True)
+        pane_log_path(agent).write_text("hello\n")
+        assert read_agent_output(agent) == "hello"
+
+
+class TestPaneLogFollower:
+    """Tests for incremental reads."""
+
+    def test_returns_only_new_complete_lines(self, tmp_path):
+        log_path = tmp_path / "pane.log"
+        log_path.write_text("old\n")
+        follower = PaneLogFollower(log_path)
+
+        with open(log_path, "a") as f:
+            f.write("new 1\nnew ")
+        assert follower.read_new() == "new 1\n"
+        assert follower.read_new() == ""
+
+        with open(log_path, "a") as f:
+            f.write("2\n")
+        assert follower.read_new() == "new 2\n"
+
+    def test_follows_rotation(self, tmp_path):
+        log_path = tmp_path / "pane.log"
+        log_path.write_text("a\n")
+        follower = PaneLogFollower(log_path, from_end=False)
+        assert follower.read_new() == "a\n"
+
+        with open(log_path, "a") as f:
+            f.write("b\n")
+        os.replace(log_path, tmp_path / "pane.log.1")
+        log_path.write_text("c\n")
+
+        assert follower.read_new() == "b\nc\n"
+
+
+class TestAttach:
+    """Tests for attaching pipe-pane at spawn."""
+
+    def test_attach_runs_pipe_pane(self, tmp_path):
+        log_path = tmp_path / "ws" / "pane.log"
+        with patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert attach_pane_log('@5', log_path, 1024)
+
+        args = mock_run.call_args[0][0]
+        assert args[:5] == ['tmux', 'pipe-pane', '-o', '-t', '@5']
+        assert 'orch.pane_log' in args[5] and str(log_path) in args[5]
+        assert log_path.parent.is_dir()
+
+    def test_start_disabled_by_config(self, tmp_path):
+        with patch('orch.config.get_pane_log_max_bytes', return_value=0), \
+             patch('subprocess.run') as mock_run:
+            assert start_pane_log('@5', tmp_path) is None
+        mock_run.assert_not_called()
+
+    def test_start_never_raises(self, tmp_path):
+        with patch('orch.config.get_pane_log_max_bytes', return_value=1024), \
+             patch('subprocess.run', side_effect=FileNotFoundError('tmux')):
+            assert start_pane_log('@5', tmp_path) is None
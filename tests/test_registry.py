@@ -7,6 +7,8 @@ Beads is now the source of truth. Reconciliation now:
 - Treats window closure as completion for agents without primary_artifact
 """
 
+import os
+import time
 import pytest
 import json
 from pathlib import Path
@@ -394,3 +396,616 @@ class TestRegistryMerge:
         agent_final = registry_final.find("merge-test")
         assert agent_final["status"] == "completed", \
             "Merge should prefer disk version with newer updated_at"
+
+
+class TestSqliteRegistryStorage:
+    """Tests for the SQLite (WAL) registry backend."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return tmp_path / "agent-registry.db"
+
+    def _register(self, registry, i, **kwargs):
+        return registry.register(
+            agent_id=f"agent-{i}",
+            task=f"Task {i}",
+            window=f"workers:{i}",
+            window_id=f"@{100 + i}",
+            project_dir="/tmp/test",
+            workspace=f"/tmp/workspace-{i}",
+            **kwargs,
+        )
+
+    def test_db_suffix_selects_sqlite_backend(self, db_path):
+        from orch.registry_storage import SqliteRegistryStorage
+
+        registry = AgentRegistry(db_path)
+        assert isinstance(registry._storage, SqliteRegistryStorage)
+        assert registry.registry_path == db_path
+
+    def test_register_and_reload(self, db_path):
+        registry = AgentRegistry(db_path)
+        self._register(registry, 1, beads_id="proj-1")
+
+        reloaded = AgentRegistry(db_path)
+        agent = reloaded.find("proj-1")
+        assert agent is not None
+        assert agent["id"] == "agent-1"
+        assert agent["status"] == "active"
+
+    def test_uses_wal_and_indexes(self, db_path):
+        import sqlite3
+
+        self._register(AgentRegistry(db_path), 1)
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(agents)")}
+        finally:
+            conn.close()
+        assert mode == "wal"
+        assert {
+            "idx_agents_beads_id",
+            "idx_agents_window_id",
+            "idx_agents_status",
+            "idx_agents_project_dir",
+        } <= indexes
+
+    def test_reconcile_persists_and_newer_wins(self, db_path):
+        import time
+
+        registry1 = AgentRegistry(db_path)
+        self._register(registry1, 1)
+        registry2 = AgentRegistry(db_path)
+
+        time.sleep(0.01)
+        registry1.reconcile(active_windows=[])
+
+        # Stale instance saving must not clobber the newer completed row
+        registry2.save()
+
+        agent = AgentRegistry(db_path).find("agent-1")
+        assert agent["status"] == "completed"
+
+    def test_concurrent_registers_no_data_loss(self, db_path):
+        import concurrent.futures
+
+        AgentRegistry(db_path)  # create schema up front
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(lambda i: self._register(AgentRegistry(db_path), i), i)
+                for i in range(10)
+            ]
+            for future in futures:
+                future.result()
+
+        agent_ids = {a["id"] for a in AgentRegistry(db_path).list_active_agents()}
+        assert agent_ids == {f"agent-{i}" for i in range(10)}
+
+    def test_migrates_json_registry_once(self, tmp_path, db_path):
+        json_path = tmp_path / "agent-registry.json"
+        json_path.write_text(json.dumps({"agents": [{
+            "id": "legacy-agent",
+            "task": "Legacy",
+            "window": "workers:1",
+            "window_id": "@1",
+            "project_dir": "/tmp/test",
+            "workspace": "/tmp/ws",
+            "spawned_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:00:00",
+            "status": "active",
+        }]}))
+
+        registry = AgentRegistry(db_path)
+        assert registry.find("legacy-agent") is not None
+
+        # Later JSON edits are not re-imported
+        json_path.write_text(json.dumps({"agents": []}))
+        registry.remove("legacy-agent")
+        registry.save()
+        json_path.write_text(json.dumps({"agents": [{
+            "id": "late-agent", "status": "active", "window_id": "@2",
+        }]}))
+
+        reloaded = AgentRegistry(db_path)
+        assert reloaded.find("late-agent") is None
+        assert reloaded.find("legacy-agent")["status"] == "deleted"
+
+    def test_default_path_follows_registry_backend_config(self, tmp_path):
+        from orch.registry_storage import default_registry_path
+
+        with patch("orch.config.get_registry_backend", return_value="sqlite"), \
+             patch("pathlib.Path.home", return_value=tmp_path):
+            assert default_registry_path() == tmp_path / ".orch" / "agent-registry.db"
+
+
+class TestJournalRegistryStorage:
+    """Tests for the append-only journal registry backend."""
+
+    @pytest.fixture
+    def journal_path(self, tmp_path):
+        return tmp_path / "agent-registry.jsonl"
+
+    def _register(self, registry, i):
+        return registry.register(
+            agent_id=f"agent-{i}",
+            task=f"Task {i}",
+            window=f"workers:{i}",
+            window_id=f"@{100 + i}",
+            project_dir="/tmp/test",
+            workspace=f"/tmp/workspace-{i}",
+        )
+
+    def test_jsonl_suffix_selects_journal_backend(self, journal_path):
+        from orch.registry_storage import JournalRegistryStorage
+
+        registry = AgentRegistry(journal_path)
+        assert isinstance(registry._storage, JournalRegistryStorage)
+
+    def test_save_appends_only_changed_agents(self, journal_path):
+        registry = AgentRegistry(journal_path)
+        self._register(registry, 1)
+        self._register(registry, 2)
+        assert len(journal_path.read_text().splitlines()) == 2
+
+        registry.reconcile(active_windows=["@102"])
+        lines = [json.loads(l) for l in journal_path.read_text().splitlines()]
+        assert len(lines) == 3
+        assert lines[-1]["agent"]["id"] == "agent-1"
+        assert lines[-1]["agent"]["status"] == "completed"
+        assert lines[-1]["updated_at"] == lines[-1]["agent"]["updated_at"]
+
+        reloaded = AgentRegistry(journal_path)
+        assert reloaded.find("agent-1")["status"] == "completed"
+        assert reloaded.find("agent-2")["status"] == "active"
+
+    def test_existing_json_registry_is_initial_snapshot(self, tmp_path, journal_path):
+        (tmp_path / "agent-registry.json").write_text(json.dumps({"agents": [{
+            "id": "legacy-agent",
+            "window_id": "@1",
+            "status": "active",
+            "updated_at": "2025-01-01T00:00:00",
+        }]}))
+
+        registry = AgentRegistry(journal_path)
+        assert registry.find("legacy-agent")["status"] == "active"
+
+    def test_stale_instance_does_not_clobber_newer_entry(self, journal_path):
+        import time
+
+        registry1 = AgentRegistry(journal_path)
+        self._register(registry1, 1)
+        registry2 = AgentRegistry(journal_path)
+
+        time.sleep(0.01)
+        registry1.reconcile(active_windows=[])
+        registry2.save()
+
+        assert AgentRegistry(journal_path).find("agent-1")["status"] == "completed"
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path, journal_path):
+        from orch.registry_storage import JournalRegistryStorage
+
+        storage = JournalRegistryStorage(journal_path, compact_bytes=1)
+        registry = AgentRegistry(storage=storage)
+        self._register(registry, 1)
+        self._register(registry, 2)
+
+        # Threshold of 1 byte compacts on every save
+        assert journal_path.read_text() == ""
+        snapshot = json.loads((tmp_path / "agent-registry.json").read_text())
+        assert {a["id"] for a in snapshot["agents"]} == {"agent-1", "agent-2"}
+        assert not list(tmp_path.glob(".agent-registry.json.*"))
+
+        reloaded = AgentRegistry(journal_path)
+        assert {a["id"] for a in reloaded.list_active_agents()} == {"agent-1", "agent-2"}
+
+    def test_concurrent_registers_no_data_loss(self, journal_path):
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(lambda i: self._register(AgentRegistry(journal_path), i), i)
+                for i in range(10)
+            ]
+            for future in futures:
+                future.result()
+
+        agent_ids = {a["id"] for a in AgentRegistry(journal_path).list_active_agents()}
+        assert agent_ids == {f"agent-{i}" for i in range(10)}
+
+    def test_torn_trailing_line_is_ignored(self, journal_path):
+        registry = AgentRegistry(journal_path)
+        self._register(registry, 1)
+        with open(journal_path, "a") as f:
+            f.write('{"updated_at": "2099-01-01", "agent": {"id": "agent-1"')
+
+        assert AgentRegistry(journal_path).find("agent-1")["status"] == "active"
+
+        # Next append starts on a fresh line
+        registry.reconcile(active_windows=[])
+        assert AgentRegistry(journal_path).find("agent-1")["status"] == "completed"
+
+
+class TestShardedRegistryStorage:
+    """Tests for the per-project sharded registry backend."""
+
+    @pytest.fixture
+    def shard_path(self, tmp_path):
+        return tmp_path / "agent-registry.d"
+
+    def _register(self, registry, i, project_dir="/tmp/project-a"):
+        return registry.register(
+            agent_id=f"agent-{i}",
+            task=f"Task {i}",
+            window=f"workers:{i}",
+            window_id=f"@{100 + i}",
+            project_dir=project_dir,
+            workspace=f"/tmp/workspace-{i}",
+        )
+
+    def test_d_suffix_selects_sharded_backend(self, shard_path):
+        from orch.registry_storage import ShardedRegistryStorage
+
+        registry = AgentRegistry(shard_path)
+        assert isinstance(registry._storage, ShardedRegistryStorage)
+
+    def test_agents_are_split_by_project(self, shard_path):
+        from orch.registry_storage import ShardedRegistryStorage
+
+        registry = AgentRegistry(shard_path)
+        self._register(registry, 1, "/tmp/project-a")
+        self._register(registry, 2, "/tmp/project-b")
+
+        shard_a = shard_path / "shards" / ShardedRegistryStorage.shard_name("/tmp/project-a")
+        shard_b = shard_path / "shards" / ShardedRegistryStorage.shard_name("/tmp/project-b")
+        assert [a["id"] for a in json.loads(shard_a.read_text())["agents"]] == ["agent-1"]
+        assert [a["id"] for a in json.loads(shard_b.read_text())["agents"]] == ["agent-2"]
+
+        index = json.loads((shard_path / "index.json").read_text())
+        assert index["shards"][shard_a.name] == "/tmp/project-a"
+        assert index["shards"][shard_b.name] == "/tmp/project-b"
+
+        reloaded = AgentRegistry(shard_path)
+        assert {a["id"] for a in reloaded.list_active_agents()} == {"agent-1", "agent-2"}
+
+    def test_save_only_touches_changed_shards(self, shard_path):
+        from orch.registry_storage import ShardedRegistryStorage
+
+        registry = AgentRegistry(shard_path)
+        self._register(registry, 1, "/tmp/project-a")
+        self._register(registry, 2, "/tmp/project-b")
+        shard_b = shard_path / "shards" / ShardedRegistryStorage.shard_name("/tmp/project-b")
+        before = shard_b.stat().st_mtime_ns
+
+        time.sleep(0.01)
+        registry.reconcile(active_windows=["@102"])
+
+        assert shard_b.stat().st_mtime_ns == before
+        assert AgentRegistry(shard_path).find("agent-1")["status"] == "completed"
+
+    def test_existing_json_registry_is_imported_once(self, tmp_path, shard_path):
+        (tmp_path / "agent-registry.json").write_text(json.dumps({"agents": [{
+            "id": "legacy-agent",
+            "window_id": "@1",
+            "project_dir": "/tmp/legacy",
+            "status": "active",
+            "updated_at": "2025-01-01T00:00:00",
+        }]}))
+
+        registry = AgentRegistry(shard_path)
+        assert registry.find("legacy-agent")["status"] == "active"
+        registry.remove("legacy-agent")
+        registry.save()
+
+        # Not re-imported over the newer shard copy
+        assert AgentRegistry(shard_path).find("legacy-agent")["status"] == "deleted"
+        index = json.loads((shard_path / "index.json").read_text())
+        assert index["migrated_from_json"].endswith("agent-registry.json")
+
+    def test_archive_purges_from_shards(self, shard_path):
+        registry = AgentRegistry(shard_path)
+        self._register(registry, 1, "/tmp/project-a")
+        self._register(registry, 2, "/tmp/project-b")
+        registry.reconcile(active_windows=["@102"])
+
+        assert registry.archive_terminal_agents(max_age_days=0) == 1
+        reloaded = AgentRegistry(shard_path)
+        assert reloaded.find("agent-1") is None
+        assert reloaded.find("agent-2")["status"] == "active"
+
+    def test_concurrent_registers_across_projects(self, shard_path):
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(
+                    lambda i: self._register(AgentRegistry(shard_path), i, f"/tmp/project-{i % 3}"), i
+                )
+                for i in range(10)
+            ]
+            for future in futures:
+                future.result()
+
+        agent_ids = {a["id"] for a in AgentRegistry(shard_path).list_active_agents()}
+        assert agent_ids == {f"agent-{i}" for i in range(10)}
+        assert len(list((shard_path / "shards").glob("*.json"))) == 3
+
+
+class TestRegistryIndexes:
+    """Tests for AgentRecord and the registry's hash indexes."""
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        registry = AgentRegistry(tmp_path / "agent-registry.json")
+        for i in range(3):
+            registry.register(
+                agent_id=f"agent-{i}",
+                task=f"Task {i}",
+                window=f"workers:{i}",
+                window_id=f"@{100 + i}",
+                project_dir="/tmp/test",
+                workspace=f"/tmp/workspace-{i}",
+                beads_id=f"proj-{i}",
+            )
+        return registry
+
+    def test_agent_record_is_dict_compatible(self):
+        from orch.registry import AgentRecord
+
+        record = AgentRecord({"id": "a", "status": "active", "custom": 1})
+        assert record["id"] == "a"
+        assert record.get("beads_id") is None
+        assert "beads_id" not in record
+        assert "custom" in record
+        assert dict(record) == {"id": "a", "status": "active", "custom": 1}
+        assert record == {"id": "a", "status": "active", "custom": 1}
+        with pytest.raises(AttributeError):
+            record.unknown_attribute = 1
+
+    def test_direct_status_mutation_updates_active_index(self, registry):
+        agent = registry.find("agent-1")
+        agent["status"] = "completed"
+
+        assert [a["id"] for a in registry.list_active_agents()] == ["agent-0", "agent-2"]
+
+    def test_window_reuse_lookup_uses_index(self, registry):
+        registry.find("agent-0")["status"] = "completed"
+        assert registry._find_by_window_id("@100") is None
+        assert registry._find_by_window_id("@101")["id"] == "agent-1"
+
+    def test_beads_id_change_is_reindexed(self, registry):
+        registry.find("agent-2")["beads_id"] = "proj-new"
+
+        assert registry.find("proj-2") is None
+        assert registry.find("proj-new")["id"] == "agent-2"
+
+    def test_agents_appended_directly_are_indexed(self, registry):
+        registry._agents.append({"id": "legacy", "status": "active", "window_id": None})
+
+        assert registry.find("legacy")["status"] == "active"
+        assert len(registry.list_active_agents()) == 4
+
+    def test_records_round_trip_through_storage(self, registry, tmp_path):
+        registry.reconcile(active_windows=["@100"])
+
+        reloaded = AgentRegistry(tmp_path / "agent-registry.json")
+        assert [a["id"] for a in reloaded.list_active_agents()] == ["agent-0"]
+        assert reloaded.find("proj-1")["status"] == "completed"
+
+    def test_records_serialize_in_json_output(self, registry):
+        from orch.json_output import output_json
+
+        data = json.loads(output_json({"history": registry.list_agents()}))
+        assert [a["id"] for a in data["history"]] == ["agent-0", "agent-1", "agent-2"]
+
+
+class TestRegistryArchive:
+    """Tests for moving terminal agents into the registry archive tier."""
+
+    @pytest.fixture
+    def registry_path(self, tmp_path):
+        return tmp_path / "agent-registry.json"
+
+    def _seed(self, registry_path, agents):
+        registry_path.write_text(json.dumps({"agents": agents}))
+        return AgentRegistry(registry_path)
+
+    def _agent(self, agent_id, status, finished_at=None):
+        agent = {
+            "id": agent_id,
+            "task": f"Task {agent_id}",
+            "window": "workers:1",
+            "window_id": f"@{agent_id}",
+            "project_dir": "/tmp/test",
+            "workspace": f"/tmp/{agent_id}",
+            "spawned_at": "2025-01-01T00:00:00",
+            "updated_at": finished_at or "2025-01-01T00:00:00",
+            "status": status,
+        }
+        if status == "completed":
+            agent["completed_at"] = finished_at
+        return agent
+
+    def test_archives_only_old_terminal_agents(self, registry_path, tmp_path):
+        recent = datetime.now().isoformat()
+        registry = self._seed(registry_path, [
+            self._agent("live", "active"),
+            self._agent("old-done", "completed", "2025-01-05T00:00:00"),
+            self._agent("old-deleted", "deleted", "2025-02-10T00:00:00"),
+            self._agent("new-done", "completed", recent),
+        ])
+
+        assert registry.archive_terminal_agents(max_age_days=7) == 2
+
+        # Hot registry keeps live and recently finished agents only
+        hot = AgentRegistry(registry_path)
+        assert {a["id"] for a in hot._agents} == {"live", "new-done"}
+
+        segments = sorted(p.name for p in (tmp_path / "registry-archive").glob("*.jsonl.gz"))
+        assert segments == ["2025-01.jsonl.gz", "2025-02.jsonl.gz"]
+
+    def test_history_reads_archive_only_when_asked(self, registry_path):
+        registry = self._seed(registry_path, [
+            self._agent("live", "active"),
+            self._agent("old-done", "completed", "2025-01-05T00:00:00"),
+            self._agent("old-deleted", "deleted", "2025-01-06T00:00:00"),
+        ])
+        registry.archive_terminal_agents(max_age_days=7)
+
+        hot = AgentRegistry(registry_path)
+        assert [a["id"] for a in hot.list_agents()] == ["live"]
+        assert [a["id"] for a in hot.list_agents(include_archived=True)] == ["live", "old-done"]
+        assert [a["id"] for a in hot.list_archived_agents(statuses=["deleted"])] == ["old-deleted"]
+
+    def test_archived_copy_also_in_hot_registry_is_not_duplicated(self, registry_path):
+        agent = self._agent("old-done", "completed", "2025-01-05T00:00:00")
+        registry = self._seed(registry_path, [agent])
+        registry.archive.append([agent])
+
+        ids = [a["id"] for a in registry.list_agents(include_archived=True)]
+        assert ids == ["old-done"]
+
+    def test_archive_purges_from_sqlite_and_journal(self, tmp_path):
+        for suffix in (".db", ".jsonl"):
+            backend_dir = tmp_path / suffix.lstrip(".")
+            backend_dir.mkdir()
+            path = backend_dir / f"agent-registry{suffix}"
+            registry = AgentRegistry(path)
+            registry.register(
+                agent_id="done", task="t", window="w:1", window_id="@1",
+                project_dir="/tmp", workspace="/tmp/ws",
+            )
+            registry.reconcile(active_windows=[])
+
+            assert registry.archive_terminal_agents(max_age_days=0) == 1
+            reloaded = AgentRegistry(path)
+            assert reloaded.find("done") is None
+            assert [a["id"] for a in reloaded.list_archived_agents()] == ["done"]
+
+
+class TestRegistryTransaction:
+    """Tests for batching registry mutations into one save."""
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        registry = AgentRegistry(tmp_path / "agent-registry.json")
+        for i in range(3):
+            registry.register(
+                agent_id=f"agent-{i}",
+                task=f"Task {i}",
+                window=f"workers:{i}",
+                window_id=f"@{100 + i}",
+                project_dir="/tmp/test",
+                workspace=f"/tmp/workspace-{i}",
+            )
+        return registry
+
+    def test_many_mutations_write_once(self, registry, tmp_path):
+        with patch.object(registry._storage, "save", wraps=registry._storage.save) as save:
+            with registry.transaction():
+                registry.abandon_agent("agent-0", reason="stuck")
+                registry.remove("agent-1")
+                registry.save()
+                registry.reconcile(active_windows=[])
+                assert save.call_count == 0
+        assert save.call_count == 1
+
+        reloaded = AgentRegistry(tmp_path / "agent-registry.json")
+        assert [reloaded.find(f"agent-{i}")["status"] for i in range(3)] == [
+            "abandoned", "deleted", "completed"
+        ]
+
+    def test_no_write_without_changes(self, registry):
+        with patch.object(registry._storage, "save") as save:
+            with registry.transaction():
+                registry.find("agent-0")
+        save.assert_not_called()
+
+    def test_nested_transaction_joins_outer(self, registry):
+        with patch.object(registry._storage, "save") as save:
+            with registry.transaction():
+                with registry.transaction(skip_merge=True):
+                    registry.remove("agent-0")
+                save.assert_not_called()
+        save.assert_called_once_with(registry._agents, skip_merge=True)
+
+    def test_changes_before_exception_are_written(self, registry, tmp_path):
+        with pytest.raises(RuntimeError):
+            with registry.transaction():
+                registry.find("agent-2")["status"] = "failed"
+                raise RuntimeError("tmux went away")
+
+        reloaded = AgentRegistry(tmp_path / "agent-registry.json")
+        assert reloaded.find("agent-2")["status"] == "failed"
+
+    def test_register_reusing_window_saves_once(self, registry):
+        with patch.object(registry._storage, "save") as save:
+            registry.register(
+                agent_id="agent-new",
+                task="Reuses window",
+                window="workers:0",
+                window_id="@100",
+                project_dir="/tmp/test",
+                workspace="/tmp/workspace-new",
+            )
+        save.assert_called_once()
+        assert registry.find("agent-0")["status"] == "abandoned"
+
+
+class TestRegistryReadCache:
+    """Tests for the process-level registry parse cache."""
+
+    @pytest.fixture
+    def registry_path(self, tmp_path):
+        from orch.registry_storage import clear_read_cache
+
+        clear_read_cache()
+        path = tmp_path / "agent-registry.json"
+        path.write_text(json.dumps({"agents": [{
+            "id": "agent-1",
+            "status": "active",
+            "window_id": "@1",
+            "beads_ids": ["proj-1"],
+            "updated_at": "2025-01-01T00:00:00",
+        }]}))
+        # Age the file past the racy-timestamp window so it is cacheable
+        os.utime(path, ns=(time.time_ns() - 10**9, time.time_ns() - 10**9))
+        yield path
+        clear_read_cache()
+
+    def test_unchanged_registry_is_not_reparsed(self, registry_path):
+        AgentRegistry(registry_path)
+        with patch("orch.registry_storage.json.loads") as loads:
+            registry = AgentRegistry(registry_path)
+        loads.assert_not_called()
+        assert registry.find("agent-1")["status"] == "active"
+
+    def test_cached_agents_are_independent_copies(self, registry_path):
+        first = AgentRegistry(registry_path)
+        agent = first.find("agent-1")
+        agent["status"] = "completed"
+        agent["beads_ids"].append("proj-2")
+
+        second = AgentRegistry(registry_path)
+        assert second.find("agent-1")["status"] == "active"
+        assert second.find("agent-1")["beads_ids"] == ["proj-1"]
+
+    def test_save_in_this_process_invalidates(self, registry_path):
+        first = AgentRegistry(registry_path)
+        AgentRegistry(registry_path)  # populate cache
+        first.reconcile(active_windows=[])
+
+        assert AgentRegistry(registry_path).find("agent-1")["status"] == "completed"
+
+    def test_write_by_another_process_invalidates(self, registry_path):
+        AgentRegistry(registry_path)  # populate cache
+
+        # Simulate another process rewriting the file (no in-process save)
+        data = json.loads(registry_path.read_text())
+        data["agents"][0]["status"] = "abandoned"
+        registry_path.write_text(json.dumps(data))
+
+        assert AgentRegistry(registry_path).find("agent-1")["status"] == "abandoned"
@@ -10,6 +10,24 @@ from pathlib import Path
 # cli_runner fixture provided by conftest.py
 
 
+def _tmux_echoing(message):
+    """subprocess.run mock whose capture-pane output shows the message once it was pasted."""
+    pasted = []
+
+    def run(args, **kwargs):
+        if 'paste-buffer' in args:
+            pasted.append(True)
+        return Mock(returncode=0, stdout=message if pasted else '> ')
+
+    return Mock(side_effect=run)
+
+
+def _loaded_message(mock_run):
+    """The text piped into `tmux load-buffer`."""
+    [load] = [c for c in mock_run.call_args_list if 'load-buffer' in c[0][0]]
+    return load[1]['input']
+
+
 class TestSendCommand:
     """Tests for the send command."""
 
@@ -34,15 +52,15 @@ class TestSendCommand:
             mock_window = Mock()
 
             with patch('orch.tmux_utils.get_window_by_target', return_value=mock_window):
-                with patch('subprocess.run') as mock_run:
+                with patch('subprocess.run', _tmux_echoing('Hello agent')) as mock_run:
                     result = cli_runner.invoke(cli, ['send', 'test-agent', 'Hello agent'])
 
         # Test should pass when implementation exists
-        assert result.exit_code == 0
+        assert result.exit_code == 0, result.output
         assert 'Message sent' in result.output or 'Sent' in result.output
 
-        # Verify subprocess.run was called twice (message + Enter)
-        assert mock_run.call_count == 2
+        # Verify subprocess.run calls: capture, load-buffer, paste-buffer, echo check, Enter
+        assert mock_run.call_count == 5
 
     def test_send_message_agent_not_found(self, cli_runner):
         """Test error when agent doesn't exist in registry."""
@@ -73,15 +91,15 @@ class TestSendCommand:
         mock_window = Mock()
 
         with patch('orch.send.get_window_by_target', return_value=mock_window):
-            with patch('subprocess.run') as mock_run:
+            with patch('subprocess.run', _tmux_echoing('Test message')) as mock_run:
                 send_message_to_agent(mock_agent, 'Test message')
 
-        # Verify subprocess.run was called twice (message + Enter)
-        assert mock_run.call_count == 2
-        # First call: send message
-        assert 'Test message' in str(mock_run.call_args_list[0])
-        # Second call: send Enter
-        assert 'Enter' in str(mock_run.call_args_list[1])
+        # Verify subprocess.run calls: capture, load-buffer, paste-buffer, echo check, Enter
+        assert mock_run.call_count == 5
+        # Message loaded into the paste buffer
+        assert _loaded_message(mock_run) == 'Test message'
+        # Last call: send Enter
+        assert 'Enter' in str(mock_run.call_args_list[-1])
 
     def test_send_message_tmux_window_not_found(self):
         """Test error when tmux window doesn't exist."""
@@ -113,14 +131,13 @@ class TestSendMessageFunction:
         mock_window = Mock()
 
         with patch('orch.send.get_window_by_target', return_value=mock_window):
-            with patch('subprocess.run') as mock_run:
+            with patch('subprocess.run', _tmux_echoing('Hello from orchestrator')) as mock_run:
                 send_message_to_agent(agent, 'Hello from orchestrator')
 
-        # Verify subprocess.run was called twice
-        assert mock_run.call_count == 2
+        # Verify subprocess.run was called five times
+        assert mock_run.call_count == 5
         # Verify message was sent
-        first_call = mock_run.call_args_list[0][0][0]
-        assert 'Hello from orchestrator' in first_call
+        assert _loaded_message(mock_run) == 'Hello from orchestrator'
 
     def test_message_with_special_characters(self):
         """Test sending message with special characters."""
@@ -135,13 +152,12 @@ class TestSendMessageFunction:
         message = 'Check file: ~/test/path with spaces.txt'
 
         with patch('orch.send.get_window_by_target', return_value=mock_window):
-            with patch('subprocess.run') as mock_run:
+            with patch('subprocess.run', _tmux_echoing(message)) as mock_run:
                 send_message_to_agent(agent, message)
 
         # Verify message was passed through
-        assert mock_run.call_count == 2
-        first_call = mock_run.call_args_list[0][0][0]
-        assert message in first_call
+        assert mock_run.call_count == 5
+        assert _loaded_message(mock_run) == message
 
     def test_multiline_message(self):
         """Test sending multiline message."""
@@ -156,13 +172,128 @@ class TestSendMessageFunction:
         message = 'Line 1\nLine 2\nLine 3'
 
         with patch('orch.send.get_window_by_target', return_value=mock_window):
-            with patch('subprocess.run') as mock_run:
+            with patch('subprocess.run', _tmux_echoing(message)) as mock_run:
                 send_message_to_agent(agent, message)
 
-        # Verify multiline message was sent
-        assert mock_run.call_count == 2
-        first_call = mock_run.call_args_list[0][0][0]
-        assert message in first_call
+        # Verify multiline message was sent as one paste
+        assert mock_run.call_count == 5
+        assert _loaded_message(mock_run) == message
+
+
+class TestPasteDelivery:
+    """Tests for paste-buffer delivery and the echo check."""
+
+    def test_pastes_with_bracketed_paste(self):
+        from orch.send import send_message_to_agent
+
+        with patch('orch.send.get_window_by_target', return_value=Mock()):
+            with patch('subprocess.run', _tmux_echoing('-starts with dash')) as mock_run:
+                send_message_to_agent({'id': 'a', 'window': 'workers:1'}, '-starts with dash')
+
+        load, paste = [c[0][0] for c in mock_run.call_args_list[1:3]]
+        assert load == ['tmux', 'load-buffer', '-b', load[3], '-']
+        assert _loaded_message(mock_run) == '-starts with dash'
+        assert paste == ['tmux', 'paste-buffer', '-p', '-d', '-b', load[3], '-t', 'workers:1']
+
+    def test_trailing_semicolon_stays_in_message(self):
+        from orch.send import send_message_to_agent
+
+        with patch('orch.send.get_window_by_target', return_value=Mock()):
+            with patch('subprocess.run', _tmux_echoing('echo hi;')) as mock_run:
+                send_message_to_agent({'id': 'a', 'window': 'workers:1'}, 'echo hi;')
+
+        assert _loaded_message(mock_run) == 'echo hi;'
+        assert all('echo hi;' not in c[0][0] for c in mock_run.call_args_list)
+
+    def test_enter_waits_for_echo(self):
+        from orch.send import _wait_for_echo
+
+        outputs = iter(['> ', '> ', '> line one\n  ...and the end'])
+        with patch('subprocess.run', side_effect=lambda *a, **k: Mock(stdout=next(outputs))) as mock_run, \
+             patch('time.sleep'):
+            assert _wait_for_echo('@1', 'line one\n...and the end', before='> ')
+        assert mock_run.call_count == 3
+
+    def test_collapsed_paste_counts_as_echo(self):
+        from orch.send import _wait_for_echo
+
+        with patch('subprocess.run', return_value=Mock(stdout='> [Pasted text #1 +40 lines]')):
+            assert _wait_for_echo('@1', 'long\nmessage', before='> ')
+
+    def test_earlier_copy_on_screen_is_not_echo(self):
+        from orch.send import _wait_for_echo
+
+        screen = '> Status?\nAll good.\n> '
+        with patch('subprocess.run', return_value=Mock(stdout=screen)), patch('time.sleep'):
+            assert not _wait_for_echo('@1', 'Status?', before=screen, timeout=0)
+
+        with patch('subprocess.run', return_value=Mock(stdout=screen + 'Status?')):
+            assert _wait_for_echo('@1', 'Status?', before=screen)
+
+    def test_paste_seen_after_older_copy_scrolled_away(self):
+        from orch.send import _paste_seen
+
+        before = '> [Pasted text #1 +40 lines]\nDone.\n> '
+        after = 'Done.\n> [Pasted text #2 +40 lines]'
+
+        assert _paste_seen(before, after, 'message')
+
+    def test_echo_timeout(self):
+        from orch.send import _wait_for_echo
+
+        with patch('subprocess.run', return_value=Mock(stdout='> ')), patch('time.sleep'):
+            assert not _wait_for_echo('@1', 'never shown', timeout=0)
+
+
+class TestSendBroadcast:
+    """Tests for orch send --all/--project."""
+
+    def test_broadcast_to_all_active_agents(self, cli_runner):
+        from orch.cli import cli
+
+        agents = [{'id': 'a', 'window': 'w:1'}, {'id': 'b', 'window': 'w:2'}]
+        sent = []
+
+        with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry, \
+             patch('orch.send.snapshot_windows') as mock_snapshot, \
+             patch('orch.send.send_message_to_agent',
+                   side_effect=lambda agent, message, snapshot=None: sent.append((agent['id'], message, snapshot))):
+            MockRegistry.return_value.list_active_agents.return_value = agents
+            result = cli_runner.invoke(cli, ['send', '--all', 'Status?'])
+
+        assert result.exit_code == 0
+        assert sorted(sent) == [('a', 'Status?', mock_snapshot.return_value),
+                                ('b', 'Status?', mock_snapshot.return_value)]
+        assert 'Message sent to a' in result.output and 'Message sent to b' in result.output
+        mock_snapshot.assert_called_once()
+
+    def test_broadcast_reports_failures(self, cli_runner):
+        from orch.cli import cli
+
+        agents = [{'id': 'a', 'window': 'w:1', 'project_dir': '/p'}, {'id': 'b', 'window': 'w:2', 'project_dir': '/p'}]
+
+        def deliver(agent, message, snapshot=None):
+            if agent['id'] == 'b':
+                raise RuntimeError("Window 'w:2' not found")
+
+        with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry, \
+             patch('orch.send.snapshot_windows'), \
+             patch('orch.send.send_message_to_agent', side_effect=deliver):
+            MockRegistry.return_value.list_active_agents.return_value = agents
+            result = cli_runner.invoke(cli, ['send', '--project', '/p', 'Status?'])
+
+        assert result.exit_code != 0
+        assert 'Message sent to a' in result.output
+        assert "b: Window 'w:2' not found" in result.output
+
+    def test_broadcast_rejects_agent_id(self, cli_runner):
+        from orch.cli import cli
+
+        with patch('orch.monitoring_commands.AgentRegistry'):
+            result = cli_runner.invoke(cli, ['send', '--all', 'agent-1', 'Status?'])
+
+        assert result.exit_code != 0
+        assert 'pass only the message' in result.output
 
 
 class TestSendLogging:
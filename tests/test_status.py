@@ -3,9 +3,11 @@ Tests for orch status logging functionality.
 """
 
 import pytest
-from unittest.mock import Mock, patch, mock_open, call
+from unittest.mock import MagicMock, Mock, patch, mock_open, call
 import time
 
+from orch.tmux_utils import WindowSnapshot
+
 
 # cli_runner fixture provided by conftest.py
 
@@ -37,7 +39,7 @@ class TestStatusLogging:
 
             # Mock registry and tmux checks (now in monitoring_commands module)
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = []
                 MockRegistry.return_value = mock_registry
 
@@ -80,7 +82,7 @@ class TestStatusLogging:
 
             # Mock registry with reconciliation that adds/removes agents
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = []
 
                 # Simulate reconciliation finding changes
@@ -93,10 +95,9 @@ class TestStatusLogging:
                 MockRegistry.return_value = mock_registry
 
                 # Mock tmux availability (now in monitoring_commands module)
-                with patch('orch.monitoring_commands.is_tmux_available', return_value=True):
-                    with patch('orch.monitoring_commands.find_session', return_value=Mock()):
-                        with patch('orch.monitoring_commands.list_windows', return_value=[]):
-                            result = cli_runner.invoke(cli, ['status'])
+                # Mock tmux snapshot (tmux running, no windows)
+                with patch('orch.monitoring_commands.snapshot_windows', return_value=WindowSnapshot([])):
+                    result = cli_runner.invoke(cli, ['status'])
 
         # Check reconciliation was logged
         reconciliation_logs = [log for log in mock_log_data if 'Reconciliation' in log['message']]
@@ -130,7 +131,7 @@ class TestStatusLogging:
 
             # Mock registry (now in monitoring_commands module)
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 # Phase 2.5: Also mock list_agents for completed agents
                 mock_registry.list_agents.return_value = mock_agents  # No completed agents in this test
@@ -178,7 +179,7 @@ class TestStatusLogging:
 
             # Mock registry with no agents (now in monitoring_commands module)
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = []
                 # Phase 2.5: Also mock list_agents for completed agents
                 mock_registry.list_agents.return_value = []
@@ -232,42 +233,34 @@ class TestCrossSessionReconciliation:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = mock_agents
                 mock_registry.reconcile = mock_reconcile
                 mock_registry.reconcile_opencode = Mock()
                 MockRegistry.return_value = mock_registry
 
-                with patch('orch.monitoring_commands.is_tmux_available', return_value=True):
-                    # Mock session default to 'orchestrator'
-                    with patch('orch.config.get_tmux_session_default', return_value='orchestrator'):
-                        # Mock find_session to return sessions for both orchestrator and workers-price-watch
-                        def mock_find_session(session_name):
-                            return Mock()  # Session exists
-
-                        # Mock list_windows to return windows for each session
-                        def mock_list_windows(session_name):
-                            if session_name == 'workers-price-watch':
-                                return [{'index': '5', 'name': 'feat-scraper-08dec', 'id': '@1234'}]
-                            elif session_name == 'orchestrator':
-                                return [{'index': '1', 'name': 'main', 'id': '@100'}]
-                            return []
-
-                        with patch('orch.monitoring_commands.find_session', side_effect=mock_find_session):
-                            with patch('orch.monitoring_commands.list_windows', side_effect=mock_list_windows):
-                                with patch('orch.monitoring_commands.check_agent_status') as mock_check:
-                                    mock_check.return_value = Mock(
-                                        priority='ok',
-                                        phase='Implementing',
-                                        alerts=[],
-                                        context_info=None,
-                                        recommendation=None,
-                                        completed_at=None,
-                                        age_str=None,
-                                        is_stale=False
-                                    )
-                                    result = cli_runner.invoke(cli, ['status'])
+                # One snapshot covers windows in every session
+                snapshot = WindowSnapshot([
+                    {'session': 'workers-price-watch', 'id': '@1234', 'index': '5',
+                     'name': 'feat-scraper-08dec', 'pane_pid': 101},
+                    {'session': 'orchestrator', 'id': '@100', 'index': '1',
+                     'name': 'main', 'pane_pid': 102},
+                ])
+
+                with patch('orch.monitoring_commands.snapshot_windows', return_value=snapshot):
+                    with patch('orch.monitoring_commands.check_agent_status') as mock_check:
+                        mock_check.return_value = Mock(
+                            priority='ok',
+                            phase='Implementing',
+                            alerts=[],
+                            context_info=None,
+                            recommendation=None,
+                            completed_at=None,
+                            age_str=None,
+                            is_stale=False
+                        )
+                        result = cli_runner.invoke(cli, ['status'])
 
         # Verify reconcile was called with window IDs from BOTH sessions
         assert len(reconcile_calls) == 1
@@ -306,37 +299,32 @@ class TestCrossSessionReconciliation:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = mock_agents
                 mock_registry.reconcile = mock_reconcile
                 mock_registry.reconcile_opencode = Mock()
                 MockRegistry.return_value = mock_registry
 
-                with patch('orch.monitoring_commands.is_tmux_available', return_value=True):
-                    def mock_find_session(session_name):
-                        return Mock()
-
-                    def mock_list_windows(session_name):
-                        if session_name == 'workers-price-watch':
-                            # Window @1234 EXISTS in workers-price-watch
-                            return [{'index': '5', 'name': 'feat-scraper-08dec', 'id': '@1234'}]
-                        return []
-
-                    with patch('orch.monitoring_commands.find_session', side_effect=mock_find_session):
-                        with patch('orch.monitoring_commands.list_windows', side_effect=mock_list_windows):
-                            with patch('orch.monitoring_commands.check_agent_status') as mock_check:
-                                mock_check.return_value = Mock(
-                                    priority='ok',
-                                    phase='Implementing',
-                                    alerts=[],
-                                    context_info=None,
-                                    recommendation=None,
-                                    completed_at=None,
-                                    age_str=None,
-                                    is_stale=False
-                                )
-                                result = cli_runner.invoke(cli, ['status'])
+                # Window @1234 EXISTS in workers-price-watch
+                snapshot = WindowSnapshot([
+                    {'session': 'workers-price-watch', 'id': '@1234', 'index': '5',
+                     'name': 'feat-scraper-08dec', 'pane_pid': 101},
+                ])
+
+                with patch('orch.monitoring_commands.snapshot_windows', return_value=snapshot):
+                    with patch('orch.monitoring_commands.check_agent_status') as mock_check:
+                        mock_check.return_value = Mock(
+                            priority='ok',
+                            phase='Implementing',
+                            alerts=[],
+                            context_info=None,
+                            recommendation=None,
+                            completed_at=None,
+                            age_str=None,
+                            is_stale=False
+                        )
+                        result = cli_runner.invoke(cli, ['status'])
 
         # Agent should NOT be marked as completed since its window exists
         assert len(agents_marked_completed) == 0, "Agent should not be marked completed when its window exists"
@@ -387,7 +375,7 @@ class TestConvergenceDisplay:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = mock_agents
                 mock_registry.reconcile = Mock()
@@ -460,7 +448,7 @@ class TestConvergenceDisplay:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = mock_agents
                 mock_registry.reconcile = Mock()
@@ -494,5 +482,145 @@ class TestConvergenceDisplay:
         assert 'children' not in result.output.lower()
 
 
+class TestBatchedBeadsLookup:
+    """Tests for fetching all agents' beads data in one batch."""
+
+    def test_status_fetches_issues_with_one_show_call(self, cli_runner):
+        """Test that titles and phases for several agents share one bd show call."""
+        from orch.cli import cli
+        import json
+
+        mock_agents = [
+            {
+                'id': f'agent-{i}',
+                'window': f'orchestrator:{i}',
+                'project_dir': '/test/project',
+                'workspace': f'.orch/workspace/agent-{i}',
+                'beads_id': f'orch-cli-{i}',
+                'status': 'active'
+            }
+            for i in (1, 2, 3)
+        ]
+        show_output = json.dumps([
+            {"id": f"orch-cli-{i}", "title": f"Issue {i}", "status": "in_progress",
+             "comments": [{"text": f"Phase: {phase}"}]}
+            for i, phase in ((1, 'Planning'), (2, 'Implementing'), (3, 'Complete'))
+        ])
+
+        with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry, \
+             patch('orch.monitoring_commands.snapshot_windows', return_value=WindowSnapshot(available=False)), \
+             patch('orch.monitoring_commands.detect_and_display_context'), \
+             patch('orch.beads_integration.subprocess.run') as mock_beads_run:
+            mock_registry = MagicMock()
+            mock_registry.list_active_agents.return_value = mock_agents
+            MockRegistry.return_value = mock_registry
+            mock_beads_run.return_value = Mock(returncode=0, stdout=show_output, stderr="")
+
+            result = cli_runner.invoke(cli, ['status', '--global'])
+
+        assert result.exit_code == 0
+        bd_calls = [c[0][0] for c in mock_beads_run.call_args_list]
+        assert bd_calls == [['bd', 'show', 'orch-cli-1', 'orch-cli-2', 'orch-cli-3', '--json']]
+        assert 'Issue 2' in result.output
+        assert 'Implementing' in result.output
+
+
+class TestParallelStatusEvaluation:
+    """Tests for evaluate_agent_statuses (concurrent per-agent status checks)."""
+
+    def test_results_keep_agent_order(self):
+        """Checks finishing out of order still come back in input order."""
+        from orch.monitor import AgentStatus, evaluate_agent_statuses
+
+        agents = [{'id': f'agent-{i}'} for i in range(6)]
+
+        def check(agent, **kwargs):
+            time.sleep(0.01 * (6 - int(agent['id'][-1])))
+            return AgentStatus(agent_id=agent['id'], phase=kwargs['phase'])
+
+        statuses = evaluate_agent_statuses(agents, max_workers=3, timeout=5, check_func=check, phase='Planning')
+
+        assert [s.agent_id for s in statuses] == [a['id'] for a in agents]
+        assert all(s.phase == 'Planning' for s in statuses)
+
+    def test_slow_check_degrades_to_unknown(self):
+        """A hung check is reported as unknown without blocking the others."""
+        import threading
+        from orch.monitor import AgentStatus, evaluate_agent_statuses
+
+        release = threading.Event()
+        agents = [{'id': 'hung'}, {'id': 'a'}, {'id': 'b'}]
+
+        def check(agent, **kwargs):
+            if agent['id'] == 'hung':
+                release.wait(5)
+            return AgentStatus(agent_id=agent['id'], phase='Implementing')
+
+        start = time.monotonic()
+        # One worker: the agents queued behind the hung check still get evaluated
+        statuses = evaluate_agent_statuses(agents, max_workers=1, timeout=0.1, check_func=check)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert statuses[0].timed_out and statuses[0].phase == 'Unknown'
+        assert statuses[0].alerts[0]['type'] == 'status_timeout'
+        assert [s.phase for s in statuses[1:]] == ['Implementing', 'Implementing']
+
+    def test_check_errors_propagate(self):
+        from orch.monitor import evaluate_agent_statuses
+
+        def check(agent, **kwargs):
+            raise ValueError('boom')
+
+        with pytest.raises(ValueError):
+            evaluate_agent_statuses([{'id': 'x'}], timeout=5, check_func=check)
+
+
+class TestAgentStatusPoller:
+    """Tests for AgentStatusPoller (orch wait's one-check-at-a-time polling)."""
+
+    def test_hung_check_not_restarted(self):
+        """Polls during a hung check wait on it instead of starting new checks."""
+        import threading
+        from orch.monitor import AgentStatus, AgentStatusPoller
+
+        release = threading.Event()
+        calls = []
+
+        def check(agent, **kwargs):
+            calls.append(agent['id'])
+            release.wait(5)
+            return AgentStatus(agent_id=agent['id'], phase='Complete')
+
+        poller = AgentStatusPoller(timeout=0.05, check_func=check)
+        first = poller.poll({'id': 'agent-1'})
+        second = poller.poll({'id': 'agent-1'})
+        release.set()
+        third = poller.poll({'id': 'agent-1'})
+
+        assert first.timed_out and second.timed_out
+        assert third.phase == 'Complete'
+        assert calls == ['agent-1']
+
+    def test_new_check_after_previous_finished(self):
+        from orch.monitor import AgentStatus, AgentStatusPoller
+
+        phases = iter(['Planning', 'Complete'])
+        check = Mock(side_effect=lambda agent: AgentStatus(agent_id=agent['id'], phase=next(phases)))
+
+        poller = AgentStatusPoller(timeout=5, check_func=check)
+
+        assert [poller.poll({'id': 'a'}).phase for _ in range(2)] == ['Planning', 'Complete']
+        assert check.call_count == 2
+
+    def test_check_errors_propagate(self):
+        from orch.monitor import AgentStatusPoller
+
+        poller = AgentStatusPoller(timeout=5, check_func=Mock(side_effect=ValueError('boom')))
+
+        with pytest.raises(ValueError):
+            poller.poll({'id': 'x'})
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
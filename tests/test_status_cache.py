@@ -0,0 +1,167 @@
+"""Tests for the fingerprint-keyed agent status cache."""
+
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from orch.monitor import AgentStatus, Scenario, evaluate_agent_statuses
+from orch.status_cache import StatusCache
+
+
+def _age(path, seconds=60):
+    """Backdate path so it is outside the cache's racy window."""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "project"
+    investigations = project / ".kb" / "investigations" / "simple"
+    investigations.mkdir(parents=True)
+    artifact = investigations / "2026-01-01-inv-topic.md"
+    artifact.write_text("**Phase:** Investigating\n")
+    for path in (artifact, investigations, investigations.parent):
+        _age(path)
+    return project
+
+
+@pytest.fixture
+def agent(project):
+    return {
+        'id': 'inv-topic',
+        'project_dir': str(project),
+        'workspace': str(project / '.orch' / 'workspace' / 'inv-topic'),
+        'window': 'workers:1',
+        'status': 'active',
+        'skill': 'investigation',
+        'primary_artifact': '.kb/investigations/simple/2026-01-01-inv-topic.md',
+        'updated_at': '2026-01-01T10:00:00',
+    }
+
+
+def _fingerprint(agent):
+    """Fingerprint from a fresh cache (per-project inputs are read once per instance)."""
+    fingerprint, storable = StatusCache().fingerprint(agent)
+    assert storable
+    return fingerprint
+
+
+class TestFingerprint:
+    def test_stable_when_nothing_changes(self, agent):
+        assert _fingerprint(agent) == _fingerprint(agent)
+
+    def test_ignores_updated_at(self, agent):
+        before = _fingerprint(agent)
+        agent['updated_at'] = '2026-01-02T10:00:00'
+
+        assert _fingerprint(agent) == before
+
+    def test_changes_with_registry_status(self, agent):
+        before = _fingerprint(agent)
+        agent['status'] = 'completed'
+
+        assert _fingerprint(agent) != before
+
+    def test_changes_when_artifact_edited(self, agent, project):
+        before = _fingerprint(agent)
+        artifact = project / agent['primary_artifact']
+        artifact.write_text("**Phase:** Complete\n")
+        _age(artifact, seconds=30)
+
+        assert _fingerprint(agent) != before
+
+    def test_changes_when_investigation_added(self, agent, project):
+        before = _fingerprint(agent)
+        new_dir = project / ".kb" / "investigations" / "simple"
+        (new_dir / "2026-01-02-inv-other.md").write_text("**Phase:** Planning\n")
+        for path in new_dir.iterdir():
+            _age(path, seconds=30)
+        _age(new_dir, seconds=30)
+
+        assert _fingerprint(agent) != before
+
+    def test_changes_when_beads_db_written(self, agent, tmp_path):
+        db = tmp_path / "beads.db"
+        db.write_bytes(b"one")
+        _age(db)
+        agent.update(beads_id='orch-1', beads_db_path=str(db))
+        before = _fingerprint(agent)
+        db.write_bytes(b"three")
+        _age(db, seconds=30)
+
+        assert _fingerprint(agent) != before
+
+    def test_changes_when_project_jsonl_written(self, agent, project, monkeypatch):
+        monkeypatch.delenv('BEADS_DB', raising=False)
+        monkeypatch.chdir(project.parent)
+        jsonl = project / ".beads" / "issues.jsonl"
+        jsonl.parent.mkdir()
+        jsonl.write_text('{"id": "orch-1"}\n')
+        _age(jsonl)
+        agent['beads_id'] = 'orch-1'
+        before = _fingerprint(agent)
+        jsonl.write_text('{"id": "orch-1", "comments": []}\n')
+        _age(jsonl, seconds=30)
+
+        assert _fingerprint(agent) != before
+
+    def test_missing_beads_store_not_storable(self, agent, project, monkeypatch):
+        monkeypatch.delenv('BEADS_DB', raising=False)
+        monkeypatch.chdir(project.parent)
+        agent['beads_id'] = 'orch-1'
+
+        _, storable = StatusCache().fingerprint(agent)
+
+        assert not storable
+
+    def test_recent_write_not_storable(self, agent, project):
+        (project / agent['primary_artifact']).write_text("**Phase:** Complete\n")
+
+        _, storable = StatusCache().fingerprint(agent)
+
+        assert not storable
+
+
+class TestEvaluateWithCache:
+    def test_unchanged_agent_not_rechecked(self, agent):
+        check = Mock(return_value=AgentStatus(agent_id='inv-topic', phase='Investigating',
+                                              scenario=Scenario.WORKING))
+        cache = StatusCache()
+        evaluate_agent_statuses([agent], check_func=check, status_cache=cache)
+        cache.save()
+
+        [status] = evaluate_agent_statuses([agent], check_func=check, status_cache=StatusCache())
+
+        assert check.call_count == 1
+        assert status.phase == 'Investigating'
+        assert status.scenario == Scenario.WORKING
+
+    def test_changed_input_rechecked(self, agent):
+        check = Mock(return_value=AgentStatus(agent_id='inv-topic'))
+        cache = StatusCache()
+        evaluate_agent_statuses([agent], check_func=check, status_cache=cache)
+        cache.save()
+        agent['status'] = 'completed'
+
+        evaluate_agent_statuses([agent], check_func=check, status_cache=StatusCache())
+
+        assert check.call_count == 2
+
+    def test_context_checks_bypass_cache(self, agent):
+        check = Mock(return_value=AgentStatus(agent_id='inv-topic'))
+        cache = StatusCache()
+        evaluate_agent_statuses([agent], check_func=check, status_cache=cache)
+
+        evaluate_agent_statuses([agent], check_func=check, status_cache=cache, check_context=True)
+
+        assert check.call_count == 2
+
+    def test_timed_out_status_not_stored(self, agent):
+        cache = StatusCache()
+        cache.put('inv-topic', 'abc', AgentStatus(agent_id='inv-topic', timed_out=True))
+        cache.save()
+
+        assert StatusCache().get('inv-topic', 'abc') is None
@@ -0,0 +1,267 @@
+"""Tests for the background status daemon (orch statusd)."""
+
+import importlib.util
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from orch.monitor import AgentStatus, Scenario, status_from_dict, status_to_dict
+from orch.registry import AgentRegistry
+from orch.status_daemon import (
+    StatusDaemon,
+    StatusDaemonError,
+    StatusSnapshot,
+    compute_snapshot,
+    registry_signature,
+    request_snapshot,
+)
+from orch.tmux_utils import WindowSnapshot
+
+
+def _agent(agent_id, project_dir='/tmp/project'):
+    return {
+        'id': agent_id,
+        'workspace': f'.orch/workspace/{agent_id}',
+        'project_dir': project_dir,
+        'window': 'workers:1',
+        'status': 'active',
+        'beads_id': f'orch-{agent_id}',
+    }
+
+
+def _snapshot(registry_path, **overrides):
+    fields = dict(
+        computed_at=time.time(),
+        registry_path=str(registry_path),
+        registry_signature=registry_signature(registry_path),
+        active=[(_agent('agent-a'), AgentStatus(agent_id='agent-a', phase='Implementing'))],
+        issue_titles={'orch-agent-a': 'Make status fast'},
+    )
+    fields.update(overrides)
+    return StatusSnapshot(**fields)
+
+
+@pytest.fixture
+def registry_file(tmp_path):
+    path = tmp_path / 'agent-registry.json'
+    path.write_text(json.dumps({'agents': []}))
+    return path
+
+
+@pytest.fixture
+def running_daemon(tmp_path, registry_file):
+    """A StatusDaemon serving a fixed snapshot on a tmp socket."""
+    daemon = StatusDaemon(path=tmp_path / 's.sock', registry_path=registry_file, poll_interval=0.05,
+                          max_refresh_interval=3600)
+    with patch('orch.status_daemon.compute_snapshot', side_effect=lambda path: _snapshot(path)), \
+         patch.object(StatusDaemon, 'inputs_changed', return_value=False):
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        for _ in range(100):
+            if daemon.path.exists() and daemon.snapshot is not None:
+                break
+            time.sleep(0.02)
+        yield daemon
+        daemon.stop()
+        thread.join(timeout=5)
+
+
+class TestStatusSerialization:
+    def test_round_trip(self):
+        status = AgentStatus(
+            agent_id='agent-a', needs_attention=True, priority='warning',
+            alerts=[{'type': 'stale', 'message': 'No progress'}], phase='Complete',
+            scenario=Scenario.READY_CLEAN, recommendation='orch clean agent-a',
+            completed_at=datetime(2026, 1, 2, 3, 4, 5), age_str='2h ago', is_stale=True,
+        )
+
+        restored = status_from_dict(json.loads(json.dumps(status_to_dict(status))))
+
+        assert restored == status
+
+    def test_snapshot_rejects_other_versions(self, registry_file):
+        data = _snapshot(registry_file).to_dict()
+        data['version'] = 99
+
+        with pytest.raises(ValueError):
+            StatusSnapshot.from_dict(data)
+
+
+class TestSnapshotFreshness:
+    def test_current_when_inputs_unchanged(self, registry_file):
+        assert _snapshot(registry_file).is_current()
+
+    def test_outdated_after_registry_write(self, registry_file):
+        snapshot = _snapshot(registry_file)
+        registry_file.write_text(json.dumps({'agents': [_agent('agent-b')]}))
+
+        assert not snapshot.is_current()
+
+    def test_outdated_after_beads_write(self, registry_file, tmp_path):
+        db = tmp_path / '.beads' / 'beads.db'
+        db.parent.mkdir()
+        db.write_bytes(b'one')
+        from orch.status_daemon import _beads_signatures
+        snapshot = _snapshot(registry_file, beads_signatures=_beads_signatures([str(db)]))
+        db.write_bytes(b'three')
+
+        assert not snapshot.is_current()
+
+    def test_outdated_when_too_old(self, registry_file):
+        snapshot = _snapshot(registry_file, computed_at=time.time() - 600)
+
+        assert not snapshot.is_current(max_age=120)
+
+
+class TestComputeSnapshot:
+    def test_archive_tier_not_read(self, registry_file):
+        done = dict(_agent('old-done'), status='completed', completed_at='2025-01-05T00:00:00')
+        recent = dict(_agent('new-done'), status='completed', completed_at=datetime.now().isoformat())
+        registry_file.write_text(json.dumps({'agents': [_agent('live'), done, recent]}))
+        AgentRegistry(registry_file).archive_terminal_agents(max_age_days=7)
+
+        def evaluate(agents, **kwargs):
+            return [AgentStatus(agent_id=a['id']) for a in agents]
+
+        with patch('orch.status_daemon.snapshot_windows', return_value=WindowSnapshot(available=False)), \
+             patch('orch.status_daemon.BeadsBatch.fetch') as fetch, \
+             patch('orch.status_daemon.evaluate_agent_statuses', side_effect=evaluate), \
+             patch.object(AgentRegistry, 'list_archived_agents') as list_archived:
+            snapshot = compute_snapshot(registry_file)
+
+        list_archived.assert_not_called()
+        assert [a['id'] for a, _ in snapshot.active] == ['live']
+        assert [a['id'] for a, _ in snapshot.completed] == ['new-done']
+        assert [ref[0] for ref in fetch.call_args[0][0]] == ['orch-live', 'orch-new-done']
+
+
+class TestStatusDaemonSocket:
+    def test_request_snapshot_without_daemon(self, tmp_path):
+        assert request_snapshot(path=tmp_path / 'missing.sock') is None
+
+    def test_serves_snapshot(self, running_daemon, registry_file):
+        snapshot = request_snapshot(path=running_daemon.path, registry_path=registry_file)
+
+        assert snapshot is not None
+        [(agent, status)] = snapshot.active
+        assert agent['id'] == 'agent-a'
+        assert status.phase == 'Implementing'
+        assert snapshot.issue_titles == {'orch-agent-a': 'Make status fast'}
+
+    def test_snapshot_for_other_registry_ignored(self, running_daemon, tmp_path):
+        other = tmp_path / 'other-registry.json'
+        other.write_text('{}')
+
+        assert request_snapshot(path=running_daemon.path, registry_path=other) is None
+
+    def test_registry_change_falls_back(self, running_daemon, registry_file):
+        registry_file.write_text(json.dumps({'agents': [_agent('agent-b')]}))
+
+        assert request_snapshot(path=running_daemon.path, registry_path=registry_file) is None
+
+    def test_second_daemon_refuses_to_start(self, running_daemon, registry_file):
+        second = StatusDaemon(path=running_daemon.path, registry_path=registry_file)
+
+        with pytest.raises(StatusDaemonError):
+            second.serve_forever()
+
+    def test_stale_socket_replaced(self, tmp_path, registry_file):
+        import socket
+        path = tmp_path / 'stale.sock'
+        dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        dead.bind(str(path))
+        dead.close()
+
+        daemon = StatusDaemon(path=path, registry_path=registry_file)
+        daemon._bind()
+        try:
+            assert path.exists()
+        finally:
+            daemon._server.server_close()
+
+
+class TestStatusCommandUsesDaemon:
+    def test_status_json_reads_snapshot(self, cli_runner, registry_file):
+        from orch.cli import cli
+
+        with patch('orch.monitoring_commands.request_snapshot', return_value=_snapshot(registry_file)), \
+             patch('orch.monitoring_commands._load_reconciled_agents') as load_direct:
+            result = cli_runner.invoke(cli, ['status', '--json', '--global'])
+
+        assert result.exit_code == 0, result.output
+        load_direct.assert_not_called()
+        [agent] = json.loads(result.output)['agents']
+        assert agent['agent_id'] == 'agent-a'
+        assert agent['phase'] == 'Implementing'
+        assert agent['beads_title'] == 'Make status fast'
+
+    def test_include_completed_adds_archived_agents(self, cli_runner, registry_file):
+        from orch.cli import cli
+
+        archived = dict(_agent('old-done'), status='completed')
+        with patch('orch.monitoring_commands.request_snapshot', return_value=_snapshot(registry_file)), \
+             patch('orch.monitoring_commands._load_archived_completed_agents', return_value=[archived]), \
+             patch('orch.monitoring_commands._evaluate_statuses',
+                   return_value=([], [(archived, AgentStatus(agent_id='old-done', phase='Complete'))], {}, {})
+                   ) as evaluate:
+            result = cli_runner.invoke(cli, ['status', '--json', '--global', '--include-completed'])
+
+        assert result.exit_code == 0, result.output
+        assert evaluate.call_args[0][:2] == ([], [archived])
+        ids = [a['agent_id'] for a in json.loads(result.output)['agents']]
+        assert ids == ['agent-a', 'old-done']
+
+    def test_no_daemon_flag_computes_directly(self, cli_runner):
+        from orch.cli import cli
+
+        with patch('orch.monitoring_commands.request_snapshot') as request, \
+             patch('orch.monitoring_commands._load_reconciled_agents', return_value=([], [])):
+            result = cli_runner.invoke(cli, ['status', '--json', '--global', '--no-daemon'])
+
+        assert result.exit_code == 0, result.output
+        request.assert_not_called()
+        assert json.loads(result.output)['agents'] == []
+
+
+class TestSessionStartHook:
+    """The SessionStart hook reads the socket itself; it applies the same freshness check."""
+
+    @pytest.fixture
+    def hook(self):
+        hook_path = Path(__file__).parent.parent / 'hooks' / 'load-orchestration-context.py'
+        spec = importlib.util.spec_from_file_location('session_start_hook', hook_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_current_snapshot_accepted(self, hook, registry_file, tmp_path):
+        from orch.status_daemon import _beads_signatures
+        db = tmp_path / '.beads' / 'beads.db'
+        db.parent.mkdir()
+        db.write_bytes(b'one')
+        snapshot = _snapshot(registry_file, beads_signatures=_beads_signatures([str(db)]))
+
+        assert hook._snapshot_is_current(json.loads(json.dumps(snapshot.to_dict())))
+
+    def test_registry_write_rejects_snapshot(self, hook, registry_file):
+        data = json.loads(json.dumps(_snapshot(registry_file).to_dict()))
+        registry_file.write_text(json.dumps({'agents': [_agent('agent-b')]}))
+
+        assert not hook._snapshot_is_current(data)
+
+    def test_beads_write_rejects_snapshot(self, hook, registry_file, tmp_path):
+        from orch.status_daemon import _beads_signatures
+        db = tmp_path / '.beads' / 'beads.db'
+        db.parent.mkdir()
+        db.write_bytes(b'one')
+        data = json.loads(json.dumps(
+            _snapshot(registry_file, beads_signatures=_beads_signatures([str(db)])).to_dict()
+        ))
+        db.write_bytes(b'three')
+
+        assert not hook._snapshot_is_current(data)
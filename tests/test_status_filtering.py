@@ -3,7 +3,7 @@ Tests for orch status filtering functionality.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 
 # cli_runner fixture provided by conftest.py
@@ -32,7 +32,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -67,7 +67,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -109,7 +109,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -146,7 +146,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -184,7 +184,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -216,7 +216,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -251,7 +251,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -289,7 +289,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -327,7 +327,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -363,7 +363,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # Phase 2.5: No completed agents
                 MockRegistry.return_value = mock_registry
@@ -399,7 +399,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # No completed agents
                 MockRegistry.return_value = mock_registry
@@ -434,7 +434,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # No completed agents
                 MockRegistry.return_value = mock_registry
@@ -474,7 +474,7 @@ class TestStatusFiltering:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []
                 MockRegistry.return_value = mock_registry
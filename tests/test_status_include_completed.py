@@ -6,7 +6,7 @@ The --include-completed flag enables showing completed agents.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 
 class TestStatusIncludeCompleted:
@@ -32,7 +32,7 @@ class TestStatusIncludeCompleted:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_active_agents
                 mock_registry.list_agents.return_value = mock_active_agents + mock_completed_agents
                 MockRegistry.return_value = mock_registry
@@ -81,7 +81,7 @@ class TestStatusIncludeCompleted:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_active_agents
                 mock_registry.list_agents.return_value = mock_active_agents + mock_completed_agents
                 MockRegistry.return_value = mock_registry
@@ -145,7 +145,7 @@ class TestStatusIncludeCompleted:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_active_agents
                 mock_registry.list_agents.return_value = mock_active_agents + mock_completed_agents
                 MockRegistry.return_value = mock_registry
@@ -194,7 +194,7 @@ class TestStatusIncludeCompleted:
             MockLogger.return_value = mock_logger
 
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_active_agents
                 mock_registry.list_agents.return_value = mock_active_agents  # No completed
                 MockRegistry.return_value = mock_registry
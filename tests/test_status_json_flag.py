@@ -4,7 +4,7 @@ Tests for orch status --json flag functionality.
 
 import pytest
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 
 class TestStatusJsonFlag:
@@ -37,7 +37,7 @@ class TestStatusJsonFlag:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []  # No completed agents
                 MockRegistry.return_value = mock_registry
@@ -82,7 +82,7 @@ class TestStatusJsonFlag:
                 MockLogger.return_value = mock_logger
 
                 with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                    mock_registry = Mock()
+                    mock_registry = MagicMock()
                     mock_registry.list_active_agents.return_value = mock_agents
                     mock_registry.list_agents.return_value = []
                     MockRegistry.return_value = mock_registry
@@ -134,7 +134,7 @@ class TestStatusJsonFlag:
 
             # Mock registry
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = mock_agents
                 mock_registry.list_agents.return_value = []
                 MockRegistry.return_value = mock_registry
@@ -163,7 +163,7 @@ class TestStatusJsonFlag:
 
             # Mock registry with no agents
             with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
-                mock_registry = Mock()
+                mock_registry = MagicMock()
                 mock_registry.list_active_agents.return_value = []
                 mock_registry.list_agents.return_value = []
                 MockRegistry.return_value = mock_registry
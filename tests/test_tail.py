@@ -195,6 +195,26 @@ class TestTailFunction:
         call_args = mock_run.call_args[0][0]
         assert '-100' in call_args
 
+    def test_reads_pane_log_instead_of_capture(self, tmp_path):
+        """Test that an agent's pipe-pane log is read from disk when present."""
+        from orch.tail import tail_agent_output
+
+        agent = {
+            'id': 'agent-1',
+            'window': 'orchestrator:10',
+            'project_dir': str(tmp_path),
+            'workspace': '.orch/workspace/agent-1'
+        }
+        log_path = tmp_path / '.orch' / 'workspace' / 'agent-1' / 'pane.log'
+        log_path.parent.mkdir(parents=True)
+        log_path.write_text(''.join(f'line {i}\n' for i in range(50)))
+
+        with patch('subprocess.run') as mock_run:
+            output = tail_agent_output(agent, lines=2)
+
+        assert output == 'line 48\nline 49'
+        mock_run.assert_not_called()
+
     def test_tmux_failure_raises_error(self):
         """Test that tmux command failure raises appropriate error."""
         from orch.tail import tail_agent_output
@@ -410,3 +430,71 @@ class TestTailCommandOpenCode:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestTailFollow:
+    """Tests for multi-agent follow mode."""
+
+    def _agent(self, tmp_path, agent_id, content=None):
+        agent = {
+            'id': agent_id,
+            'window': f'workers:{agent_id}',
+            'project_dir': str(tmp_path),
+            'workspace': f'.orch/workspace/{agent_id}',
+            'status': 'active',
+        }
+        if content is not None:
+            log_path = tmp_path / '.orch' / 'workspace' / agent_id / 'pane.log'
+            log_path.parent.mkdir(parents=True)
+            log_path.write_text(content)
+        return agent
+
+    def test_follow_interleaves_new_log_output(self, tmp_path):
+        """Test follow emits history, then only appended lines, per agent."""
+        import threading
+        from orch.tail import follow_agents
+
+        agents = [self._agent(tmp_path, 'a', 'a-old\n'), self._agent(tmp_path, 'b', 'b-old\n')]
+        stop = threading.Event()
+        seen = []
+
+        def emit(agent_id, line):
+            seen.append((agent_id, line))
+            if len(seen) == 2:
+                # History printed; agents produce more output
+                for agent_id_ in ('a', 'b'):
+                    with open(tmp_path / '.orch' / 'workspace' / agent_id_ / 'pane.log', 'a') as f:
+                        f.write(f'{agent_id_}-new\n')
+            if len(seen) == 4:
+                stop.set()
+
+        follow_agents(agents, emit, lines=5, interval=0.01, stop=stop)
+
+        assert seen == [('a', 'a-old'), ('b', 'b-old'), ('a', 'a-new'), ('b', 'b-new')]
+
+    def test_capture_source_emits_only_new_lines(self):
+        """Test the capture-pane fallback diffs successive captures."""
+        from orch.tail import _CaptureSource
+
+        captures = iter(["one\ntwo\n", "two\nthree\nfour\n", "two\nthree\nfour\n"])
+        with patch('orch.tail._tail_tmux_capture', side_effect=lambda agent, lines: next(captures)):
+            source = _CaptureSource({'id': 'a', 'window': 'workers:1'}, 20)
+            assert source.poll() == ['three', 'four']
+            assert source.poll() == []
+
+    def test_tail_all_prefixes_each_agent(self, cli_runner, tmp_path):
+        """Test one-shot tail of several agents prefixes lines with the agent id."""
+        from orch.cli import cli
+
+        agents = [self._agent(tmp_path, 'alpha', 'from alpha\n'), self._agent(tmp_path, 'b', 'from b\n')]
+
+        with patch('orch.monitoring_commands.AgentRegistry') as MockRegistry:
+            mock_registry = Mock()
+            mock_registry.list_active_agents.return_value = agents
+            MockRegistry.return_value = mock_registry
+
+            result = cli_runner.invoke(cli, ['tail', '--all'])
+
+        assert result.exit_code == 0
+        assert '[alpha] from alpha' in result.output
+        assert '[b    ] from b' in result.output
@@ -0,0 +1,153 @@
+"""
+Tests for the tmux control-mode client and event-driven reconciliation.
+"""
+
+import io
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from orch.registry import AgentRegistry
+from orch.tmux_control import (
+    TmuxControlClient,
+    TmuxControlError,
+    WindowCloseReconciler,
+    decode_output,
+    quote_arg,
+)
+from orch.tmux_utils import WindowSnapshot
+
+
+def _connected_client():
+    """Client wired to an in-memory stdin instead of a tmux process."""
+    client = TmuxControlClient(session_name='workers')
+    client._proc = Mock(stdin=io.StringIO())
+    client.connected = True
+    return client
+
+
+def _reply_when_sent(client, lines, error=False):
+    """Feed a %begin/%end reply once the command has been written."""
+    def feed():
+        while not client._pending:
+            time.sleep(0.001)
+        client._handle_line('%begin 1700000000 12 1')
+        for line in lines:
+            client._handle_line(line)
+        client._handle_line(('%error' if error else '%end') + ' 1700000000 12 1')
+
+    thread = threading.Thread(target=feed)
+    thread.start()
+    return thread
+
+
+class TestControlProtocol:
+    """Tests for control-mode output parsing."""
+
+    def test_command_returns_reply_lines(self):
+        client = _connected_client()
+        thread = _reply_when_sent(client, ['@1', '@2'])
+
+        assert client.command('list-windows', '-a', '-F', '#{window_id}') == ['@1', '@2']
+        thread.join()
+        assert client._proc.stdin.getvalue() == "list-windows -a -F '#{window_id}'\n"
+
+    def test_error_reply_raises(self):
+        client = _connected_client()
+        thread = _reply_when_sent(client, ["can't find window: @99"], error=True)
+
+        with pytest.raises(TmuxControlError, match="can't find window"):
+            client.command('kill-window', '-t', '@99')
+        thread.join()
+
+    def test_initial_attach_block_is_not_a_reply(self):
+        client = _connected_client()
+        client._handle_line('%begin 1700000000 1 0')
+        client._handle_line('%end 1700000000 1 0')
+
+        thread = _reply_when_sent(client, ['ok'])
+        assert client.command('display-message', '-p', 'ok') == ['ok']
+        thread.join()
+
+    def test_notifications_dispatch_to_callbacks(self):
+        client = _connected_client()
+        closed, output = [], []
+        client.on('window-close', closed.append)
+        client.on('output', lambda pane, data: output.append((pane, data)))
+
+        client._handle_line('%window-close @7')
+        client._handle_line('%output %3 hello\\015\\012')
+
+        assert closed == [['@7']]
+        assert output == [('%3', b'hello\r\n')]
+
+    def test_exit_fails_pending_commands(self):
+        client = _connected_client()
+        errors = []
+
+        def run():
+            try:
+                client.command('list-windows', timeout=2)
+            except TmuxControlError as e:
+                errors.append(str(e))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        while not client._pending:
+            time.sleep(0.001)
+        client._handle_line('%exit')
+        thread.join()
+
+        assert not client.connected
+        assert errors and 'disconnected' in errors[0]
+
+    def test_quote_and_decode(self):
+        assert quote_arg('@12') == '@12'
+        assert quote_arg("it's") == "'it'\\''s'"
+        assert decode_output('a\\134b') == b'a\\b'
+
+
+class TestWindowCloseReconciler:
+    """Tests for completing agents from window-close events."""
+
+    @pytest.fixture
+    def registry_path(self, tmp_path):
+        path = tmp_path / "agent-registry.json"
+        registry = AgentRegistry(path)
+        for i in (1, 2):
+            registry.register(
+                agent_id=f"agent-{i}",
+                task=f"Task {i}",
+                window=f"workers:{i}",
+                window_id=f"@{i}",
+                project_dir="/tmp/test",
+                workspace=f"/tmp/workspace-{i}",
+            )
+        return path
+
+    def test_close_events_complete_only_those_agents(self, registry_path):
+        client = _connected_client()
+        reconciler = WindowCloseReconciler(client, registry_path, debounce=60)
+        with patch('orch.tmux_utils.snapshot_windows', return_value=WindowSnapshot(available=False)):
+            reconciler.start()
+
+        client._handle_line('%unlinked-window-close @1')
+        client._handle_line('%window-close @99')
+        assert reconciler.flush() == 1
+
+        registry = AgentRegistry(registry_path)
+        assert registry.find("agent-1")["status"] == "completed"
+        assert registry.find("agent-2")["status"] == "active"
+
+    def test_start_runs_full_reconcile(self, registry_path):
+        snapshot = WindowSnapshot([
+            {'session': 'workers', 'id': '@2', 'index': '2', 'name': 'agent-2', 'pane_pid': 102},
+        ])
+        with patch('orch.tmux_utils.snapshot_windows', return_value=snapshot):
+            WindowCloseReconciler(_connected_client(), registry_path).start()
+
+        registry = AgentRegistry(registry_path)
+        assert registry.find("agent-1")["status"] == "completed"
+        assert registry.find("agent-2")["status"] == "active"
@@ -0,0 +1,200 @@
+"""
+Tests for tmux_utils window snapshot.
+"""
+
+from unittest.mock import Mock, patch
+
+from orch.tmux_utils import WindowSnapshot, get_window_by_id, snapshot_windows
+
+
+LIST_WINDOWS_OUTPUT = (
+    "orchestrator\t@1\t0\tmain\t1001\n"
+    "workers-orch\t@7\t1\tfeat-a\t1007\n"
+    "workers-orch\t@9\t2\tfeat b\t1009\n"
+)
+
+
+class TestSnapshotWindows:
+    """Tests for the single-call window snapshot."""
+
+    def test_parses_all_sessions_in_one_call(self):
+        result = Mock(returncode=0, stdout=LIST_WINDOWS_OUTPUT)
+        with patch('subprocess.run', return_value=result) as mock_run:
+            snapshot = snapshot_windows()
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[:3] == ['tmux', 'list-windows', '-a']
+
+        assert snapshot.available
+        assert snapshot.window_ids() == ['@1', '@7', '@9']
+        assert snapshot.sessions == ['orchestrator', 'workers-orch']
+        assert snapshot.by_id['@9']['name'] == 'feat b'
+        assert snapshot.by_id['@9']['pane_pid'] == 1009
+        assert snapshot.by_target['workers-orch:1']['id'] == '@7'
+        assert [w['id'] for w in snapshot.windows_in('workers-orch')] == ['@7', '@9']
+
+    def test_no_server_is_unavailable(self):
+        result = Mock(returncode=1, stdout='', stderr='no server running')
+        with patch('subprocess.run', return_value=result):
+            snapshot = snapshot_windows()
+
+        assert not snapshot.available
+        assert snapshot.window_ids() == []
+
+    def test_tmux_not_installed_is_unavailable(self):
+        with patch('subprocess.run', side_effect=FileNotFoundError('tmux')):
+            snapshot = snapshot_windows()
+
+        assert not snapshot.available
+
+    def test_malformed_lines_are_skipped(self):
+        result = Mock(returncode=0, stdout="garbage\norchestrator\t@1\t0\tmain\t\n")
+        with patch('subprocess.run', return_value=result):
+            snapshot = snapshot_windows()
+
+        assert snapshot.window_ids() == ['@1']
+        assert snapshot.by_id['@1']['pane_pid'] is None
+
+
+class TestGetWindowById:
+    """Tests for get_window_by_id backed by the snapshot."""
+
+    def _snapshot(self):
+        return WindowSnapshot([
+            {'session': 'workers-orch', 'id': '@7', 'index': '1', 'name': 'feat-a', 'pane_pid': 1007},
+        ])
+
+    def test_finds_window_in_session(self):
+        window = get_window_by_id('@7', 'workers-orch', snapshot=self._snapshot())
+        assert window['index'] == '1'
+
+    def test_session_mismatch_returns_none(self):
+        assert get_window_by_id('@7', 'orchestrator', snapshot=self._snapshot()) is None
+
+    def test_any_session_when_not_given(self):
+        assert get_window_by_id('@7', snapshot=self._snapshot()) is not None
+
+    def test_missing_window_returns_none(self):
+        assert get_window_by_id('@8', snapshot=self._snapshot()) is None
+
+    def test_takes_snapshot_when_not_given(self):
+        with patch('orch.tmux_utils.snapshot_windows', return_value=self._snapshot()) as mock_snapshot:
+            assert get_window_by_id('@7', 'workers-orch') is not None
+        mock_snapshot.assert_called_once()
+
+
+class TestBatchedLivenessProbe:
+    """Tests for the batched live-process probe."""
+
+    def test_process_children_includes_this_process(self):
+        import os
+        from orch.tmux_utils import process_children
+
+        children = process_children()
+        assert os.getpid() in children.get(os.getppid(), [])
+
+    def test_pane_pids_parsed_from_one_call(self):
+        from orch.tmux_utils import pane_pids_by_window
+
+        result = Mock(returncode=0, stdout="@1\t100\n@2\t200\n@2\t201\n")
+        with patch('subprocess.run', return_value=result) as mock_run:
+            panes = pane_pids_by_window()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:3] == ['tmux', 'list-panes', '-a']
+        assert panes == {'@1': [100], '@2': [200, 201]}
+
+    def test_windows_with_active_processes(self):
+        from orch.tmux_utils import windows_with_active_processes
+
+        panes = {'@1': [100], '@2': [200, 201], '@3': [300]}
+        children = {201: [202], 300: [301]}
+        with patch('orch.tmux_utils.pane_pids_by_window', return_value=panes), \
+             patch('orch.tmux_utils.process_children', return_value=children) as mock_children:
+            assert windows_with_active_processes() == {'@2', '@3'}
+            assert windows_with_active_processes(['@1', '@2', '@9']) == {'@2'}
+
+        # One process-table walk per probe, not per window
+        assert mock_children.call_count == 2
+
+    def test_no_tmux_means_no_busy_windows(self):
+        from orch.tmux_utils import windows_with_active_processes
+
+        with patch('orch.tmux_utils.pane_pids_by_window', return_value={}), \
+             patch('orch.tmux_utils.process_children') as mock_children:
+            assert windows_with_active_processes(['@1']) == set()
+        mock_children.assert_not_called()
+
+    def test_wait_for_idle_windows_rechecks_only_busy(self):
+        from orch.tmux_utils import wait_for_idle_windows
+
+        probes = [{'@1', '@2'}, {'@2'}, set()]
+        with patch('orch.tmux_utils.windows_with_active_processes', side_effect=probes) as mock_probe, \
+             patch('time.sleep'):
+            assert wait_for_idle_windows(['@1', '@2', '@3'], wait_seconds=5) == set()
+
+        assert set(mock_probe.call_args_list[1][0][0]) == {'@1', '@2'}
+        assert set(mock_probe.call_args_list[2][0][0]) == {'@2'}
+
+
+class TestShutdownWindows:
+    """Tests for the concurrent shutdown cascade."""
+
+    def _snapshot(self):
+        return WindowSnapshot([
+            {'session': 'workers', 'id': f'@{i}', 'index': str(i), 'name': f'agent-{i}', 'pane_pid': 100 + i}
+            for i in range(1, 6)
+        ] + [{'session': 'workers', 'id': '@9', 'index': '9', 'name': 'other', 'pane_pid': 109}])
+
+    def test_cascade_stages_apply_to_still_busy_windows(self):
+        from orch.tmux_utils import shutdown_windows
+
+        # @1 idle; @2 stops on Ctrl+C; @3 on /exit; @4 needs killing; @7 is gone
+        probes = [{'@2', '@3', '@4'}, {'@3', '@4'}, {'@4'}]
+        with patch('orch.tmux_utils.windows_with_active_processes', side_effect=probes[:1]), \
+             patch('orch.tmux_utils.wait_for_idle_windows', side_effect=probes[1:]) as mock_wait, \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            outcomes = shutdown_windows(['@1', '@2', '@3', '@4', '@7'], graceful_wait=30,
+                                        exit_wait=30, snapshot=self._snapshot())
+
+        assert outcomes == {'@1': 'idle', '@2': 'interrupted', '@3': 'exited',
+                            '@4': 'killed', '@7': 'closed'}
+
+        # Each stage waits once for all of its windows
+        assert [set(c[0][0]) for c in mock_wait.call_args_list] == [{'@2', '@3', '@4'}, {'@3', '@4'}]
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        interrupts = sorted(c[3] for c in commands if c[-1] == 'C-c')
+        exits = sorted(c[3] for c in commands if c[-2:] == ['/exit', 'Enter'])
+        killed = sorted(c[3] for c in commands if c[1] == 'kill-window')
+        assert interrupts == ['@2', '@3', '@4']
+        assert exits == ['@3', '@4']
+        assert killed == ['@1', '@2', '@3', '@4']
+        # Another window remains in the session, so no placeholder is needed
+        assert not [c for c in commands if c[1] == 'new-window']
+
+    def test_keeps_session_alive_and_reports_busy_without_kill(self):
+        from orch.tmux_utils import shutdown_windows
+
+        snapshot = WindowSnapshot([{'session': 'workers', 'id': '@1', 'index': '1', 'name': 'a', 'pane_pid': 1}])
+        with patch('orch.tmux_utils.windows_with_active_processes', return_value={'@1'}), \
+             patch('orch.tmux_utils.wait_for_idle_windows', return_value={'@1'}), \
+             patch('subprocess.run', return_value=Mock(returncode=0)) as mock_run:
+            assert shutdown_windows(['@1'], kill=False, snapshot=snapshot) == {'@1': 'busy'}
+            assert not [c for c in mock_run.call_args_list if c[0][0][1] == 'kill-window']
+
+            assert shutdown_windows(['@1'], snapshot=snapshot) == {'@1': 'killed'}
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert commands.index(['tmux', 'new-window', '-d', '-t', 'workers', '-n', 'main']) < \
+            commands.index(['tmux', 'kill-window', '-t', '@1'])
+
+    def test_no_tmux_means_all_closed(self):
+        from orch.tmux_utils import shutdown_windows
+
+        with patch('orch.tmux_utils.windows_with_active_processes') as mock_probe:
+            outcomes = shutdown_windows(['@1', None], snapshot=WindowSnapshot(available=False))
+
+        assert outcomes == {'@1': 'closed'}
+        mock_probe.assert_not_called()